@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 import traceback
 
 from bcsfe import cli, copy_to_data_dir
@@ -71,6 +72,13 @@ def main():
         help=f"copy all data from bcsfe/src/files to {core.Path.get_data_folder()}",
     )
 
+    subparsers = parser.add_subparsers(dest="command")
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="load, edit and save many save files without any prompts",
+    )
+    cli.batch.Batch.add_arguments(batch_parser)
+
     args = parser.parse_args()
     if args.version:
         print(bcsfe.__version__)
@@ -95,6 +103,10 @@ def main():
 
     core.core_data.init_data()
 
+    if args.command == "batch":
+        success = cli.batch.Batch.from_args(args).run()
+        sys.exit(0 if success else 1)
+
     try:
         cli.main.Main().main(args.input_path)
     except KeyboardInterrupt:
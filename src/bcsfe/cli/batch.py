@@ -0,0 +1,270 @@
+"""Non-interactive batch processing of many save files.
+
+Each save is loaded, edited and serialised in a separate worker process so that
+parsing scales across cores. The edits are a JSON list of operations applied in
+order to each save file:
+
+    [
+        {"set": "catfood", "value": 45000},
+        {"call": "set_xp", "args": [99999999]},
+        {"call": "max_rank_up_sale"}
+    ]
+
+`set` assigns a value to an attribute and `call` calls a method with optional
+`args` and `kwargs`. Both accept dotted paths relative to the save file (e.g
+`story.clear_tutorial`). If `save_file` is true the save file is passed as the
+first argument of the call.
+
+A result is printed as a JSON line for every save file.
+"""
+
+from __future__ import annotations
+import concurrent.futures
+import json
+import os
+import sys
+import time
+import traceback
+from typing import Any
+from bcsfe import core
+
+
+def init_worker(
+    config_path: core.Path | None,
+    log_path: core.Path | None,
+    game_data_path: core.Path | None,
+    data_dir_path: core.Path | None,
+):
+    """Set up the core data in a worker process, using the same paths as the
+    parent process."""
+    if config_path is not None:
+        core.set_config_path(config_path)
+    if log_path is not None:
+        core.set_log_path(log_path)
+    if game_data_path is not None:
+        core.set_game_data_path(game_data_path)
+    if data_dir_path is not None:
+        core.set_data_dir_path(data_dir_path)
+    core.core_data.init_data()
+
+
+def resolve(obj: Any, path: str) -> tuple[Any, str]:
+    """Resolve a dotted path to the object that owns the last attribute.
+
+    Args:
+        obj (Any): The object to start from
+        path (str): The dotted path
+
+    Returns:
+        tuple[Any, str]: The owning object and the last attribute name
+    """
+    parts = path.split(".")
+    for part in parts[:-1]:
+        obj = getattr(obj, part)
+    return obj, parts[-1]
+
+
+def apply_edit(save_file: core.SaveFile, edit: dict[str, Any]):
+    """Apply a single scripted edit to a save file.
+
+    Args:
+        save_file (core.SaveFile): The save file to edit
+        edit (dict[str, Any]): The edit
+
+    Raises:
+        ValueError: If the edit is neither a `set` or a `call`
+    """
+    if "set" in edit:
+        obj, name = resolve(save_file, edit["set"])
+        setattr(obj, name, edit.get("value"))
+    elif "call" in edit:
+        obj, name = resolve(save_file, edit["call"])
+        args: list[Any] = list(edit.get("args", []))
+        if edit.get("save_file", False):
+            args.insert(0, save_file)
+        getattr(obj, name)(*args, **edit.get("kwargs", {}))
+    else:
+        raise ValueError(f"Invalid edit: {edit}")
+
+
+def process_save(
+    input_path: str, edits: list[dict[str, Any]], output_path: str | None
+) -> dict[str, Any]:
+    """Load, edit and serialise a single save file. Runs in a worker process.
+
+    Args:
+        input_path (str): Path to the save file
+        edits (list[dict[str, Any]]): The edits to apply
+        output_path (str | None): Where to write the edited save, or None to not
+            write it
+
+    Returns:
+        dict[str, Any]: The result for this save file
+    """
+    start = time.perf_counter()
+    result: dict[str, Any] = {"input": input_path, "output": output_path}
+    try:
+        save_file = core.SaveFile(core.Path(input_path).read())
+        result["cc"] = save_file.cc.get_code()
+        result["game_version"] = save_file.game_version.to_string()
+        for edit in edits:
+            apply_edit(save_file, edit)
+        data = save_file.to_data()
+        if output_path is not None:
+            path = core.Path(output_path)
+            path.parent().generate_dirs()
+            data.to_file(path)
+        result["size"] = len(data)
+        result["ok"] = True
+    except Exception as e:
+        result["ok"] = False
+        cause = e.__cause__ if e.__cause__ is not None else e
+        result["error"] = f"{type(cause).__name__}: {cause}"
+        result["traceback"] = traceback.format_exc()
+    result["seconds"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+class Batch:
+    def __init__(
+        self,
+        inputs: list[str],
+        edits: list[dict[str, Any]],
+        output_dir: str | None = None,
+        workers: int | None = None,
+    ):
+        self.inputs = inputs
+        self.edits = edits
+        self.output_dir = output_dir
+        self.workers = workers
+
+    @staticmethod
+    def read_manifest(path: core.Path) -> list[str]:
+        """Read a manifest with one save file path per line. Blank lines and
+        lines starting with # are ignored."""
+        paths: list[str] = []
+        for line in path.read().to_str().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            paths.append(line)
+        return paths
+
+    @staticmethod
+    def read_edits(path: core.Path | None) -> list[dict[str, Any]]:
+        if path is None:
+            return []
+        edits = core.JsonFile.from_data(path.read()).as_object()
+        if not isinstance(edits, list):
+            raise ValueError("Edits file must contain a JSON list")
+        return edits  # type: ignore
+
+    def get_jobs(self) -> list[tuple[str, str | None]]:
+        """Expand the inputs into save files and their output paths. Files in an
+        input directory keep their path relative to that directory."""
+        jobs: list[tuple[str, str | None]] = []
+        for input_path in self.inputs:
+            path = core.Path(input_path)
+            if path.is_directory():
+                for file in sorted(
+                    path.glob("**/*", recursive=True), key=lambda p: p.to_str()
+                ):
+                    if file.is_file():
+                        jobs.append(
+                            (file.to_str(), self.get_output(file.strip_path_from(path)))
+                        )
+            else:
+                jobs.append(
+                    (path.to_str(), self.get_output(core.Path(path.basename())))
+                )
+        return jobs
+
+    def get_output(self, relative: core.Path) -> str | None:
+        if self.output_dir is None:
+            return None
+        return core.Path(self.output_dir).add(relative).to_str()
+
+    def run(self) -> bool:
+        """Process all save files, printing a JSON line for each one as it
+        finishes.
+
+        Returns:
+            bool: Whether every save file was processed successfully
+        """
+        jobs = self.get_jobs()
+        success = True
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_worker,
+            initargs=(
+                core.config_path,
+                core.log_path,
+                core.game_data_path,
+                core.data_dir_path,
+            ),
+        ) as executor:
+            futures: dict[
+                concurrent.futures.Future[dict[str, Any]], tuple[str, str | None]
+            ] = {}
+            for job in jobs:
+                future = executor.submit(process_save, job[0], self.edits, job[1])
+                futures[future] = job
+            for future in concurrent.futures.as_completed(futures):
+                result: dict[str, Any]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # the worker died or failed outside of process_save, e.g
+                    # BrokenProcessPool, so report it for this save and carry on
+                    input_path, output_path = futures[future]
+                    result = {
+                        "input": input_path,
+                        "output": output_path,
+                        "ok": False,
+                        "error": f"{type(e).__name__}: {e}",
+                    }
+                success = success and result["ok"]
+                sys.stdout.write(json.dumps(result) + "\n")
+                sys.stdout.flush()
+        return success
+
+    @staticmethod
+    def add_arguments(parser: Any):
+        parser.add_argument(
+            "inputs",
+            nargs="*",
+            help="save files or directories of save files to process",
+        )
+        parser.add_argument(
+            "--manifest",
+            "-m",
+            type=str,
+            help="file with a save file path on each line",
+        )
+        parser.add_argument(
+            "--edits",
+            "-e",
+            type=str,
+            help="JSON file with the list of edits to apply to each save",
+        )
+        parser.add_argument(
+            "--output-dir",
+            "-o",
+            type=str,
+            help="directory to write the edited saves to. If unspecified the saves are only checked",
+        )
+        parser.add_argument(
+            "--workers",
+            "-w",
+            type=int,
+            default=os.cpu_count(),
+            help="number of worker processes",
+        )
+
+    @staticmethod
+    def from_args(args: Any) -> Batch:
+        inputs: list[str] = list(args.inputs)
+        if args.manifest is not None:
+            inputs.extend(Batch.read_manifest(core.Path(args.manifest)))
+        edits = Batch.read_edits(core.map_opt(args.edits, core.Path))
+        return Batch(inputs, edits, args.output_dir, args.workers)
@@ -26,8 +26,9 @@ class CatEditor:
         return self.save_file.cats.get_non_gacha_cats(self.save_file)
 
     def filter_cats(self, cats: list[core.Cat]) -> list[core.Cat]:
-        unlocked_cats = self.get_current_cats()
-        return [cat for cat in cats if cat in unlocked_cats]
+        all_cats = self.save_file.cats
+        selection = all_cats.select_cats(cats) & all_cats.select_unlocked()
+        return selection.get_cats(all_cats)
 
     def get_cats_rarity(self, rarity: int) -> list[core.Cat]:
         return self.save_file.cats.get_cats_rarity(self.save_file, rarity)
@@ -48,6 +49,7 @@ class CatEditor:
         if len(current_cats) > 50:
             color.color_print_key("total_selected_cats", total=len(current_cats))
         else:
+            self.save_file.cats.prefetch_names(self.save_file, current_cats)
             for cat in current_cats:
                 names = cat.get_names_cls(self.save_file)
                 if not names:
@@ -130,12 +132,15 @@ class CatEditor:
         else:
             mode = SelectMode.OR
 
-        if mode == SelectMode.AND:
-            return list(set(current_cats) & set(new_cats)), False
-        if mode == SelectMode.OR:
-            return list(set(current_cats) | set(new_cats)), False
         if mode == SelectMode.REPLACE:
             return new_cats, False
+        all_cats = self.save_file.cats
+        current = all_cats.select_cats(current_cats)
+        new = all_cats.select_cats(new_cats)
+        if mode == SelectMode.AND:
+            return (current & new).get_cats(all_cats), False
+        if mode == SelectMode.OR:
+            return (current | new).get_cats(all_cats), False
         return new_cats, False
 
     def select_id(self) -> list[core.Cat] | None:
@@ -148,7 +153,7 @@ class CatEditor:
         return self.save_file.cats.get_cats_by_ids(cat_ids)
 
     def select_cats_game_version(self) -> list[core.Cat] | None:
-        unitbuy = core.UnitBuy(self.save_file)
+        unitbuy = self.save_file.cats.read_unitbuy(self.save_file)
         if unitbuy.unit_buy is None:
             return None
 
@@ -209,15 +214,8 @@ class CatEditor:
         if not valid_versions:
             color.color_print_key("no_valid_gvs_entered")
 
-        cats: list[core.Cat] = []
-        for cat in self.save_file.cats.cats:
-            row = unitbuy.get_unit_buy(cat.id)
-            if row is None:
-                continue
-            if row.game_version in valid_versions:
-                cats.append(cat)
-
-        return cats
+        cats = self.save_file.cats
+        return cats.select_game_versions(self.save_file, valid_versions).get_cats(cats)
 
     def select_rarity(self) -> list[core.Cat] | None:
         rarity_names = self.save_file.cats.get_rarity_names(self.save_file)
@@ -226,31 +224,22 @@ class CatEditor:
         )
         if rarity_ids is None:
             return None
-        cats: list[core.Cat] = []
+        cats = self.save_file.cats
+        selection = core.CatSelection(0, len(cats))
         for rarity_id in rarity_ids:
-            rarity_cats = self.get_cats_rarity(rarity_id)
-            cats = list(set(cats + rarity_cats))
-        return cats
+            selection |= cats.select_rarity(self.save_file, rarity_id)
+        return selection.get_cats(cats)
 
     def select_name(self) -> list[core.Cat] | None:
         usr_name = dialog_creator.str_input_key("enter_name")
         if usr_name is None:
             return []
-        cats = self.get_cats_name(usr_name)
-        if not cats:
+        matches = self.save_file.cats.find_names(self.save_file, usr_name)
+        cat_list = self.save_file.cats.get_cats_by_ids(list(matches))
+        if not cat_list:
             color.color_print_key("no_cats_found_name", name=usr_name)
             return None
-        cat_names: list[str] = []
-        cat_list: list[core.Cat] = []
-        for cat in cats:
-            names = cat.get_names_cls(self.save_file)
-            if not names:
-                names = [str(cat.id)]
-            for name in names:
-                if usr_name.lower() in name.lower():
-                    cat_names.append(name)
-                    cat_list.append(cat)
-                    break
+        cat_names = [matches[cat.id] for cat in cat_list]
         if len(cat_names) == 1:
             color.color_print(f"<@t>{cat_names[0]}</>")
         cat_option_ids = dialog_creator.multi_select_indexes_key(
@@ -339,13 +328,14 @@ class CatEditor:
         if gatya_ids is None:
             return None
 
-        cats: list[core.Cat] = []
+        cats = self.save_file.cats
+        selection = core.CatSelection(0, len(cats))
         for gatya_id in gatya_ids:
-            gatya_cats = self.get_cats_gatya_banner(gatya_id)
-            if gatya_cats is None:
+            gatya_selection = cats.select_gatya_banner(self.save_file, gatya_id)
+            if gatya_selection is None:
                 continue
-            cats = list(set(cats + gatya_cats))
-        return cats
+            selection |= gatya_selection
+        return selection.get_cats(cats)
 
     def unlock_cats(self, cats: list[core.Cat]):
         cats = self.get_save_cats(cats)
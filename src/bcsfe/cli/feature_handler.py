@@ -287,7 +287,7 @@ class FeatureHandler:
                 features_dict = self.get_features()
                 features = [[k] for k in features_dict.keys()]
 
-                core.core_data.game_data_getter = None  # reset game data getter so that if an old version is removed, it will download the new version
+                core.core_data.game_data_registry.remove_unavailable()  # retry game data that failed to download, e.g because of no internet
 
     def do_save_actions(self):
         if core.core_data.config.get_bool(core.ConfigKey.CLEAR_TUTORIAL_ON_LOAD):
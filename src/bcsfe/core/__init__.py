@@ -1,5 +1,7 @@
 from __future__ import annotations
+from collections import OrderedDict
 from collections.abc import Callable
+import threading
 from typing import Any, Optional, TypeVar
 
 from bcsfe import __app_name__
@@ -34,6 +36,7 @@ from bcsfe.core.game.catbase.beacon_base import BeaconEventListScene
 from bcsfe.core.game.catbase.cat import (
     Cat,
     Cats,
+    CatSelection,
     UnitBuy,
     TalentData,
     NyankoPictureBook,
@@ -95,7 +98,7 @@ from bcsfe.core.game.catbase.unlock_popups import (
     UnlockPopupData,
     UnlockPopupLine,
 )
-from bcsfe.core.game.catbase.upgrade import Upgrade
+from bcsfe.core.game.catbase.upgrade import Upgrade, UpgradeView
 from bcsfe.core.game.catbase.user_rank_rewards import (
     UserRankRewards,
     RankGifts,
@@ -140,7 +143,13 @@ from bcsfe.core.io.data import Data
 from bcsfe.core.io.json_file import JsonFile
 from bcsfe.core.io.path import Path
 from bcsfe.core.io.save import SaveError, SaveFile, CantDetectSaveCCError
-from bcsfe.core.io.thread_helper import thread_run_many, Thread
+from bcsfe.core.io.save_reader import SaveReader
+from bcsfe.core.io.thread_helper import (
+    thread_run_many,
+    Thread,
+    ThreadPool,
+    get_thread_pool,
+)
 from bcsfe.core.io.yaml import YamlFile
 from bcsfe.core.io.git_handler import GitHandler, Repo
 from bcsfe.core.io.root_handler import RootHandler
@@ -167,6 +176,7 @@ from bcsfe.core.server.managed_item import (
 )
 from bcsfe.core.server.request import RequestHandler, MultiPartFile, MultipartForm
 from bcsfe.core.server.server_handler import ServerHandler
+from bcsfe.core.server.async_server_handler import AsyncServerHandler, HostLimiter
 from bcsfe.core.server.updater import Updater
 from bcsfe.core.theme_handler import (
     ThemeHandler,
@@ -194,13 +204,17 @@ def first_tuple(v: tuple[T, Any] | None) -> T | None:
     return map_opt(v, lambda x: x[0])
 
 
-class CoreData:
-    def init_data(self):
-        self.config = Config(config_path, print_config_err)
-        self.logger = Logger(log_path)
-        self.local_manager = LocalManager()
-        self.theme_manager = ThemeHandler()
-        self.max_value_manager = MaxValueHelper.from_file()
+class GameData:
+    def __init__(self, cc: CountryCode, gv: GameVersion):
+        """The game data tables for a single country code, game version and
+        language. Each table is only built when it is first used.
+
+        Args:
+            cc (CountryCode): The country code
+            gv (GameVersion): The game version
+        """
+        self.cc = cc
+        self.gv = gv
         self.game_data_getter: GameDataGetter | None = None
         self.gatya_item_names: GatyaItemNames | None = None
         self.gatya_item_buy: GatyaItemBuy | None = None
@@ -218,98 +232,172 @@ class CoreData:
         self.mission_names: MissionNames | None = None
         self.mission_conditions: MissionConditions | None = None
 
+
+class GameDataRegistry:
+    def __init__(self, max_size: int = 4):
+        """Game data for each (cc, game version, language) that has been used,
+        so saves from different regions and versions each get their own tables.
+        The least recently used game data is removed once there are more than
+        `max_size` entries.
+
+        Args:
+            max_size (int, optional): Maximum number of entries. Defaults to 4.
+        """
+        self.max_size = max_size
+        self.entries: OrderedDict[tuple[str, int, str], GameData] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, cc: CountryCode, gv: GameVersion) -> GameData:
+        lang = core_data.config.get_str(ConfigKey.LOCALE)
+        key = (cc.get_code(), gv.game_version, lang)
+        with self.lock:
+            game_data = self.entries.get(key)
+            if game_data is not None:
+                self.entries.move_to_end(key)
+                return game_data
+            game_data = GameData(cc, gv)
+            self.entries[key] = game_data
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+            return game_data
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def remove_unavailable(self):
+        """Remove game data that couldn't find a game data version, so that the
+        next use tries again."""
+        with self.lock:
+            for key, game_data in list(self.entries.items()):
+                gdg = game_data.game_data_getter
+                if gdg is not None and gdg.version is None:
+                    del self.entries[key]
+
+
+class CoreData:
+    def init_data(self):
+        self.config = Config(config_path, print_config_err)
+        old_logger: Logger | None = getattr(self, "logger", None)
+        if old_logger is not None:
+            old_logger.close()
+        self.logger = Logger(log_path)
+        self.local_manager = LocalManager()
+        self.theme_manager = ThemeHandler()
+        self.max_value_manager = MaxValueHelper.from_file()
+        self.game_data_registry = GameDataRegistry()
+
+    def get_game_data(self, save: SaveFile) -> GameData:
+        return self.game_data_registry.get(save.cc, save.game_version)
+
     def get_game_data_getter(
         self,
         save: SaveFile | None = None,
         cc: CountryCode | None = None,
         gv: GameVersion | None = None,
     ) -> GameDataGetter:
-        if self.game_data_getter is None:
-            if cc is None and save is not None:
-                cc = save.cc
-            if cc is None:
-                raise ValueError("cc must be provided if save is not provided")
-            if gv is None and save is not None:
-                gv = save.game_version
-            if gv is None:
-                raise ValueError("gv must be provided if save is not provided")
-            self.game_data_getter = GameDataGetter(cc, gv)
-        return self.game_data_getter
+        if cc is None and save is not None:
+            cc = save.cc
+        if cc is None:
+            raise ValueError("cc must be provided if save is not provided")
+        if gv is None and save is not None:
+            gv = save.game_version
+        if gv is None:
+            raise ValueError("gv must be provided if save is not provided")
+        game_data = self.game_data_registry.get(cc, gv)
+        if game_data.game_data_getter is None:
+            game_data.game_data_getter = GameDataGetter(cc, gv)
+        return game_data.game_data_getter
 
     def get_gatya_item_names(self, save: SaveFile) -> GatyaItemNames:
-        if self.gatya_item_names is None:
-            self.gatya_item_names = GatyaItemNames(save)
-        return self.gatya_item_names
+        game_data = self.get_game_data(save)
+        if game_data.gatya_item_names is None:
+            game_data.gatya_item_names = GatyaItemNames(save)
+        return game_data.gatya_item_names
 
     def get_gatya_item_buy(self, save: SaveFile) -> GatyaItemBuy:
-        if self.gatya_item_buy is None:
-            self.gatya_item_buy = GatyaItemBuy(save)
-        return self.gatya_item_buy
+        game_data = self.get_game_data(save)
+        if game_data.gatya_item_buy is None:
+            game_data.gatya_item_buy = GatyaItemBuy(save)
+        return game_data.gatya_item_buy
 
     def get_chara_drop(self, save: SaveFile) -> CharaDrop:
-        if self.chara_drop is None:
-            self.chara_drop = CharaDrop(save)
-        return self.chara_drop
+        game_data = self.get_game_data(save)
+        if game_data.chara_drop is None:
+            game_data.chara_drop = CharaDrop(save)
+        return game_data.chara_drop
 
     def get_gamatoto_levels(self, save: SaveFile) -> GamatotoLevels:
-        if self.gamatoto_levels is None:
-            self.gamatoto_levels = GamatotoLevels(save)
-        return self.gamatoto_levels
+        game_data = self.get_game_data(save)
+        if game_data.gamatoto_levels is None:
+            game_data.gamatoto_levels = GamatotoLevels(save)
+        return game_data.gamatoto_levels
 
     def get_gamatoto_members_name(self, save: SaveFile) -> GamatotoMembersName:
-        if self.gamatoto_members_name is None:
-            self.gamatoto_members_name = GamatotoMembersName(save)
-        return self.gamatoto_members_name
+        game_data = self.get_game_data(save)
+        if game_data.gamatoto_members_name is None:
+            game_data.gamatoto_members_name = GamatotoMembersName(save)
+        return game_data.gamatoto_members_name
 
     def get_localizable(self, save: SaveFile) -> Localizable:
-        if self.localizable is None:
-            self.localizable = Localizable(save)
-        return self.localizable
+        game_data = self.get_game_data(save)
+        if game_data.localizable is None:
+            game_data.localizable = Localizable(save)
+        return game_data.localizable
 
     def get_ability_data(self, save: SaveFile) -> AbilityData:
-        if self.abilty_data is None:
-            self.abilty_data = AbilityData(save)
-        return self.abilty_data
+        game_data = self.get_game_data(save)
+        if game_data.abilty_data is None:
+            game_data.abilty_data = AbilityData(save)
+        return game_data.abilty_data
 
     def get_enemy_names(self, save: SaveFile) -> EnemyNames:
-        if self.enemy_names is None:
-            self.enemy_names = EnemyNames(save)
-        return self.enemy_names
+        game_data = self.get_game_data(save)
+        if game_data.enemy_names is None:
+            game_data.enemy_names = EnemyNames(save)
+        return game_data.enemy_names
 
     def get_rank_gift_descriptions(self, save: SaveFile) -> RankGiftDescriptions:
-        if self.rank_gift_descriptions is None:
-            self.rank_gift_descriptions = RankGiftDescriptions(save)
-        return self.rank_gift_descriptions
+        game_data = self.get_game_data(save)
+        if game_data.rank_gift_descriptions is None:
+            game_data.rank_gift_descriptions = RankGiftDescriptions(save)
+        return game_data.rank_gift_descriptions
 
     def get_rank_gifts(self, save: SaveFile) -> RankGifts:
-        if self.rank_gifts is None:
-            self.rank_gifts = RankGifts(save)
-        return self.rank_gifts
+        game_data = self.get_game_data(save)
+        if game_data.rank_gifts is None:
+            game_data.rank_gifts = RankGifts(save)
+        return game_data.rank_gifts
 
     def get_treasure_text(self, save: SaveFile) -> TreasureText:
-        if self.treasure_text is None:
-            self.treasure_text = TreasureText(save)
-        return self.treasure_text
+        game_data = self.get_game_data(save)
+        if game_data.treasure_text is None:
+            game_data.treasure_text = TreasureText(save)
+        return game_data.treasure_text
 
     def get_cat_shrine_levels(self, save: SaveFile) -> CatShrineLevels:
-        if self.cat_shrine_levels is None:
-            self.cat_shrine_levels = CatShrineLevels(save)
-        return self.cat_shrine_levels
+        game_data = self.get_game_data(save)
+        if game_data.cat_shrine_levels is None:
+            game_data.cat_shrine_levels = CatShrineLevels(save)
+        return game_data.cat_shrine_levels
 
     def get_medal_names(self, save: SaveFile) -> MedalNames:
-        if self.medal_names is None:
-            self.medal_names = MedalNames(save)
-        return self.medal_names
+        game_data = self.get_game_data(save)
+        if game_data.medal_names is None:
+            game_data.medal_names = MedalNames(save)
+        return game_data.medal_names
 
     def get_mission_names(self, save: SaveFile) -> MissionNames:
-        if self.mission_names is None:
-            self.mission_names = MissionNames(save)
-        return self.mission_names
+        game_data = self.get_game_data(save)
+        if game_data.mission_names is None:
+            game_data.mission_names = MissionNames(save)
+        return game_data.mission_names
 
     def get_mission_conditions(self, save: SaveFile) -> MissionConditions:
-        if self.mission_conditions is None:
-            self.mission_conditions = MissionConditions(save)
-        return self.mission_conditions
+        game_data = self.get_game_data(save)
+        if game_data.mission_conditions is None:
+            game_data.mission_conditions = MissionConditions(save)
+        return game_data.mission_conditions
 
     def get_lang(self, save: SaveFile) -> str:
         return self.get_localizable(save).get_lang() or "en"
@@ -499,14 +587,18 @@ __all__ = [
     "Data",
     "CSV",
     "ServerHandler",
+    "AsyncServerHandler",
+    "HostLimiter",
     "GameVersion",
     "SaveFile",
+    "SaveReader",
     "JsonFile",
     "ManagedItem",
     "ManagedItemType",
     "BackupMetaData",
     "Cat",
     "Upgrade",
+    "UpgradeView",
     "PowerUpHelper",
     "TalentOrb",
     "TalentOrbs",
@@ -565,6 +657,7 @@ __all__ = [
     "LineUps",
     "BeaconEventListScene",
     "Cats",
+    "CatSelection",
     "TalentData",
     "Gatya",
     "GatyaDataSet",
@@ -608,6 +701,8 @@ __all__ = [
     "Row",
     "SaveError",
     "thread_run_many",
+    "ThreadPool",
+    "get_thread_pool",
     "Repo",
     "RootHandler",
     "ClientInfo",
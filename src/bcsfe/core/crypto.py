@@ -3,6 +3,7 @@ import enum
 import hashlib
 import hmac
 import random
+from typing import Iterable, Union, cast
 from bcsfe import core
 
 
@@ -14,6 +15,9 @@ class HashAlgorithm(enum.Enum):
     SHA256 = enum.auto()
 
 
+HashInput = Union["core.Data", bytes, bytearray, memoryview]
+
+
 class Hash:
     """A class to hash data."""
 
@@ -22,38 +26,81 @@ class Hash:
 
         Args:
             algorithm (HashAlgorithm): The hash algorithm to use.
+
+        Raises:
+            ValueError: Invalid hash algorithm.
         """
         self.algorithm = algorithm
+        if self.algorithm == HashAlgorithm.MD5:
+            self.hash = hashlib.md5()
+        elif self.algorithm == HashAlgorithm.SHA1:
+            self.hash = hashlib.sha1()
+        elif self.algorithm == HashAlgorithm.SHA256:
+            self.hash = hashlib.sha256()
+        else:
+            raise ValueError("Invalid hash algorithm")
+
+    def update(self, *data: HashInput) -> Hash:
+        """Adds data to the hash without copying it.
+
+        Args:
+            *data (HashInput): The data to add, in order.
+
+        Returns:
+            Hash: This hash, so calls can be chained.
+        """
+        for item in data:
+            if isinstance(item, core.Data):
+                item = item.get_view()
+            self.hash.update(item)
+        return self
+
+    def digest(self, length: int | None = None) -> core.Data:
+        """Gets the hash of the data added so far.
+
+        Args:
+            length (int | None, optional): The length of the hash. Defaults to None.
+
+        Returns:
+            core.Data: The hash of the data.
+        """
+        if length is None:
+            return core.Data(self.hash.digest())
+        return core.Data(self.hash.digest()[:length])
+
+    def copy(self) -> Hash:
+        """Copies the current state of the hash.
+
+        Returns:
+            Hash: The copied hash.
+        """
+        new_hash = Hash(self.algorithm)
+        new_hash.hash = self.hash.copy()
+        return new_hash
 
     def get_hash(
         self,
-        data: core.Data,
+        data: HashInput | Iterable[HashInput],
         length: int | None = None,
     ) -> core.Data:
         """Gets the hash of the given data.
 
         Args:
-            data (core.Data): The data to hash.
+            data (HashInput | Iterable[HashInput]): The data to hash, or several
+                buffers to hash one after another.
             length (int | None, optional): The length of the hash. Defaults to None.
 
-        Raises:
-            ValueError: Invalid hash algorithm.
-
         Returns:
             core.Data: The hash of the data.
         """
-        if self.algorithm == HashAlgorithm.MD5:
-            hash = hashlib.md5()
-        elif self.algorithm == HashAlgorithm.SHA1:
-            hash = hashlib.sha1()
-        elif self.algorithm == HashAlgorithm.SHA256:
-            hash = hashlib.sha256()
+        hash = Hash(self.algorithm)
+        if isinstance(data, (core.Data, bytes, bytearray, memoryview)):
+            # an Iterable[HashInput] is narrowed to memoryview[HashInput] here,
+            # but a memoryview is always a single buffer
+            hash.update(cast(HashInput, data))
         else:
-            raise ValueError("Invalid hash algorithm")
-        hash.update(data.get_bytes())
-        if length is None:
-            return core.Data(hash.digest())
-        return core.Data(hash.digest()[:length])
+            hash.update(*data)
+        return hash.digest(length)
 
 
 class Random:
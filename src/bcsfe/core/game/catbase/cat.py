@@ -1,7 +1,12 @@
 from __future__ import annotations
-from typing import Any
+import array
+import bisect
+import itertools
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 from bcsfe import core
 
+T = TypeVar("T")
+
 
 class SkillLevel:
     def __init__(
@@ -25,10 +30,21 @@ class SkillLevel:
 class SkillLevelData:
     def __init__(self, levels: list[SkillLevel] | None):
         self.levels = levels
+        self.level_ids: dict[int, SkillLevel] = {}
+        for level in levels or []:
+            self.level_ids.setdefault(level.id, level)
 
     @staticmethod
     def from_game_data(save_file: core.SaveFile) -> SkillLevelData | None:
         gdg = core.core_data.get_game_data_getter(save_file)
+        return gdg.load_cached(
+            "SkillLevel",
+            [("DataLocal", "SkillLevel.csv")],
+            lambda: SkillLevelData.parse(gdg),
+        )
+
+    @staticmethod
+    def parse(gdg: core.GameDataGetter) -> SkillLevelData | None:
         data = gdg.download("DataLocal", "SkillLevel.csv")
         if data is None:
             return None
@@ -39,12 +55,7 @@ class SkillLevelData:
         return SkillLevelData(levels)
 
     def get_skill_level(self, id: int) -> SkillLevel | None:
-        if self.levels is None:
-            return None
-        for level in self.levels:
-            if level.id == id:
-                return level
-        return None
+        return self.level_ids.get(id)
 
 
 class Skill:
@@ -91,6 +102,9 @@ class CatSkill:
         self.cat_id = cat_id
         self.type_id = type_id
         self.skills = skills
+        self.skill_ids: dict[int, Skill] = {}
+        for skill in skills:
+            self.skill_ids.setdefault(skill.ability_id, skill)
 
     @staticmethod
     def from_row(row: core.Row):
@@ -125,6 +139,14 @@ class CatSkills:
     @staticmethod
     def from_game_data(save_file: core.SaveFile) -> CatSkills | None:
         gdg = core.core_data.get_game_data_getter(save_file)
+        return gdg.load_cached(
+            "SkillAcquisition",
+            [("DataLocal", "SkillAcquisition.csv")],
+            lambda: CatSkills.parse(gdg),
+        )
+
+    @staticmethod
+    def parse(gdg: core.GameDataGetter) -> CatSkills | None:
         data = gdg.download("DataLocal", "SkillAcquisition.csv")
         if data is None:
             return None
@@ -146,12 +168,18 @@ class SkillNames:
     @staticmethod
     def from_game_data(save_file: core.SaveFile) -> SkillNames | None:
         gdg = core.core_data.get_game_data_getter(save_file)
+        return gdg.load_cached(
+            "SkillDescriptions",
+            [("resLocal", "SkillDescriptions.csv")],
+            lambda: SkillNames.parse(gdg, save_file.cc),
+        )
+
+    @staticmethod
+    def parse(gdg: core.GameDataGetter, cc: core.CountryCode) -> SkillNames | None:
         data = gdg.download("resLocal", "SkillDescriptions.csv")
         if data is None:
             return None
-        csv = core.CSV(
-            data, delimiter=core.Delimeter.from_country_code_res(save_file.cc)
-        )
+        csv = core.CSV(data, delimiter=core.Delimeter.from_country_code_res(cc))
         names: dict[int, str] = {}
         for line in csv.lines[1:]:
             names[line[0].to_int()] = line[1].to_str()
@@ -195,10 +223,7 @@ class TalentData:
         cat_skill = self.get_cat_skill(cat_id)
         if cat_skill is None:
             return None
-        for skill in cat_skill.skills:
-            if skill.ability_id == skill_id:
-                return skill
-        return None
+        return cat_skill.skill_ids.get(skill_id)
 
     def get_talent_from_cat_skill(self, cat: core.Cat, skill_id: int) -> Talent | None:
         talents = cat.talents
@@ -315,12 +340,27 @@ class NyankoPictureBookCatData:
 
 
 class NyankoPictureBook:
-    def __init__(self, save_file: core.SaveFile):
+    def __init__(
+        self,
+        save_file: core.SaveFile,
+        cats: list[NyankoPictureBookCatData] | None = None,
+    ):
         self.save_file = save_file
-        self.cats = self.get_cats()
+        self.cats = cats if cats is not None else self.get_cats()
+        self.cat_ids: dict[int, NyankoPictureBookCatData] = {}
+        for cat in self.cats or []:
+            self.cat_ids.setdefault(cat.cat_id, cat)
 
     def get_cats(self) -> list[NyankoPictureBookCatData] | None:
         gdg = core.core_data.get_game_data_getter(self.save_file)
+        return gdg.load_cached(
+            "nyankoPictureBookData",
+            [("DataLocal", "nyankoPictureBookData.csv")],
+            lambda: NyankoPictureBook.parse(gdg),
+        )
+
+    @staticmethod
+    def parse(gdg: core.GameDataGetter) -> list[NyankoPictureBookCatData] | None:
         data = gdg.download("DataLocal", "nyankoPictureBookData.csv")
         if data is None:
             return None
@@ -342,12 +382,7 @@ class NyankoPictureBook:
         return cats
 
     def get_cat(self, cat_id: int) -> NyankoPictureBookCatData | None:
-        if self.cats is None:
-            return None
-        for cat in self.cats:
-            if cat.cat_id == cat_id:
-                return cat
-        return None
+        return self.cat_ids.get(cat_id)
 
     def get_obtainable_cats(self) -> list[NyankoPictureBookCatData] | None:
         if self.cats is None:
@@ -467,8 +502,14 @@ class UnitBuy:
         self.unit_buy = self.read_unit_buy()
 
     def read_unit_buy(self) -> list[UnitBuyCatData] | None:
-        unit_buy: list[UnitBuyCatData] = []
         gdg = core.core_data.get_game_data_getter(self.save_file)
+        return gdg.load_cached(
+            "unitbuy", [("DataLocal", "unitbuy.csv")], lambda: UnitBuy.parse(gdg)
+        )
+
+    @staticmethod
+    def parse(gdg: core.GameDataGetter) -> list[UnitBuyCatData] | None:
+        unit_buy: list[UnitBuyCatData] = []
         data = gdg.download("DataLocal", "unitbuy.csv")
         if data is None:
             return None
@@ -525,20 +566,127 @@ class UnitLimit:
 
 
 class Cat:
-    def __init__(self, id: int, unlocked: int):
+    __slots__ = ("id", "index", "parent")
+
+    def __init__(
+        self,
+        id: int,
+        unlocked: int = 0,
+        parent: Cats | None = None,
+        index: int = 0,
+    ):
+        """A view of a single cat. The data of the cat is stored in the columns
+        of `parent`.
+
+        Args:
+            id (int): The id of the cat
+            unlocked (int, optional): Whether the cat is unlocked. Only used if
+                `parent` is None. Defaults to 0.
+            parent (Cats | None, optional): The cats that store the data. If None
+                the cat gets its own storage. Defaults to None.
+            index (int, optional): Index of the cat in `parent`. Defaults to 0.
+        """
+        if parent is None:
+            parent = Cats(1)
+            parent.unlocked[0] = unlocked
+            index = 0
         self.id = id
-        self.unlocked = unlocked
-        self.talents: list[Talent] | None = None
-        self.upgrade: core.Upgrade = core.Upgrade.init()
-        self.current_form: int = 0
-        self.unlocked_forms: int = 0
-        self.gatya_seen: int = 0
-        self.max_upgrade_level: core.Upgrade = core.Upgrade.init()
-        self.catguide_collected: bool = False
-        self.fourth_form: int = 0
-        self.catseyes_used: int = 0
-
-        self.names: list[str] | None = None
+        self.index = index
+        self.parent = parent
+
+    @property
+    def unlocked(self) -> int:
+        return self.parent.unlocked[self.index]
+
+    @unlocked.setter
+    def unlocked(self, value: int):
+        self.parent.unlocked[self.index] = value
+
+    @property
+    def current_form(self) -> int:
+        return self.parent.current_form[self.index]
+
+    @current_form.setter
+    def current_form(self, value: int):
+        self.parent.current_form[self.index] = value
+
+    @property
+    def unlocked_forms(self) -> int:
+        return self.parent.unlocked_forms[self.index]
+
+    @unlocked_forms.setter
+    def unlocked_forms(self, value: int):
+        self.parent.unlocked_forms[self.index] = value
+
+    @property
+    def gatya_seen(self) -> int:
+        return self.parent.gatya_seen[self.index]
+
+    @gatya_seen.setter
+    def gatya_seen(self, value: int):
+        self.parent.gatya_seen[self.index] = value
+
+    @property
+    def catguide_collected(self) -> bool:
+        return self.parent.catguide_collected[self.index] != 0
+
+    @catguide_collected.setter
+    def catguide_collected(self, value: bool):
+        self.parent.catguide_collected[self.index] = value
+
+    @property
+    def fourth_form(self) -> int:
+        return self.parent.fourth_form[self.index]
+
+    @fourth_form.setter
+    def fourth_form(self, value: int):
+        self.parent.fourth_form[self.index] = value
+
+    @property
+    def catseyes_used(self) -> int:
+        return self.parent.catseyes_used[self.index]
+
+    @catseyes_used.setter
+    def catseyes_used(self, value: int):
+        self.parent.catseyes_used[self.index] = value
+
+    @property
+    def talents(self) -> list[Talent] | None:
+        return self.parent.talents[self.index]
+
+    @talents.setter
+    def talents(self, value: list[Talent] | None):
+        self.parent.talents[self.index] = value
+
+    @property
+    def names(self) -> list[str] | None:
+        return self.parent.names[self.index]
+
+    @names.setter
+    def names(self, value: list[str] | None):
+        self.parent.names[self.index] = value
+
+    @property
+    def upgrade(self) -> core.Upgrade:
+        return core.UpgradeView(
+            self.parent.upgrade_plus, self.parent.upgrade_base, self.index
+        )
+
+    @upgrade.setter
+    def upgrade(self, upgrade: core.Upgrade):
+        self.parent.upgrade_plus[self.index] = upgrade.plus
+        self.parent.upgrade_base[self.index] = upgrade.base
+
+    @property
+    def max_upgrade_level(self) -> core.Upgrade:
+        return core.UpgradeView(
+            self.parent.max_upgrade_plus, self.parent.max_upgrade_base, self.index
+        )
+
+    @max_upgrade_level.setter
+    def max_upgrade_level(self, upgrade: core.Upgrade):
+        self.parent.max_upgrade_plus[self.index] = upgrade.plus
+        self.parent.max_upgrade_base[self.index] = upgrade.base
 
     def get_talent_from_id(self, id: int) -> Talent | None:
         for talent in self.talents or []:
@@ -647,62 +795,6 @@ class Cat:
     def init(id: int) -> Cat:
         return Cat(id, 0)
 
-    @staticmethod
-    def read_unlocked(id: int, stream: core.Data):
-        return Cat(id, stream.read_int())
-
-    def write_unlocked(self, stream: core.Data):
-        stream.write_int(self.unlocked)
-
-    def read_upgrade(self, stream: core.Data):
-        self.upgrade = core.Upgrade.read(stream)
-
-    def write_upgrade(self, stream: core.Data):
-        self.upgrade.write(stream)
-
-    def read_current_form(self, stream: core.Data):
-        self.current_form = stream.read_int()
-
-    def write_current_form(self, stream: core.Data):
-        stream.write_int(self.current_form)
-
-    def read_unlocked_forms(self, stream: core.Data):
-        self.unlocked_forms = stream.read_int()
-
-    def write_unlocked_forms(self, stream: core.Data):
-        stream.write_int(self.unlocked_forms)
-
-    def read_gatya_seen(self, stream: core.Data):
-        self.gatya_seen = stream.read_int()
-
-    def write_gatya_seen(self, stream: core.Data):
-        stream.write_int(self.gatya_seen)
-
-    def read_max_upgrade_level(self, stream: core.Data):
-        level = core.Upgrade.read(stream)
-        self.max_upgrade_level = level
-
-    def write_max_upgrade_level(self, stream: core.Data):
-        self.max_upgrade_level.write(stream)
-
-    def read_catguide_collected(self, stream: core.Data):
-        self.catguide_collected = stream.read_bool()
-
-    def write_catguide_collected(self, stream: core.Data):
-        stream.write_bool(self.catguide_collected)
-
-    def read_fourth_form(self, stream: core.Data):
-        self.fourth_form = stream.read_int()
-
-    def write_fourth_form(self, stream: core.Data):
-        stream.write_int(self.fourth_form)
-
-    def read_catseyes_used(self, stream: core.Data):
-        self.catseyes_used = stream.read_int()
-
-    def write_catseyes_used(self, stream: core.Data):
-        stream.write_int(self.catseyes_used)
-
     def serialize(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -723,8 +815,11 @@ class Cat:
         }
 
     @staticmethod
-    def deserialize(data: dict[str, Any]) -> Cat:
-        cat = Cat(data["id"], data["unlocked"])
+    def deserialize(
+        data: dict[str, Any], parent: Cats | None = None, index: int = 0
+    ) -> Cat:
+        cat = Cat(data["id"], parent=parent, index=index)
+        cat.unlocked = data["unlocked"]
         cat.upgrade = core.Upgrade.deserialize(data["upgrade"])
         cat.current_form = data["current_form"]
         cat.unlocked_forms = data["unlocked_forms"]
@@ -760,20 +855,27 @@ class Cat:
 
     def get_names_cls(self, save_file: core.SaveFile) -> list[str] | None:
         if self.names is None:
-            self.names = Cat.get_names(self.id, save_file)
+            self.parent.prefetch_names(save_file, [self])
         return self.names
 
+    @staticmethod
+    def get_names_file_name(id: int, save_file: core.SaveFile) -> str:
+        return f"Unit_Explanation{id + 1}_{core.core_data.get_lang(save_file)}.csv"
+
     @staticmethod
     def get_names(
         id: int,
         save_file: core.SaveFile,
     ) -> list[str] | None:
-        file_name = f"Unit_Explanation{id + 1}_{core.core_data.get_lang(save_file)}.csv"
         data = core.core_data.get_game_data_getter(save_file).download(
-            "resLocal", file_name
+            "resLocal", Cat.get_names_file_name(id, save_file)
         )
         if data is None:
             return None
+        return Cat.parse_names(data, save_file)
+
+    @staticmethod
+    def parse_names(data: core.Data, save_file: core.SaveFile) -> list[str]:
         csv = core.CSV(
             data,
             core.Delimeter.from_country_code_res(save_file.cc),
@@ -786,6 +888,152 @@ class Cat:
         return names
 
 
+class CatNameIndex:
+    # names are joined with a character that can't be in a search
+    SEPARATOR = "\x00"
+
+    def __init__(self, names: dict[int, list[str]]):
+        """The names of all forms of every cat, indexed for case-insensitive
+        substring and prefix search.
+
+        Args:
+            names (dict[int, list[str]]): The names of each cat id
+        """
+        self.names = names
+        # (cat id, name) of each name, in cat id and then form order
+        self.entries: list[tuple[int, str]] = []
+        # offset of each name in the text
+        self.starts = array.array("i")
+        lower_names: list[str] = []
+        offset = 0
+        for id in sorted(names):
+            for name in names[id]:
+                lower_name = name.lower()
+                self.entries.append((id, name))
+                self.starts.append(offset)
+                lower_names.append(lower_name)
+                offset += len(lower_name) + 1
+        self.text = CatNameIndex.SEPARATOR.join(lower_names)
+
+        order = sorted(range(len(lower_names)), key=lambda i: lower_names[i])
+        self.sorted_names = [lower_names[i] for i in order]
+        self.sorted_entries = array.array("i", order)
+
+    @staticmethod
+    def get_cache_name(save_file: core.SaveFile) -> str:
+        return f"Unit_Explanation_{core.core_data.get_lang(save_file)}"
+
+    @staticmethod
+    def from_game_data(
+        save_file: core.SaveFile, total_cats: int
+    ) -> CatNameIndex | None:
+        """Get the name index, building it from every `Unit_Explanation` file
+        the first time and caching it next to the game data.
+
+        Args:
+            save_file (core.SaveFile): The save file
+            total_cats (int): Number of cats to get the names of
+
+        Returns:
+            CatNameIndex | None: The index, or None if there are no name files
+        """
+        gdg = core.core_data.get_game_data_getter(save_file)
+        keys = [
+            ("resLocal", Cat.get_names_file_name(id, save_file))
+            for id in range(total_cats)
+        ]
+        existing = gdg.get_existing_files("resLocal")
+        if any(file_name not in existing for _, file_name in keys):
+            # download the missing files concurrently before working out which
+            # files the cached index depends on
+            gdg.prefetch(key for key in keys if key[1] not in existing)
+            existing = gdg.get_existing_files("resLocal")
+        sources = [key for key in keys if key[1] in existing]
+        if not sources:
+            return None
+        return gdg.load_cached(
+            CatNameIndex.get_cache_name(save_file),
+            sources,
+            lambda: CatNameIndex.parse(gdg, save_file, total_cats),
+        )
+
+    @staticmethod
+    def parse(
+        gdg: core.GameDataGetter, save_file: core.SaveFile, total_cats: int
+    ) -> CatNameIndex | None:
+        keys = [
+            ("resLocal", Cat.get_names_file_name(id, save_file))
+            for id in range(total_cats)
+        ]
+        files = gdg.prefetch(keys)
+        names: dict[int, list[str]] = {}
+        for id, key in enumerate(keys):
+            data = files.get(key)
+            if data is not None:
+                names[id] = Cat.parse_names(data, save_file)
+        if not names:
+            return None
+        return CatNameIndex(names)
+
+    def get_names(self, id: int) -> list[str] | None:
+        return self.names.get(id)
+
+    def get_entry(self, offset: int) -> int:
+        return bisect.bisect_right(self.starts, offset) - 1
+
+    def search_entries(self, search_name: str) -> list[int]:
+        if not search_name:
+            return list(range(len(self.entries)))
+        if CatNameIndex.SEPARATOR in search_name:
+            return []
+        entries: list[int] = []
+        offset = self.text.find(search_name)
+        while offset != -1:
+            entry = self.get_entry(offset)
+            entries.append(entry)
+            if entry + 1 >= len(self.starts):
+                break
+            # only the first match in each name is needed
+            offset = self.text.find(search_name, self.starts[entry + 1])
+        return entries
+
+    def search_prefix_entries(self, search_name: str) -> list[int]:
+        entries: list[int] = []
+        i = bisect.bisect_left(self.sorted_names, search_name)
+        while i < len(self.sorted_names) and self.sorted_names[i].startswith(
+            search_name
+        ):
+            entries.append(self.sorted_entries[i])
+            i += 1
+        entries.sort()
+        return entries
+
+    def search(self, search_name: str, prefix: bool = False) -> dict[int, str]:
+        """Find the cats with a name that contains or starts with a string,
+        ignoring case.
+
+        Args:
+            search_name (str): The string to search for
+            prefix (bool, optional): Whether names must start with the string
+                instead of just containing it. Defaults to False.
+
+        Returns:
+            dict[int, str]: The first matching name of each cat id, in cat id
+                order
+        """
+        search_name = search_name.lower()
+        if prefix:
+            entries = self.search_prefix_entries(search_name)
+        else:
+            entries = self.search_entries(search_name)
+        matches: dict[int, str] = {}
+        for entry in entries:
+            id, name = self.entries[entry]
+            if id not in matches:
+                matches[id] = name
+        return matches
+
+
 class StorageItem:
     def __init__(self, item_id: int):
         self.item_id = item_id
@@ -839,9 +1087,133 @@ class StorageItem:
         return f"StorageItem(item_id={self.item_id}, item_type={self.item_type})"
 
 
+class CatSelection:
+    # maps 0/1 bytes to the digits of a binary string and back
+    TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+    FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+    def __init__(self, bits: int, total_cats: int):
+        """A set of cats stored as the bits of an int, so selections can be
+        combined with `&`, `|`, `-` and `~` without creating a list of cats for
+        each one.
+
+        Args:
+            bits (int): Bit `i` is set if the cat with id `i` is selected
+            total_cats (int): Number of cats that can be selected
+        """
+        self.total_cats = max(total_cats, 0)
+        self.bits = bits & ((1 << self.total_cats) - 1)
+
+    @staticmethod
+    def from_flags(flags: Iterable[Any]) -> CatSelection:
+        """Create a selection from one flag per cat, e.g a column of `Cats`.
+
+        Args:
+            flags (Iterable[Any]): Cat `i` is selected if `flags[i]` is truthy
+
+        Returns:
+            CatSelection: The selection
+        """
+        digits = bytes(map(bool, flags))
+        if not digits:
+            return CatSelection(0, 0)
+        bits = int(digits.translate(CatSelection.TO_DIGITS)[::-1], 2)
+        return CatSelection(bits, len(digits))
+
+    @staticmethod
+    def from_ids(ids: Iterable[int], total_cats: int) -> CatSelection:
+        bits = 0
+        for id in ids:
+            if 0 <= id < total_cats:
+                bits |= 1 << id
+        return CatSelection(bits, total_cats)
+
+    def get_flags(self) -> bytes:
+        """Get a 0 or 1 byte for each cat.
+
+        Returns:
+            bytes: Byte `i` is 1 if the cat with id `i` is selected
+        """
+        if self.total_cats == 0:
+            return b""
+        digits = format(self.bits, f"0{self.total_cats}b")[::-1]
+        return digits.encode("ascii").translate(CatSelection.FROM_DIGITS)
+
+    def get_ids(self) -> list[int]:
+        return list(itertools.compress(range(self.total_cats), self.get_flags()))
+
+    def get_cats(self, cats: Cats) -> list[Cat]:
+        return list(itertools.compress(cats.cats, self.get_flags()))
+
+    def __and__(self, other: CatSelection) -> CatSelection:
+        return CatSelection(
+            self.bits & other.bits, max(self.total_cats, other.total_cats)
+        )
+
+    def __or__(self, other: CatSelection) -> CatSelection:
+        return CatSelection(
+            self.bits | other.bits, max(self.total_cats, other.total_cats)
+        )
+
+    def __sub__(self, other: CatSelection) -> CatSelection:
+        return CatSelection(
+            self.bits & ~other.bits, max(self.total_cats, other.total_cats)
+        )
+
+    def __invert__(self) -> CatSelection:
+        return CatSelection(~self.bits, self.total_cats)
+
+    def __contains__(self, id: int) -> bool:
+        return 0 <= id < self.total_cats and (self.bits >> id) & 1 == 1
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.get_ids())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CatSelection):
+            return NotImplemented
+        return self.bits == other.bits and self.total_cats == other.total_cats
+
+    def __repr__(self) -> str:
+        return f"CatSelection(ids={self.get_ids()}, total_cats={self.total_cats})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
 class Cats:
-    def __init__(self, cats: list[Cat], total_storage_items: int = 0):
-        self.cats = cats
+    def __init__(self, total_cats: int = 0, total_storage_items: int = 0):
+        """The cats of a save file. Each per-cat value is stored in a column
+        with one item per cat, and `Cat` objects are views of a single row.
+
+        Args:
+            total_cats (int, optional): Number of cats. Defaults to 0.
+            total_storage_items (int, optional): Number of storage slots.
+                Defaults to 0.
+        """
+        total_cats = max(total_cats, 0)
+        self.unlocked = Cats.new_column(total_cats)
+        self.upgrade_plus = Cats.new_column(total_cats)
+        self.upgrade_base = Cats.new_column(total_cats)
+        self.current_form = Cats.new_column(total_cats)
+        self.unlocked_forms = Cats.new_column(total_cats)
+        self.gatya_seen = Cats.new_column(total_cats)
+        self.max_upgrade_plus = Cats.new_column(total_cats)
+        self.max_upgrade_base = Cats.new_column(total_cats)
+        self.catguide_collected = Cats.new_column(total_cats, "b")
+        self.fourth_form = Cats.new_column(total_cats)
+        self.catseyes_used = Cats.new_column(total_cats)
+        self.talents: list[list[Talent] | None] = [None] * total_cats
+        self.names: list[list[str] | None] = [None] * total_cats
+        self.cat_views: list[Cat] | None = None
+        self.selections: dict[tuple[Any, ...], Any] = {}
+
         self.storage_items = [StorageItem.init() for _ in range(total_storage_items)]
         self.favourites: dict[int, bool] = {}
         self.chara_new_flags: dict[int, int] = {}
@@ -849,6 +1221,20 @@ class Cats:
         self.unit_limit: UnitLimit | None = None
         self.nyanko_picture_book: NyankoPictureBook | None = None
         self.talent_data: TalentData | None = None
+        self.name_index: CatNameIndex | None = None
+
+    @staticmethod
+    def new_column(total_cats: int, fmt: str = "i") -> array.array[int]:
+        return array.array(fmt, [0]) * total_cats
+
+    def __len__(self) -> int:
+        return len(self.unlocked)
+
+    @property
+    def cats(self) -> list[Cat]:
+        if self.cat_views is None:
+            self.cat_views = [Cat(i, parent=self, index=i) for i in range(len(self))]
+        return self.cat_views
 
     def get_all_cats(self) -> list[Cat]:
         return self.cats
@@ -858,15 +1244,12 @@ class Cats:
         total_cats = Cats.get_gv_cats(gv)
         if total_cats is None:
             total_cats = 0
-        cats_l: list[Cat] = []
-        for i in range(total_cats):
-            cats_l.append(Cat.init(i))
 
         if gv < 110100:
             total_storage_items = 100
         else:
             total_storage_items = 0
-        return Cats(cats_l, total_storage_items)
+        return Cats(total_cats, total_storage_items)
 
     @staticmethod
     def get_gv_cats(gv: core.GameVersion) -> int | None:
@@ -886,24 +1269,103 @@ class Cats:
             total_cats = None
         return total_cats
 
+    def get_cached_selection(self, key: tuple[Any, ...], func: Callable[[], T]) -> T:
+        """Get a selection that only depends on the game data, creating it the
+        first time it is used.
+
+        Args:
+            key (tuple[Any, ...]): Key of the selection
+            func (Callable[[], T]): Creates the selection
+
+        Returns:
+            T: The selection
+        """
+        if key not in self.selections:
+            self.selections[key] = func()
+        return self.selections[key]
+
+    def select_all(self) -> CatSelection:
+        return CatSelection((1 << len(self)) - 1, len(self))
+
+    def select_ids(self, ids: Iterable[int]) -> CatSelection:
+        return CatSelection.from_ids(ids, len(self))
+
+    def select_cats(self, cats: Iterable[Cat]) -> CatSelection:
+        return self.select_ids(cat.id for cat in cats)
+
+    def select_unlocked(self) -> CatSelection:
+        return CatSelection.from_flags(self.unlocked)
+
+    def select_rarity(self, save_file: core.SaveFile, rarity: int) -> CatSelection:
+        unit_buy = self.read_unitbuy(save_file)
+        return self.get_cached_selection(
+            ("rarity", rarity),
+            lambda: CatSelection.from_flags(
+                unit_buy.get_cat_rarity(id) == rarity for id in range(len(self))
+            ),
+        )
+
+    def select_non_gacha(self, save_file: core.SaveFile) -> CatSelection:
+        def select() -> CatSelection:
+            unit_buy = self.read_unitbuy(save_file)
+            flags: list[bool] = []
+            for id in range(len(self)):
+                unit_buy_data = unit_buy.get_unit_buy(id)
+                flags.append(
+                    unit_buy_data is not None and unit_buy_data.unlock_source != 2
+                )
+            return CatSelection.from_flags(flags)
+
+        return self.get_cached_selection(("non_gacha",), select)
+
+    def select_game_versions(
+        self, save_file: core.SaveFile, game_versions: set[int]
+    ) -> CatSelection:
+        unit_buy = self.read_unitbuy(save_file)
+        flags: list[bool] = []
+        for id in range(len(self)):
+            unit_buy_data = unit_buy.get_unit_buy(id)
+            flags.append(
+                unit_buy_data is not None
+                and unit_buy_data.game_version in game_versions
+            )
+        return CatSelection.from_flags(flags)
+
+    def select_obtainable(self, save_file: core.SaveFile) -> CatSelection | None:
+        def select() -> CatSelection | None:
+            nyanko_picture_book = self.read_nyanko_picture_book(save_file)
+            obtainable_cats = nyanko_picture_book.get_obtainable_cats()
+            if obtainable_cats is None:
+                return None
+            return self.select_ids(cat.cat_id for cat in obtainable_cats)
+
+        return self.get_cached_selection(("obtainable",), select)
+
+    def select_gatya_banner(
+        self, save_file: core.SaveFile, gatya_id: int
+    ) -> CatSelection | None:
+        def select() -> CatSelection | None:
+            gatya_data_set = save_file.gatya.read_gatya_data_set(save_file)
+            cat_ids = gatya_data_set.get_cat_ids(gatya_id)
+            if cat_ids is None:
+                return None
+            return self.select_ids(cat_ids)
+
+        return self.get_cached_selection(("gatya_banner", gatya_id), select)
+
+    def select_name(
+        self, save_file: core.SaveFile, search_name: str, prefix: bool = False
+    ) -> CatSelection:
+        return self.select_ids(self.find_names(save_file, search_name, prefix))
+
     def get_unlocked_cats(self) -> list[Cat]:
-        return [cat for cat in self.cats if cat.unlocked]
+        return self.select_unlocked().get_cats(self)
 
     def get_non_unlocked_cats(self) -> list[Cat]:
-        return [cat for cat in self.cats if not cat.unlocked]
+        return (~self.select_unlocked()).get_cats(self)
 
     def get_non_gacha_cats(self, save_file: core.SaveFile) -> list[Cat]:
-        unitbuy = self.read_unitbuy(save_file)
-        cats: list[Cat] = []
-        for cat in self.cats:
-            unit_buy_data = unitbuy.get_unit_buy(cat.id)
-            if unit_buy_data is None:
-                continue
-
-            if unit_buy_data.unlock_source != 2:
-                cats.append(cat)
-
-        return cats
+        return self.select_non_gacha(save_file).get_cats(self)
 
     def read_unitbuy(self, save_file: core.SaveFile) -> UnitBuy:
         if self.unit_buy is None:
@@ -925,76 +1387,185 @@ class Cats:
             self.talent_data = TalentData.from_game_data(save_file)
         return self.talent_data
 
+    def read_name_index(self, save_file: core.SaveFile) -> CatNameIndex | None:
+        if self.name_index is None:
+            self.name_index = CatNameIndex.from_game_data(save_file, len(self))
+        return self.name_index
+
     def get_cats_rarity(self, save_file: core.SaveFile, rarity: int) -> list[Cat]:
-        unit_buy = self.read_unitbuy(save_file)
-        return [cat for cat in self.cats if unit_buy.get_cat_rarity(cat.id) == rarity]
+        return self.select_rarity(save_file, rarity).get_cats(self)
+
+    def prefetch_names(self, save_file: core.SaveFile, cats: list[Cat] | None = None):
+        """Get the names of many cats at once, instead of one file at a time.
+
+        Args:
+            save_file (core.SaveFile): The save file
+            cats (list[Cat] | None, optional): The cats. Defaults to None (all
+                cats).
+        """
+        if cats is None:
+            cats = self.cats
+        cats = [cat for cat in cats if cat.names is None]
+        if not cats:
+            return
+        name_index = self.read_name_index(save_file)
+        if name_index is not None:
+            for cat in cats:
+                cat.names = name_index.get_names(cat.id)
+            cats = [cat for cat in cats if cat.names is None]
+            if not cats:
+                return
+        gdg = core.core_data.get_game_data_getter(save_file)
+        keys = [
+            ("resLocal", Cat.get_names_file_name(cat.id, save_file)) for cat in cats
+        ]
+        files = gdg.prefetch(keys)
+        for cat, key in zip(cats, keys):
+            data = files.get(key)
+            if data is not None:
+                cat.names = Cat.parse_names(data, save_file)
+
+    def find_names(
+        self, save_file: core.SaveFile, search_name: str, prefix: bool = False
+    ) -> dict[int, str]:
+        """Find the cats with a name that contains or starts with a string,
+        ignoring case.
+
+        Args:
+            save_file (core.SaveFile): The save file
+            search_name (str): The string to search for
+            prefix (bool, optional): Whether names must start with the string.
+                Defaults to False.
+
+        Returns:
+            dict[int, str]: The first matching name of each cat id
+        """
+        name_index = self.read_name_index(save_file)
+        if name_index is None:
+            self.prefetch_names(save_file)
+            name_index = CatNameIndex(
+                {cat.id: cat.names for cat in self.cats if cat.names is not None}
+            )
+        return name_index.search(search_name, prefix)
 
     def get_cats_name(
         self,
         save_file: core.SaveFile,
         search_name: str,
     ) -> list[Cat]:
-        cats: list[Cat] = []
-        for cat in self.cats:
-            names = cat.get_names_cls(save_file)
-            if names is None:
-                continue
-            for name in names:
-                if search_name.lower() in name.lower():
-                    cats.append(cat)
-                    break
-        return cats
+        return self.select_name(save_file, search_name).get_cats(self)
 
     def get_cats_obtainable(self, save_file: core.SaveFile) -> list[Cat] | None:
-        nyanko_picture_book = self.read_nyanko_picture_book(save_file)
-        obtainable_cats = nyanko_picture_book.get_obtainable_cats()
-        if obtainable_cats is None:
+        selection = self.select_obtainable(save_file)
+        if selection is None:
             return None
-        ny_cats = [cat.cat_id for cat in obtainable_cats]
-        cats: list[Cat] = []
-        for cat in self.cats:
-            if cat.id in ny_cats:
-                cats.append(cat)
-        return cats
+        return selection.get_cats(self)
 
     def get_cats_non_obtainable(self, save_file: core.SaveFile) -> list[Cat] | None:
-        nyanko_picture_book = self.read_nyanko_picture_book(save_file)
-        obtainable_cats = nyanko_picture_book.get_obtainable_cats()
-        if obtainable_cats is None:
+        selection = self.select_obtainable(save_file)
+        if selection is None:
             return None
-        ny_cats = [cat.cat_id for cat in obtainable_cats]
-        cats: list[Cat] = []
-        for cat in self.cats:
-            if cat.id not in ny_cats:
-                cats.append(cat)
-        return cats
+        return (~selection).get_cats(self)
 
     def get_cats_gatya_banner(
         self, save_file: core.SaveFile, gatya_id: int
     ) -> list[core.Cat] | None:
-        cat_ids = save_file.gatya.read_gatya_data_set(save_file).get_cat_ids(gatya_id)
-        if cat_ids is None:
+        selection = self.select_gatya_banner(save_file, gatya_id)
+        if selection is None:
             return None
-        return self.get_cats_by_ids(cat_ids)
+        return selection.get_cats(self)
 
-    def true_form_cats(
+    def fill(self, column: str, indexes: list[int], value: int):
+        """Set a column to the same value for many cats at once.
+
+        Args:
+            column (str): Name of the column, e.g `unlocked_forms`
+            indexes (list[int]): Indexes of the cats
+            value (int): The value
+        """
+        values: array.array[int] = getattr(self, column)
+        if len(indexes) == len(values) and len(set(indexes)) == len(values):
+            values[:] = array.array(values.typecode, [value]) * len(values)
+            return
+        for index in indexes:
+            values[index] = value
+
+    def unlock_cats(self, save_file: core.SaveFile, indexes: list[int]):
+        self.fill("unlocked", indexes, 1)
+        self.fill("gatya_seen", indexes, 1)
+        chara_drop = core.core_data.get_chara_drop(save_file)
+        for index in indexes:
+            chara_drop.unlock_drops_from_cat_id(self.cats[index].id)
+        if indexes:
+            save_file.unlock_equip_menu()
+
+    def set_forms(
+        self,
+        save_file: core.SaveFile,
+        indexes: list[int],
+        form: int,
+        set_current_forms: bool = True,
+    ):
+        """Set the form of many cats at once, the same way as
+        `Cat.set_form_true` does for a single cat.
+
+        Args:
+            save_file (core.SaveFile): The save file
+            indexes (list[int]): Indexes of the cats
+            form (int): The form. 0 and 1 are the first two forms, 2 is the true
+                form and 3 is the fourth form.
+            set_current_forms (bool, optional): Whether to also switch the cats
+                to the form. Always done for the first two forms. Defaults to
+                True.
+        """
+        if form < 2:
+            self.fill("unlocked_forms", indexes, 0)
+            self.fill("current_form", indexes, form)
+            return
+        if core.core_data.config.get_bool(core.ConfigKey.UNLOCK_CAT_ON_EDIT):
+            self.unlock_cats(save_file, indexes)
+        self.fill("unlocked_forms", indexes, 3)
+        if set_current_forms:
+            self.fill("current_form", indexes, form)
+        if form == 3:
+            self.fill("fourth_form", indexes, 2)
+
+    def set_forms_true(
         self,
         save_file: core.SaveFile,
         cats: list[Cat],
         force: bool = False,
         set_current_forms: bool = True,
+        fourth_form: bool = False,
     ):
         pic_book = self.read_nyanko_picture_book(save_file)
+        forms: dict[int, list[int]] = {}
         for cat in cats:
-            pic_book_cat = pic_book.get_cat(cat.id)
             if force:
-                cat.true_form(save_file, set_current_form=set_current_forms)
-            elif pic_book_cat is not None:
-                cat.set_form_true(
-                    save_file,
-                    pic_book_cat.total_forms,
-                    set_current_form=set_current_forms,
-                )
+                form = 3 if fourth_form else 2
+            else:
+                pic_book_cat = pic_book.get_cat(cat.id)
+                if pic_book_cat is None:
+                    continue
+                total_forms = pic_book_cat.total_forms
+                if total_forms == 4 and fourth_form:
+                    form = 3
+                elif total_forms >= 3:
+                    form = 2
+                else:
+                    form = max(total_forms - 1, 0)
+            forms.setdefault(form, []).append(cat.index)
+        for form, indexes in forms.items():
+            self.set_forms(save_file, indexes, form, set_current_forms)
+
+    def true_form_cats(
+        self,
+        save_file: core.SaveFile,
+        cats: list[Cat],
+        force: bool = False,
+        set_current_forms: bool = True,
+    ):
+        self.set_forms_true(save_file, cats, force, set_current_forms)
 
     def fourth_form_cats(
         self,
@@ -1003,32 +1574,30 @@ class Cats:
         force: bool = False,
         set_current_forms: bool = True,
     ):
-        pic_book = self.read_nyanko_picture_book(save_file)
-        for cat in cats:
-            pic_book_cat = pic_book.get_cat(cat.id)
-            if force:
-                cat.unlock_fourth_form(save_file, set_current_form=set_current_forms)
-            elif pic_book_cat is not None:
-                cat.set_form_true(
-                    save_file,
-                    pic_book_cat.total_forms,
-                    set_current_form=set_current_forms,
-                    fourth_form=True,
-                )
+        self.set_forms_true(save_file, cats, force, set_current_forms, fourth_form=True)
 
     def get_cats_by_ids(self, ids: list[int]) -> list[Cat]:
-        cats: list[Cat] = []
-        for cat in self.cats:
-            if cat.id in ids:
-                cats.append(cat)
-        return cats
+        return self.select_ids(ids).get_cats(self)
 
     def get_cat_by_id(self, id: int) -> Cat | None:
-        for cat in self.cats:
-            if cat.id == id:
-                return cat
+        if 0 <= id < len(self):
+            return self.cats[id]
         return None
 
+    def get_upgrade_total(self) -> int:
+        """Get the sum of the levels of all unlocked cats.
+
+        Returns:
+            int: The total level
+        """
+        total = 0
+        for unlocked, plus, base in zip(
+            self.unlocked, self.upgrade_plus, self.upgrade_base
+        ):
+            if unlocked:
+                total += base + 1 + plus
+        return total
+
     @staticmethod
     def get_rarity_names(save_file: core.SaveFile) -> list[str]:
         localizable = save_file.get_localizable()
@@ -1042,92 +1611,103 @@ class Cats:
             rarity_index += 1
         return rarity_names
 
+    def read_column(
+        self, stream: core.Data, gv: core.GameVersion, fmt: str = "i"
+    ) -> array.array[int]:
+        if Cats.get_gv_cats(gv) is None:
+            stream.read_int()
+        return stream.read_array(fmt, len(self))
+
+    def write_column(
+        self, stream: core.Data, gv: core.GameVersion, values: array.array[int]
+    ):
+        if Cats.get_gv_cats(gv) is None:
+            stream.write_int(len(self))
+        stream.write_array(values)
+
+    def read_upgrade_columns(
+        self, stream: core.Data, gv: core.GameVersion
+    ) -> tuple[array.array[int], array.array[int]]:
+        # each upgrade is stored as a plus ushort followed by a base ushort
+        if Cats.get_gv_cats(gv) is None:
+            stream.read_int()
+        values = stream.read_array("H", len(self) * 2)
+        return array.array("i", values[0::2]), array.array("i", values[1::2])
+
+    def write_upgrade_columns(
+        self,
+        stream: core.Data,
+        gv: core.GameVersion,
+        plus: array.array[int],
+        base: array.array[int],
+    ):
+        if Cats.get_gv_cats(gv) is None:
+            stream.write_int(len(self))
+        values = array.array("H", [0]) * (len(self) * 2)
+        values[0::2] = array.array("H", plus)
+        values[1::2] = array.array("H", base)
+        stream.write_array(values)
+
+    def read_counted_column(
+        self, stream: core.Data, values: array.array[int]
+    ) -> array.array[int]:
+        # these sections store their own count, which may be less than the
+        # number of cats
+        total_cats = stream.read_int()
+        if total_cats > len(values):
+            raise IndexError("list index out of range")
+        values[: max(total_cats, 0)] = stream.read_array(values.typecode, total_cats)
+        return values
+
+    def write_counted_column(self, stream: core.Data, values: array.array[int]):
+        stream.write_int(len(values))
+        stream.write_array(values)
+
     @staticmethod
     def read_unlocked(stream: core.Data, gv: core.GameVersion) -> Cats:
         total_cats = Cats.get_gv_cats(gv)
         if total_cats is None:
             total_cats = stream.read_int()
-        cats_l: list[Cat] = []
-        for i in range(total_cats):
-            cats_l.append(Cat.read_unlocked(i, stream))
-        return Cats(cats_l)
+        cats = Cats(total_cats)
+        cats.unlocked = stream.read_array("i", len(cats))
+        return cats
 
     def write_unlocked(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            stream.write_int(len(self.cats))
-        for cat in self.cats:
-            cat.write_unlocked(stream)
+        self.write_column(stream, gv, self.unlocked)
 
     def read_upgrade(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            total_cats = stream.read_int()
-        for cat in self.cats:
-            cat.read_upgrade(stream)
+        self.upgrade_plus, self.upgrade_base = self.read_upgrade_columns(stream, gv)
 
     def write_upgrade(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            stream.write_int(len(self.cats))
-        for cat in self.cats:
-            cat.write_upgrade(stream)
+        self.write_upgrade_columns(stream, gv, self.upgrade_plus, self.upgrade_base)
 
     def read_current_form(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            total_cats = stream.read_int()
-        for cat in self.cats:
-            cat.read_current_form(stream)
+        self.current_form = self.read_column(stream, gv)
 
     def write_current_form(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            stream.write_int(len(self.cats))
-        for cat in self.cats:
-            cat.write_current_form(stream)
+        self.write_column(stream, gv, self.current_form)
 
     def read_unlocked_forms(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            total_cats = stream.read_int()
-        for cat in self.cats:
-            cat.read_unlocked_forms(stream)
+        self.unlocked_forms = self.read_column(stream, gv)
 
     def write_unlocked_forms(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            stream.write_int(len(self.cats))
-        for cat in self.cats:
-            cat.write_unlocked_forms(stream)
+        self.write_column(stream, gv, self.unlocked_forms)
 
     def read_gatya_seen(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            total_cats = stream.read_int()
-        for cat in self.cats:
-            cat.read_gatya_seen(stream)
+        self.gatya_seen = self.read_column(stream, gv)
 
     def write_gatya_seen(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            stream.write_int(len(self.cats))
-        for cat in self.cats:
-            cat.write_gatya_seen(stream)
+        self.write_column(stream, gv, self.gatya_seen)
 
     def read_max_upgrade_levels(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            total_cats = stream.read_int()
-        for cat in self.cats:
-            cat.read_max_upgrade_level(stream)
+        self.max_upgrade_plus, self.max_upgrade_base = self.read_upgrade_columns(
+            stream, gv
+        )
 
     def write_max_upgrade_levels(self, stream: core.Data, gv: core.GameVersion):
-        total_cats = Cats.get_gv_cats(gv)
-        if total_cats is None:
-            stream.write_int(len(self.cats))
-        for cat in self.cats:
-            cat.write_max_upgrade_level(stream)
+        self.write_upgrade_columns(
+            stream, gv, self.max_upgrade_plus, self.max_upgrade_base
+        )
 
     def read_storage(self, stream: core.Data, gv: core.GameVersion):
         if gv < 110100:
@@ -1149,34 +1729,23 @@ class Cats:
             item.write_item_type(stream)
 
     def read_catguide_collected(self, stream: core.Data):
-        total_cats = stream.read_int()
-        for i in range(total_cats):
-            self.cats[i].read_catguide_collected(stream)
+        values = self.read_counted_column(stream, self.catguide_collected)
+        self.catguide_collected = array.array("b", map(bool, values))
 
     def write_catguide_collected(self, stream: core.Data):
-        stream.write_int(len(self.cats))
-        for cat in self.cats:
-            cat.write_catguide_collected(stream)
+        self.write_counted_column(stream, self.catguide_collected)
 
     def read_fourth_forms(self, stream: core.Data):
-        total_cats = stream.read_int()
-        for i in range(total_cats):
-            self.cats[i].read_fourth_form(stream)
+        self.read_counted_column(stream, self.fourth_form)
 
     def read_catseyes_used(self, stream: core.Data):
-        total_cats = stream.read_int()
-        for i in range(total_cats):
-            self.cats[i].read_catseyes_used(stream)
+        self.read_counted_column(stream, self.catseyes_used)
 
     def write_catseyes_used(self, stream: core.Data):
-        stream.write_int(len(self.cats))
-        for cat in self.cats:
-            cat.write_catseyes_used(stream)
+        self.write_counted_column(stream, self.catseyes_used)
 
     def write_fourth_forms(self, stream: core.Data):
-        stream.write_int(len(self.cats))
-        for cat in self.cats:
-            cat.write_fourth_form(stream)
+        self.write_counted_column(stream, self.fourth_form)
 
     def read_favorites(self, stream: core.Data):
         self.favourites: dict[int, bool] = {}
@@ -1208,11 +1777,9 @@ class Cats:
         total_cats = stream.read_int()
         for _ in range(total_cats):
             cat_id = stream.read_int()
-            if cat_id < 0 or cat_id >= len(self.cats):
-                cat = Cat.init(cat_id)
-                cat.read_talents(stream)
-                continue
-            self.cats[cat_id].read_talents(stream)
+            talents = [Talent.read(stream) for _ in range(stream.read_int())]
+            if 0 <= cat_id < len(self):
+                self.talents[cat_id] = talents
 
     def write_talents(self, stream: core.Data):
         total_talents = 0
@@ -1235,8 +1802,10 @@ class Cats:
 
     @staticmethod
     def deserialize(data: dict[str, Any]) -> Cats:
-        cats_l = [Cat.deserialize(cat) for cat in data.get("cats", [])]
-        cats = Cats(cats_l)
+        cats_data: list[dict[str, Any]] = data.get("cats", [])
+        cats = Cats(len(cats_data))
+        for i, cat_data in enumerate(cats_data):
+            Cat.deserialize(cat_data, cats, i)
         cats.storage_items = [
             StorageItem.deserialize(item) for item in data.get("storage_items", [])
         ]
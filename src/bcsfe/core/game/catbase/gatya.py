@@ -1,6 +1,6 @@
 from __future__ import annotations
 import enum
-from typing import Any, Callable
+from typing import Any
 from bcsfe import core
 from bcsfe.cli import dialog_creator, color
 
@@ -282,7 +282,7 @@ class GatyaInfos:
         self.gatya_data_set = GatyaDataSet(save_file).load_gatya_data_set(
             type_str, set_id
         )
-        self.infos: list[GatyaInfo] = []
+        self.infos: list[GatyaInfo | None] = []
         self.got_all = False
 
     def get_all(
@@ -294,32 +294,51 @@ class GatyaInfos:
         if self.gatya_data_set is None:
             return
         all_ids = len(self.gatya_data_set)
+        progress = self.print_progress if print_progress else None
         if threaded:
-            funcs: list[Callable[..., Any]] = []
-            args: list[list[Any]] = []
-            for id in range(all_ids):
-                funcs.append(self.get)
-                args.append([id, print_progress])
-            core.thread_run_many(funcs, args, max_threads=max_threads)
+            self.infos = core.thread_run_many(
+                [self.get_or_none] * all_ids,
+                [[id] for id in range(all_ids)],
+                max_threads=max_threads,
+                progress=progress,
+            )
 
         else:
+            self.infos = []
             for id in range(all_ids):
-                self.infos.append(self.get(id, print_progress=print_progress))
+                self.infos.append(self.get_or_none(id))
+                if progress is not None:
+                    progress(id + 1, all_ids)
 
         self.got_all = True
 
-    def get(self, gatya_id: int, print_progress: bool):
-        if print_progress:
-            color.color_print_key(
-                "gatya_info_progress",
-                current=len(self.infos or []) + 1,
-                total=len(self.gatya_data_set or []),
-            )
+    @staticmethod
+    def print_progress(current: int, total: int):
+        color.color_print_key("gatya_info_progress", current=current, total=total)
+
+    def get(self, gatya_id: int) -> GatyaInfo:
         info = GatyaInfo(gatya_id, self.save_file.cc, self.type)
         info.get_data()
-        self.infos.append(info)
         return info
 
+    def get_or_none(self, gatya_id: int) -> GatyaInfo | None:
+        """Get the info of a gatya, so that one page failing doesn't stop the
+        others being fetched.
+
+        Args:
+            gatya_id (int): The gatya id
+
+        Returns:
+            GatyaInfo | None: The info, or None if getting it failed
+        """
+        try:
+            return self.get(gatya_id)
+        except Exception as e:
+            core.core_data.logger.log_exception(
+                e, f"Failed to get gatya info {gatya_id}"
+            )
+            return None
+
     def get_info(self, gatya_id: int) -> GatyaInfo | None:
         if self.infos:
             return self.infos[gatya_id]
@@ -329,10 +348,9 @@ class GatyaInfos:
         if not self.got_all:
             self.get_all(True, max_threads=64)
         names: dict[int, str] = {}
-        for info in self.infos:
-            names[
-                info.gatya_id
-            ] = info.get_name() or core.core_data.local_manager.get_key(
+        for gatya_id, info in enumerate(self.infos):
+            name = info.get_name() if info is not None else None
+            names[gatya_id] = name or core.core_data.local_manager.get_key(
                 "unknown_banner"
             )
 
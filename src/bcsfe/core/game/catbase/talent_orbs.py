@@ -177,6 +177,9 @@ class OrbInfoList:
             orb_info_list (list[OrbInfo]): The list of OrbInfo
         """
         self.orb_info_list = orb_info_list
+        self.components: dict[tuple[str, str | None, str], OrbInfo] = {}
+        for orb in orb_info_list:
+            self.components.setdefault((orb.rank, orb.target, orb.effect), orb)
 
     @staticmethod
     def create(save_file: core.SaveFile) -> OrbInfoList | None:
@@ -189,6 +192,27 @@ class OrbInfoList:
             OrbInfoList | None: The OrbInfoList
         """
         gdg = core.core_data.get_game_data_getter(save_file)
+        sources: list[tuple[str, str]] = []
+        for path in (
+            OrbInfoList.equipment_data_file_name,
+            OrbInfoList.grade_list_file_name,
+            OrbInfoList.attribute_list_file_name,
+            OrbInfoList.effect_list_file_name,
+        ):
+            pack_name, file_name = path.split("/")
+            sources.append((pack_name, file_name))
+        return gdg.load_cached("equipment", sources, lambda: OrbInfoList.parse(gdg))
+
+    @staticmethod
+    def parse(gdg: core.GameDataGetter) -> OrbInfoList | None:
+        """Download and parse the equipment data
+
+        Args:
+            gdg (core.GameDataGetter): The game data getter
+
+        Returns:
+            OrbInfoList | None: The OrbInfoList
+        """
         json_data_file = gdg.download_from_path(OrbInfoList.equipment_data_file_name)
         grade_list_file = gdg.download_from_path(OrbInfoList.grade_list_file_name)
         attribute_list_file = gdg.download_from_path(
@@ -297,10 +321,7 @@ class OrbInfoList:
         Returns:
             OrbInfo | None: The OrbInfo
         """
-        for orb in self.orb_info_list:
-            if orb.rank == grade and orb.target == attribute and orb.effect == effect:
-                return orb
-        return None
+        return self.components.get((grade, attribute, effect))
 
     def does_match_orb_str(self, str_1: str | None, str_2: str | None) -> bool:
         if str_2 == "*":
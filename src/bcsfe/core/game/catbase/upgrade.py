@@ -1,4 +1,5 @@
 from __future__ import annotations
+import array
 import random
 from typing import Any
 from bcsfe import core
@@ -198,3 +199,37 @@ class Upgrade:
         upgrade.base_range = self.base_range
         upgrade.plus_range = self.plus_range
         return upgrade
+
+
+class UpgradeView(Upgrade):
+    def __init__(self, plus: array.array[int], base: array.array[int], index: int):
+        """An `Upgrade` that reads and writes a single row of a plus level
+        column and a base level column, e.g the upgrades of `core.Cats`.
+
+        Args:
+            plus (array.array[int]): The plus level column
+            base (array.array[int]): The base level column
+            index (int): Index of the row
+        """
+        self.plus_values = plus
+        self.base_values = base
+        self.index = index
+
+        self.base_range: tuple[int, int] | None = None
+        self.plus_range: tuple[int, int] | None = None
+
+    @property
+    def plus(self) -> int:
+        return self.plus_values[self.index]
+
+    @plus.setter
+    def plus(self, value: int):
+        self.plus_values[self.index] = value
+
+    @property
+    def base(self) -> int:
+        return self.base_values[self.index]
+
+    @base.setter
+    def base(self, value: int):
+        self.base_values[self.index] = value
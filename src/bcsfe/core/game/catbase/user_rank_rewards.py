@@ -1,4 +1,5 @@
 from __future__ import annotations
+import bisect
 from bcsfe import core
 from bcsfe.cli import dialog_creator, color
 
@@ -14,13 +15,31 @@ class RankGift:
 
 
 class RankGifts:
-    def __init__(self, save_file: core.SaveFile):
+    def __init__(
+        self, save_file: core.SaveFile, rank_gift: list[RankGift] | None = None
+    ):
         self.save_file = save_file
-        self.rank_gift = self.read_rank_gift()
+        self.rank_gift = rank_gift if rank_gift is not None else self.read_rank_gift()
+
+        self.thresholds: dict[int, RankGift] = {}
+        for gift in self.rank_gift or []:
+            self.thresholds.setdefault(gift.threshold, gift)
+        # gifts sorted by threshold so the gifts unlocked at a user rank are a
+        # prefix of the list
+        self.sorted_gifts = sorted(
+            self.rank_gift or [], key=lambda gift: gift.threshold
+        )
+        self.sorted_thresholds = [gift.threshold for gift in self.sorted_gifts]
 
     def read_rank_gift(self) -> list[RankGift] | None:
-        rank_gift: list[RankGift] = []
         gdg = core.core_data.get_game_data_getter(self.save_file)
+        return gdg.load_cached(
+            "rankGift", [("DataLocal", "rankGift.csv")], lambda: RankGifts.parse(gdg)
+        )
+
+    @staticmethod
+    def parse(gdg: core.GameDataGetter) -> list[RankGift] | None:
+        rank_gift: list[RankGift] = []
         data = gdg.download("DataLocal", "rankGift.csv")
         if data is None:
             return None
@@ -36,21 +55,13 @@ class RankGifts:
         return rank_gift
 
     def get_rank_gift(self, user_rank: int) -> RankGift | None:
-        if self.rank_gift is None:
-            return None
-        for rank_gift in self.rank_gift:
-            if rank_gift.threshold == user_rank:
-                return rank_gift
-        return None
+        return self.thresholds.get(user_rank)
 
     def get_all_rank_gifts(self, user_rank: int) -> list[RankGift] | None:
         if self.rank_gift is None:
             return None
-        return [
-            rank_gift
-            for rank_gift in self.rank_gift
-            if rank_gift.threshold <= user_rank
-        ]
+        total = bisect.bisect_right(self.sorted_thresholds, user_rank)
+        return sorted(self.sorted_gifts[:total], key=lambda gift: gift.index)
 
     def get_by_id(self, id: int) -> RankGift | None:
         if self.rank_gift is None:
@@ -60,14 +71,7 @@ class RankGifts:
         return self.rank_gift[id]
 
     def get_all_unlocked(self, user_rank: int) -> list[RankGift] | None:
-        if self.rank_gift is None:
-            return None
-
-        return [
-            rank_gift
-            for rank_gift in self.rank_gift
-            if rank_gift.threshold <= user_rank
-        ]
+        return self.get_all_rank_gifts(user_rank)
 
 
 class RankGiftDescription:
@@ -81,6 +85,11 @@ class RankGiftDescriptions:
     def __init__(self, save_file: core.SaveFile):
         self.save_file = save_file
         self.rank_gift_descriptions = self.read_rank_gift_descriptions()
+        self.descriptions: dict[int, str] = {}
+        for rank_gift_description in self.rank_gift_descriptions or []:
+            self.descriptions.setdefault(
+                rank_gift_description.threshold, rank_gift_description.description
+            )
 
     def read_rank_gift_descriptions(self) -> list[RankGiftDescription] | None:
         rank_gift_descriptions: list[RankGiftDescription] = []
@@ -96,12 +105,7 @@ class RankGiftDescriptions:
         return rank_gift_descriptions
 
     def get_name(self, user_rank: int) -> str | None:
-        if self.rank_gift_descriptions is None:
-            return None
-        for rank_gift_description in self.rank_gift_descriptions:
-            if rank_gift_description.threshold == user_rank:
-                return rank_gift_description.description
-        return None
+        return self.descriptions.get(user_rank)
 
 
 class Reward:
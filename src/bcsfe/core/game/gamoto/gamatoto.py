@@ -1,4 +1,5 @@
 from __future__ import annotations
+import bisect
 from dataclasses import dataclass
 from typing import Any, Optional
 from bcsfe import core
@@ -96,10 +97,29 @@ class GamatotoLimit:
 
 
 class GamatotoLevels:
-    def __init__(self, save_file: core.SaveFile):
+    def __init__(
+        self,
+        save_file: core.SaveFile,
+        levels: list[GamatotoLevel] | None = None,
+        limit: GamatotoLimit | None = None,
+    ):
         self.save_file = save_file
-        self.levels = self.read_levels()
-        self.limit = self.read_max_level()
+        self.levels = levels if levels is not None else self.read_levels()
+        self.limit = limit if limit is not None else self.read_max_level()
+
+        # the first level needing more xp than every level before it, so the
+        # level for an amount of xp can be found with a binary search
+        self.record_levels: list[GamatotoLevel] = []
+        self.record_xps: list[int] = []
+        if self.levels is not None and self.limit is not None:
+            for level in self.levels:
+                if level.level >= self.limit.max_level:
+                    break
+                if level.xp_needed == -1:
+                    continue
+                if not self.record_xps or level.xp_needed > self.record_xps[-1]:
+                    self.record_levels.append(level)
+                    self.record_xps.append(level.xp_needed)
 
     def read_levels(self) -> list[GamatotoLevel] | None:
         levels: list[GamatotoLevel] = []
@@ -138,13 +158,9 @@ class GamatotoLevels:
     def get_level_from_xp(self, xp: int) -> GamatotoLevel | None:
         if self.levels is None or self.limit is None:
             return None
-        for level in self.levels:
-            if level.level >= self.limit.max_level:
-                break
-            if level.xp_needed == -1:
-                continue
-            if xp < level.xp_needed:
-                return level
+        index = bisect.bisect_right(self.record_xps, xp)
+        if index < len(self.record_levels):
+            return self.record_levels[index]
         if self.limit.max_level >= len(self.levels):
             return self.levels[-1]
         return self.levels[self.limit.max_level - 1]
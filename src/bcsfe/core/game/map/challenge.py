@@ -23,13 +23,10 @@ class ChallengeChapters:
         self.chapters.write(data)
 
     def read_scores(self, data: core.Data):
-        total_scores = data.read_int()
-        self.scores = [data.read_int() for _ in range(total_scores)]
+        self.scores = data.read_int_list()
 
     def write_scores(self, data: core.Data):
-        data.write_int(len(self.scores))
-        for score in self.scores:
-            data.write_int(score)
+        data.write_int_list(self.scores)
 
     def read_popup(self, data: core.Data):
         self.shown_popup = data.read_bool()
@@ -95,11 +95,14 @@ class Chapter:
         data.write_int(self.clear_progress)
 
     def read_stages(self, data: core.Data, total_stages: int):
-        self.stages = [Stage.read(data) for _ in range(total_stages)]
+        self.stages = [
+            Stage(clear_times) for clear_times in data.read_int_list(total_stages)
+        ]
 
     def write_stages(self, data: core.Data):
-        for stage in self.stages:
-            stage.write(data)
+        data.write_int_list(
+            [stage.clear_times for stage in self.stages], write_length=False
+        )
 
     def read_chapter_unlock_state(self, data: core.Data):
         self.chapter_unlock_state = data.read_int()
@@ -180,14 +183,19 @@ class ChaptersStars:
             chapter.write_clear_progress(data)
 
     def read_stages(self, data: core.Data, total_stages: int):
-        for _ in range(total_stages):
-            for chapter in self.chapters:
-                chapter.stages.append(Stage.read(data))
+        total_chapters = len(self.chapters)
+        clear_times = data.read_int_list(total_stages * total_chapters)
+        for i, chapter in enumerate(self.chapters):
+            chapter.stages.extend(
+                Stage(value) for value in clear_times[i::total_chapters]
+            )
 
     def write_stages(self, data: core.Data):
+        clear_times: list[int] = []
         for i in range(len(self.chapters[0].stages)):
             for chapter in self.chapters:
-                chapter.stages[i].write(data)
+                clear_times.append(chapter.stages[i].clear_times)
+        data.write_int_list(clear_times, write_length=False)
 
     def read_chapter_unlock_state(self, data: core.Data):
         for chapter in self.chapters:
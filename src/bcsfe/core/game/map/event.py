@@ -1,40 +1,31 @@
 from __future__ import annotations
+import array
 from typing import Any
 from bcsfe import core
 from bcsfe.cli import color, dialog_creator, edits
 
 
-class EventStage:
-    def __init__(self, clear_amount: int):
-        self.clear_amount = clear_amount
+def zeros(length: int) -> array.array[int]:
+    return array.array("i", bytes(4 * max(length, 0)))
 
-    @staticmethod
-    def init() -> EventStage:
-        return EventStage(0)
 
-    @staticmethod
-    def read(data: core.Data, is_int: bool) -> EventStage:
-        if is_int:
-            clear_amount = data.read_int()
-        else:
-            clear_amount = data.read_short()
-        return EventStage(clear_amount)
+class EventStage:
+    def __init__(self, event_chapters: EventChapters, index: int):
+        """A view of the clear amount of a single stage."""
+        self.event_chapters = event_chapters
+        self.index = index
 
-    def write(self, data: core.Data, is_int: bool):
-        if is_int:
-            data.write_int(self.clear_amount)
-        else:
-            data.write_short(self.clear_amount)
+    @property
+    def clear_amount(self) -> int:
+        return self.event_chapters.clear_amounts[self.index]
+
+    @clear_amount.setter
+    def clear_amount(self, value: int):
+        self.event_chapters.clear_amounts[self.index] = value
 
     def serialize(self) -> int:
         return self.clear_amount
 
-    @staticmethod
-    def deserialize(data: int) -> EventStage:
-        return EventStage(
-            clear_amount=data,
-        )
-
     def __repr__(self) -> str:
         return f"<EventStage clear_amount={self.clear_amount}>"
 
@@ -52,11 +43,45 @@ class EventStage:
 
 
 class EventSubChapter:
-    def __init__(self, selected_stage: int, total_stages: int = 0):
-        self.selected_stage = selected_stage
-        self.clear_progress = 0
-        self.stages = [EventStage.init() for _ in range(total_stages)]
-        self.chapter_unlock_state = 0
+    def __init__(self, event_chapters: EventChapters, type: int, map: int, star: int):
+        """A view of a single star difficulty of a map."""
+        self.event_chapters = event_chapters
+        self.map_index = type * event_chapters.total_subchapters + map
+        self.star = star
+        self.index = self.map_index * event_chapters.stars_per_subchapter + star
+
+    @property
+    def selected_stage(self) -> int:
+        return self.event_chapters.selected_stages[self.index]
+
+    @selected_stage.setter
+    def selected_stage(self, value: int):
+        self.event_chapters.selected_stages[self.index] = value
+
+    @property
+    def clear_progress(self) -> int:
+        return self.event_chapters.clear_progress[self.index]
+
+    @clear_progress.setter
+    def clear_progress(self, value: int):
+        self.event_chapters.clear_progress[self.index] = value
+
+    @property
+    def chapter_unlock_state(self) -> int:
+        return self.event_chapters.chapter_unlock_states[self.index]
+
+    @chapter_unlock_state.setter
+    def chapter_unlock_state(self, value: int):
+        self.event_chapters.chapter_unlock_states[self.index] = value
+
+    @property
+    def stages(self) -> list[EventStage]:
+        return [
+            EventStage(self.event_chapters, index)
+            for index in self.event_chapters.get_stage_indexes(
+                self.map_index, self.star
+            )
+        ]
 
     def clear_stage(
         self,
@@ -71,7 +96,7 @@ class EventSubChapter:
             self.clear_progress = max(self.clear_progress, index + 1)
         self.stages[index].clear_stage(clear_amount, ensure_cleared_only)
         self.chapter_unlock_state = 3
-        if index == len(self.stages) - 1:
+        if index == self.event_chapters.stages_per_subchapter - 1:
             return True
         return False
 
@@ -82,85 +107,30 @@ class EventSubChapter:
         return True
 
     def clear_map(self, increment: bool = True) -> bool:
-        self.clear_progress = len(self.stages)
+        clear_amounts = self.event_chapters.clear_amounts
+        self.clear_progress = self.event_chapters.stages_per_subchapter
         self.chapter_unlock_state = 3
-        for stage in self.stages:
+        for index in self.event_chapters.get_stage_indexes(self.map_index, self.star):
             if increment:
-                clear_amount = stage.clear_amount + 1
+                clear_amounts[index] += 1
             else:
-                clear_amount = stage.clear_amount or 1
-            stage.clear_stage(clear_amount)
+                clear_amounts[index] = clear_amounts[index] or 1
         return True
 
-    @staticmethod
-    def init(total_stages: int) -> EventSubChapter:
-        return EventSubChapter(0, total_stages)
-
-    @staticmethod
-    def read_selected_stage(data: core.Data, is_int: bool) -> EventSubChapter:
-        if is_int:
-            selected_stage = data.read_int()
-        else:
-            selected_stage = data.read_byte()
-        return EventSubChapter(selected_stage)
-
-    def write_selected_stage(self, data: core.Data, is_int: bool):
-        if is_int:
-            data.write_int(self.selected_stage)
-        else:
-            data.write_byte(self.selected_stage)
-
-    def read_clear_progress(self, data: core.Data, is_int: bool):
-        if is_int:
-            self.clear_progress = data.read_int()
-        else:
-            self.clear_progress = data.read_byte()
-
-    def write_clear_progress(self, data: core.Data, is_int: bool):
-        if is_int:
-            data.write_int(self.clear_progress)
-        else:
-            data.write_byte(self.clear_progress)
-
-    def read_stages(self, data: core.Data, total_stages: int, is_int: bool):
-        self.stages = [EventStage.read(data, is_int) for _ in range(total_stages)]
-
-    def write_stages(self, data: core.Data, is_int: bool):
-        for stage in self.stages:
-            stage.write(data, is_int)
-
-    def read_chapter_unlock_state(self, data: core.Data, is_int: bool):
-        if is_int:
-            self.chapter_unlock_state = data.read_int()
-        else:
-            self.chapter_unlock_state = data.read_byte()
-
-    def write_chapter_unlock_state(self, data: core.Data, is_int: bool):
-        if is_int:
-            data.write_int(self.chapter_unlock_state)
-        else:
-            data.write_byte(self.chapter_unlock_state)
-
     def serialize(self) -> dict[str, Any]:
+        clear_amounts = self.event_chapters.clear_amounts
         return {
             "selected_stage": self.selected_stage,
             "clear_progress": self.clear_progress,
-            "stages": [stage.serialize() for stage in self.stages],
+            "stages": [
+                clear_amounts[index]
+                for index in self.event_chapters.get_stage_indexes(
+                    self.map_index, self.star
+                )
+            ],
             "chapter_unlock_state": self.chapter_unlock_state,
         }
 
-    @staticmethod
-    def deserialize(data: dict[str, Any]) -> EventSubChapter:
-        sub_chapter = EventSubChapter(
-            selected_stage=data.get("selected_stage", 0),
-        )
-        sub_chapter.clear_progress = data.get("clear_progress", 0)
-        sub_chapter.stages = [
-            EventStage.deserialize(stage) for stage in data.get("stages", [])
-        ]
-        sub_chapter.chapter_unlock_state = data.get("chapter_unlock_state", 0)
-        return sub_chapter
-
     def __repr__(self) -> str:
         return f"<EventSubChapter selected_stage={self.selected_stage}, clear_progress={self.clear_progress}, stages={self.stages}, chapter_unlock_state={self.chapter_unlock_state}>"
 
@@ -169,9 +139,27 @@ class EventSubChapter:
 
 
 class EventSubChapterStars:
-    def __init__(self, chapters: list[EventSubChapter]):
-        self.chapters = chapters
-        self.legend_restriction = 0
+    def __init__(self, event_chapters: EventChapters, type: int, map: int):
+        """A view of all of the star difficulties of a map."""
+        self.event_chapters = event_chapters
+        self.type = type
+        self.map = map
+        self.map_index = type * event_chapters.total_subchapters + map
+
+    @property
+    def chapters(self) -> list[EventSubChapter]:
+        return [
+            EventSubChapter(self.event_chapters, self.type, self.map, star)
+            for star in range(self.event_chapters.stars_per_subchapter)
+        ]
+
+    @property
+    def legend_restriction(self) -> int:
+        return self.event_chapters.legend_restrictions[self.map_index]
+
+    @legend_restriction.setter
+    def legend_restriction(self, value: int):
+        self.event_chapters.legend_restrictions[self.map_index] = value
 
     def clear_stage(
         self,
@@ -181,26 +169,29 @@ class EventSubChapterStars:
         overwrite_clear_progress: bool = False,
         ensure_cleared_only: bool = False,
     ) -> bool:
-        finished = self.chapters[star].clear_stage(
+        chapters = self.chapters
+        finished = chapters[star].clear_stage(
             stage, clear_amount, overwrite_clear_progress, ensure_cleared_only
         )
         if finished:
-            if star + 1 < len(self.chapters):
-                self.chapters[star + 1].chapter_unlock_state = 1
+            if star + 1 < len(chapters):
+                chapters[star + 1].chapter_unlock_state = 1
         return finished
 
     def unclear_stage(self, star: int, stage: int):
-        finished = self.chapters[star].unclear_stage(stage)
-        if finished and star + 1 < len(self.chapters):
-            for chapter in self.chapters[star + 1 :]:
+        chapters = self.chapters
+        finished = chapters[star].unclear_stage(stage)
+        if finished and star + 1 < len(chapters):
+            for chapter in chapters[star + 1 :]:
                 chapter.chapter_unlock_state = 0
         return finished
 
     def clear_map(self, star: int, increment: bool = True) -> bool:
-        finished = self.chapters[star].clear_map(increment)
+        chapters = self.chapters
+        finished = chapters[star].clear_map(increment)
         if finished:
-            if star + 1 < len(self.chapters):
-                self.chapters[star + 1].chapter_unlock_state = 1
+            if star + 1 < len(chapters):
+                chapters[star + 1].chapter_unlock_state = 1
         return finished
 
     def clear_chapter(self, increment: bool = True) -> bool:
@@ -208,75 +199,12 @@ class EventSubChapterStars:
             chapter.clear_map(increment)
         return True
 
-    @staticmethod
-    def init(total_stars: int) -> EventSubChapterStars:
-        return EventSubChapterStars(
-            [EventSubChapter.init(0) for _ in range(total_stars)]
-        )
-
-    @staticmethod
-    def read_selected_stage(
-        data: core.Data, total_stars: int, is_int: bool
-    ) -> EventSubChapterStars:
-        chapters = [
-            EventSubChapter.read_selected_stage(data, is_int)
-            for _ in range(total_stars)
-        ]
-        return EventSubChapterStars(chapters)
-
-    def write_selected_stage(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.write_selected_stage(data, is_int)
-
-    def read_clear_progress(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.read_clear_progress(data, is_int)
-
-    def write_clear_progress(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.write_clear_progress(data, is_int)
-
-    def read_stages(self, data: core.Data, total_stages: int, is_int: bool):
-        for _ in range(total_stages):
-            for chapter in self.chapters:
-                chapter.stages.append(EventStage.read(data, is_int))
-                # chapter.read_stages(data, total_stages, is_int)
-
-    def write_stages(self, data: core.Data, is_int: bool):
-        for i in range(len(self.chapters[0].stages)):
-            for chapter in self.chapters:
-                chapter.stages[i].write(data, is_int)
-                # chapter.write_stages(data, is_int)
-
-    def read_chapter_unlock_state(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.read_chapter_unlock_state(data, is_int)
-
-    def write_chapter_unlock_state(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.write_chapter_unlock_state(data, is_int)
-
-    def read_legend_restrictions(self, data: core.Data):
-        self.legend_restriction = data.read_int()
-
-    def write_legend_restrictions(self, data: core.Data):
-        data.write_int(self.legend_restriction)
-
     def serialize(self) -> dict[str, Any]:
         return {
             "chapters": [chapter.serialize() for chapter in self.chapters],
             "legend_restriction": self.legend_restriction,
         }
 
-    @staticmethod
-    def deserialize(data: dict[str, Any]) -> EventSubChapterStars:
-        chapters = [
-            EventSubChapter.deserialize(chapter) for chapter in data.get("chapters", [])
-        ]
-        chapter = EventSubChapterStars(chapters)
-        chapter.legend_restriction = data.get("legend_restriction", 0)
-        return chapter
-
     def __repr__(self) -> str:
         return f"<EventSubChapterStars chapters={self.chapters}, legend_restriction={self.legend_restriction}>"
 
@@ -285,8 +213,17 @@ class EventSubChapterStars:
 
 
 class EventChapterGroup:
-    def __init__(self, chapters: list[EventSubChapterStars]):
-        self.chapters = chapters
+    def __init__(self, event_chapters: EventChapters, type: int):
+        """A view of all of the maps of a map type."""
+        self.event_chapters = event_chapters
+        self.type = type
+
+    @property
+    def chapters(self) -> list[EventSubChapterStars]:
+        return [
+            EventSubChapterStars(self.event_chapters, self.type, map)
+            for map in range(self.event_chapters.total_subchapters)
+        ]
 
     def clear_stage(
         self,
@@ -297,100 +234,49 @@ class EventChapterGroup:
         overwrite_clear_progress: bool = False,
         ensure_cleared_only: bool = False,
     ) -> bool:
-        finished = self.chapters[map].clear_stage(
+        finished = self.get_map(map).clear_stage(
             star,
             stage,
             clear_amount,
             overwrite_clear_progress,
             ensure_cleared_only,
         )
-        if finished and map + 1 < len(self.chapters):
-            self.chapters[map + 1].chapters[0].chapter_unlock_state = 1
+        self.unlock_next_map(map, finished)
 
         return finished
 
     def unclear_stage(self, map: int, star: int, stage: int) -> bool:
-        finished = self.chapters[map].unclear_stage(star, stage)
-        if finished and map + 1 < len(self.chapters) and star == 0:
-            for chapter in self.chapters[map + 1].chapters:
+        finished = self.get_map(map).unclear_stage(star, stage)
+        if finished and map + 1 < self.event_chapters.total_subchapters and star == 0:
+            for chapter in self.get_map(map + 1).chapters:
                 chapter.chapter_unlock_state = 0
 
         return finished
 
     def clear_map(self, map: int, star: int, increment: bool = True):
-        finished = self.chapters[map].clear_map(star, increment)
-        if finished and map + 1 < len(self.chapters):
-            self.chapters[map + 1].chapters[0].chapter_unlock_state = 1
+        finished = self.get_map(map).clear_map(star, increment)
+        self.unlock_next_map(map, finished)
 
     def clear_chapter(self, map: int, increment: bool = True):
-        finished = self.chapters[map].clear_chapter(increment)
-        if finished and map + 1 < len(self.chapters):
-            self.chapters[map + 1].chapters[0].chapter_unlock_state = 1
+        finished = self.get_map(map).clear_chapter(increment)
+        self.unlock_next_map(map, finished)
 
     def clear_group(self, increment: bool = True):
         for chapter in self.chapters:
             chapter.clear_chapter(increment)
 
-    @staticmethod
-    def init(total_subchapters: int, total_stars: int) -> EventChapterGroup:
-        return EventChapterGroup(
-            [EventSubChapterStars.init(total_stars) for _ in range(total_subchapters)]
-        )
+    def get_map(self, map: int) -> EventSubChapterStars:
+        if not 0 <= map < self.event_chapters.total_subchapters:
+            raise IndexError("list index out of range")
+        return EventSubChapterStars(self.event_chapters, self.type, map)
 
-    @staticmethod
-    def read_selected_stage(
-        data: core.Data, total_subchapters: int, total_stars: int, is_int: bool
-    ) -> EventChapterGroup:
-        chapters = [
-            EventSubChapterStars.read_selected_stage(data, total_stars, is_int)
-            for _ in range(total_subchapters)
-        ]
-        return EventChapterGroup(chapters)
-
-    def write_selected_stage(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.write_selected_stage(data, is_int)
-
-    def read_clear_progress(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.read_clear_progress(data, is_int)
-
-    def write_clear_progress(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.write_clear_progress(data, is_int)
-
-    def read_stages(self, data: core.Data, total_stages: int, is_int: bool):
-        for chapter in self.chapters:
-            chapter.read_stages(data, total_stages, is_int)
-
-    def write_stages(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.write_stages(data, is_int)
-
-    def read_chapter_unlock_state(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.read_chapter_unlock_state(data, is_int)
-
-    def write_chapter_unlock_state(self, data: core.Data, is_int: bool):
-        for chapter in self.chapters:
-            chapter.write_chapter_unlock_state(data, is_int)
-
-    def read_legend_restrictions(self, data: core.Data):
-        for chapter in self.chapters:
-            chapter.read_legend_restrictions(data)
-
-    def write_legend_restrictions(self, data: core.Data):
-        for chapter in self.chapters:
-            chapter.write_legend_restrictions(data)
+    def unlock_next_map(self, map: int, finished: bool):
+        if finished and map + 1 < self.event_chapters.total_subchapters:
+            self.get_map(map + 1).chapters[0].chapter_unlock_state = 1
 
     def serialize(self) -> list[dict[str, Any]]:
         return [chapter.serialize() for chapter in self.chapters]
 
-    @staticmethod
-    def deserialize(data: list[dict[str, Any]]) -> EventChapterGroup:
-        chapters = [EventSubChapterStars.deserialize(chapter) for chapter in data]
-        return EventChapterGroup(chapters)
-
     def __repr__(self) -> str:
         return f"<EventChapterGroup chapters={self.chapters}>"
 
@@ -399,13 +285,72 @@ class EventChapterGroup:
 
 
 class EventChapters:
-    def __init__(self, chapters: list[EventChapterGroup]):
-        self.chapters = chapters
+    def __init__(
+        self,
+        total_map_types: int = 0,
+        total_subchapters: int = 0,
+        stars_per_subchapter: int = 0,
+        stages_per_subchapter: int = 0,
+    ):
+        """Stage progress of the event, sol and collab maps.
+
+        The values of every map are stored in flat typed arrays instead of an
+        object for each stage. Values of a star difficulty are indexed by
+        `(type * total_subchapters + map) * stars_per_subchapter + star`, and
+        stage clear amounts are stored in save file order, i.e (type, map,
+        stage, star). `EventChapterGroup`, `EventSubChapterStars`,
+        `EventSubChapter` and `EventStage` are views into these arrays.
+
+        Args:
+            total_map_types (int, optional): Number of map types. Defaults to 0.
+            total_subchapters (int, optional): Number of maps of each type.
+                Defaults to 0.
+            stars_per_subchapter (int, optional): Number of star difficulties of
+                each map. Defaults to 0.
+            stages_per_subchapter (int, optional): Number of stages of each map.
+                Defaults to 0.
+        """
+        self.total_map_types = total_map_types
+        self.total_subchapters = total_subchapters
+        self.stars_per_subchapter = stars_per_subchapter
+        self.stages_per_subchapter = stages_per_subchapter
+
+        total_maps = total_map_types * total_subchapters
+        total_stars = total_maps * stars_per_subchapter
+        self.selected_stages = zeros(total_stars)
+        self.clear_progress = zeros(total_stars)
+        self.chapter_unlock_states = zeros(total_stars)
+        self.clear_amounts = zeros(total_stars * stages_per_subchapter)
+        self.legend_restrictions = zeros(total_maps)
+
         self.chapter_completion_count: dict[int, int] = {}
         self.displayed_cleared_limit_text: dict[int, bool] = {}
         self.event_start_dates: dict[int, int] = {}
         self.stages_reward_claimed: list[int] = []
 
+    @property
+    def chapters(self) -> list[EventChapterGroup]:
+        return [EventChapterGroup(self, type) for type in range(self.total_map_types)]
+
+    def get_stage_indexes(self, map_index: int, star: int) -> range:
+        """Get the indexes in `clear_amounts` of the stages of a star difficulty.
+
+        Args:
+            map_index (int): `type * total_subchapters + map`
+            star (int): The star difficulty
+
+        Returns:
+            range: The indexes, in stage order
+        """
+        stars = self.stars_per_subchapter
+        start = map_index * self.stages_per_subchapter * stars + star
+        return range(start, start + self.stages_per_subchapter * stars, stars)
+
+    def get_group(self, type: int) -> EventChapterGroup:
+        if not 0 <= type < self.total_map_types:
+            raise IndexError("list index out of range")
+        return EventChapterGroup(self, type)
+
     def clear_stage(
         self,
         type: int,
@@ -416,7 +361,7 @@ class EventChapters:
         overwrite_clear_progress: bool = False,
         ensure_cleared_only: bool = False,
     ) -> bool:
-        return self.chapters[type].clear_stage(
+        return self.get_group(type).clear_stage(
             map,
             star,
             stage,
@@ -426,21 +371,21 @@ class EventChapters:
         )
 
     def unclear_stage(self, type: int, map: int, star: int, stage: int) -> bool:
-        return self.chapters[type].unclear_stage(map, star, stage)
+        return self.get_group(type).unclear_stage(map, star, stage)
 
     def clear_map(self, type: int, map: int, star: int, increment: bool = True):
-        self.chapters[type].clear_map(map, star, increment)
+        self.get_group(type).clear_map(map, star, increment)
 
     def clear_chapter(self, type: int, map: int, increment: bool = True):
-        self.chapters[type].clear_chapter(map, increment)
+        self.get_group(type).clear_chapter(map, increment)
 
     def clear_group(self, type: int, increment: bool = True):
-        self.chapters[type].clear_group(increment)
+        self.get_group(type).clear_group(increment)
 
     @staticmethod
     def init(gv: core.GameVersion) -> EventChapters:
         if gv < 20:
-            return EventChapters([])
+            return EventChapters()
         if gv <= 32:
             total_map_types = 3
             total_subchapters = 150
@@ -454,17 +399,51 @@ class EventChapters:
             total_subchapters = 0
             stars_per_subchapter = 0
 
-        return EventChapters(
-            [
-                EventChapterGroup.init(total_subchapters, stars_per_subchapter)
-                for _ in range(total_map_types)
-            ]
-        )
+        return EventChapters(total_map_types, total_subchapters, stars_per_subchapter)
+
+    @staticmethod
+    def read_lengths(data: core.Data, gv: core.GameVersion, count: int) -> list[int]:
+        """Read the lengths that are stored before each block of values in saves
+        between game version 35 and 8.0.0. The lengths of the first block are
+        used for every block.
+
+        Args:
+            data (core.Data): The save data
+            gv (core.GameVersion): The game version
+            count (int): Number of lengths stored before the block
+
+        Returns:
+            list[int]: The lengths, or an empty list if there are none
+        """
+        if gv <= 34 or 80099 < gv:
+            return []
+        return data.read_int_list(count)
+
+    def write_lengths(self, data: core.Data, gv: core.GameVersion, stages: bool):
+        if gv <= 34 or 80099 < gv:
+            return
+        (
+            total_map_types,
+            total_subchapters,
+            stars_per_subchapter,
+            stages_per_subchapter,
+        ) = self.get_lengths()
+        data.write_int(total_map_types)
+        data.write_int(total_subchapters)
+        if stages:
+            data.write_int(stages_per_subchapter)
+        data.write_int(stars_per_subchapter)
+
+    @staticmethod
+    def to_int_array(values: array.array[int]) -> array.array[int]:
+        if values.typecode == "i":
+            return values
+        return array.array("i", values)
 
     @staticmethod
     def read(data: core.Data, gv: core.GameVersion) -> EventChapters:
         if gv < 20:
-            return EventChapters([])
+            return EventChapters()
         stages_per_subchapter = 0
         if 80099 < gv:
             total_map_types = data.read_byte()
@@ -487,96 +466,46 @@ class EventChapters:
             total_subchapters = data.read_int()
             stars_per_subchapter = data.read_int()
             is_int = True
-        chapters = [
-            EventChapterGroup.read_selected_stage(
-                data, total_subchapters, stars_per_subchapter, is_int
-            )
-            for _ in range(total_map_types)
-        ]
-        if 80099 < gv:
-            is_int = False
-        elif gv <= 32:
-            total_map_types = 3
-            total_subchapters = 150
-            stars_per_subchapter = 3
-            is_int = True
-        elif gv <= 34:
-            total_map_types = 4
-            total_subchapters = 150
-            stars_per_subchapter = 3
-            is_int = True
-        else:
-            total_map_types = data.read_int()
-            total_subchapters = data.read_int()
-            stars_per_subchapter = data.read_int()
-            is_int = True
 
-        for chapter in chapters:
-            chapter.read_clear_progress(data, is_int)
+        chapters = EventChapters(
+            total_map_types, total_subchapters, stars_per_subchapter
+        )
+        total_stars = total_map_types * total_subchapters * stars_per_subchapter
+        fmt = "i" if is_int else "b"
+        stage_fmt = "i" if is_int else "h"
 
-        if 80099 < gv:
-            is_int = False
-        elif gv <= 32:
-            total_map_types = 3
-            total_subchapters = 150
-            stars_per_subchapter = 3
-            stages_per_subchapter = 12
-            is_int = True
-        elif gv <= 34:
-            total_map_types = 4
-            total_subchapters = 150
-            stars_per_subchapter = 3
-            stages_per_subchapter = 12
-            is_int = True
-        else:
-            total_map_types = data.read_int()
-            total_subchapters = data.read_int()
-            stages_per_subchapter = data.read_int()
-            stars_per_subchapter = data.read_int()
-            is_int = True
+        chapters.selected_stages = EventChapters.to_int_array(
+            data.read_array(fmt, total_stars)
+        )
 
-        for chapter in chapters:
-            chapter.read_stages(data, stages_per_subchapter, is_int)
+        EventChapters.read_lengths(data, gv, 3)
+        chapters.clear_progress = EventChapters.to_int_array(
+            data.read_array(fmt, total_stars)
+        )
 
-        if 80099 < gv:
-            is_int = False
-        elif gv <= 32:
-            total_map_types = 3
-            total_subchapters = 150
-            stars_per_subchapter = 3
-            is_int = True
+        if 34 < gv <= 80099:
+            stages_per_subchapter = EventChapters.read_lengths(data, gv, 4)[2]
         elif gv <= 34:
-            total_map_types = 4
-            total_subchapters = 150
-            stars_per_subchapter = 3
-            is_int = True
-        else:
-            total_map_types = data.read_int()
-            total_subchapters = data.read_int()
-            stars_per_subchapter = data.read_int()
-            is_int = True
+            stages_per_subchapter = 12
+        chapters.stages_per_subchapter = stages_per_subchapter
+        chapters.clear_amounts = EventChapters.to_int_array(
+            data.read_array(stage_fmt, total_stars * stages_per_subchapter)
+        )
 
-        for chapter in chapters:
-            chapter.read_chapter_unlock_state(data, is_int)
+        EventChapters.read_lengths(data, gv, 3)
+        chapters.chapter_unlock_states = EventChapters.to_int_array(
+            data.read_array(fmt, total_stars)
+        )
 
-        return EventChapters(chapters)
+        return chapters
 
     def get_lengths(self) -> tuple[int, int, int, int]:
-        total_map_types = len(self.chapters)
-        try:
-            total_subchapters = len(self.chapters[0].chapters)
-        except IndexError:
-            total_subchapters = 0
-
-        try:
-            stars_per_subchapter = len(self.chapters[0].chapters[0].chapters)
-        except IndexError:
-            stars_per_subchapter = 0
-
-        try:
-            stages_per_subchapter = len(self.chapters[0].chapters[0].chapters[0].stages)
-        except IndexError:
-            stages_per_subchapter = 0
+        total_map_types = self.total_map_types
+        total_subchapters = self.total_subchapters if total_map_types else 0
+        stars_per_subchapter = self.stars_per_subchapter if total_subchapters else 0
+        stages_per_subchapter = (
+            self.stages_per_subchapter if stars_per_subchapter else 0
+        )
         return (
             total_map_types,
             total_subchapters,
@@ -585,101 +514,56 @@ class EventChapters:
         )
 
     def write(self, data: core.Data, gv: core.GameVersion):
-        (
-            total_map_types,
-            total_subchapters,
-            stars_per_subchapter,
-            stages_per_subchapter,
-        ) = self.get_lengths()
         if gv <= 34:
             is_int = True
+        elif 80099 < gv:
+            (
+                total_map_types,
+                total_subchapters,
+                stars_per_subchapter,
+                stages_per_subchapter,
+            ) = self.get_lengths()
+            data.write_byte(total_map_types)
+            data.write_short(total_subchapters)
+            data.write_byte(stars_per_subchapter)
+            data.write_byte(stages_per_subchapter)
+            is_int = False
         else:
-            if 80099 < gv:
-                data.write_byte(total_map_types)
-                data.write_short(total_subchapters)
-                data.write_byte(stars_per_subchapter)
-                data.write_byte(stages_per_subchapter)
-                is_int = False
-            else:
-                data.write_int(total_map_types)
-                data.write_int(total_subchapters)
-                data.write_int(stars_per_subchapter)
-                is_int = True
-
-        for chapter in self.chapters:
-            chapter.write_selected_stage(data, is_int)
-
-        if gv <= 34:
             is_int = True
-        else:
-            if 80099 < gv:
-                is_int = False
-            else:
-                data.write_int(total_map_types)
-                data.write_int(total_subchapters)
-                data.write_int(stars_per_subchapter)
-                is_int = True
+        fmt = "i" if is_int else "b"
 
-        for chapter in self.chapters:
-            chapter.write_clear_progress(data, is_int)
+        self.write_lengths(data, gv, False)
+        data.write_array(self.selected_stages, fmt)
 
-        if gv <= 34:
-            is_int = True
-        else:
-            if 80099 < gv:
-                is_int = False
-            else:
-                data.write_int(total_map_types)
-                data.write_int(total_subchapters)
-                data.write_int(stages_per_subchapter)
-                data.write_int(stars_per_subchapter)
-                is_int = True
+        self.write_lengths(data, gv, False)
+        data.write_array(self.clear_progress, fmt)
 
-        for chapter in self.chapters:
-            chapter.write_stages(data, is_int)
+        self.write_lengths(data, gv, True)
+        data.write_array(self.clear_amounts, "i" if is_int else "h")
 
-        if gv <= 34:
-            is_int = True
-        else:
-            if 80099 < gv:
-                is_int = False
-            else:
-                data.write_int(total_map_types)
-                data.write_int(total_subchapters)
-                data.write_int(stars_per_subchapter)
-                is_int = True
-
-        for chapter in self.chapters:
-            chapter.write_chapter_unlock_state(data, is_int)
+        self.write_lengths(data, gv, False)
+        data.write_array(self.chapter_unlock_states, fmt)
 
     def read_legend_restrictions(self, data: core.Data, gv: core.GameVersion):
         if gv < 20:
             return
-        if gv < 33:
-            total_map_types = 3  # type: ignore
-            total_subchapters = 150  # type: ignore
-        elif gv < 41:
-            total_map_types = 4  # type: ignore
-            total_subchapters = 150  # type: ignore
-        else:
-            total_map_types = data.read_int()  # type: ignore
-            total_subchapters = data.read_int()  # type: ignore
+        if gv >= 41:
+            data.read_int()  # total map types
+            data.read_int()  # total subchapters
 
-        for chapter in self.chapters:
-            chapter.read_legend_restrictions(data)
+        self.legend_restrictions = data.read_array(
+            "i", self.total_map_types * self.total_subchapters
+        )
 
     def write_legend_restrictions(self, data: core.Data, gv: core.GameVersion):
         if gv < 20:
             return
         if gv >= 41:
-            data.write_int(len(self.chapters))
-            try:
-                data.write_int(len(self.chapters[0].chapters))
-            except IndexError:
-                data.write_int(0)
+            total_map_types, total_subchapters, _, _ = self.get_lengths()
+            data.write_int(total_map_types)
+            data.write_int(total_subchapters)
 
-        for chapter in self.chapters:
-            chapter.write_legend_restrictions(data)
+        data.write_array(self.legend_restrictions)
 
     def read_dicts(self, data: core.Data):
         self.chapter_completion_count = data.read_int_int_dict()
@@ -704,11 +588,40 @@ class EventChapters:
 
     @staticmethod
     def deserialize(data: dict[str, Any]) -> EventChapters:
-        chapters = [
-            EventChapterGroup.deserialize(chapter)
-            for chapter in data.get("chapters", [])
-        ]
-        ch = EventChapters(chapters)
+        groups: list[list[dict[str, Any]]] = data.get("chapters", [])
+        total_map_types = len(groups)
+        total_subchapters = len(groups[0]) if total_map_types else 0
+        stars_per_subchapter = 0
+        if total_subchapters:
+            stars_per_subchapter = len(groups[0][0].get("chapters", []))
+        stages_per_subchapter = 0
+        if stars_per_subchapter:
+            stages_per_subchapter = len(groups[0][0]["chapters"][0].get("stages", []))
+
+        ch = EventChapters(
+            total_map_types,
+            total_subchapters,
+            stars_per_subchapter,
+            stages_per_subchapter,
+        )
+        for type, group in enumerate(groups):
+            for map, stars in enumerate(group[:total_subchapters]):
+                map_index = type * total_subchapters + map
+                ch.legend_restrictions[map_index] = stars.get("legend_restriction", 0)
+                chapters = stars.get("chapters", [])[:stars_per_subchapter]
+                for star, chapter in enumerate(chapters):
+                    index = map_index * stars_per_subchapter + star
+                    ch.selected_stages[index] = chapter.get("selected_stage", 0)
+                    ch.clear_progress[index] = chapter.get("clear_progress", 0)
+                    ch.chapter_unlock_states[index] = chapter.get(
+                        "chapter_unlock_state", 0
+                    )
+                    for stage_index, clear_amount in zip(
+                        ch.get_stage_indexes(map_index, star),
+                        chapter.get("stages", []),
+                    ):
+                        ch.clear_amounts[stage_index] = clear_amount
+
         ch.chapter_completion_count = data.get("chapter_completion_count", {})
         ch.displayed_cleared_limit_text = data.get("displayed_cleared_limit_text", {})
         ch.event_start_dates = data.get("event_start_dates", {})
@@ -722,16 +635,10 @@ class EventChapters:
         return self.__repr__()
 
     def get_total_stars(self, type: int, map: int) -> int:
-        try:
-            return len(self.chapters[type].chapters[map].chapters)
-        except IndexError:
-            return len(self.chapters[0].chapters[0].chapters)
+        return self.stars_per_subchapter
 
     def get_total_stages(self, type: int, map: int, star: int) -> int:
-        try:
-            return len(self.chapters[type].chapters[map].chapters[star].stages)
-        except IndexError:
-            return len(self.chapters[0].chapters[0].chapters[0].stages)
+        return self.stages_per_subchapter
 
     @staticmethod
     def ask_stars(
@@ -966,9 +873,10 @@ class EventChapters:
     ):
         if not stages:
             return
+        map_index = type * self.total_subchapters + id
         for star in range(stars, self.get_total_stars(type, id)):
-            for stage in range(max(stages), self.get_total_stages(type, id, star)):
-                self.chapters[type].chapters[id].chapters[star].stages[
-                    stage
-                ].clear_amount = 0
-                self.chapters[type].chapters[id].chapters[star].clear_progress = 0
+            stage_indexes = self.get_stage_indexes(map_index, star)
+            for index in stage_indexes[max(stages) :]:
+                self.clear_amounts[index] = 0
+            if max(stages) < len(stage_indexes):
+                self.clear_progress[map_index * self.stars_per_subchapter + star] = 0
@@ -265,7 +265,7 @@ class GauntletChapters:
         for chapter in chapters:
             chapter.read_chapter_unlock_state(data)
 
-        unknown = [data.read_byte() for _ in range(total_chapters)]
+        unknown = data.read_byte_list(total_chapters)
 
         return GauntletChapters(chapters, unknown)
 
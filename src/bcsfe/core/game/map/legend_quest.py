@@ -298,8 +298,8 @@ class LegendQuestChapters:
         for chapter in chapters:
             chapter.read_chapter_unlock_state(data)
 
-        unknown = [data.read_byte() for _ in range(total_chapters)]
-        ids = [data.read_int() for _ in range(total_stages)]
+        unknown = data.read_byte_list(total_chapters)
+        ids = data.read_int_list(total_stages)
 
         return LegendQuestChapters(chapters, unknown, ids)
 
@@ -6,7 +6,9 @@ from bcsfe.core.io import (
     yaml,
     config,
     json_file,
+    schema,
     save,
+    save_reader,
     thread_helper,
     root_handler,
     adb_handler,
@@ -22,7 +24,9 @@ __all__ = [
     "yaml",
     "config",
     "json_file",
+    "schema",
     "save",
+    "save_reader",
     "thread_helper",
     "root_handler",
     "adb_handler",
@@ -29,31 +29,59 @@ class Delimeter:
         return self.delimiter.value
 
 
+def str_to_int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
 class Cell:
-    def __init__(self, dt: core.Data):
-        self.data = dt
+    __slots__ = ("value", "int_value")
+
+    def __init__(self, value: str | core.Data):
+        if isinstance(value, core.Data):
+            value = value.to_str()
+        self.value = value
+        self.int_value: int | None = None
+
+    @property
+    def data(self) -> core.Data:
+        return core.Data(self.value)
 
     def to_str(self) -> str:
-        return self.data.to_str()
+        return self.value
 
     def to_int(self) -> int:
-        return self.data.to_int()
+        # cells are usually converted more than once, so only parse them once
+        if self.int_value is None:
+            self.int_value = str_to_int(self.value)
+        return self.int_value
 
     def to_bool(self) -> bool:
-        return self.data.to_bool()
+        return bool(self.to_int())
 
     def __repr__(self) -> str:
-        return f"Cell({self.data})"
+        return f"Cell({self.value})"
 
     def __str__(self) -> str:
-        return self.data.to_str()
+        return self.value
 
 
 class Row:
     def __init__(self, cells: list[Cell]):
-        self.cells = cells
+        self.values = [cell.value for cell in cells]
+        self.row_cells: list[Cell] | None = cells
         self.index = 0
 
+    @property
+    def cells(self) -> list[Cell]:
+        # most rows of game data files are never read, so the cells are only
+        # created once the row is used
+        if self.row_cells is None:
+            self.row_cells = [Cell(value) for value in self.values]
+        return self.row_cells
+
     @typing.overload
     def __getitem__(self, index: int) -> Cell: ...
 
@@ -65,14 +93,14 @@ class Row:
             try:
                 return self.cells[index]
             except IndexError:
-                return Cell(core.Data(""))
+                return Cell("")
         try:
             return Row(self.cells[index])
         except IndexError:
             return Row([])
 
     def __len__(self) -> int:
-        return len(self.cells)
+        return len(self.values)
 
     @staticmethod
     def from_list(dt: list[core.Data]) -> Row:
@@ -81,6 +109,13 @@ class Row:
             cells.append(Cell(item))
         return Row(cells)
 
+    @staticmethod
+    def from_strs(values: list[str]) -> Row:
+        row = Row([])
+        row.values = values
+        row.row_cells = None
+        return row
+
     def __repr__(self) -> str:
         return f"Row({self.cells})"
 
@@ -107,7 +142,7 @@ class Row:
         return self.next()
 
     def done(self):
-        return self.index >= len(self.cells)
+        return self.index >= len(self.values)
 
     def next_int(self) -> int:
         return self.next().to_int()
@@ -137,7 +172,7 @@ class Row:
         return val.to_bool()
 
     def to_str_list(self) -> list[str]:
-        return [cell.to_str() for cell in self.cells]
+        return list(self.values)
 
     def to_int_list(self) -> list[int]:
         return [cell.to_int() for cell in self.cells]
@@ -167,24 +202,28 @@ class CSV:
         self.parse()
 
     def parse(self):
-        reader = csv_module.reader(
-            self.file_data.data.decode("utf-8").splitlines(),
-            delimiter=str(self.delimiter),
-        )
+        delimiter = str(self.delimiter)
+        text = self.file_data.data.decode("utf-8")
+        if '"' in text:
+            # quoted fields need the csv module, the quotes are removed and
+            # then the fields are split like any other line
+            lines = (
+                delimiter.join(row)
+                for row in csv_module.reader(text.splitlines(), delimiter=delimiter)
+            )
+        else:
+            lines = text.splitlines()
+
         self.lines: list[Row] = []
-        for row in reader:
-            new_row: list[core.Data] = []
-            full_row = f"{str(self.delimiter)}".join(row)
+        for line in lines:
             if self.remove_comments:
-                full_row = full_row.split("//")[0]
-            row = full_row.split(str(self.delimiter))
-            if row or not self.remove_empty:
-                for item in row:
-                    item = item.strip()
-                    if item or not self.remove_empty:
-                        new_row.append(core.Data(item))
-                if new_row or not self.remove_empty:
-                    self.lines.append(Row.from_list(new_row))
+                line = line.split("//", 1)[0]
+            items = [item.strip() for item in line.split(delimiter)]
+            if self.remove_empty:
+                items = [item for item in items if item]
+                if not items:
+                    continue
+            self.lines.append(Row.from_strs(items))
 
     def get_row(self, index: int) -> Row:
         try:
@@ -198,6 +237,27 @@ class CSV:
     def __len__(self) -> int:
         return len(self.lines)
 
+    def column_strs(self, index: int) -> list[str]:
+        """Get a column of the csv without creating any cells. Rows that are
+        too short give an empty string.
+
+        Args:
+            index (int): The column index
+
+        Returns:
+            list[str]: A value from each row
+        """
+        column: list[str] = []
+        for line in self.lines:
+            try:
+                column.append(line.values[index])
+            except IndexError:
+                column.append("")
+        return column
+
+    def column_ints(self, index: int) -> list[int]:
+        return [str_to_int(value) for value in self.column_strs(index)]
+
     @staticmethod
     def from_file(
         pt: core.Path, delimiter: Delimeter = Delimeter(DelimeterType.COMMA)
@@ -207,10 +267,7 @@ class CSV:
     def add_line(self, line: list[Any] | Any):
         if not isinstance(line, list):
             line = [line]
-        new_line: list[core.Data] = []
-        for item in line:  # type: ignore
-            new_line.append(core.Data(str(item)))  # type: ignore
-        self.lines.append(Row.from_list(new_line))
+        self.lines.append(Row.from_strs([str(item) for item in line]))  # type: ignore
 
     def set_line(self, index: int, line: list[Any]):
         new_line: list[core.Data] = []
@@ -260,4 +317,4 @@ class CSV:
             if sub_length == 0:
                 self.lines.append(Row.from_list([]))
             else:
-                self.lines.append(Row.from_list([core.Data("")] * sub_length))
+                self.lines.append(Row.from_strs([""] * sub_length))
@@ -19,6 +19,7 @@ class ConfigKey(enum.Enum):
     SEPARATE_CAT_EDIT_OPTIONS = "separate_cat_edit_options"
     STRICT_BAN_PREVENTION = "strict_ban_prevention"
     MAX_REQUEST_TIMEOUT = "max_request_timeout"
+    MAX_REQUEST_RETRIES = "max_request_retries"
     GAME_DATA_REPO = "game_data_repo"
     FORCE_LANG_GAME_DATA = "force_lang_game_data"
     CLEAR_TUTORIAL_ON_LOAD = "clear_tutorial_on_load"
@@ -72,6 +73,7 @@ class Config:
             ConfigKey.SEPARATE_CAT_EDIT_OPTIONS: True,
             ConfigKey.STRICT_BAN_PREVENTION: False,
             ConfigKey.MAX_REQUEST_TIMEOUT: 30,
+            ConfigKey.MAX_REQUEST_RETRIES: 3,
             ConfigKey.GAME_DATA_REPO: "https://git.battlecatsmodding.org/fieryhenry/BCData/raw/branch/main/metadata.json",
             ConfigKey.FORCE_LANG_GAME_DATA: False,
             ConfigKey.CLEAR_TUTORIAL_ON_LOAD: True,
@@ -483,6 +485,8 @@ class Config:
         elif isinstance(config.get(feature), int):
             if feature == ConfigKey.MAX_REQUEST_TIMEOUT:
                 max = dialog_creator.MaxValue.always_cap(1000).hide_max()
+            elif feature == ConfigKey.MAX_REQUEST_RETRIES:
+                max = dialog_creator.MaxValue.always_cap(10).hide_max()
             else:
                 max = None
             core.core_data.config.edit_int(feature, max)
@@ -1,8 +1,10 @@
 from __future__ import annotations
+import array
 import base64
 import enum
 from io import BytesIO
 import struct
+import sys
 import typing
 from typing import Any, Literal
 from bcsfe import core
@@ -15,6 +17,28 @@ class PaddingType(enum.Enum):
     NONE = enum.auto()
 
 
+class Structs:
+    """Precompiled struct formats for a single endianness, so that reads and
+    writes can work directly on the underlying buffer without slicing or
+    reparsing a format string"""
+
+    def __init__(self, endiness: Literal["<", ">"]):
+        self.int = struct.Struct(f"{endiness}i")
+        self.uint = struct.Struct(f"{endiness}I")
+        self.short = struct.Struct(f"{endiness}h")
+        self.ushort = struct.Struct(f"{endiness}H")
+        self.byte = struct.Struct(f"{endiness}b")
+        self.ubyte = struct.Struct(f"{endiness}B")
+        self.float = struct.Struct(f"{endiness}f")
+        self.double = struct.Struct(f"{endiness}d")
+        self.long = struct.Struct(f"{endiness}q")
+        self.ulong = struct.Struct(f"{endiness}Q")
+        self.date = struct.Struct(f"{endiness}6i")
+
+
+STRUCTS: dict[str, Structs] = {"<": Structs("<"), ">": Structs(">")}
+
+
 class Data:
     def __init__(
         self, data: bytes | str | None | int | bool | Data | Any = None
@@ -41,6 +65,17 @@ class Data:
         self.pos = 0
         self.set_little_endiness()
         self.buffer_enabled = False
+        self.write_buffer: bytearray | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        # `data` is removed while unbuffered writes are collected in
+        # `write_buffer`, and is only converted back to bytes when next read
+        write_buffer = self.__dict__.get("write_buffer")
+        if name != "data" or write_buffer is None:
+            raise AttributeError(name)
+        self.data = bytes(write_buffer)
+        self.write_buffer = None
+        return self.data
 
     def __bytes__(self) -> bytes:
         return self.data
@@ -53,16 +88,21 @@ class Data:
         return Data(bytes.fromhex(hex))
 
     def enable_buffer(self):
-        self.data_buffer: list[bytes] = []
+        """Redirect writes into a single growable bytearray instead of
+        reallocating the data on every write. Call `end_buffer` to get the final
+        data back."""
+        self.data_buffer = bytearray()
         self.buffer_enabled = True
 
     def end_buffer(self):
         self.buffer_enabled = False
-        self.data = b"".join(self.data_buffer)
-        self.data_buffer = []
+        self.data = bytes(self.data_buffer)
+        self.data_buffer = bytearray()
+        self.write_buffer = None
 
     def set_endiness(self, endiness: Literal["<", ">"]):
         self.endiness = endiness
+        self.structs = STRUCTS[endiness]
 
     def set_little_endiness(self):
         self.set_endiness("<")
@@ -95,6 +135,7 @@ class Data:
 
     def clear(self):
         self.data = b""
+        self.write_buffer = None
         self.pos = 0
 
     def get_pos(self) -> int:
@@ -134,6 +175,33 @@ class Data:
     def get_bytes(self) -> bytes:
         return self.data
 
+    def get_view(self, start: int = 0, end: int | None = None) -> memoryview:
+        """Get a zero-copy view of the data.
+
+        Args:
+            start (int, optional): Start offset. Defaults to 0.
+            end (int | None, optional): End offset, negative values are relative
+                to the end of the data. Defaults to None (end of data).
+
+        Returns:
+            memoryview: A read-only view over the data
+        """
+        return memoryview(self.data)[start:end]
+
+    def unpack(self, st: struct.Struct) -> Any:
+        """Unpack a precompiled struct at the current position without copying
+        the underlying data.
+
+        Args:
+            st (struct.Struct): The struct to unpack
+
+        Returns:
+            Any: The first unpacked value
+        """
+        result = st.unpack_from(self.data, self.pos)[0]
+        self.pos += st.size
+        return result
+
     def read_bytes(self, length: int) -> bytes:
         result = self.data[self.pos : self.pos + length]
         self.pos += length
@@ -144,8 +212,7 @@ class Data:
         return self.read_bytes(length)
 
     def read_int(self) -> int:
-        result = struct.unpack(f"{self.endiness}i", self.read_bytes(4))[0]
-        return result
+        return self.unpack(self.structs.int)
 
     def read_variable_length_int(self) -> int:
         i = 0
@@ -170,21 +237,66 @@ class Data:
         for i6 in range(i5):
             self.write_ubyte((i4 >> (((i5 - i6) - 1) * 8)) & 0xFF)
 
+    def read_packed_list(self, fmt: str, length: int) -> list[Any]:
+        """Read a run of fixed-width values in a single unpack call.
+
+        Args:
+            fmt (str): Struct format character for a single item (e.g `i`)
+            length (int): Number of items to read
+
+        Returns:
+            list[Any]: The unpacked values
+        """
+        st = struct.Struct(f"{self.endiness}{max(length, 0)}{fmt}")
+        result = list(st.unpack_from(self.data, self.pos))
+        self.pos += st.size
+        return result
+
+    def needs_byteswap(self) -> bool:
+        return (self.endiness == "<") != (sys.byteorder == "little")
+
+    def read_array(self, fmt: str, length: int) -> array.array[int]:
+        """Read a run of fixed-width values into a typed array without creating
+        an object for each value.
+
+        Args:
+            fmt (str): Array type code of a single item (e.g `i`, `h` or `b`)
+            length (int): Number of items to read
+
+        Returns:
+            array.array[int]: The values
+        """
+        values: array.array[int] = array.array(fmt)
+        values.frombytes(self.read_bytes(max(length, 0) * values.itemsize))
+        if self.needs_byteswap():
+            values.byteswap()
+        return values
+
+    def write_array(self, values: array.array[int], fmt: str | None = None):
+        """Write a typed array as a run of fixed-width values.
+
+        Args:
+            values (array.array[int]): The values
+            fmt (str | None, optional): Array type code to write each item as.
+                Defaults to None (the type code of the array).
+        """
+        if fmt is not None and fmt != values.typecode:
+            values = array.array(fmt, values)
+        elif self.needs_byteswap():
+            values = array.array(values.typecode, values)
+        if self.needs_byteswap():
+            values.byteswap()
+        self.write_bytes(values.tobytes())
+
     def read_int_list(self, length: int | None = None) -> list[int]:
         if length is None:
             length = self.read_int()
-        result: list[int] = []
-        for _ in range(length):
-            result.append(self.read_int())
-        return result
+        return self.read_packed_list("i", length)
 
     def read_bool_list(self, length: int | None = None) -> list[bool]:
         if length is None:
             length = self.read_int()
-        result: list[bool] = []
-        for _ in range(length):
-            result.append(self.read_bool())
-        return result
+        return [value != 0 for value in self.read_packed_list("b", length)]
 
     def read_string_list(self, length: int | None = None) -> list[str]:
         if length is None:
@@ -197,51 +309,39 @@ class Data:
     def read_byte_list(self, length: int | None = None) -> list[int]:
         if length is None:
             length = self.read_int()
-        result: list[int] = []
-        for _ in range(length):
-            result.append(self.read_byte())
-        return result
+        return self.read_packed_list("b", length)
 
     def read_short_list(self, length: int | None = None) -> list[int]:
         if length is None:
             length = self.read_int()
-        result: list[int] = []
-        for _ in range(length):
-            result.append(self.read_short())
-        return result
+        return self.read_packed_list("h", length)
 
     def read_uint(self) -> int:
-        result = struct.unpack(f"{self.endiness}I", self.read_bytes(4))[0]
-        return result
+        return self.unpack(self.structs.uint)
 
     def read_short(self) -> int:
-        result = struct.unpack(f"{self.endiness}h", self.read_bytes(2))[0]
-        return result
+        return self.unpack(self.structs.short)
 
     def read_ushort(self) -> int:
-        result = struct.unpack(f"{self.endiness}H", self.read_bytes(2))[0]
-        return result
+        return self.unpack(self.structs.ushort)
 
     def read_byte(self) -> int:
-        result = struct.unpack(f"{self.endiness}b", self.read_bytes(1))[0]
-        return result
+        return self.unpack(self.structs.byte)
 
     def read_ubyte(self) -> int:
-        result = struct.unpack(f"{self.endiness}B", self.read_bytes(1))[0]
-        return result
+        return self.unpack(self.structs.ubyte)
 
     def read_float(self) -> float:
-        result = struct.unpack(f"{self.endiness}f", self.read_bytes(4))[0]
-        return result
+        return self.unpack(self.structs.float)
 
     def read_double(self) -> float:
-        result = struct.unpack(f"{self.endiness}d", self.read_bytes(8))[0]
-        return result
+        return self.unpack(self.structs.double)
 
     def read_string(self, length: int | None = None) -> str:
         if length is None:
             length = self.read_int()
-        result = self.read_bytes(length).decode("utf-8")
+        result = str(self.get_view(self.pos, self.pos + length), "utf-8")
+        self.pos += length
         return result
 
     def read_utf8_string_by_char_length(self, length: int | None = None) -> str:
@@ -263,66 +363,70 @@ class Data:
         return result_str
 
     def read_long(self) -> int:
-        result = struct.unpack(f"{self.endiness}q", self.read_bytes(8))[0]
-        return result
+        return self.unpack(self.structs.long)
 
     def read_ulong(self) -> int:
-        result = struct.unpack(f"{self.endiness}Q", self.read_bytes(8))[0]
-        return result
+        return self.unpack(self.structs.ulong)
 
     def read_date(self):
-        year = self.read_int()
-        month = self.read_int()
-        day = self.read_int()
-        hour = self.read_int()
-        minute = self.read_int()
-        second = self.read_int()
+        year, month, day, hour, minute, second = self.structs.date.unpack_from(
+            self.data, self.pos
+        )
+        self.pos += self.structs.date.size
         return datetime.datetime(year, month, day, hour, minute, second)
 
     def write_date(self, date: datetime.datetime):
-        self.write_int(date.year)
-        self.write_int(date.month)
-        self.write_int(date.day)
-        self.write_int(date.hour)
-        self.write_int(date.minute)
-        self.write_int(date.second)
+        self.write_bytes(
+            self.structs.date.pack(
+                date.year,
+                date.month,
+                date.day,
+                date.hour,
+                date.minute,
+                date.second,
+            )
+        )
 
     def write_bytes(self, data: bytes):
         if self.buffer_enabled:
-            self.data_buffer.append(data)
+            self.data_buffer += data
         else:
-            self.data += data
+            # appends go to a bytearray so that they are amortised
+            if self.write_buffer is None:
+                self.write_buffer = bytearray(self.data)
+                del self.data
+            self.write_buffer += data
         self.pos += len(data)
 
     def write_int(self, value: int):
         value = int(value)
-        self.write_bytes(struct.pack(f"{self.endiness}i", value))
+        self.write_bytes(self.structs.int.pack(value))
 
     def write_uint(self, value: int):
         value = int(value)
-        self.write_bytes(struct.pack(f"{self.endiness}I", value))
+        self.write_bytes(self.structs.uint.pack(value))
 
     def write_short(self, value: int):
         value = int(value)
-        self.write_bytes(struct.pack(f"{self.endiness}h", value))
+        self.write_bytes(self.structs.short.pack(value))
 
     def write_ushort(self, value: int):
         value = int(value)
-        self.write_bytes(struct.pack(f"{self.endiness}H", value))
+        self.write_bytes(self.structs.ushort.pack(value))
 
     def write_byte(self, value: int):
         value = int(value)
-        self.write_bytes(struct.pack(f"{self.endiness}b", value))
+        self.write_bytes(self.structs.byte.pack(value))
 
     def write_ubyte(self, value: int):
         value = int(value)
-        self.write_bytes(struct.pack(f"{self.endiness}B", value))
+        self.write_bytes(self.structs.ubyte.pack(value))
 
     def write_float(self, value: float):
-        self.write_bytes(struct.pack(f"{self.endiness}f", value))
+        self.write_bytes(self.structs.float.pack(value))
 
     def write_double(self, value: float):
-        self.write_bytes(struct.pack(f"{self.endiness}d", value))
+        self.write_bytes(self.structs.double.pack(value))
 
     def write_string(self, value: str, write_length: bool = True):
         if write_length:
@@ -330,10 +434,10 @@ class Data:
         self.write_bytes(value.encode("utf-8"))
 
     def write_long(self, value: int):
-        self.write_bytes(struct.pack(f"{self.endiness}q", value))
+        self.write_bytes(self.structs.long.pack(value))
 
     def write_ulong(self, value: int):
-        self.write_bytes(struct.pack(f"{self.endiness}Q", value))
+        self.write_bytes(self.structs.ulong.pack(value))
 
     def write_list(
         self,
@@ -351,8 +455,41 @@ class Data:
             value += [empty_value] * (length - len(value))
         elif length < len(value):
             value = value[:length]
+        write_func = getattr(self, f"write_{data_type}")
         for item in value:
-            getattr(self, f"write_{data_type}")(item)
+            write_func(item)
+
+    def write_packed_list(
+        self,
+        value: list[Any],
+        fmt: str,
+        empty_value: Any = 0,
+        write_length: bool = True,
+        length: int | None = None,
+    ):
+        """Write a run of fixed-width values in a single pack call. Padding and
+        truncation behave the same as `write_list`.
+
+        Args:
+            value (list[Any]): The values to write
+            fmt (str): Struct format character for a single item (e.g `i`)
+            empty_value (Any, optional): Value used to pad the list. Defaults to 0.
+            write_length (bool, optional): Whether to write the length first.
+                Defaults to True.
+            length (int | None, optional): Number of items to write. Defaults to
+                None (length of the list).
+        """
+        if length is None:
+            length = len(value)
+        if write_length:
+            self.write_int(length)
+        if length > len(value):
+            value += [empty_value] * (length - len(value))
+        elif length < len(value):
+            value = value[:length]
+        self.write_bytes(
+            struct.pack(f"{self.endiness}{length}{fmt}", *map(int, value))
+        )
 
     def write_int_list(
         self,
@@ -360,7 +497,7 @@ class Data:
         write_length: bool = True,
         length: int | None = None,
     ):
-        self.write_list(value, "int", 0, write_length, length)
+        self.write_packed_list(value, "i", 0, write_length, length)
 
     def write_bool_list(
         self,
@@ -368,7 +505,7 @@ class Data:
         write_length: bool = True,
         length: int | None = None,
     ):
-        self.write_list(value, "bool", False, write_length, length)
+        self.write_packed_list(value, "b", False, write_length, length)
 
     def write_string_list(
         self,
@@ -384,7 +521,7 @@ class Data:
         write_length: bool = True,
         length: int | None = None,
     ):
-        self.write_list(value, "byte", 0, write_length, length)
+        self.write_packed_list(value, "b", 0, write_length, length)
 
     def write_short_list(
         self,
@@ -392,7 +529,7 @@ class Data:
         write_length: bool = True,
         length: int | None = None,
     ):
-        self.write_list(value, "short", 0, write_length, length)
+        self.write_packed_list(value, "h", 0, write_length, length)
 
     def read_bool(self) -> bool:
         return self.read_byte() != 0
@@ -598,6 +735,7 @@ class Data:
 
     def set(self, value: bytes | str | None | int | bool) -> None:
         self.data = Data(value).data
+        self.write_buffer = None
 
     def to_bytes_io(self) -> BytesIO:
         return BytesIO(self.data)
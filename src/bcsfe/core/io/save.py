@@ -1,10 +1,14 @@
 from __future__ import annotations
 import base64
-from typing import Any
+import concurrent.futures
+import contextlib
+import threading
+from typing import Any, Callable, Generator
 from bcsfe import core, __version__, cli
 import datetime
 
 from bcsfe.core.io.config import ConfigKey
+from bcsfe.core.io.schema import Field, Marker, Schema
 
 
 class SaveError(Exception):
@@ -27,7 +31,39 @@ class FailedToSaveError(SaveError):
     pass
 
 
+class SaveSection:
+    """Descriptor for a save file attribute that is written with
+    `SaveFile.write_section`. The encoded bytes of a section are cached and
+    reused for as long as its object has only been used by loading and saving.
+    Once the attribute is read or set anywhere else, the object can be edited
+    in place at any time through the reference that was handed out, so the
+    section is re-encoded on every save from then on."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, save_file: SaveFile | None, owner: Any = None) -> Any:
+        if save_file is None:
+            return self
+        try:
+            value = save_file.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if self.name not in save_file.exposed_sections and not save_file.is_internal():
+            save_file.exposed_sections.add(self.name)
+        return value
+
+    def __set__(self, save_file: SaveFile, value: Any):
+        save_file.__dict__[self.name] = value
+        if save_file.is_internal():
+            save_file.clear_section_cache(self.name)
+        else:
+            save_file.exposed_sections.add(self.name)
+
+
 class SaveFile:
+    last_detected_cc: core.CountryCode | None = None
+
     def __init__(
         self,
         dt: core.Data | None = None,
@@ -36,8 +72,32 @@ class SaveFile:
         gv: core.GameVersion | None = None,
         package_name: str | None = None,
     ):
+        """Create a save file.
+
+        Args:
+            dt (core.Data | None, optional): The save data. Defaults to None.
+            cc (core.CountryCode | None, optional): Country code to use if it
+                can't be detected. Defaults to None.
+            load (bool, optional): Whether to load the save data. Defaults to True.
+            gv (core.GameVersion | None, optional): Game version of a new save.
+                Defaults to None.
+            package_name (str | None, optional): Package name. Defaults to None.
+        """
         self.package_name = package_name
         self.save_path: core.Path | None = None
+
+        # sections whose objects have been handed out, so they are never
+        # written from the cache
+        self.exposed_sections: set[str] = set()
+        self.section_cache: dict[str, bytes] = {}
+        self.section_cache_key: tuple[int, str] | None = None
+        self.internal_access_state = threading.local()
+        self.save_lock = threading.Lock()
+
+        self.order_id_index: dict[str, list[int]] = {}
+        self.order_id_index_source: list[str] | None = None
+        self.order_id_index_length = 0
+
         if dt is None:
             self.data = core.Data()
         else:
@@ -54,7 +114,8 @@ class SaveFile:
 
         self.localizable: core.Localizable | None = None
 
-        self.init_save(gv)
+        with self.internal_access():
+            self.init_save(gv)
 
         if dt is not None and load:
             self.load_wrapper()
@@ -68,23 +129,62 @@ class SaveFile:
         self.data = other.data
         self.cc = other.cc
         self.game_version = other.game_version
-        self.init_save(other.game_version)
+        with self.internal_access():
+            self.init_save(other.game_version)
         self.load_wrapper()
 
+    @contextlib.contextmanager
+    def internal_access(self) -> Generator[None, None, None]:
+        """Mark section accesses made by the current thread as part of
+        loading or saving, so they don't stop the section cache from being
+        used."""
+        state = self.internal_access_state
+        depth = getattr(state, "depth", 0)
+        state.depth = depth + 1
+        try:
+            yield
+        finally:
+            state.depth = depth
+
+    def is_internal(self) -> bool:
+        return getattr(self.internal_access_state, "depth", 0) > 0
+
     def detect_cc(self) -> core.CountryCode | None:
-        for cc in core.CountryCode.get_all():
-            self.cc = cc
-            if self.verify_hash():
+        """Detect the country code of the save file by finding the salt that
+        produces the stored hash. The last detected country code is tried first,
+        so a batch of saves from the same region only hashes each save once.
+
+        Returns:
+            core.CountryCode | None: The detected country code
+        """
+        if len(self.data) < 32:
+            return None
+        current_hash = self.get_current_hash()
+
+        ccs = core.CountryCode.get_all()
+        last_cc = SaveFile.last_detected_cc
+        if last_cc is not None:
+            ccs.sort(key=lambda cc: cc != last_cc)
+
+        for cc in ccs:
+            if self.get_new_hash(cc=cc) == current_hash:
+                SaveFile.last_detected_cc = cc
                 return cc
         return None
 
-    def get_salt(self) -> str:
+    def get_salt(self, cc: core.CountryCode | None = None) -> str:
         """Get the salt for the save file. This is used for hashing the save file.
 
+        Args:
+            cc (core.CountryCode | None, optional): Country code to get the salt
+                for. Defaults to None (the save's country code).
+
         Returns:
             str: The salt
         """
-        salt = f"battlecats{self.cc.get_patching_code()}"
+        if cc is None:
+            cc = self.cc
+        salt = f"battlecats{cc.get_patching_code()}"
         return salt
 
     def get_current_hash(self) -> str:
@@ -98,21 +198,25 @@ class SaveFile:
         hash = self.data.read_string(32)
         return hash
 
-    def get_new_hash(self, existing_hash: bool = True) -> str:
+    def get_new_hash(
+        self, existing_hash: bool = True, cc: core.CountryCode | None = None
+    ) -> str:
         """Get the new hash for the save file. This is used for hashing the save file.
 
+        Args:
+            existing_hash (bool, optional): Whether the data already ends with a
+                hash that should be skipped. Defaults to True.
+            cc (core.CountryCode | None, optional): Country code to get the salt
+                for. Defaults to None (the save's country code).
+
         Returns:
             str: The new hash
         """
-        salt = self.get_salt()
-        self.data.reset_pos()
-        if existing_hash:
-            data_to_hash = self.data.read_bytes(len(self.data) - 32)
-        else:
-            data_to_hash = self.data.read_bytes(len(self.data))
-        salted_data = core.Data(salt.encode("utf-8") + data_to_hash)
-        hash = core.Hash(core.HashAlgorithm.MD5).get_hash(salted_data)
-        return hash.to_hex()
+        end = len(self.data) - 32 if existing_hash else len(self.data)
+        hash = core.Hash(core.HashAlgorithm.MD5).update(
+            self.get_salt(cc).encode("utf-8"), self.data.get_view(0, end)
+        )
+        return hash.digest().to_hex()
 
     def set_hash(self, add: bool = False):
         """Set the hash of the save file."""
@@ -133,17 +237,21 @@ class SaveFile:
 
     def load_wrapper(self):
         try:
-            self.load()
+            with self.internal_access():
+                self.load()
         except Exception as e:
-            ignore_error = core.core_data.config.get_bool(ConfigKey.IGNORE_PARSE_ERROR)
-            if not ignore_error:
-                raise FailedToLoadError(
-                    core.core_data.local_manager.get_key("failed_to_load_save")
-                ) from e
-            else:
-                from traceback import format_exc
+            self.handle_load_error(e)
+
+    def handle_load_error(self, e: Exception):
+        ignore_error = core.core_data.config.get_bool(ConfigKey.IGNORE_PARSE_ERROR)
+        if not ignore_error:
+            raise FailedToLoadError(
+                core.core_data.local_manager.get_key("failed_to_load_save")
+            ) from e
+        else:
+            from traceback import format_exc
 
-                cli.color.color_print_key("parse_ignored_error", error=format_exc())
+            cli.color.color_print_key("parse_ignored_error", error=format_exc())
 
     def set_gv(self, gv: core.GameVersion):
         self.game_version = gv
@@ -157,6 +265,12 @@ class SaveFile:
 
     def load(self):
         """Load the save file. For most of this stuff I have no idea what it is used for"""
+        for _ in self.iter_load():
+            pass
+
+    def iter_load(self) -> Generator[None, None, None]:
+        """Load the save file, yielding between top-level sections so that
+        loading can be paused and resumed by `core.SaveReader`."""
 
         self.data.reset_pos()
         self.dst_index = 0
@@ -165,14 +279,7 @@ class SaveFile:
 
         self.game_version: core.GameVersion = core.GameVersion(self.data.read_int())
 
-        if self.game_version >= 10 or self.not_jp():
-            self.ub1 = self.data.read_bool()
-
-        self.mute_bgm = self.data.read_bool()
-        self.mute_se = self.data.read_bool()
-
-        self.catfood = self.data.read_int()
-        self.current_energy = self.data.read_int()
+        SETTINGS_SCHEMA.read(self)
 
         year = self.data.read_int()
         self.year = self.data.read_int()
@@ -193,63 +300,31 @@ class SaveFile:
 
         self.date = datetime.datetime(year, month, day, hour, minute, second)
 
-        self.ui1 = self.data.read_int()
-        self.stamp_value_save = self.data.read_int()
-        self.ui2 = self.data.read_int()
-
-        self.upgrade_state = self.data.read_int()
-
-        self.xp = self.data.read_int()
-        self.tutorial_state = self.data.read_int()
-
-        self.ui3 = self.data.read_int()
-        self.koreaSuperiorTreasureState = self.data.read_int()
-
-        self.unlock_popups_11 = self.data.read_int_list(3)
-        self.ui5 = self.data.read_int()
-        self.unlock_enemy_guide = self.data.read_int()
-        self.ui6 = self.data.read_int()
-        self.ub0 = self.data.read_bool()
-        self.ui7 = self.data.read_int()
-        self.cleared_eoc_1 = self.data.read_int()
-        self.ui8 = self.data.read_int()
-        self.unlocked_ending = self.data.read_int()
+        HEADER_SCHEMA.read(self)
 
+        yield
         self.lineups = core.LineUps.read(self.data, self.game_version)
 
+        yield
         self.stamp_data = core.StampData.read(self.data)
+        yield
         self.story = core.StoryChapters.read(self.data)
 
-        if 20 <= self.game_version and self.game_version <= 25:
-            self.enemy_guide = self.data.read_int_list(231)
-        else:
-            self.enemy_guide = self.data.read_int_list()
+        ENEMY_GUIDE_SCHEMA.read(self)
 
+        yield
         self.cats = core.Cats.read_unlocked(self.data, self.game_version)
         self.cats.read_upgrade(self.data, self.game_version)
         self.cats.read_current_form(self.data, self.game_version)
 
+        yield
         self.special_skills = core.SpecialSkills.read_upgrades(self.data)
-        if self.game_version <= 25:
-            self.menu_unlocks = self.data.read_int_list(5)
-            self.unlock_popups_0 = self.data.read_int_list(5)
-        elif self.game_version == 26:
-            self.menu_unlocks = self.data.read_int_list(6)
-            self.unlock_popups_0 = self.data.read_int_list(6)
-        else:
-            self.menu_unlocks = self.data.read_int_list()
-            self.unlock_popups_0 = self.data.read_int_list()
+        MENU_UNLOCKS_SCHEMA.read(self)
 
+        yield
         self.battle_items = core.BattleItems.read_items(self.data)
 
-        if self.game_version <= 26:
-            self.new_dialogs_2 = self.data.read_int_list(17)
-        else:
-            self.new_dialogs_2 = self.data.read_int_list()
-
-        self.uil1 = self.data.read_int_list(length=20)
-        self.moneko_bonus = self.data.read_int_list(length=1)
-        self.daily_reward_initialized = self.data.read_int_list(length=1)
+        DIALOGS_SCHEMA.read(self)
 
         self.battle_items.read_locked_items(self.data)
 
@@ -261,100 +336,44 @@ class SaveFile:
         self.read_dst()
         self.date_3 = self.data.read_date()
 
-        if self.game_version <= 37:
-            self.ui0 = self.data.read_int()
-
-        self.stage_unlock_cat_value = self.data.read_int()
-        self.show_ending_value = self.data.read_int()
-        self.chapter_clear_cat_unlock = self.data.read_int()
-        self.ui9 = self.data.read_int()
-        self.ios_android_month = self.data.read_int()
-        self.ui10 = self.data.read_int()
-        self.save_data_4_hash = self.data.read_string()
+        ENDING_SCHEMA.read(self)
 
+        yield
         self.mysale = core.MySale.read_bonus_hash(self.data)
-        self.chara_flags = self.data.read_int_list(length=2)
-
-        if self.game_version <= 37:
-            self.uim1 = self.data.read_int()
-            self.ubm1 = self.data.read_bool()
-
-        self.chara_flags_2 = self.data.read_int_list(length=2)
-
-        self.normal_tickets = self.data.read_int()
-        self.rare_tickets = self.data.read_int()
+        TICKETS_SCHEMA.read(self)
 
         self.cats.read_gatya_seen(self.data, self.game_version)
         self.special_skills.read_gatya_seen(self.data)
         self.cats.read_storage(self.data, self.game_version)
 
+        yield
         self.event_stages = core.EventChapters.read(self.data, self.game_version)
-        self.itf1_ending = self.data.read_int()
-        self.continue_flag = self.data.read_int()
-        if 20 <= self.game_version:
-            self.unlock_popups_8 = self.data.read_int_list(length=36)
-
-        if 20 <= self.game_version and self.game_version <= 25:
-            self.unit_drops = self.data.read_int_list(length=110)
-        elif 26 <= self.game_version:
-            self.unit_drops = self.data.read_int_list()
+        UNIT_DROPS_SCHEMA.read(self)
 
+        yield
         self.gatya = core.Gatya.read_rare_normal_seed(self.data, self.game_version)
 
-        self.get_event_data = self.data.read_bool()
-        self.achievements = self.data.read_bool_list(length=7)
-
-        self.os_value = self.data.read_int()
+        EVENT_DATA_SCHEMA.read(self)
 
         self.read_dst()
         self.date_4 = self.data.read_date()
 
         self.gatya.read2(self.data)
 
-        if self.not_jp():
-            self.player_id = self.data.read_string()
-
-        self.order_ids = self.data.read_string_list()
-
-        if self.not_jp():
-            self.g_timestamp = self.data.read_double()
-            self.g_servertimestamp = self.data.read_double()
-            self.m_gettimesave = self.data.read_double()
-            self.usl1 = self.data.read_string_list()
-            self.energy_notification = self.data.read_bool()
-            self.full_gameversion = self.data.read_int()
+        PLAYER_ID_SCHEMA.read(self)
 
         self.lineups.read_2(self.data, self.game_version)
         self.event_stages.read_legend_restrictions(self.data, self.game_version)
 
-        if self.game_version <= 37:
-            self.uil2 = self.data.read_int_list(length=7)
-            self.uil3 = self.data.read_int_list(length=7)
-            self.uil4 = self.data.read_int_list(length=7)
-
-        self.g_timestamp_2 = self.data.read_double()
-        self.g_servertimestamp_2 = self.data.read_double()
-        self.m_gettimesave_2 = self.data.read_double()
-        self.unknown_timestamp = self.data.read_double()
+        TIMESTAMPS_SCHEMA.read(self)
         self.gatya.read_trade_progress(self.data)
 
-        if self.game_version <= 37:
-            self.usl2 = self.data.read_string_list()
-
-        if self.not_jp():
-            self.m_dGetTimeSave2 = self.data.read_double()
-            self.ui11 = 0
-        else:
-            self.ui11 = self.data.read_int()
-
-        if 20 <= self.game_version and self.game_version <= 25:
-            self.ubl1 = self.data.read_bool_list(length=12)
-        elif 26 <= self.game_version and self.game_version < 39:
-            self.ubl1 = self.data.read_bool_list()
+        SAVE_TIME_2_SCHEMA.read(self)
 
         self.cats.read_max_upgrade_levels(self.data, self.game_version)
         self.special_skills.read_max_upgrade_levels(self.data)
 
+        yield
         self.user_rank_rewards = core.UserRankRewards.read(self.data, self.game_version)
 
         if not self.not_jp():
@@ -362,9 +381,7 @@ class SaveFile:
 
         self.cats.read_unlocked_forms(self.data, self.game_version)
 
-        self.transfer_code = self.data.read_string()
-        self.confirmation_code = self.data.read_string()
-        self.transfer_flag = self.data.read_bool()
+        TRANSFER_SCHEMA.read(self)
 
         if 20 <= self.game_version:
             self.item_reward_stages = core.ItemRewardChapters.read(
@@ -376,83 +393,46 @@ class SaveFile:
             )
             self.inquiry_code = self.data.read_string()
             self.officer_pass = core.OfficerPass.read(self.data)
-            self.has_account = self.data.read_byte()
-            self.backup_state = self.data.read_int()
-
-            if self.not_jp():
-                self.ub2 = self.data.read_bool()
-
-            assert self.data.read_int() == 44
-
-            self.itf1_complete = self.data.read_int()
+            BACKUP_SCHEMA.read(self)
 
             self.story.read_itf_timed_scores(self.data)
 
-            self.title_chapter_bg = self.data.read_int()
-
-            if self.game_version > 26:
-                self.combo_unlocks = self.data.read_int_list()
-
-            self.combo_unlocked_10k_ur = self.data.read_bool()
-
-            assert self.data.read_int() == 45
+            COMBO_SCHEMA.read(self)
 
+        yield
         if 21 <= self.game_version:
             assert self.data.read_int() == 46
 
             self.gatya.read_event_seed(self.data, self.game_version)
-            if self.game_version < 34:
-                self.event_capsules = self.data.read_int_list(length=100)
-                self.event_capsules_counter = self.data.read_int_list(length=100)
-            else:
-                self.event_capsules = self.data.read_int_list()
-                self.event_capsules_counter = self.data.read_int_list()
-
-            assert self.data.read_int() == 47
+            EVENT_CAPSULES_SCHEMA.read(self)
 
+        yield
         if 22 <= self.game_version:
             assert self.data.read_int() == 48
 
-        if 23 <= self.game_version:
-            if not self.not_jp():
-                self.energy_notification = self.data.read_bool()
-
-            self.m_dGetTimeSave3 = self.data.read_double()
-            if self.game_version < 26:
-                self.gatya_seen_lucky_drops = self.data.read_int_list(length=44)
-            else:
-                self.gatya_seen_lucky_drops = self.data.read_int_list()
-            self.show_ban_message = self.data.read_bool()
-            self.catfood_beginner_purchased = self.data.read_bool_list(length=3)
-            self.next_week_timestamp = self.data.read_double()
-            self.catfood_beginner_expired = self.data.read_bool_list(length=3)
-            self.rank_up_sale_value = self.data.read_int()
-
-            assert self.data.read_int() == 49
+        yield
+        GV_23_SCHEMA.read(self)
 
+        yield
         if 24 <= self.game_version:
             assert self.data.read_int() == 50
 
+        yield
         if 25 <= self.game_version:
             assert self.data.read_int() == 51
 
+        yield
         if 26 <= self.game_version:
             self.cats.read_catguide_collected(self.data)
 
             assert self.data.read_int() == 52
 
+        yield
         if 27 <= self.game_version:
-            self.time_since_time_check_cumulative = self.data.read_double()
-            self.server_timestamp = self.data.read_double()
-            self.last_checked_energy_recovery_time = self.data.read_double()
-            self.time_since_check = self.data.read_double()
-            self.last_checked_expedition_time = self.data.read_double()
-
-            self.catfruit = self.data.read_int_list()
+            ENERGY_SCHEMA.read(self)
             self.cats.read_fourth_forms(self.data)
             self.cats.read_catseyes_used(self.data)
-            self.catseyes = self.data.read_int_list()
-            self.catamins = self.data.read_int_list()
+            CATSEYES_SCHEMA.read(self)
             self.gamatoto = core.Gamatoto.read(self.data)
 
             self.unlock_popups_6 = self.data.read_bool_list()
@@ -460,29 +440,21 @@ class SaveFile:
 
             assert self.data.read_int() == 53
 
+        yield
         if 29 <= self.game_version:
             self.gamatoto.read_2(self.data)
             assert self.data.read_int() == 54
             self.item_pack = core.ItemPack.read(self.data)
             assert self.data.read_int() == 54
 
+        yield
         if self.game_version >= 30:
             self.gamatoto.read_skin(self.data)
             self.platinum_tickets = self.data.read_int()
             self.logins = core.LoginBonus.read(self.data, self.game_version)
-            if self.game_version < 101000:
-                self.reset_item_reward_flags = self.data.read_bool_list()
-
-            self.reward_remaining_time = self.data.read_double()
-            self.last_checked_reward_time = self.data.read_double()
-            self.announcements = self.data.read_int_tuple_list(length=16)
-            self.backup_counter = self.data.read_int()
-            self.ui12 = self.data.read_int()
-            self.ui13 = self.data.read_int()
-            self.ui14 = self.data.read_int()
-
-            assert self.data.read_int() == 55
+            REWARDS_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 31:
             self.ub3 = self.data.read_bool()
             self.item_reward_stages.read_item_obtains(self.data)
@@ -492,31 +464,33 @@ class SaveFile:
 
             assert self.data.read_int() == 56
 
+        yield
         if self.game_version >= 32:
             self.ub4 = self.data.read_bool()
             self.cats.read_favorites(self.data)
 
             assert self.data.read_int() == 57
 
+        yield
         if self.game_version >= 33:
             self.dojo = core.Dojo.read_chapters(self.data)
             self.dojo.read_item_locks(self.data)
 
             assert self.data.read_int() == 58
 
+        yield
         if self.game_version >= 34:
             self.last_checked_zombie_time = self.data.read_double()
             self.outbreaks = core.Outbreaks.read_chapters(self.data)
             self.outbreaks.read_2(self.data)
             self.scheme_items = core.SchemeItems.read(self.data)
 
+        yield
         if self.game_version >= 35:
             self.outbreaks.read_current_outbreaks(self.data, self.game_version)
-            self.first_locks = self.data.read_int_bool_dict()
-            self.energy_penalty_timestamp = self.data.read_double()
-
-            assert self.data.read_int() == 60
+            LOCKS_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 36:
             self.cats.read_chara_new_flags(self.data)
             self.shown_maxcollab_mg = self.data.read_bool()
@@ -524,10 +498,12 @@ class SaveFile:
 
             assert self.data.read_int() == 61
 
+        yield
         if self.game_version >= 38:
             self.unlock_popups = core.UnlockPopups.read(self.data)
             assert self.data.read_int() == 63
 
+        yield
         if self.game_version >= 39:
             self.ototo = core.Ototo.read(self.data)
             self.ototo.read_2(self.data, self.game_version)
@@ -535,11 +511,13 @@ class SaveFile:
 
             assert self.data.read_int() == 64
 
+        yield
         if self.game_version >= 40:
             self.beacon_base = core.BeaconEventListScene.read(self.data)
 
             assert self.data.read_int() == 65
 
+        yield
         if self.game_version >= 41:
             self.tower = core.TowerChapters.read(self.data)
             self.missions = core.Missions.read(self.data, self.game_version)
@@ -547,6 +525,7 @@ class SaveFile:
 
             assert self.data.read_int() == 66
 
+        yield
         if self.game_version >= 42:
             self.dojo.read_ranking(self.data, self.game_version)
             self.item_pack.read_three_days(self.data)
@@ -556,6 +535,7 @@ class SaveFile:
 
             assert self.data.read_int() == 67
 
+        yield
         if self.game_version >= 43:
             self.missions.read_weekly_missions(self.data)
             self.dojo.ranking.read_did_win_rewards(self.data)
@@ -563,70 +543,62 @@ class SaveFile:
 
             assert self.data.read_int() == 68
 
+        yield
         if self.game_version >= 44:
             self.event_stages.read_dicts(self.data)
             self.cotc_1_complete = self.data.read_int()
 
             assert self.data.read_int() == 69
 
+        yield
         if self.game_version >= 46:
             self.gamatoto.read_collab_data(self.data)
 
             assert self.data.read_int() == 71
 
+        yield
         if self.game_version < 90300:
             self.map_resets = core.MapResets.read(self.data)
 
             assert self.data.read_int() == 72
 
+        yield
         if self.game_version >= 51:
             self.uncanny = core.UncannyChapters.read(self.data)
             assert self.data.read_int() == 76
 
+        yield
         if self.game_version >= 77:
             self.catamin_stages = core.UncannyChapters.read(self.data)
+            LUCKY_TICKETS_SCHEMA.read(self)
 
-            self.lucky_tickets = self.data.read_int_list()
-
-            self.ub5 = self.data.read_bool()
-
-            assert self.data.read_int() == 77
-
+        yield
         if self.game_version >= 80000:
             self.officer_pass.read_gold_pass(self.data, self.game_version)
             self.cats.read_talents(self.data)
-            self.np = self.data.read_int()
-            self.ub6 = self.data.read_bool()
-
-            assert self.data.read_int() == 80000
+            NP_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 80200:
-            self.ub7 = self.data.read_bool()
-            self.leadership = self.data.read_short()
+            LEADERSHIP_SCHEMA.read(self)
             self.officer_pass.read_cat_data(self.data)
 
             assert self.data.read_int() == 80200
 
-        if self.game_version >= 80300:
-            self.filibuster_stage_id = self.data.read_byte()
-            self.filibuster_stage_enabled = self.data.read_bool()
-
-            assert self.data.read_int() == 80300
-
-        if self.game_version >= 80500:
-            self.stage_ids_10s = self.data.read_int_list()
+        yield
+        GV_80300_SCHEMA.read(self)
 
-            assert self.data.read_int() == 80500
+        yield
+        GV_80500_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 80600:
             length = self.data.read_short()
             self.uil6 = self.data.read_int_list(length=length)
             self.legend_quest = core.LegendQuestChapters.read(self.data)
-            self.ush1 = self.data.read_short()
-            self.uby1 = self.data.read_byte()
-
-            assert self.data.read_int() == 80600
+            GV_80600_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 80700:
             length = self.data.read_int()
             self.uiid1: dict[int, list[int]] = {}
@@ -637,29 +609,26 @@ class SaveFile:
 
             assert self.data.read_int() == 80700
 
+        yield
         if self.game_version >= 100600:
             if self.is_en():
                 self.uby2 = self.data.read_byte()
                 assert self.data.read_int() == 100600
 
-        if self.game_version >= 81000:
-            self.restart_pack = self.data.read_byte()
-            assert self.data.read_int() == 81000
+        yield
+        GV_81000_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 90000:
             self.medals = core.Medals.read(self.data)
             self.wildcat_slots = core.GamblingEvent.read(self.data, self.game_version)
 
             assert self.data.read_int() == 90000
 
-        if self.game_version >= 90100:
-            self.ush2 = self.data.read_short()
-            self.ush3 = self.data.read_short()
-            self.ui15 = self.data.read_int()
-            self.ud1 = self.data.read_double()
-
-            assert self.data.read_int() == 90100
+        yield
+        GV_90100_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 90300:
             length = self.data.read_short()
             self.utl1: list[tuple[int, int, int, int, int, int, int]] = []
@@ -680,6 +649,7 @@ class SaveFile:
 
             assert self.data.read_int() == 90300
 
+        yield
         if self.game_version >= 90400:
             self.enigma_clears = core.GauntletChapters.read(self.data)
             self.enigma = core.Enigma.read(self.data, self.game_version)
@@ -687,17 +657,10 @@ class SaveFile:
 
             assert self.data.read_int() == 90400
 
+        yield
         if self.game_version >= 90500:
             self.collab_gauntlets = core.GauntletChapters.read(self.data)
-            self.ub8 = self.data.read_bool()
-            self.ud2 = self.data.read_double()
-            self.ud3 = self.data.read_double()
-            self.ui16 = self.data.read_int()
-            if self.game_version >= 100300:
-                self.uby3 = self.data.read_byte()
-                self.ub9 = self.data.read_bool()
-                self.ud4 = self.data.read_double()
-                self.ud5 = self.data.read_double()
+            GV_90500_SCHEMA.read(self)
 
             if self.game_version >= 130700:
                 length = self.data.read_short()
@@ -724,6 +687,7 @@ class SaveFile:
 
             assert self.data.read_int() == 90500
 
+        yield
         if self.game_version >= 90700:
             self.talent_orbs = core.TalentOrbs.read(self.data, self.game_version)
             length = self.data.read_short()
@@ -744,25 +708,21 @@ class SaveFile:
 
             assert self.data.read_int() == 90700
 
-        if self.game_version >= 90800:
-            length = self.data.read_short()
-            self.uil7 = self.data.read_int_list(length)
-            self.ubl2 = self.data.read_bool_list(10)
-
-            assert self.data.read_int() == 90800
+        yield
+        GV_90800_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 90900:
             self.cat_shrine = core.CatShrine.read(self.data)
-            self.ud6 = self.data.read_double()
-            self.ud7 = self.data.read_double()
-
-            assert self.data.read_int() == 90900
+            GV_90900_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 91000:
             self.lineups.read_slot_names(self.data, self.game_version)
 
             assert self.data.read_int() == 91000
 
+        yield
         if self.game_version >= 100000:
             self.legend_tickets = self.data.read_int()
             length = self.data.read_byte()
@@ -772,52 +732,33 @@ class SaveFile:
                 i2 = self.data.read_int()
                 self.uiil1.append((i1, i2))
 
-            self.ub11 = self.data.read_bool()
-            self.ub12 = self.data.read_bool()
-
-            self.password_refresh_token = self.data.read_string()
-
-            self.ub13 = self.data.read_bool()
-            self.uby4 = self.data.read_byte()
-            self.uby5 = self.data.read_byte()
-            self.ud8 = self.data.read_double()
-            self.ud9 = self.data.read_double()
-
-            assert self.data.read_int() == 100000
+            GV_100000_SCHEMA.read(self)
 
-        if self.game_version >= 100100:
-            self.date_int = self.data.read_int()
-
-            assert self.data.read_int() == 100100
+        yield
+        GV_100100_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 100300:
             self.battle_items.read_endless_items(self.data)
 
             assert self.data.read_int() == 100300
 
-        if self.game_version >= 100400:
-            length = self.data.read_byte()
-            self.event_capsules_2 = self.data.read_int_list(length)
-            self.two_battle_lines = self.data.read_bool()
-
-            assert self.data.read_int() == 100400
-
-        if self.game_version >= 100600:
-            self.ud10 = self.data.read_double()
-            self.platinum_shards = self.data.read_int()
-            self.ub15 = self.data.read_bool()
+        yield
+        GV_100400_SCHEMA.read(self)
 
-            assert self.data.read_int() == 100600
+        yield
+        GV_100600_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 100700:
             self.cat_scratcher = core.GamblingEvent.read(self.data, self.game_version)
 
             assert self.data.read_int() == 100700
 
+        yield
         if self.game_version >= 100900:
             self.aku = core.AkuChapters.read(self.data)
-            self.ub16 = self.data.read_bool()
-            self.ub17 = self.data.read_bool()
+            GV_100900_SCHEMA.read(self)
 
             length = self.data.read_short()
             self.ushdshd2: dict[int, list[int]] = {}
@@ -850,11 +791,10 @@ class SaveFile:
 
             assert self.data.read_int() == 100900
 
-        if self.game_version >= 101000:
-            self.uby6 = self.data.read_byte()
-
-            assert self.data.read_int() == 101000
+        yield
+        GV_101000_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 110000:
             length = self.data.read_short()
             self.uidtii: dict[int, tuple[int, int]] = {}
@@ -868,17 +808,17 @@ class SaveFile:
 
             assert self.data.read_int() == 110000
 
+        yield
         if self.game_version >= 110500:
             self.behemoth_culling = core.GauntletChapters.read(self.data)
             self.ub19 = self.data.read_bool()
 
             assert self.data.read_int() == 110500
 
-        if self.game_version >= 110600:
-            self.ub20 = self.data.read_bool()
-
-            assert self.data.read_int() == 110600
+        yield
+        GV_110600_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 110700:
             length = self.data.read_int()
             self.uidtff: dict[int, tuple[float, float]] = {}
@@ -895,73 +835,27 @@ class SaveFile:
 
             assert self.data.read_int() == 110700
 
+        yield
         if self.game_version >= 110800:
             self.cat_shrine.read_dialogs(self.data)
-            self.ub21 = self.data.read_bool()
-            self.dojo_3x_speed = self.data.read_bool()
-            self.ub22 = self.data.read_bool()
-            self.ub23 = self.data.read_bool()
-
-            assert self.data.read_int() == 110800
+            GV_110800_SCHEMA.read(self)
 
-        if self.game_version >= 111000:
-            self.ui17 = self.data.read_int()
-            self.ush4 = self.data.read_short()
-            self.uby7 = self.data.read_byte()
-            self.uby8 = self.data.read_byte()
-            self.ub24 = self.data.read_bool()
-            self.uby9 = self.data.read_byte()
-
-            length = self.data.read_byte()
-            self.ushl1 = self.data.read_short_list(length)
-
-            length = self.data.read_short()
-            self.ushl2 = self.data.read_short_list(length)
-
-            length = self.data.read_short()
-            self.ushl3 = self.data.read_short_list(length)
-
-            self.ui18 = self.data.read_int()
-            self.ui19 = self.data.read_int()
-            self.ui20 = self.data.read_int()
-            self.ush5 = self.data.read_short()
-            self.ush6 = self.data.read_short()
-            self.ush7 = self.data.read_short()
-            self.ush8 = self.data.read_short()
-            self.uby10 = self.data.read_byte()
-            self.ub25 = self.data.read_bool()
-            self.ub26 = self.data.read_bool()
-            self.ub27 = self.data.read_bool()
-            self.ub28 = self.data.read_bool()
-            self.ub29 = self.data.read_bool()
-            self.ub30 = self.data.read_bool()
-            self.uby11 = self.data.read_byte()
-
-            length = self.data.read_short()
-            self.ushl4 = self.data.read_short_list(length)
-
-            self.ubl3 = self.data.read_bool_list(14)
-
-            length = self.data.read_byte()
-            self.labyrinth_medals = self.data.read_short_list(length)
-
-            assert self.data.read_int() == 111000
+        yield
+        GV_111000_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 120000:
             self.zero_legends = core.ZeroLegendsChapters.read(self.data)
             self.uby12 = self.data.read_byte()
 
             assert self.data.read_int() == 120000
 
-        if self.game_version >= 120100:
-            length = self.data.read_short()
-            self.ushl6 = self.data.read_short_list(length)
-
-            assert self.data.read_int() == 120100
+        yield
+        GV_120100_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 120200:
-            self.ub31 = self.data.read_bool()
-            self.ush9 = self.data.read_short()
+            GV_120200_SCHEMA.read(self)
             length = self.data.read_byte()
             self.ushshd: dict[int, int] = {}
             for _ in range(length):
@@ -971,28 +865,16 @@ class SaveFile:
 
             assert self.data.read_int() == 120200
 
-        if self.game_version >= 120400:
-            self.ud11 = self.data.read_double()
-            self.ud12 = self.data.read_double()
-
-            assert self.data.read_int() == 120400
-
-        if self.game_version >= 120500:
-            self.ub32 = self.data.read_bool()
-            self.ub33 = self.data.read_bool()
-            self.ub34 = self.data.read_bool()
+        yield
+        GV_120400_SCHEMA.read(self)
 
-            self.ui21 = self.data.read_int()
-            self.golden_cpu_count = self.data.read_byte()
+        yield
+        GV_120500_SCHEMA.read(self)
 
-            assert self.data.read_int() == 120500
-
-        if self.game_version >= 120600:
-            self.sound_effects_volume = self.data.read_byte()
-            self.background_music_volume = self.data.read_byte()
-
-            assert self.data.read_int() == 120600
+        yield
+        GV_120600_SCHEMA.read(self)
 
+        yield
         if (self.not_jp() and self.game_version >= 120700) or (
             self.is_jp() and self.game_version >= 130000
         ):
@@ -1008,6 +890,7 @@ class SaveFile:
             else:
                 assert self.data.read_int() == 130000
 
+        yield
         if self.game_version >= 130100:
             length = self.data.read_int()
             self.utl3: list[tuple[int, int]] = []
@@ -1018,6 +901,7 @@ class SaveFile:
 
             assert self.data.read_int() == 130100
 
+        yield
         if self.game_version >= 130301:
             length = self.data.read_int()
             self.ustid1: dict[str, tuple[int, float]] = {}
@@ -1029,12 +913,10 @@ class SaveFile:
 
             assert self.data.read_int() == 130301
 
-        if self.game_version >= 130400:
-            self.ud13 = self.data.read_double()
-            self.ud14 = self.data.read_double()
-
-            assert self.data.read_int() == 130400
+        yield
+        GV_130400_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 130500:
             self.utl4: list[tuple[int, list[tuple[int, int, int, list[int]]]]] = []
             length1 = self.data.read_short()
@@ -1060,27 +942,12 @@ class SaveFile:
 
             assert self.data.read_int() == 130500
 
-        if self.game_version >= 130600:
-            self.uby14 = self.data.read_byte()
-
-            if self.not_jp():
-                self.ush12 = self.data.read_short()
-
-            assert self.data.read_int() == 130600
+        yield
+        GV_130600_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 130700:
-            if self.is_jp():
-                self.ush12 = self.data.read_short()
-            self.ud15 = self.data.read_double()
-            self.uby15 = self.data.read_byte()
-            self.uby16 = self.data.read_byte()
-
-            self.ush11 = self.data.read_short()
-            self.uby17 = self.data.read_byte()
-            self.uby18 = self.data.read_byte()
-            self.uby19 = self.data.read_byte()
-
-            self.ud16 = self.data.read_double()
+            GV_130700_SCHEMA.read(self)
 
             length1 = self.data.read_short()
 
@@ -1105,10 +972,9 @@ class SaveFile:
 
             assert self.data.read_int() == 130700
 
+        yield
         if self.game_version >= 140000:
-            self.ui22 = self.data.read_int()
-            self.ud17 = self.data.read_double()
-            self.uby20 = self.data.read_byte()
+            GV_140000_SCHEMA.read(self)
 
             length = self.data.read_byte()
 
@@ -1126,14 +992,7 @@ class SaveFile:
 
             self.dojo_chapters = core.ZeroLegendsChapters.read(self.data)
 
-            length = self.data.read_short()
-
-            self.uil9: list[int] = []
-            for _ in range(length):
-                self.uil9.append(self.data.read_int())
-
-            self.ub35 = self.data.read_bool()
-            self.ud18 = self.data.read_double()
+            GV_140000_2_SCHEMA.read(self)
 
             length = self.data.read_short()
 
@@ -1146,10 +1005,10 @@ class SaveFile:
 
             assert self.data.read_int() == 140000
 
-        if self.game_version >= 140100 and self.game_version < 140500:
-            self.uby21 = self.data.read_byte()
-            assert self.data.read_int() == 140100
+        yield
+        GV_140100_SCHEMA.read(self)
 
+        yield
         if self.game_version >= 140200:
             length = self.data.read_byte()
 
@@ -1224,44 +1083,13 @@ class SaveFile:
 
             assert self.data.read_int() == 140200
 
-        if self.game_version >= 140300:
-            length = self.data.read_byte()
-            self.uil11: list[int] = []
-            for _ in range(length):
-                val = self.data.read_byte()
-                self.uil11.append(val)
-
-            if self.game_version >= 150300:
-                self.ui24 = self.data.read_int()
-                self.ub38 = self.data.read_bool()
-            if self.game_version >= 150500:
-                self.ub39 = self.data.read_bool()
-
-            self.ub36 = self.data.read_bool()
-
-            length = self.data.read_byte()
-
-            self.treasure_chests: list[int] = []
-
-            for _ in range(length):
-                value = self.data.read_int()
-                self.treasure_chests.append(value)
-
-            self.ui23 = self.data.read_int()
-            length = self.data.read_short()
-
-            self.uil13: list[int] = []
-
-            for _ in range(length):
-                self.uil13.append(self.data.read_int())
-
-            self.ub37 = self.data.read_bool()
-
-            assert self.data.read_int() == 140300
+        yield
+        GV_140300_SCHEMA.read(self)
 
         self.remaining_data = self.data.read_to_end(32)
 
     def save(self, data: core.Data):
+        self.start_section_cache()
         self.data = data
         self.dst_index = 0
         self.data.clear()
@@ -1269,14 +1097,7 @@ class SaveFile:
 
         self.data.write_int(self.game_version.game_version)
 
-        if self.game_version >= 10 or self.not_jp():
-            self.data.write_bool(self.ub1)
-
-        self.data.write_bool(self.mute_bgm)
-        self.data.write_bool(self.mute_se)
-
-        self.data.write_int(self.catfood)
-        self.data.write_int(self.current_energy)
+        SETTINGS_SCHEMA.write(self)
 
         self.data.write_int(self.date.year)
         self.data.write_int(self.year)
@@ -1295,255 +1116,116 @@ class SaveFile:
 
         self.write_dst()
 
-        self.data.write_int(self.ui1)
-        self.data.write_int(self.stamp_value_save)
-        self.data.write_int(self.ui2)
-
-        self.data.write_int(self.upgrade_state)
-
-        self.data.write_int(self.xp)
-        self.data.write_int(self.tutorial_state)
-
-        self.data.write_int(self.ui3)
-        self.data.write_int(self.koreaSuperiorTreasureState)
-
-        self.data.write_int_list(self.unlock_popups_11, write_length=False, length=3)
-        self.data.write_int(self.ui5)
-        self.data.write_int(self.unlock_enemy_guide)
-        self.data.write_int(self.ui6)
-        self.data.write_bool(self.ub0)
-        self.data.write_int(self.ui7)
-        self.data.write_int(self.cleared_eoc_1)
-        self.data.write_int(self.ui8)
-        self.data.write_int(self.unlocked_ending)
-
-        self.lineups.write(self.data, self.game_version)
+        HEADER_SCHEMA.write(self)
 
-        self.stamp_data.write(self.data)
+        self.write_section("lineups", self.lineups.write, self.game_version)
 
-        self.story.write(self.data)
+        self.write_section("stamp_data", self.stamp_data.write)
 
-        if 20 <= self.game_version and self.game_version <= 25:
-            self.data.write_int_list(self.enemy_guide, write_length=False, length=231)
-        else:
-            self.data.write_int_list(self.enemy_guide)
+        self.write_section("story", self.story.write)
 
-        self.cats.write_unlocked(self.data, self.game_version)
-        self.cats.write_upgrade(self.data, self.game_version)
-        self.cats.write_current_form(self.data, self.game_version)
+        ENEMY_GUIDE_SCHEMA.write(self)
 
-        self.special_skills.write_upgrades(self.data)
+        self.write_section("cats", self.cats.write_unlocked, self.game_version)
+        self.write_section("cats", self.cats.write_upgrade, self.game_version)
+        self.write_section("cats", self.cats.write_current_form, self.game_version)
 
-        if self.game_version <= 25:
-            self.data.write_int_list(self.menu_unlocks, write_length=False, length=5)
-            self.data.write_int_list(self.unlock_popups_0, write_length=False, length=5)
-        elif self.game_version <= 26:
-            self.data.write_int_list(self.menu_unlocks, write_length=False, length=6)
-            self.data.write_int_list(self.unlock_popups_0, write_length=False, length=6)
-        else:
-            self.data.write_int_list(self.menu_unlocks)
-            self.data.write_int_list(self.unlock_popups_0)
+        self.write_section("special_skills", self.special_skills.write_upgrades)
 
-        self.battle_items.write_items(self.data)
+        MENU_UNLOCKS_SCHEMA.write(self)
 
-        if self.game_version <= 26:
-            self.data.write_int_list(self.new_dialogs_2, write_length=False, length=17)
-        else:
-            self.data.write_int_list(self.new_dialogs_2)
+        self.write_section("battle_items", self.battle_items.write_items)
 
-        self.data.write_int_list(self.uil1, write_length=False, length=20)
-        self.data.write_int_list(self.moneko_bonus, write_length=False, length=1)
-        self.data.write_int_list(
-            self.daily_reward_initialized, write_length=False, length=1
-        )
+        DIALOGS_SCHEMA.write(self)
 
-        self.battle_items.write_locked_items(self.data)
+        self.write_section("battle_items", self.battle_items.write_locked_items)
 
         self.write_dst()
         self.data.write_date(self.date_2)
 
-        self.story.write_treasure_festival(self.data)
+        self.write_section("story", self.story.write_treasure_festival)
 
         self.write_dst()
         self.data.write_date(self.date_3)
 
-        if self.game_version <= 37:
-            self.data.write_int(self.ui0)
-
-        self.data.write_int(self.stage_unlock_cat_value)
-        self.data.write_int(self.show_ending_value)
-        self.data.write_int(self.chapter_clear_cat_unlock)
-        self.data.write_int(self.ui9)
-        self.data.write_int(self.ios_android_month)
-        self.data.write_int(self.ui10)
-        self.data.write_string(self.save_data_4_hash)
-
-        self.mysale.write_bonus_hash(self.data)
-        self.data.write_int_list(self.chara_flags, write_length=False, length=2)
-
-        if self.game_version <= 37:
-            self.data.write_int(self.uim1)
-            self.data.write_bool(self.ubm1)
-
-        self.data.write_int_list(self.chara_flags_2, write_length=False, length=2)
+        ENDING_SCHEMA.write(self)
 
-        self.data.write_int(self.normal_tickets)
-        self.data.write_int(self.rare_tickets)
+        self.write_section("mysale", self.mysale.write_bonus_hash)
+        TICKETS_SCHEMA.write(self)
 
-        self.cats.write_gatya_seen(self.data, self.game_version)
-        self.special_skills.write_gatya_seen(self.data)
-        self.cats.write_storage(self.data, self.game_version)
+        self.write_section("cats", self.cats.write_gatya_seen, self.game_version)
+        self.write_section("special_skills", self.special_skills.write_gatya_seen)
+        self.write_section("cats", self.cats.write_storage, self.game_version)
 
-        self.event_stages.write(self.data, self.game_version)
+        self.write_section("event_stages", self.event_stages.write, self.game_version)
 
-        self.data.write_int(self.itf1_ending)
-        self.data.write_int(self.continue_flag)
+        UNIT_DROPS_SCHEMA.write(self)
 
-        if 20 <= self.game_version:
-            self.data.write_int_list(
-                self.unlock_popups_8, write_length=False, length=36
-            )
-
-        if 20 <= self.game_version and self.game_version <= 25:
-            self.data.write_int_list(self.unit_drops, write_length=False, length=110)
-        elif 26 <= self.game_version:
-            self.data.write_int_list(self.unit_drops)
-
-        self.gatya.write_rare_normal_seed(self.data)
+        self.write_section("gatya", self.gatya.write_rare_normal_seed)
 
-        self.data.write_bool(self.get_event_data)
-        self.data.write_bool_list(self.achievements, write_length=False, length=7)
-
-        self.data.write_int(self.os_value)
+        EVENT_DATA_SCHEMA.write(self)
 
         self.write_dst()
         self.data.write_date(self.date_4)
 
-        self.gatya.write2(self.data)
-
-        if self.not_jp():
-            self.data.write_string(self.player_id)
-
-        self.data.write_string_list(self.order_ids)
-
-        if self.not_jp():
-            self.data.write_double(self.g_timestamp)
-            self.data.write_double(self.g_servertimestamp)
-            self.data.write_double(self.m_gettimesave)
-            self.data.write_string_list(self.usl1)
-            self.data.write_bool(self.energy_notification)
-            self.data.write_int(self.full_gameversion)
+        self.write_section("gatya", self.gatya.write2)
 
-        self.lineups.write_2(self.data, self.game_version)
-        self.event_stages.write_legend_restrictions(self.data, self.game_version)
+        PLAYER_ID_SCHEMA.write(self)
 
-        if self.game_version <= 37:
-            self.data.write_int_list(self.uil2, write_length=False, length=7)
-            self.data.write_int_list(self.uil3, write_length=False, length=7)
-            self.data.write_int_list(self.uil4, write_length=False, length=7)
-
-        self.data.write_double(self.g_timestamp_2)
-        self.data.write_double(self.g_servertimestamp_2)
-        self.data.write_double(self.m_gettimesave_2)
-        self.data.write_double(self.unknown_timestamp)
-
-        self.gatya.write_trade_progress(self.data)
+        self.write_section("lineups", self.lineups.write_2, self.game_version)
+        self.write_section(
+            "event_stages",
+            self.event_stages.write_legend_restrictions,
+            self.game_version,
+        )
 
-        if self.game_version <= 37:
-            self.data.write_string_list(self.usl2)
+        TIMESTAMPS_SCHEMA.write(self)
 
-        if self.not_jp():
-            self.data.write_double(self.m_dGetTimeSave2)
-        else:
-            self.data.write_int(self.ui11)
+        self.write_section("gatya", self.gatya.write_trade_progress)
 
-        if 20 <= self.game_version and self.game_version <= 25:
-            self.data.write_bool_list(self.ubl1, write_length=False, length=12)
-        elif 26 <= self.game_version and self.game_version < 39:
-            self.data.write_bool_list(self.ubl1)
+        SAVE_TIME_2_SCHEMA.write(self)
 
-        self.cats.write_max_upgrade_levels(self.data, self.game_version)
-        self.special_skills.write_max_upgrade_levels(self.data)
+        self.write_section(
+            "cats", self.cats.write_max_upgrade_levels, self.game_version
+        )
+        self.write_section(
+            "special_skills", self.special_skills.write_max_upgrade_levels
+        )
 
-        self.user_rank_rewards.write(self.data, self.game_version)
+        self.write_section(
+            "user_rank_rewards", self.user_rank_rewards.write, self.game_version
+        )
 
         if self.is_jp():
             self.data.write_double(self.m_dGetTimeSave2)
 
-        self.cats.write_unlocked_forms(self.data, self.game_version)
+        self.write_section("cats", self.cats.write_unlocked_forms, self.game_version)
 
-        self.data.write_string(self.transfer_code)
-        self.data.write_string(self.confirmation_code)
-        self.data.write_bool(self.transfer_flag)
+        TRANSFER_SCHEMA.write(self)
 
         if 20 <= self.game_version:
-            self.item_reward_stages.write(self.data, self.game_version)
-            self.timed_score_stages.write(self.data, self.game_version)
+            self.write_section(
+                "item_reward_stages", self.item_reward_stages.write, self.game_version
+            )
+            self.write_section(
+                "timed_score_stages", self.timed_score_stages.write, self.game_version
+            )
 
             self.data.write_string(self.inquiry_code)
-            self.officer_pass.write(self.data)
-            self.data.write_byte(self.has_account)
-            self.data.write_int(self.backup_state)
-
-            if self.not_jp():
-                self.data.write_bool(self.ub2)
-
-            self.data.write_int(44)
-            self.data.write_int(self.itf1_complete)
-            self.story.write_itf_timed_scores(self.data)
-            self.data.write_int(self.title_chapter_bg)
-
-            if self.game_version > 26:
-                self.data.write_int_list(self.combo_unlocks)
-
-            self.data.write_bool(self.combo_unlocked_10k_ur)
-
-            self.data.write_int(45)
+            self.write_section("officer_pass", self.officer_pass.write)
+            BACKUP_SCHEMA.write(self)
+            self.write_section("story", self.story.write_itf_timed_scores)
+            COMBO_SCHEMA.write(self)
 
         if 21 <= self.game_version:
             self.data.write_int(46)
-            self.gatya.write_event_seed(self.data)
-            if self.game_version < 34:
-                self.data.write_int_list(
-                    self.event_capsules, write_length=False, length=100
-                )
-                self.data.write_int_list(
-                    self.event_capsules_counter, write_length=False, length=100
-                )
-            else:
-                self.data.write_int_list(self.event_capsules)
-                self.data.write_int_list(self.event_capsules_counter)
-
-            self.data.write_int(47)
+            self.write_section("gatya", self.gatya.write_event_seed)
+            EVENT_CAPSULES_SCHEMA.write(self)
 
         if 22 <= self.game_version:
             self.data.write_int(48)
 
-        if 23 <= self.game_version:
-            if self.is_jp():
-                self.data.write_bool(self.energy_notification)
-
-            self.data.write_double(self.m_dGetTimeSave3)
-            if self.game_version < 26:
-                self.data.write_int_list(
-                    self.gatya_seen_lucky_drops,
-                    write_length=False,
-                    length=44,
-                )
-            else:
-                self.data.write_int_list(self.gatya_seen_lucky_drops)
-            self.data.write_bool(self.show_ban_message)
-            self.data.write_bool_list(
-                self.catfood_beginner_purchased,
-                write_length=False,
-                length=3,
-            )
-            self.data.write_double(self.next_week_timestamp)
-            self.data.write_bool_list(
-                self.catfood_beginner_expired, write_length=False, length=3
-            )
-            self.data.write_int(self.rank_up_sale_value)
-            self.data.write_int(49)
+        GV_23_SCHEMA.write(self)
 
         if 24 <= self.game_version:
             self.data.write_int(50)
@@ -1552,176 +1234,146 @@ class SaveFile:
             self.data.write_int(51)
 
         if 26 <= self.game_version:
-            self.cats.write_catguide_collected(self.data)
+            self.write_section("cats", self.cats.write_catguide_collected)
             self.data.write_int(52)
 
         if 27 <= self.game_version:
-            self.data.write_double(self.time_since_time_check_cumulative)
-            self.data.write_double(self.server_timestamp)
-            self.data.write_double(self.last_checked_energy_recovery_time)
-            self.data.write_double(self.time_since_check)
-            self.data.write_double(self.last_checked_expedition_time)
-
-            self.data.write_int_list(self.catfruit)
-            self.cats.write_fourth_forms(self.data)
-            self.cats.write_catseyes_used(self.data)
-            self.data.write_int_list(self.catseyes)
-            self.data.write_int_list(self.catamins)
-            self.gamatoto.write(self.data)
+            ENERGY_SCHEMA.write(self)
+            self.write_section("cats", self.cats.write_fourth_forms)
+            self.write_section("cats", self.cats.write_catseyes_used)
+            CATSEYES_SCHEMA.write(self)
+            self.write_section("gamatoto", self.gamatoto.write)
 
             self.data.write_bool_list(self.unlock_popups_6)
-            self.ex_stages.write(self.data)
+            self.write_section("ex_stages", self.ex_stages.write)
 
             self.data.write_int(53)
 
         if 29 <= self.game_version:
-            self.gamatoto.write_2(self.data)
+            self.write_section("gamatoto", self.gamatoto.write_2)
             self.data.write_int(54)
-            self.item_pack.write(self.data)
+            self.write_section("item_pack", self.item_pack.write)
             self.data.write_int(54)
 
         if self.game_version >= 30:
-            self.gamatoto.write_skin(self.data)
+            self.write_section("gamatoto", self.gamatoto.write_skin)
             self.data.write_int(self.platinum_tickets)
-            self.logins.write(self.data, self.game_version)
-
-            if self.game_version < 101000:
-                self.data.write_bool_list(self.reset_item_reward_flags)
-
-            self.data.write_double(self.reward_remaining_time)
-            self.data.write_double(self.last_checked_reward_time)
-
-            self.data.write_int_tuple_list(
-                self.announcements, write_length=False, length=16
-            )
-            self.data.write_int(self.backup_counter)
-            self.data.write_int(self.ui12)
-            self.data.write_int(self.ui13)
-            self.data.write_int(self.ui13)
-            self.data.write_int(55)
+            self.write_section("logins", self.logins.write, self.game_version)
+            REWARDS_SCHEMA.write(self)
 
         if self.game_version >= 31:
             self.data.write_bool(self.ub3)
-            self.item_reward_stages.write_item_obtains(self.data)
-            self.gatya.write_stepup(self.data)
+            self.write_section(
+                "item_reward_stages", self.item_reward_stages.write_item_obtains
+            )
+            self.write_section("gatya", self.gatya.write_stepup)
 
             self.data.write_int(self.backup_frame)
             self.data.write_int(56)
 
         if self.game_version >= 32:
             self.data.write_bool(self.ub4)
-            self.cats.write_favorites(self.data)
+            self.write_section("cats", self.cats.write_favorites)
             self.data.write_int(57)
 
         if self.game_version >= 33:
-            self.dojo.write_chapters(self.data)
-            self.dojo.write_item_locks(self.data)
+            self.write_section("dojo", self.dojo.write_chapters)
+            self.write_section("dojo", self.dojo.write_item_locks)
             self.data.write_int(58)
 
         if self.game_version >= 34:
             self.data.write_double(self.last_checked_zombie_time)
-            self.outbreaks.write_chapters(self.data)
-            self.outbreaks.write_2(self.data)
-            self.scheme_items.write(self.data)
+            self.write_section("outbreaks", self.outbreaks.write_chapters)
+            self.write_section("outbreaks", self.outbreaks.write_2)
+            self.write_section("scheme_items", self.scheme_items.write)
 
         if self.game_version >= 35:
-            self.outbreaks.write_current_outbreaks(self.data, self.game_version)
-            self.data.write_int_bool_dict(self.first_locks)
-            self.data.write_double(self.energy_penalty_timestamp)
-            self.data.write_int(60)
+            self.write_section(
+                "outbreaks", self.outbreaks.write_current_outbreaks, self.game_version
+            )
+            LOCKS_SCHEMA.write(self)
 
         if self.game_version >= 36:
-            self.cats.write_chara_new_flags(self.data)
+            self.write_section("cats", self.cats.write_chara_new_flags)
             self.data.write_bool(self.shown_maxcollab_mg)
-            self.item_pack.write_displayed_packs(self.data)
+            self.write_section("item_pack", self.item_pack.write_displayed_packs)
             self.data.write_int(61)
 
         if self.game_version >= 38:
-            self.unlock_popups.write(self.data)
+            self.write_section("unlock_popups", self.unlock_popups.write)
             self.data.write_int(63)
 
         if self.game_version >= 39:
-            self.ototo.write(self.data)
-            self.ototo.write_2(self.data, self.game_version)
+            self.write_section("ototo", self.ototo.write)
+            self.write_section("ototo", self.ototo.write_2, self.game_version)
             self.data.write_double(self.last_checked_castle_time)
             self.data.write_int(64)
 
         if self.game_version >= 40:
-            self.beacon_base.write(self.data)
+            self.write_section("beacon_base", self.beacon_base.write)
             self.data.write_int(65)
 
         if self.game_version >= 41:
-            self.tower.write(self.data)
-            self.missions.write(self.data, self.game_version)
-            self.tower.write_item_obtain_states(self.data)
+            self.write_section("tower", self.tower.write)
+            self.write_section("missions", self.missions.write, self.game_version)
+            self.write_section("tower", self.tower.write_item_obtain_states)
             self.data.write_int(66)
 
         if self.game_version >= 42:
-            self.dojo.write_ranking(self.data, self.game_version)
-            self.item_pack.write_three_days(self.data)
-            self.challenge.write(self.data)
-            self.challenge.write_scores(self.data)
-            self.challenge.write_popup(self.data)
+            self.write_section("dojo", self.dojo.write_ranking, self.game_version)
+            self.write_section("item_pack", self.item_pack.write_three_days)
+            self.write_section("challenge", self.challenge.write)
+            self.write_section("challenge", self.challenge.write_scores)
+            self.write_section("challenge", self.challenge.write_popup)
             self.data.write_int(67)
 
         if self.game_version >= 43:
-            self.missions.write_weekly_missions(self.data)
+            self.write_section("missions", self.missions.write_weekly_missions)
             self.dojo.ranking.write_did_win_rewards(self.data)
             self.data.write_bool(self.event_update_flags)
             self.data.write_int(68)
 
         if self.game_version >= 44:
-            self.event_stages.write_dicts(self.data)
+            self.write_section("event_stages", self.event_stages.write_dicts)
             self.data.write_int(self.cotc_1_complete)
             self.data.write_int(69)
 
         if self.game_version >= 46:
-            self.gamatoto.write_collab_data(self.data)
+            self.write_section("gamatoto", self.gamatoto.write_collab_data)
             self.data.write_int(71)
 
         if self.game_version < 90300:
-            self.map_resets.write(self.data)
+            self.write_section("map_resets", self.map_resets.write)
             self.data.write_int(72)
 
         if self.game_version >= 51:
-            self.uncanny.write(self.data)
+            self.write_section("uncanny", self.uncanny.write)
             self.data.write_int(76)
 
         if self.game_version >= 77:
-            self.catamin_stages.write(self.data)
-            self.data.write_int_list(self.lucky_tickets)
-            self.data.write_bool(self.ub5)
-            self.data.write_int(77)
+            self.write_section("catamin_stages", self.catamin_stages.write)
+            LUCKY_TICKETS_SCHEMA.write(self)
 
         if self.game_version >= 80000:
-            self.officer_pass.write_gold_pass(self.data, self.game_version)
-            self.cats.write_talents(self.data)
-            self.data.write_int(self.np)
-            self.data.write_bool(self.ub6)
-            self.data.write_int(80000)
+            self.write_section(
+                "officer_pass", self.officer_pass.write_gold_pass, self.game_version
+            )
+            self.write_section("cats", self.cats.write_talents)
+            NP_SCHEMA.write(self)
 
         if self.game_version >= 80200:
-            self.data.write_bool(self.ub7)
-            self.data.write_short(self.leadership)
-            self.officer_pass.write_cat_data(self.data)
+            LEADERSHIP_SCHEMA.write(self)
+            self.write_section("officer_pass", self.officer_pass.write_cat_data)
             self.data.write_int(80200)
 
-        if self.game_version >= 80300:
-            self.data.write_byte(self.filibuster_stage_id)
-            self.data.write_bool(self.filibuster_stage_enabled)
-            self.data.write_int(80300)
-
-        if self.game_version >= 80500:
-            self.data.write_int_list(self.stage_ids_10s)
-            self.data.write_int(80500)
+        GV_80300_SCHEMA.write(self)
+        GV_80500_SCHEMA.write(self)
 
         if self.game_version >= 80600:
             self.data.write_short(len(self.uil6))
             self.data.write_int_list(self.uil6, write_length=False)
-            self.legend_quest.write(self.data)
-            self.data.write_short(self.ush1)
-            self.data.write_byte(self.uby1)
-            self.data.write_int(80600)
+            self.write_section("legend_quest", self.legend_quest.write)
+            GV_80600_SCHEMA.write(self)
 
         if self.game_version >= 80700:
             self.data.write_int(len(self.uiid1))
@@ -1735,22 +1387,17 @@ class SaveFile:
                 self.data.write_byte(self.uby2)
                 self.data.write_int(100600)
 
-        if self.game_version >= 81000:
-            self.data.write_byte(self.restart_pack)
-            self.data.write_int(81000)
+        GV_81000_SCHEMA.write(self)
 
         if self.game_version >= 90000:
-            self.medals.write(self.data)
-            self.wildcat_slots.write(self.data, self.game_version)
+            self.write_section("medals", self.medals.write)
+            self.write_section(
+                "wildcat_slots", self.wildcat_slots.write, self.game_version
+            )
 
             self.data.write_int(90000)
 
-        if self.game_version >= 90100:
-            self.data.write_short(self.ush2)
-            self.data.write_short(self.ush3)
-            self.data.write_int(self.ui15)
-            self.data.write_double(self.ud1)
-            self.data.write_int(90100)
+        GV_90100_SCHEMA.write(self)
 
         if self.game_version >= 90300:
             self.data.write_short(len(self.utl1))
@@ -1782,26 +1429,18 @@ class SaveFile:
 
             self.data.write_short(len(self.uidd1))
             self.data.write_int_double_dict(self.uidd1, write_length=False)
-            self.gauntlets.write(self.data)
+            self.write_section("gauntlets", self.gauntlets.write)
             self.data.write_int(90300)
 
         if self.game_version >= 90400:
-            self.enigma_clears.write(self.data)
-            self.enigma.write(self.data, self.game_version)
-            self.cleared_slots.write(self.data)
+            self.write_section("enigma_clears", self.enigma_clears.write)
+            self.write_section("enigma", self.enigma.write, self.game_version)
+            self.write_section("cleared_slots", self.cleared_slots.write)
             self.data.write_int(90400)
 
         if self.game_version >= 90500:
-            self.collab_gauntlets.write(self.data)
-            self.data.write_bool(self.ub8)
-            self.data.write_double(self.ud2)
-            self.data.write_double(self.ud3)
-            self.data.write_int(self.ui16)
-            if self.game_version >= 100300:
-                self.data.write_byte(self.uby3)
-                self.data.write_bool(self.ub9)
-                self.data.write_double(self.ud4)
-                self.data.write_double(self.ud5)
+            self.write_section("collab_gauntlets", self.collab_gauntlets.write)
+            GV_90500_SCHEMA.write(self)
 
             if self.game_version >= 130700:
                 self.data.write_short(len(self.uiid3))
@@ -1823,7 +1462,7 @@ class SaveFile:
             self.data.write_int(90500)
 
         if self.game_version >= 90700:
-            self.talent_orbs.write(self.data, self.game_version)
+            self.write_section("talent_orbs", self.talent_orbs.write, self.game_version)
             self.data.write_short(len(self.uidiid2))
             for key, value in self.uidiid2.items():
                 self.data.write_short(key)
@@ -1835,20 +1474,16 @@ class SaveFile:
             self.data.write_bool(self.ub10)
             self.data.write_int(90700)
 
-        if self.game_version >= 90800:
-            self.data.write_short(len(self.uil7))
-            self.data.write_int_list(self.uil7, write_length=False)
-            self.data.write_bool_list(self.ubl2, write_length=False, length=10)
-            self.data.write_int(90800)
+        GV_90800_SCHEMA.write(self)
 
         if self.game_version >= 90900:
-            self.cat_shrine.write(self.data)
-            self.data.write_double(self.ud6)
-            self.data.write_double(self.ud7)
-            self.data.write_int(90900)
+            self.write_section("cat_shrine", self.cat_shrine.write)
+            GV_90900_SCHEMA.write(self)
 
         if self.game_version >= 91000:
-            self.lineups.write_slot_names(self.data, self.game_version)
+            self.write_section(
+                "lineups", self.lineups.write_slot_names, self.game_version
+            )
             self.data.write_int(91000)
 
         if self.game_version >= 100000:
@@ -1858,49 +1493,28 @@ class SaveFile:
                 self.data.write_byte(key)
                 self.data.write_int(value)
 
-            self.data.write_bool(self.ub11)
-            self.data.write_bool(self.ub12)
+            GV_100000_SCHEMA.write(self)
 
-            self.data.write_string(self.password_refresh_token)
-
-            self.data.write_bool(self.ub13)
-            self.data.write_byte(self.uby4)
-            self.data.write_byte(self.uby5)
-            self.data.write_double(self.ud8)
-            self.data.write_double(self.ud9)
-
-            self.data.write_int(100000)
-
-        if self.game_version >= 100100:
-            self.data.write_int(self.date_int)
-            self.data.write_int(100100)
+        GV_100100_SCHEMA.write(self)
 
         if self.game_version >= 100300:
-            self.battle_items.write_endless_items(self.data)
+            self.write_section("battle_items", self.battle_items.write_endless_items)
 
             self.data.write_int(100300)
 
-        if self.game_version >= 100400:
-            self.data.write_byte(len(self.event_capsules_2))
-            self.data.write_int_list(self.event_capsules_2, write_length=False)
-            self.data.write_bool(self.two_battle_lines)
-            self.data.write_int(100400)
-
-        if self.game_version >= 100600:
-            self.data.write_double(self.ud10)
-            self.data.write_int(self.platinum_shards)
-            self.data.write_bool(self.ub15)
-            self.data.write_int(100600)
+        GV_100400_SCHEMA.write(self)
+        GV_100600_SCHEMA.write(self)
 
         if self.game_version >= 100700:
-            self.cat_scratcher.write(self.data, self.game_version)
+            self.write_section(
+                "cat_scratcher", self.cat_scratcher.write, self.game_version
+            )
 
             self.data.write_int(100700)
 
         if self.game_version >= 100900:
-            self.aku.write(self.data)
-            self.data.write_bool(self.ub16)
-            self.data.write_bool(self.ub17)
+            self.write_section("aku", self.aku.write)
+            GV_100900_SCHEMA.write(self)
 
             self.data.write_short(len(self.ushdshd2))
             for key, value in self.ushdshd2.items():
@@ -1922,9 +1536,7 @@ class SaveFile:
             self.data.write_bool(self.ub18)
             self.data.write_int(100900)
 
-        if self.game_version >= 101000:
-            self.data.write_byte(self.uby6)
-            self.data.write_int(101000)
+        GV_101000_SCHEMA.write(self)
 
         if self.game_version >= 110000:
             self.data.write_short(len(self.uidtii))
@@ -1936,13 +1548,11 @@ class SaveFile:
             self.data.write_int(110000)
 
         if self.game_version >= 110500:
-            self.behemoth_culling.write(self.data)
+            self.write_section("behemoth_culling", self.behemoth_culling.write)
             self.data.write_bool(self.ub19)
             self.data.write_int(110500)
 
-        if self.game_version >= 110600:
-            self.data.write_bool(self.ub20)
-            self.data.write_int(110600)
+        GV_110600_SCHEMA.write(self)
 
         if self.game_version >= 110700:
             self.data.write_int(len(self.uidtff))
@@ -1956,72 +1566,21 @@ class SaveFile:
             self.data.write_int(110700)
 
         if self.game_version >= 110800:
-            self.cat_shrine.write_dialogs(self.data)
-            self.data.write_bool(self.ub21)
-            self.data.write_bool(self.dojo_3x_speed)
-            self.data.write_bool(self.ub22)
-            self.data.write_bool(self.ub23)
-
-            self.data.write_int(110800)
-
-        if self.game_version >= 111000:
-            self.data.write_int(self.ui17)
-            self.data.write_short(self.ush4)
-            self.data.write_byte(self.uby7)
-            self.data.write_byte(self.uby8)
-            self.data.write_bool(self.ub24)
-            self.data.write_byte(self.uby9)
-
-            self.data.write_byte(len(self.ushl1))
-            self.data.write_short_list(self.ushl1, write_length=False)
-
-            self.data.write_short(len(self.ushl2))
-            self.data.write_short_list(self.ushl2, write_length=False)
-
-            self.data.write_short(len(self.ushl3))
-            self.data.write_short_list(self.ushl3, write_length=False)
-
-            self.data.write_int(self.ui18)
-            self.data.write_int(self.ui19)
-            self.data.write_int(self.ui20)
-            self.data.write_short(self.ush5)
-            self.data.write_short(self.ush6)
-            self.data.write_short(self.ush7)
-            self.data.write_short(self.ush8)
-            self.data.write_byte(self.uby10)
-            self.data.write_bool(self.ub25)
-            self.data.write_bool(self.ub26)
-            self.data.write_bool(self.ub27)
-            self.data.write_bool(self.ub28)
-            self.data.write_bool(self.ub29)
-            self.data.write_bool(self.ub30)
-            self.data.write_byte(self.uby11)
-
-            self.data.write_short(len(self.ushl4))
-            self.data.write_short_list(self.ushl4, write_length=False)
-
-            self.data.write_bool_list(self.ubl3, write_length=False, length=14)
-
-            self.data.write_byte(len(self.labyrinth_medals))
-            self.data.write_short_list(self.labyrinth_medals, write_length=False)
-
-            self.data.write_int(111000)
+            self.write_section("cat_shrine", self.cat_shrine.write_dialogs)
+            GV_110800_SCHEMA.write(self)
+
+        GV_111000_SCHEMA.write(self)
 
         if self.game_version >= 120000:
-            self.zero_legends.write(self.data)
+            self.write_section("zero_legends", self.zero_legends.write)
             self.data.write_byte(self.uby12)
 
             self.data.write_int(120000)
 
-        if self.game_version >= 120100:
-            self.data.write_short(len(self.ushl6))
-            self.data.write_short_list(self.ushl6, write_length=False)
-
-            self.data.write_int(120100)
+        GV_120100_SCHEMA.write(self)
 
         if self.game_version >= 120200:
-            self.data.write_bool(self.ub31)
-            self.data.write_short(self.ush9)
+            GV_120200_SCHEMA.write(self)
             self.data.write_byte(len(self.ushshd))
             for key, value in self.ushshd.items():
                 self.data.write_short(key)
@@ -2029,26 +1588,9 @@ class SaveFile:
 
             self.data.write_int(120200)
 
-        if self.game_version >= 120400:
-            self.data.write_double(self.ud11)
-            self.data.write_double(self.ud12)
-
-            self.data.write_int(120400)
-
-        if self.game_version >= 120500:
-            self.data.write_bool(self.ub32)
-            self.data.write_bool(self.ub33)
-            self.data.write_bool(self.ub34)
-            self.data.write_int(self.ui21)
-            self.data.write_byte(self.golden_cpu_count)
-
-            self.data.write_int(120500)
-
-        if self.game_version >= 120600:
-            self.data.write_byte(self.sound_effects_volume)
-            self.data.write_byte(self.background_music_volume)
-
-            self.data.write_int(120600)
+        GV_120400_SCHEMA.write(self)
+        GV_120500_SCHEMA.write(self)
+        GV_120600_SCHEMA.write(self)
 
         if (self.not_jp() and self.game_version >= 120700) or (
             self.is_jp() and self.game_version >= 130000
@@ -2080,11 +1622,7 @@ class SaveFile:
 
             self.data.write_int(130301)
 
-        if self.game_version >= 130400:
-            self.data.write_double(self.ud13)
-            self.data.write_double(self.ud14)
-
-            self.data.write_int(130400)
+        GV_130400_SCHEMA.write(self)
 
         if self.game_version >= 130500:
             self.data.write_short(len(self.utl4))
@@ -2103,28 +1641,10 @@ class SaveFile:
 
             self.data.write_int(130500)
 
-        if self.game_version >= 130600:
-            self.data.write_byte(self.uby14)
-
-            if self.not_jp():
-                self.data.write_short(self.ush12)
-
-            self.data.write_int(130600)
+        GV_130600_SCHEMA.write(self)
 
         if self.game_version >= 130700:
-            if self.is_jp():
-                self.data.write_short(self.ush12)
-
-            self.data.write_double(self.ud15)
-            self.data.write_byte(self.uby15)
-            self.data.write_byte(self.uby16)
-
-            self.data.write_short(self.ush11)
-            self.data.write_byte(self.uby17)
-            self.data.write_byte(self.uby18)
-            self.data.write_byte(self.uby19)
-
-            self.data.write_double(self.ud16)
+            GV_130700_SCHEMA.write(self)
 
             self.data.write_short(len(self.ushd1))
 
@@ -2141,9 +1661,7 @@ class SaveFile:
 
             self.data.write_int(130700)
         if self.game_version >= 140000:
-            self.data.write_int(self.ui22)
-            self.data.write_double(self.ud17)
-            self.data.write_byte(self.uby20)
+            GV_140000_SCHEMA.write(self)
 
             self.data.write_byte(len(self.uild1))
 
@@ -2153,14 +1671,9 @@ class SaveFile:
                 for val in value:
                     self.data.write_byte(val)
 
-            self.dojo_chapters.write(self.data)
+            self.write_section("dojo_chapters", self.dojo_chapters.write)
 
-            self.data.write_short(len(self.uil9))
-            for val in self.uil9:
-                self.data.write_int(val)
-
-            self.data.write_bool(self.ub35)
-            self.data.write_double(self.ud18)
+            GV_140000_2_SCHEMA.write(self)
 
             self.data.write_short(len(self.ushd2))
 
@@ -2170,9 +1683,7 @@ class SaveFile:
 
             self.data.write_int(140000)
 
-        if self.game_version >= 140100 and self.game_version < 140500:
-            self.data.write_byte(self.uby21)
-            self.data.write_int(140100)
+        GV_140100_SCHEMA.write(self)
 
         if self.game_version >= 140200:
             self.data.write_byte(len(self.uil10))
@@ -2204,37 +1715,48 @@ class SaveFile:
             self.data.write_int(self.hundred_million_ticket)
             self.data.write_int(140200)
 
-        if self.game_version >= 140300:
-            self.data.write_byte(len(self.uil11))
-            for val in self.uil11:
-                self.data.write_byte(val)
-
-            if self.game_version >= 150300:
-                self.data.write_int(self.ui24)
-                self.data.write_bool(self.ub38)
-            if self.game_version >= 150500:
-                self.data.write_bool(self.ub39)
-
-            self.data.write_bool(self.ub36)
-
-            self.data.write_byte(len(self.treasure_chests))
-
-            for val in self.treasure_chests:
-                self.data.write_int(val)
-
-            self.data.write_int(self.ui23)
-            self.data.write_short(len(self.uil13))
-
-            for val in self.uil13:
-                self.data.write_int(val)
-
-            self.data.write_bool(self.ub37)
-            self.data.write_int(140300)
+        GV_140300_SCHEMA.write(self)
 
         self.data.write_bytes(self.remaining_data)
 
         self.data.end_buffer()
 
+    def clear_section_cache(self, name: str):
+        for cache_key in list(self.section_cache):
+            if cache_key.startswith(f"{name}."):
+                del self.section_cache[cache_key]
+
+    def start_section_cache(self):
+        key = (self.game_version.game_version, self.cc.get_code())
+        if key != self.section_cache_key:
+            self.section_cache = {}
+            self.section_cache_key = key
+
+    def write_section(self, name: str, write_func: Callable[..., None], *args: Any):
+        """Write part of a section, reusing the cached bytes if the section's
+        object hasn't been handed out since it was loaded.
+
+        Args:
+            name (str): The attribute name of the section
+            write_func (Callable[..., None]): The method that writes this part of
+                the section
+            *args (Any): Extra arguments to pass after the data
+        """
+        cache_key = f"{name}.{write_func.__name__}"
+        if name in self.exposed_sections:
+            self.section_cache.pop(cache_key, None)
+            write_func(self.data, *args)
+            return
+        cached = self.section_cache.get(cache_key)
+        if cached is not None:
+            self.data.write_bytes(cached)
+            return
+        start = self.data.get_pos()
+        write_func(self.data, *args)
+        self.section_cache[cache_key] = bytes(
+            self.data.data_buffer[start : self.data.get_pos()]
+        )
+
     def to_data(self) -> core.Data:
         dt = core.Data()
         self.save_wrapper(dt)
@@ -2242,15 +1764,17 @@ class SaveFile:
         return dt
 
     def save_wrapper(self, data: core.Data) -> None:
-        try:
-            self.save(data)
-        except Exception as e:
-            raise FailedToSaveError(
-                core.core_data.local_manager.get_key("failed_to_save_save")
-            ) from e
+        with self.save_lock, self.internal_access():
+            try:
+                self.save(data)
+            except Exception as e:
+                self.section_cache = {}
+                raise FailedToSaveError(
+                    core.core_data.local_manager.get_key("failed_to_save_save")
+                ) from e
 
-    def to_file_thread(self, path: core.Path):
-        core.Thread("to_file", self.to_file, [path]).start()
+    def to_file_thread(self, path: core.Path) -> concurrent.futures.Future[None]:
+        return core.get_thread_pool().submit_background(self.to_file, path)
 
     def to_file(self, path: core.Path) -> None:
         path.parent().generate_dirs()
@@ -2272,138 +1796,54 @@ class SaveFile:
             "cc": self.cc.get_code(),
             "dsts": self.dsts,
             "game_version": self.game_version.game_version,
-            "ub1": self.ub1,
-            "mute_bgm": self.mute_bgm,
-            "mute_se": self.mute_se,
-            "catfood": self.catfood,
-            "current_energy": self.current_energy,
+            **SETTINGS_SCHEMA.serialize(self),
             "year": self.year,
             "month": self.month,
             "day": self.day,
             "timestamp": self.timestamp,
             "date": self.date.timestamp(),
-            "ui1": self.ui1,
-            "stamp_value_save": self.stamp_value_save,
-            "ui2": self.ui2,
-            "upgrade_state": self.upgrade_state,
-            "xp": self.xp,
-            "tutorial_state": self.tutorial_state,
-            "ui3": self.ui3,
-            "koreaSuperiorTreasureState": self.koreaSuperiorTreasureState,
-            "unlock_popups_11": self.unlock_popups_11,
-            "ui5": self.ui5,
-            "unlock_enemy_guide": self.unlock_enemy_guide,
-            "ui6": self.ui6,
-            "ub0": self.ub0,
-            "ui7": self.ui7,
-            "cleared_eoc_1": self.cleared_eoc_1,
-            "ui8": self.ui8,
-            "unlocked_ending": self.unlocked_ending,
+            **HEADER_SCHEMA.serialize(self),
             "lineups": self.lineups.serialize(),
             "stamp_data": self.stamp_data.serialize(),
             "story": self.story.serialize(),
-            "enemy_guide": self.enemy_guide,
+            **ENEMY_GUIDE_SCHEMA.serialize(self),
             "cats": self.cats.serialize(),
             "special_skills": self.special_skills.serialize(),
-            "menu_unlocks": self.menu_unlocks,
-            "unlock_popups_0": self.unlock_popups_0,
+            **MENU_UNLOCKS_SCHEMA.serialize(self),
             "battle_items": self.battle_items.serialize(),
-            "new_dialogs_2": self.new_dialogs_2,
-            "uil1": self.uil1,
-            "moneko_bonus": self.moneko_bonus,
-            "daily_reward_initialized": self.daily_reward_initialized,
+            **DIALOGS_SCHEMA.serialize(self),
             "date_2": self.date_2.timestamp(),
             "date_3": self.date_3.timestamp(),
-            "ui0": self.ui0,
-            "stage_unlock_cat_value": self.stage_unlock_cat_value,
-            "show_ending_value": self.show_ending_value,
-            "chapter_clear_cat_unlock": self.chapter_clear_cat_unlock,
-            "ui9": self.ui9,
-            "ios_android_month": self.ios_android_month,
-            "ui10": self.ui10,
-            "save_data_4_hash": self.save_data_4_hash,
+            **ENDING_SCHEMA.serialize(self),
             "mysale": self.mysale.serialize(),
-            "chara_flags": self.chara_flags,
-            "uim1": self.uim1,
-            "ubm1": self.ubm1,
-            "chara_flags_2": self.chara_flags_2,
-            "normal_tickets": self.normal_tickets,
-            "rare_tickets": self.rare_tickets,
+            **TICKETS_SCHEMA.serialize(self),
             "event_stages": self.event_stages.serialize(),
-            "itf1_ending": self.itf1_ending,
-            "continue_flag": self.continue_flag,
-            "unlock_popups_8": self.unlock_popups_8,
-            "unit_drops": self.unit_drops,
+            **UNIT_DROPS_SCHEMA.serialize(self),
             "gatya": self.gatya.serialize(),
-            "get_event_data": self.get_event_data,
-            "achievements": self.achievements,
-            "os_value": self.os_value,
+            **EVENT_DATA_SCHEMA.serialize(self),
             "date_4": self.date_4.timestamp(),
-            "player_id": self.player_id,
-            "order_ids": self.order_ids,
-            "g_timestamp": self.g_timestamp,
-            "g_servertimestamp": self.g_servertimestamp,
-            "m_gettimesave": self.m_gettimesave,
-            "usl1": self.usl1,
-            "energy_notification": self.energy_notification,
-            "full_gameversion": self.full_gameversion,
-            "uil2": self.uil2,
-            "uil3": self.uil3,
-            "uil4": self.uil4,
-            "g_timestamp_2": self.g_timestamp_2,
-            "g_servertimestamp_2": self.g_servertimestamp_2,
-            "m_gettimesave_2": self.m_gettimesave_2,
-            "unknown_timestamp": self.unknown_timestamp,
-            "usl2": self.usl2,
-            "m_dGetTimeSave2": self.m_dGetTimeSave2,
-            "ui11": self.ui11,
-            "ubl1": self.ubl1,
+            **PLAYER_ID_SCHEMA.serialize(self),
+            **TIMESTAMPS_SCHEMA.serialize(self),
+            **SAVE_TIME_2_SCHEMA.serialize(self),
             "user_rank_rewards": self.user_rank_rewards.serialize(),
-            "transfer_code": self.transfer_code,
-            "confirmation_code": self.confirmation_code,
-            "transfer_flag": self.transfer_flag,
+            **TRANSFER_SCHEMA.serialize(self),
             "item_reward_stages": self.item_reward_stages.serialize(),
             "timed_score_stages": self.timed_score_stages.serialize(),
             "inquiry_code": self.inquiry_code,
             "officer_pass": self.officer_pass.serialize(),
-            "has_account": self.has_account,
-            "backup_state": self.backup_state,
-            "ub2": self.ub2,
-            "itf1_complete": self.itf1_complete,
-            "title_chapter_bg": self.title_chapter_bg,
-            "combo_unlocks": self.combo_unlocks,
-            "combo_unlocked_10k_ur": self.combo_unlocked_10k_ur,
-            "event_capsules": self.event_capsules,
-            "event_capsules_counter": self.event_capsules_counter,
-            "m_dGetTimeSave3": self.m_dGetTimeSave3,
-            "gatya_seen_lucky_drops": self.gatya_seen_lucky_drops,
-            "banned": self.show_ban_message,
-            "catfood_beginner_purchased": self.catfood_beginner_purchased,
-            "next_week_timestamp": self.next_week_timestamp,
-            "catfood_beginner_expired": self.catfood_beginner_expired,
-            "rank_up_sale_value": self.rank_up_sale_value,
-            "time_since_time_check_cumulative": self.time_since_time_check_cumulative,
-            "server_timestamp": self.server_timestamp,
-            "last_checked_energy_recovery_time": self.last_checked_energy_recovery_time,
-            "time_since_check": self.time_since_check,
-            "last_checked_expedition_time": self.last_checked_expedition_time,
-            "catfruit": self.catfruit,
-            "catseyes": self.catseyes,
-            "catamins": self.catamins,
+            **BACKUP_SCHEMA.serialize(self),
+            **COMBO_SCHEMA.serialize(self),
+            **EVENT_CAPSULES_SCHEMA.serialize(self),
+            **GV_23_SCHEMA.serialize(self),
+            **ENERGY_SCHEMA.serialize(self),
+            **CATSEYES_SCHEMA.serialize(self),
             "gamatoto": self.gamatoto.serialize(),
             "unlock_popups_6": self.unlock_popups_6,
             "ex_stages": self.ex_stages.serialize(),
             "item_pack": self.item_pack.serialize(),
             "platinum_tickets": self.platinum_tickets,
             "logins": self.logins.serialize(),
-            "reset_item_reward_flags": self.reset_item_reward_flags,
-            "reward_remaining_time": self.reward_remaining_time,
-            "last_checked_reward_time": self.last_checked_reward_time,
-            "announcements": self.announcements,
-            "backup_counter": self.backup_counter,
-            "ui12": self.ui12,
-            "ui13": self.ui13,
-            "ui14": self.ui14,
+            **REWARDS_SCHEMA.serialize(self),
             "ub3": self.ub3,
             "backup_frame": self.backup_frame,
             "ub4": self.ub4,
@@ -2411,8 +1851,7 @@ class SaveFile:
             "last_checked_zombie_time": self.last_checked_zombie_time,
             "outbreaks": self.outbreaks.serialize(),
             "scheme_items": self.scheme_items.serialize(),
-            "first_locks": self.first_locks,
-            "energy_penalty_timestamp": self.energy_penalty_timestamp,
+            **LOCKS_SCHEMA.serialize(self),
             "shown_maxcollab_mg": self.shown_maxcollab_mg,
             "unlock_popups": self.unlock_popups.serialize(),
             "ototo": self.ototo.serialize(),
@@ -2426,28 +1865,20 @@ class SaveFile:
             "map_resets": self.map_resets.serialize(),
             "uncanny": self.uncanny.serialize(),
             "catamin_stages": self.catamin_stages.serialize(),
-            "lucky_tickets": self.lucky_tickets,
-            "ub5": self.ub5,
-            "np": self.np,
-            "ub6": self.ub6,
-            "ub7": self.ub7,
-            "leadership": self.leadership,
-            "filibuster_stage_id": self.filibuster_stage_id,
-            "filibuster_stage_enabled": self.filibuster_stage_enabled,
-            "stage_ids_10s": self.stage_ids_10s,
+            **LUCKY_TICKETS_SCHEMA.serialize(self),
+            **NP_SCHEMA.serialize(self),
+            **LEADERSHIP_SCHEMA.serialize(self),
+            **GV_80300_SCHEMA.serialize(self),
+            **GV_80500_SCHEMA.serialize(self),
             "uil6": self.uil6,
             "legend_quest": self.legend_quest.serialize(),
-            "ush1": self.ush1,
-            "uby1": self.uby1,
+            **GV_80600_SCHEMA.serialize(self),
             "uiid1": self.uiid1,
             "uby2": self.uby2,
-            "restart_pack": self.restart_pack,
+            **GV_81000_SCHEMA.serialize(self),
             "medals": self.medals.serialize(),
             "wildcat_slots": self.wildcat_slots.serialize(),
-            "ush2": self.ush2,
-            "ush3": self.ush3,
-            "ui15": self.ui15,
-            "ud1": self.ud1,
+            **GV_90100_SCHEMA.serialize(self),
             "utl1": self.utl1,
             "uidd1": self.uidd1,
             "gauntlets": self.gauntlets.serialize(),
@@ -2455,140 +1886,63 @@ class SaveFile:
             "enigma": self.enigma.serialize(),
             "cleared_slots": self.cleared_slots.serialize(),
             "collab_gauntlets": self.collab_gauntlets.serialize(),
-            "ub8": self.ub8,
-            "ud2": self.ud2,
-            "ud3": self.ud3,
-            "ui16": self.ui16,
-            "uby3": self.uby3,
-            "ub9": self.ub9,
-            "ud4": self.ud4,
-            "ud5": self.ud5,
+            **GV_90500_SCHEMA.serialize(self),
             "uiid3": self.uiid3,
             "uidd2": self.uidd2,
             "uidd3": self.uidd3,
             "talent_orbs": self.talent_orbs.serialize(),
             "uidiid2": self.uidiid2,
             "ub10": self.ub10,
-            "uil7": self.uil7,
-            "ubl2": self.ubl2,
+            **GV_90800_SCHEMA.serialize(self),
             "cat_shrine": self.cat_shrine.serialize(),
-            "ud6": self.ud6,
-            "ud7": self.ud7,
+            **GV_90900_SCHEMA.serialize(self),
             "legend_tickets": self.legend_tickets,
             "uiil1": self.uiil1,
-            "ub11": self.ub11,
-            "ub12": self.ub12,
-            "password_refresh_token": self.password_refresh_token,
-            "ub13": self.ub13,
-            "uby4": self.uby4,
-            "uby5": self.uby5,
-            "ud8": self.ud8,
-            "ud9": self.ud9,
-            "date_int": self.date_int,
-            "event_capsules_2": self.event_capsules_2,
-            "two_battle_lines": self.two_battle_lines,
-            "ud10": self.ud10,
-            "platinum_shards": self.platinum_shards,
-            "ub15": self.ub15,
+            **GV_100000_SCHEMA.serialize(self),
+            **GV_100100_SCHEMA.serialize(self),
+            **GV_100400_SCHEMA.serialize(self),
+            **GV_100600_SCHEMA.serialize(self),
             "cat_scratcher": self.cat_scratcher.serialize(),
             "aku": self.aku.serialize(),
-            "ub16": self.ub16,
-            "ub17": self.ub17,
+            **GV_100900_SCHEMA.serialize(self),
             "ushdshd2": self.ushdshd2,
             "ushdd": self.ushdd,
             "ushdd2": self.ushdd2,
             "ub18": self.ub18,
-            "uby6": self.uby6,
+            **GV_101000_SCHEMA.serialize(self),
             "uidtii": self.uidtii,
             "behemoth_culling": self.behemoth_culling.serialize(),
             "ub19": self.ub19,
-            "ub20": self.ub20,
+            **GV_110600_SCHEMA.serialize(self),
             "uidtff": self.uidtff,
-            "ub21": self.ub21,
-            "dojo_3x_speed": self.dojo_3x_speed,
-            "ub22": self.ub22,
-            "ub23": self.ub23,
-            "ui17": self.ui17,
-            "ush4": self.ush4,
-            "uby7": self.uby7,
-            "uby8": self.uby8,
-            "ub24": self.ub24,
-            "uby9": self.uby9,
-            "ushl1": self.ushl1,
-            "ushl2": self.ushl2,
-            "ushl3": self.ushl3,
-            "ui18": self.ui18,
-            "ui19": self.ui19,
-            "ui20": self.ui20,
-            "ush5": self.ush5,
-            "ush6": self.ush6,
-            "ush7": self.ush7,
-            "ush8": self.ush8,
-            "uby10": self.uby10,
-            "ub25": self.ub25,
-            "ub26": self.ub26,
-            "ub27": self.ub27,
-            "ub28": self.ub28,
-            "ub29": self.ub29,
-            "ub30": self.ub30,
-            "uby11": self.uby11,
-            "ushl4": self.ushl4,
-            "ubl3": self.ubl3,
-            "labyrinth_medals": self.labyrinth_medals,
+            **GV_110800_SCHEMA.serialize(self),
+            **GV_111000_SCHEMA.serialize(self),
             "zero_legends": self.zero_legends.serialize(),
             "uby12": self.uby12,
-            "ushl6": self.ushl6,
-            "ub31": self.ub31,
-            "ush9": self.ush9,
+            **GV_120100_SCHEMA.serialize(self),
+            **GV_120200_SCHEMA.serialize(self),
             "ushshd": self.ushshd,
-            "ud11": self.ud11,
-            "ud12": self.ud12,
-            "ub32": self.ub32,
-            "ub33": self.ub33,
-            "ub34": self.ub34,
-            "ui21": self.ui21,
-            "golden_cpu_count": self.golden_cpu_count,
-            "sound_effects_volume": self.sound_effects_volume,
-            "background_music_volume": self.background_music_volume,
+            **GV_120400_SCHEMA.serialize(self),
+            **GV_120500_SCHEMA.serialize(self),
+            **GV_120600_SCHEMA.serialize(self),
             "ustl1": self.ustl1,
             "utl3": self.utl3,
             "ustid1": self.ustid1,
-            "ud13": self.ud13,
-            "ud14": self.ud14,
+            **GV_130400_SCHEMA.serialize(self),
             "utl4": self.utl4,
-            "uby14": self.uby14,
-            "ush12": self.ush12,
-            "ud15": self.ud15,
-            "uby15": self.uby15,
-            "uby16": self.uby16,
-            "ush11": self.ush11,
-            "uby17": self.uby17,
-            "uby18": self.uby18,
-            "uby19": self.uby19,
-            "ud16": self.ud16,
+            **GV_130600_SCHEMA.serialize(self),
+            **GV_130700_SCHEMA.serialize(self),
             "ushd1": self.ushd1,
-            "ui22": self.ui22,
-            "ud17": self.ud17,
-            "uby20": self.uby20,
+            **GV_140000_SCHEMA.serialize(self),
             "uild1": self.uild1,
             "dojo_chapters": self.dojo_chapters.serialize(),
-            "uil9": self.uil9,
-            "ub35": self.ub35,
-            "ud18": self.ud18,
+            **GV_140000_2_SCHEMA.serialize(self),
             "ushd2": self.ushd2,
-            "uby21": self.uby21,
+            **GV_140100_SCHEMA.serialize(self),
             "uil10": self.uil10,
             "uid1": self.uid1,
             "hundred_million_ticket": self.hundred_million_ticket,
-            "uil11": self.uil11,
-            "ub36": self.ub36,
-            "treasure_chests": self.treasure_chests,
-            "ui23": self.ui23,
-            "uil13": self.uil13,
-            "ub37": self.ub37,
-            "ub38": self.ub38,
-            "ub39": self.ub39,
-            "ui24": self.ui24,
+            **GV_140300_SCHEMA.serialize(self),
             "remaining_data": base64.b64encode(self.remaining_data).decode("utf-8"),
         }
         return data
@@ -2610,104 +1964,45 @@ class SaveFile:
         save_file = SaveFile(cc=cc)
         save_file.dsts = data.get("dsts", [])
         save_file.game_version = core.GameVersion(data.get("game_version", 0))
-        save_file.ub1 = data.get("ub1", False)
-        save_file.mute_bgm = data.get("mute_bgm", False)
-        save_file.mute_se = data.get("mute_se", False)
-        save_file.catfood = data.get("catfood", 0)
-        save_file.current_energy = data.get("current_energy", 0)
+        SETTINGS_SCHEMA.deserialize(save_file, data)
         save_file.year = data.get("year", 0)
         save_file.month = data.get("month", 0)
         save_file.day = data.get("day", 0)
         save_file.timestamp = data.get("timestamp", 0.0)
         save_file.date = datetime.datetime.fromtimestamp(data.get("date", 0))
-        save_file.ui1 = data.get("ui1", 0)
-        save_file.stamp_value_save = data.get("stamp_value_save", 0)
-        save_file.ui2 = data.get("ui2", 0)
-        save_file.upgrade_state = data.get("upgrade_state", 0)
-        save_file.xp = data.get("xp", 0)
-        save_file.tutorial_state = data.get("tutorial_state", 0)
-        save_file.ui3 = data.get("ui3", 0)
-        save_file.koreaSuperiorTreasureState = data.get("koreaSuperiorTreasureState", 0)
-        save_file.unlock_popups_11 = data.get("unlock_popups_11", [])
-        save_file.ui5 = data.get("ui5", 0)
-        save_file.unlock_enemy_guide = data.get("unlock_enemy_guide", 0)
-        save_file.ui6 = data.get("ui6", 0)
-        save_file.ub0 = data.get("ub0", False)
-        save_file.ui7 = data.get("ui7", 0)
-        save_file.cleared_eoc_1 = data.get("cleared_eoc_1", 0)
-        save_file.ui8 = data.get("ui8", 0)
-        save_file.unlocked_ending = data.get("unlocked_ending", 0)
+        HEADER_SCHEMA.deserialize(save_file, data)
         save_file.lineups = core.LineUps.deserialize(data.get("lineups", {}))
         save_file.stamp_data = core.StampData.deserialize(data.get("stamp_data", {}))
         save_file.story = core.StoryChapters.deserialize(data.get("story", []))
-        save_file.enemy_guide = data.get("enemy_guide", [])
+        ENEMY_GUIDE_SCHEMA.deserialize(save_file, data)
         save_file.cats = core.Cats.deserialize(data.get("cats", {}))
         save_file.special_skills = core.SpecialSkills.deserialize(
             data.get("special_skills", [])
         )
-        save_file.menu_unlocks = data.get("menu_unlocks", [])
-        save_file.unlock_popups_0 = data.get("unlock_popups_0", [])
+        MENU_UNLOCKS_SCHEMA.deserialize(save_file, data)
         save_file.battle_items = core.BattleItems.deserialize(
             data.get("battle_items", {})
         )
-        save_file.new_dialogs_2 = data.get("new_dialogs_2", [])
-        save_file.uil1 = data.get("uil1", [])
-        save_file.moneko_bonus = data.get("moneko_bonus", [])
-        save_file.daily_reward_initialized = data.get("daily_reward_initialized", [])
+        DIALOGS_SCHEMA.deserialize(save_file, data)
         save_file.date_2 = datetime.datetime.fromtimestamp(data.get("date_2", 0))
         save_file.date_3 = datetime.datetime.fromtimestamp(data.get("date_3", 0))
-        save_file.ui0 = data.get("ui0", 0)
-        save_file.stage_unlock_cat_value = data.get("stage_unlock_cat_value", 0)
-        save_file.show_ending_value = data.get("show_ending_value", 0)
-        save_file.chapter_clear_cat_unlock = data.get("chapter_clear_cat_unlock", 0)
-        save_file.ui9 = data.get("ui9", 0)
-        save_file.ios_android_month = data.get("ios_android_month", 0)
-        save_file.ui10 = data.get("ui10", 0)
-        save_file.save_data_4_hash = data.get("save_data_4_hash", "")
+        ENDING_SCHEMA.deserialize(save_file, data)
         save_file.mysale = core.MySale.deserialize(data.get("mysale", {}))
-        save_file.chara_flags = data.get("chara_flags", [])
-        save_file.uim1 = data.get("uim1", 0)
-        save_file.ubm1 = data.get("ubm1", False)
-        save_file.chara_flags_2 = data.get("chara_flags_2", [])
-        save_file.normal_tickets = data.get("normal_tickets", 0)
-        save_file.rare_tickets = data.get("rare_tickets", 0)
+        TICKETS_SCHEMA.deserialize(save_file, data)
         save_file.event_stages = core.EventChapters.deserialize(
             data.get("event_stages", {})
         )
-        save_file.itf1_ending = data.get("itf1_ending", 0)
-        save_file.continue_flag = data.get("continue_flag", 0)
-        save_file.unlock_popups_8 = data.get("unlock_popups_8", [])
-        save_file.unit_drops = data.get("unit_drops", [])
+        UNIT_DROPS_SCHEMA.deserialize(save_file, data)
         save_file.gatya = core.Gatya.deserialize(data.get("gatya", {}))
-        save_file.get_event_data = data.get("get_event_data", False)
-        save_file.achievements = data.get("achievements", [])
-        save_file.os_value = data.get("os_value", 0)
+        EVENT_DATA_SCHEMA.deserialize(save_file, data)
         save_file.date_4 = datetime.datetime.fromtimestamp(data.get("date_4", 0))
-        save_file.player_id = data.get("player_id", "")
-        save_file.order_ids = data.get("order_ids", [])
-        save_file.g_timestamp = data.get("g_timestamp", 0.0)
-        save_file.g_servertimestamp = data.get("g_servertimestamp", 0.0)
-        save_file.m_gettimesave = data.get("m_gettimesave", 0.0)
-        save_file.usl1 = data.get("usl1", [])
-        save_file.energy_notification = data.get("energy_notification", False)
-        save_file.full_gameversion = data.get("full_gameversion", 0)
-        save_file.uil2 = data.get("uil2", [])
-        save_file.uil3 = data.get("uil3", [])
-        save_file.uil4 = data.get("uil4", [])
-        save_file.g_timestamp_2 = data.get("g_timestamp_2", 0.0)
-        save_file.g_servertimestamp_2 = data.get("g_servertimestamp_2", 0.0)
-        save_file.m_gettimesave_2 = data.get("m_gettimesave_2", 0.0)
-        save_file.unknown_timestamp = data.get("unknown_timestamp", 0.0)
-        save_file.usl2 = data.get("usl2", [])
-        save_file.m_dGetTimeSave2 = data.get("m_dGetTimeSave2", 0.0)
-        save_file.ui11 = data.get("ui11", 0)
-        save_file.ubl1 = data.get("ubl1", [])
+        PLAYER_ID_SCHEMA.deserialize(save_file, data)
+        TIMESTAMPS_SCHEMA.deserialize(save_file, data)
+        SAVE_TIME_2_SCHEMA.deserialize(save_file, data)
         save_file.user_rank_rewards = core.UserRankRewards.deserialize(
             data.get("user_rank_rewards", [])
         )
-        save_file.transfer_code = data.get("transfer_code", "")
-        save_file.confirmation_code = data.get("confirmation_code", "")
-        save_file.transfer_flag = data.get("transfer_flag", False)
+        TRANSFER_SCHEMA.deserialize(save_file, data)
         save_file.item_reward_stages = core.ItemRewardChapters.deserialize(
             data.get("item_reward_stages", {})
         )
@@ -2718,52 +2013,19 @@ class SaveFile:
         save_file.officer_pass = core.OfficerPass.deserialize(
             data.get("officer_pass", {})
         )
-        save_file.has_account = data.get("has_account", False)
-        save_file.backup_state = data.get("backup_state", 0)
-        save_file.ub2 = data.get("ub2", False)
-        save_file.itf1_complete = data.get("itf1_complete", 0)
-        save_file.title_chapter_bg = data.get("title_chapter_bg", 0)
-        save_file.combo_unlocks = data.get("combo_unlocks", [])
-        save_file.combo_unlocked_10k_ur = data.get("combo_unlocked_10k_ur", False)
-        save_file.event_capsules = data.get("event_capsules", [])
-        save_file.event_capsules_counter = data.get("event_capsules_counter", [])
-        save_file.m_dGetTimeSave3 = data.get("m_dGetTimeSave3", 0.0)
-        save_file.gatya_seen_lucky_drops = data.get("gatya_seen_lucky_drops", [])
-        save_file.show_ban_message = data.get("banned", False)
-        save_file.catfood_beginner_purchased = data.get(
-            "catfood_beginner_purchased", []
-        )
-        save_file.next_week_timestamp = data.get("next_week_timestamp", 0.0)
-        save_file.catfood_beginner_expired = data.get("catfood_beginner_expired", [])
-        save_file.rank_up_sale_value = data.get("rank_up_sale_value", 0)
-        save_file.time_since_time_check_cumulative = data.get(
-            "time_since_time_check_cumulative", 0.0
-        )
-        save_file.server_timestamp = data.get("server_timestamp", 0.0)
-        save_file.last_checked_energy_recovery_time = data.get(
-            "last_checked_energy_recovery_time", 0.0
-        )
-        save_file.time_since_check = data.get("time_since_check", 0.0)
-        save_file.last_checked_expedition_time = data.get(
-            "last_checked_expedition_time", 0.0
-        )
-        save_file.catfruit = data.get("catfruit", [])
-        save_file.catseyes = data.get("catseyes", [])
-        save_file.catamins = data.get("catamins", [])
+        BACKUP_SCHEMA.deserialize(save_file, data)
+        COMBO_SCHEMA.deserialize(save_file, data)
+        EVENT_CAPSULES_SCHEMA.deserialize(save_file, data)
+        GV_23_SCHEMA.deserialize(save_file, data)
+        ENERGY_SCHEMA.deserialize(save_file, data)
+        CATSEYES_SCHEMA.deserialize(save_file, data)
         save_file.gamatoto = core.Gamatoto.deserialize(data.get("gamatoto", {}))
         save_file.unlock_popups_6 = data.get("unlock_popups_6", [])
         save_file.ex_stages = core.ExChapters.deserialize(data.get("ex_stages", []))
         save_file.item_pack = core.ItemPack.deserialize(data.get("item_pack", {}))
         save_file.platinum_tickets = data.get("platinum_tickets", 0)
         save_file.logins = core.LoginBonus.deserialize(data.get("logins", {}))
-        save_file.reset_item_reward_flags = data.get("reset_item_reward_flags", [])
-        save_file.reward_remaining_time = data.get("reward_remaining_time", 0.0)
-        save_file.last_checked_reward_time = data.get("last_checked_reward_time", 0.0)
-        save_file.announcements = data.get("announcements", [])
-        save_file.backup_counter = data.get("backup_counter", 0)
-        save_file.ui12 = data.get("ui12", 0)
-        save_file.ui13 = data.get("ui13", 0)
-        save_file.ui14 = data.get("ui14", 0)
+        REWARDS_SCHEMA.deserialize(save_file, data)
         save_file.ub3 = data.get("ub3", False)
         save_file.backup_frame = data.get("backup_frame", 0)
         save_file.ub4 = data.get("ub4", False)
@@ -2773,8 +2035,7 @@ class SaveFile:
         save_file.scheme_items = core.SchemeItems.deserialize(
             data.get("scheme_items", {})
         )
-        save_file.first_locks = data.get("first_locks", {})
-        save_file.energy_penalty_timestamp = data.get("energy_penalty_timestamp", 0.0)
+        LOCKS_SCHEMA.deserialize(save_file, data)
         save_file.shown_maxcollab_mg = data.get("shown_maxcollab_mg", False)
         save_file.unlock_popups = core.UnlockPopups.deserialize(
             data.get("unlock_popups", {})
@@ -2796,32 +2057,24 @@ class SaveFile:
         save_file.catamin_stages = core.UncannyChapters.deserialize(
             data.get("catamin_stages", {})
         )
-        save_file.lucky_tickets = data.get("lucky_tickets", [])
-        save_file.ub5 = data.get("ub5", False)
-        save_file.np = data.get("np", 0)
-        save_file.ub6 = data.get("ub6", False)
-        save_file.ub7 = data.get("ub7", False)
-        save_file.leadership = data.get("leadership", 0)
-        save_file.filibuster_stage_id = data.get("filibuster_stage_id", 0)
-        save_file.filibuster_stage_enabled = data.get("filibuster_stage_enabled", False)
-        save_file.stage_ids_10s = data.get("stage_ids_10s", [])
+        LUCKY_TICKETS_SCHEMA.deserialize(save_file, data)
+        NP_SCHEMA.deserialize(save_file, data)
+        LEADERSHIP_SCHEMA.deserialize(save_file, data)
+        GV_80300_SCHEMA.deserialize(save_file, data)
+        GV_80500_SCHEMA.deserialize(save_file, data)
         save_file.uil6 = data.get("uil6", [])
         save_file.legend_quest = core.LegendQuestChapters.deserialize(
             data.get("legend_quest", {})
         )
-        save_file.ush1 = data.get("ush1", 0)
-        save_file.uby1 = data.get("uby1", 0)
+        GV_80600_SCHEMA.deserialize(save_file, data)
         save_file.uiid1 = data.get("uiid1", {})
         save_file.uby2 = data.get("uby2", 0)
-        save_file.restart_pack = data.get("restart_pack", 0)
+        GV_81000_SCHEMA.deserialize(save_file, data)
         save_file.medals = core.Medals.deserialize(data.get("medals", {}))
         save_file.wildcat_slots = core.GamblingEvent.deserialize(
             data.get("wildcat_slots", {})
         )
-        save_file.ush2 = data.get("ush2", 0)
-        save_file.ush3 = data.get("ush3", 0)
-        save_file.ui15 = data.get("ui15", 0)
-        save_file.ud1 = data.get("ud1", 0.0)
+        GV_90100_SCHEMA.deserialize(save_file, data)
         save_file.utl1 = data.get("utl1", [])
         save_file.uidd1 = data.get("uidd1", {})
         save_file.gauntlets = core.GauntletChapters.deserialize(
@@ -2837,147 +2090,71 @@ class SaveFile:
         save_file.collab_gauntlets = core.GauntletChapters.deserialize(
             data.get("collab_gauntlets", {})
         )
-        save_file.ub8 = data.get("ub8", False)
-        save_file.ud2 = data.get("ud2", 0.0)
-        save_file.ud3 = data.get("ud3", 0.0)
-        save_file.ui16 = data.get("ui16", 0)
-        save_file.uby3 = data.get("uby3", 0)
-        save_file.ub9 = data.get("ub9", False)
-        save_file.ud4 = data.get("ud4", 0.0)
-        save_file.ud5 = data.get("ud5", 0.0)
+        GV_90500_SCHEMA.deserialize(save_file, data)
         save_file.uiid3 = data.get("uiid3", {})
         save_file.uidd2 = data.get("uidd2", {})
         save_file.uidd3 = data.get("uidd3", {})
         save_file.talent_orbs = core.TalentOrbs.deserialize(data.get("talent_orbs", {}))
         save_file.uidiid2 = data.get("uidiid2", {})
         save_file.ub10 = data.get("ub10", False)
-        save_file.uil7 = data.get("uil7", [])
-        save_file.ubl2 = data.get("ubl2", [])
+        GV_90800_SCHEMA.deserialize(save_file, data)
         save_file.cat_shrine = core.CatShrine.deserialize(data.get("cat_shrine", {}))
-        save_file.ud6 = data.get("ud6", 0.0)
-        save_file.ud7 = data.get("ud7", 0)
+        GV_90900_SCHEMA.deserialize(save_file, data)
         save_file.legend_tickets = data.get("legend_tickets", 0)
         save_file.uiil1 = data.get("uiil1", [])
-        save_file.ub11 = data.get("ub11", False)
-        save_file.ub12 = data.get("ub12", False)
-        save_file.password_refresh_token = data.get("password_refresh_token", "")
-        save_file.ub13 = data.get("ub13", False)
-        save_file.uby4 = data.get("uby4", 0)
-        save_file.uby5 = data.get("uby5", 0)
-        save_file.ud8 = data.get("ud8", 0.0)
-        save_file.ud9 = data.get("ud9", 0.0)
-        save_file.date_int = data.get("date_int", 0)
-        save_file.event_capsules_2 = data.get("event_capsules_2", [])
-        save_file.two_battle_lines = data.get("two_battle_lines", False)
-        save_file.ud10 = data.get("ud10", 0.0)
-        save_file.platinum_shards = data.get("platinum_shards", 0)
-        save_file.ub15 = data.get("ub15", False)
+        GV_100000_SCHEMA.deserialize(save_file, data)
+        GV_100100_SCHEMA.deserialize(save_file, data)
+        GV_100400_SCHEMA.deserialize(save_file, data)
+        GV_100600_SCHEMA.deserialize(save_file, data)
         save_file.cat_scratcher = core.GamblingEvent.deserialize(
             data.get("cat_scratcher", {})
         )
         save_file.aku = core.AkuChapters.deserialize(data.get("aku", {}))
-        save_file.ub16 = data.get("ub16", False)
-        save_file.ub17 = data.get("ub17", False)
+        GV_100900_SCHEMA.deserialize(save_file, data)
         save_file.ushdshd2 = data.get("ushdshd2", {})
         save_file.ushdd = data.get("ushdd", {})
         save_file.ushdd2 = data.get("ushdd2", {})
         save_file.ub18 = data.get("ub18", False)
-        save_file.uby6 = data.get("uby6", 0)
+        GV_101000_SCHEMA.deserialize(save_file, data)
         save_file.uidtii = data.get("uidtii", {})
         save_file.behemoth_culling = core.GauntletChapters.deserialize(
             data.get("behemoth_culling", {})
         )
         save_file.ub19 = data.get("ub19", False)
-        save_file.ub20 = data.get("ub20", False)
+        GV_110600_SCHEMA.deserialize(save_file, data)
         save_file.uidtff = data.get("uidtff", {})
-        save_file.ub21 = data.get("ub21", False)
-        save_file.dojo_3x_speed = data.get("dojo_3x_speed", False)
-        save_file.ub22 = data.get("ub22", False)
-        save_file.ub23 = data.get("ub23", False)
-        save_file.ui17 = data.get("ui17", 0)
-        save_file.ush4 = data.get("ush4", 0)
-        save_file.uby7 = data.get("uby7", 0)
-        save_file.uby8 = data.get("uby8", 0)
-        save_file.ub24 = data.get("ub24", False)
-        save_file.uby9 = data.get("uby9", 0)
-        save_file.ushl1 = data.get("ushl1", [])
-        save_file.ushl2 = data.get("ushl2", [])
-        save_file.ushl3 = data.get("ushl3", [])
-        save_file.ui18 = data.get("ui18", 0)
-        save_file.ui19 = data.get("ui19", 0)
-        save_file.ui20 = data.get("ui20", 0)
-        save_file.ush5 = data.get("ush5", 0)
-        save_file.ush6 = data.get("ush6", 0)
-        save_file.ush7 = data.get("ush7", 0)
-        save_file.ush8 = data.get("ush8", 0)
-        save_file.uby10 = data.get("uby10", 0)
-        save_file.ub25 = data.get("ub25", False)
-        save_file.ub26 = data.get("ub26", False)
-        save_file.ub27 = data.get("ub27", False)
-        save_file.ub28 = data.get("ub28", False)
-        save_file.ub29 = data.get("ub29", False)
-        save_file.ub30 = data.get("ub30", False)
-        save_file.uby11 = data.get("uby11", 0)
-        save_file.ushl4 = data.get("ushl4", [])
-        save_file.ubl3 = data.get("ubl3", [])
-        save_file.labyrinth_medals = data.get("labyrinth_medals", [])
+        GV_110800_SCHEMA.deserialize(save_file, data)
+        GV_111000_SCHEMA.deserialize(save_file, data)
         save_file.zero_legends = core.ZeroLegendsChapters.deserialize(
             data.get("zero_legends", [])
         )
         save_file.uby12 = data.get("uby12", 0)
-        save_file.ushl6 = data.get("ushl6", [])
-        save_file.ub31 = data.get("ub31", False)
-        save_file.ush9 = data.get("ush9", 0)
+        GV_120100_SCHEMA.deserialize(save_file, data)
+        GV_120200_SCHEMA.deserialize(save_file, data)
         save_file.ushshd = data.get("ushshd", {})
-        save_file.ud11 = data.get("ud11", 0.0)
-        save_file.ud12 = data.get("ud12", 0.0)
-        save_file.ub32 = data.get("ub32", False)
-        save_file.ub33 = data.get("ub33", False)
-        save_file.ub34 = data.get("ub34", False)
-        save_file.ui21 = data.get("ui21", 0)
-        save_file.golden_cpu_count = data.get("golden_cpu_count", 0)
-        save_file.sound_effects_volume = data.get("sound_effects_volume", 0)
-        save_file.background_music_volume = data.get("background_music_volume", 0)
+        GV_120400_SCHEMA.deserialize(save_file, data)
+        GV_120500_SCHEMA.deserialize(save_file, data)
+        GV_120600_SCHEMA.deserialize(save_file, data)
         save_file.ustl1 = data.get("ustl1", [])
         save_file.utl3 = data.get("utl3", [])
         save_file.ustid1 = data.get("ustid1", {})
-        save_file.ud13 = data.get("ud13", 0.0)
-        save_file.ud14 = data.get("ud14", 0.0)
+        GV_130400_SCHEMA.deserialize(save_file, data)
         save_file.utl4 = data.get("utl4", [])
-        save_file.uby14 = data.get("uby14", 0)
-        save_file.ush12 = data.get("ush12", 0)
-        save_file.ud15 = data.get("ud15", 0.0)
-        save_file.uby15 = data.get("uby15", 0)
-        save_file.uby16 = data.get("uby16", 0)
-        save_file.ush11 = data.get("ush11", 0)
-        save_file.uby17 = data.get("uby17", 0)
-        save_file.uby18 = data.get("uby18", 0)
-        save_file.uby19 = data.get("uby19", 0)
-        save_file.ud16 = data.get("ud16", 0.0)
+        GV_130600_SCHEMA.deserialize(save_file, data)
+        GV_130700_SCHEMA.deserialize(save_file, data)
         save_file.ushd1 = data.get("ushd1", {})
-        save_file.ui22 = data.get("ui22", 0)
-        save_file.ud17 = data.get("ud17", 0.0)
-        save_file.uby20 = data.get("uby20", 0)
+        GV_140000_SCHEMA.deserialize(save_file, data)
         save_file.uild1 = data.get("uild1", {})
         save_file.dojo_chapters = core.ZeroLegendsChapters.deserialize(
             data.get("dojo_chapters", [])
         )
-        save_file.uil9 = data.get("uil9", [])
-        save_file.ub35 = data.get("ub35", False)
-        save_file.ud18 = data.get("ud18", 0.0)
+        GV_140000_2_SCHEMA.deserialize(save_file, data)
         save_file.ushd2 = data.get("ushd2", {})
+        GV_140100_SCHEMA.deserialize(save_file, data)
         save_file.uil10 = data.get("uil10", [])
         save_file.uid1 = data.get("uid1", {})
         save_file.hundred_million_ticket = data.get("hundred_million_ticket", 0)
-        save_file.uil11 = data.get("uil11", [])
-        save_file.ub36 = data.get("ub36", False)
-        save_file.treasure_chests = data.get("treasure_chests", [])
-        save_file.ui23 = data.get("ui23", 0)
-        save_file.uil13 = data.get("uil13", [])
-        save_file.ub37 = data.get("ub37", False)
-        save_file.ub38 = data.get("ub38", False)
-        save_file.ub39 = data.get("ub39", False)
-        save_file.ui24 = data.get("ui24", 0)
+        GV_140300_SCHEMA.deserialize(save_file, data)
 
         save_file.remaining_data = base64.b64decode(data.get("remaining_data", ""))
 
@@ -3164,12 +2341,12 @@ class SaveFile:
         self.stage_ids_10s = []
         self.uil6 = []
         self.uil7 = []
-        self.event_capsules_2 = []
-        self.uil9 = []
+        self.event_capsules_2: list[int] = []
+        self.uil9: list[int] = []
         self.uil10 = []
-        self.uil11 = []
-        self.treasure_chests = []
-        self.uil13 = []
+        self.uil11: list[int] = []
+        self.treasure_chests: list[int] = []
+        self.uil13: list[int] = []
 
         self.uiil1 = []
 
@@ -3230,7 +2407,7 @@ class SaveFile:
             self.unit_drops = []
 
         self.achievements = [False] * 7
-        self.order_ids = []
+        self.order_ids: list[str] = []
         self.combo_unlocks = []
         if gv < 34:
             self.event_capsules = [0] * 100
@@ -3245,14 +2422,14 @@ class SaveFile:
             self.gatya_seen_lucky_drops = []
         self.catfood_beginner_purchased = [False] * 3
         self.catfood_beginner_expired = [False] * 3
-        self.catfruit = []
-        self.catseyes = []
-        self.catamins = []
+        self.catfruit: list[int] = []
+        self.catseyes: list[int] = []
+        self.catamins: list[int] = []
         self.unlock_popups_6 = []
         self.reset_item_reward_flags = []
         self.announcements = [(0, 0)] * 16
-        self.lucky_tickets = []
-        self.labyrinth_medals = []
+        self.lucky_tickets: list[int] = []
+        self.labyrinth_medals: list[int] = []
 
         self.save_data_4_hash = ""
         self.player_id = ""
@@ -3396,12 +2573,7 @@ class SaveFile:
             self.dst_index += 1
 
     def calculate_user_rank(self):
-        user_rank = 0
-        for cat in self.cats.cats:
-            if not cat.unlocked:
-                continue
-            user_rank += cat.upgrade.base + 1
-            user_rank += cat.upgrade.plus
+        user_rank = self.cats.get_upgrade_total()
 
         for i, skill in enumerate(self.special_skills.skills):
             if i == 1:
@@ -3415,42 +2587,68 @@ class SaveFile:
     def get_string_identifier(identifier: str) -> str:
         return f"_bcsfe:{identifier}"
 
+    def get_order_id_index(self) -> dict[str, list[int]]:
+        """Get the positions of the bcsfe strings in `order_ids` for each
+        identifier. The index is rebuilt if `order_ids` has been replaced or
+        changed without using the string methods.
+
+        Returns:
+            dict[str, list[int]]: The positions for each identifier
+        """
+        if (
+            self.order_id_index_source is not self.order_ids
+            or self.order_id_index_length != len(self.order_ids)
+        ):
+            prefix = SaveFile.get_string_identifier("")
+            index: dict[str, list[int]] = {}
+            for i, order in enumerate(self.order_ids):
+                if order.startswith(prefix):
+                    identifier = order[len(prefix) :].split(":", 1)[0]
+                    index.setdefault(identifier, []).append(i)
+            self.order_id_index = index
+            self.order_id_index_source = self.order_ids
+            self.order_id_index_length = len(self.order_ids)
+        return self.order_id_index
+
+    def append_order_id(self, identifier: str, order: str):
+        positions = self.get_order_id_index().setdefault(identifier, [])
+        positions.append(len(self.order_ids))
+        self.order_ids.append(order)
+        self.order_id_index_length = len(self.order_ids)
+
+    def remove_order_ids(self, identifier: str, count: int | None = None):
+        positions = self.get_order_id_index().get(identifier)
+        if not positions:
+            return
+        removed = set(positions[:count])
+        self.order_ids = [
+            order for i, order in enumerate(self.order_ids) if i not in removed
+        ]
+
     def store_string(self, identifier: str, string: str, overwrite: bool = True):
+        order = f"{SaveFile.get_string_identifier(identifier)}:{string}"
         if overwrite:
-            for i, order in enumerate(self.order_ids):
-                if order.startswith(SaveFile.get_string_identifier(identifier)):
-                    self.order_ids[i] = (
-                        f"{SaveFile.get_string_identifier(identifier)}:{string}"
-                    )
-                    return
-        self.order_ids.append(f"{SaveFile.get_string_identifier(identifier)}:{string}")
+            positions = self.get_order_id_index().get(identifier)
+            if positions:
+                self.order_ids[positions[0]] = order
+                return
+        self.append_order_id(identifier, order)
 
     def get_string(self, identifier: str) -> str | None:
-        for order in self.order_ids:
-            if order.startswith(SaveFile.get_string_identifier(identifier)):
-                return order.split(":")[2]
-        return None
+        positions = self.get_order_id_index().get(identifier)
+        if not positions:
+            return None
+        return self.order_ids[positions[0]].split(":")[2]
 
     def get_strings(self, identifier: str) -> list[str]:
-        strings: list[str] = []
-        for order in self.order_ids:
-            if order.startswith(SaveFile.get_string_identifier(identifier)):
-                strings.append(order.split(":")[2])
-
-        return strings
+        positions = self.get_order_id_index().get(identifier, [])
+        return [self.order_ids[i].split(":")[2] for i in positions]
 
     def remove_string(self, identifier: str):
-        for i, order in enumerate(self.order_ids):
-            if order.startswith(SaveFile.get_string_identifier(identifier)):
-                self.order_ids.pop(i)
-                return
+        self.remove_order_ids(identifier, 1)
 
     def remove_strings(self, identifier: str):
-        new_order_ids: list[str] = []
-        for order in self.order_ids:
-            if not order.startswith(SaveFile.get_string_identifier(identifier)):
-                new_order_ids.append(order)
-        self.order_ids = new_order_ids
+        self.remove_order_ids(identifier)
 
     def store_dict(
         self,
@@ -3459,29 +2657,24 @@ class SaveFile:
         overwrite: bool = True,
     ):
         if overwrite:
-            for i, order in enumerate(self.order_ids):
-                if order.startswith(SaveFile.get_string_identifier(identifier)):
-                    self.order_ids.pop(i)
+            self.remove_order_ids(identifier)
 
         for key, value in dictionary.items():
-            self.order_ids.append(
-                f"{SaveFile.get_string_identifier(identifier)}:{key}:{value}"
+            self.append_order_id(
+                identifier,
+                f"{SaveFile.get_string_identifier(identifier)}:{key}:{value}",
             )
 
     def get_dict(self, identifier: str) -> dict[str, str] | None:
         dictionary: dict[str, str] = {}
-        for order in self.order_ids:
-            if order.startswith(SaveFile.get_string_identifier(identifier)):
-                dictionary[order.split(":")[2]] = order.split(":")[3]
+        for i in self.get_order_id_index().get(identifier, []):
+            values = self.order_ids[i].split(":")
+            dictionary[values[2]] = values[3]
 
         return dictionary
 
     def remove_dict(self, identifier: str):
-        new_order_ids: list[str] = []
-        for order in self.order_ids:
-            if not order.startswith(SaveFile.get_string_identifier(identifier)):
-                new_order_ids.append(order)
-        self.order_ids = new_order_ids
+        self.remove_order_ids(identifier)
 
     @staticmethod
     def get_saves_path() -> core.Path:
@@ -3596,3 +2789,610 @@ class SaveFile:
 
     def max_rank_up_sale(self):
         self.rank_up_sale_value = 0x7FFFFFFF
+
+
+# runs of plain fields that are read, written and (de)serialised from a schema
+SETTINGS_SCHEMA = Schema(
+    [
+        Field("ub1", "bool", jp=False),
+        Field("ub1", "bool", min_gv=10, jp=True),
+        Field("mute_bgm", "bool"),
+        Field("mute_se", "bool"),
+        Field("catfood", "int"),
+        Field("current_energy", "int"),
+    ]
+)
+
+HEADER_SCHEMA = Schema(
+    [
+        Field("ui1", "int"),
+        Field("stamp_value_save", "int"),
+        Field("ui2", "int"),
+        Field("upgrade_state", "int"),
+        Field("xp", "int"),
+        Field("tutorial_state", "int"),
+        Field("ui3", "int"),
+        Field("koreaSuperiorTreasureState", "int"),
+        Field("unlock_popups_11", "int_list", length=3),
+        Field("ui5", "int"),
+        Field("unlock_enemy_guide", "int"),
+        Field("ui6", "int"),
+        Field("ub0", "bool"),
+        Field("ui7", "int"),
+        Field("cleared_eoc_1", "int"),
+        Field("ui8", "int"),
+        Field("unlocked_ending", "int"),
+    ]
+)
+
+ENEMY_GUIDE_SCHEMA = Schema(
+    [
+        Field("enemy_guide", "int_list", max_gv=19),
+        Field("enemy_guide", "int_list", length=231, min_gv=20, max_gv=25),
+        Field("enemy_guide", "int_list", min_gv=26),
+    ]
+)
+
+MENU_UNLOCKS_SCHEMA = Schema(
+    [
+        Field("menu_unlocks", "int_list", length=5, max_gv=25),
+        Field("unlock_popups_0", "int_list", length=5, max_gv=25),
+        Field("menu_unlocks", "int_list", length=6, min_gv=26, max_gv=26),
+        Field("unlock_popups_0", "int_list", length=6, min_gv=26, max_gv=26),
+        Field("menu_unlocks", "int_list", min_gv=27),
+        Field("unlock_popups_0", "int_list", min_gv=27),
+    ]
+)
+
+DIALOGS_SCHEMA = Schema(
+    [
+        Field("new_dialogs_2", "int_list", length=17, max_gv=26),
+        Field("new_dialogs_2", "int_list", min_gv=27),
+        Field("uil1", "int_list", length=20),
+        Field("moneko_bonus", "int_list", length=1),
+        Field("daily_reward_initialized", "int_list", length=1),
+    ]
+)
+
+ENDING_SCHEMA = Schema(
+    [
+        Field("ui0", "int", max_gv=37),
+        Field("stage_unlock_cat_value", "int"),
+        Field("show_ending_value", "int"),
+        Field("chapter_clear_cat_unlock", "int"),
+        Field("ui9", "int"),
+        Field("ios_android_month", "int"),
+        Field("ui10", "int"),
+        Field("save_data_4_hash", "string"),
+    ]
+)
+
+TICKETS_SCHEMA = Schema(
+    [
+        Field("chara_flags", "int_list", length=2),
+        Field("uim1", "int", max_gv=37),
+        Field("ubm1", "bool", max_gv=37),
+        Field("chara_flags_2", "int_list", length=2),
+        Field("normal_tickets", "int"),
+        Field("rare_tickets", "int"),
+    ]
+)
+
+UNIT_DROPS_SCHEMA = Schema(
+    [
+        Field("itf1_ending", "int"),
+        Field("continue_flag", "int"),
+        Field("unlock_popups_8", "int_list", length=36, min_gv=20),
+        Field("unit_drops", "int_list", length=110, min_gv=20, max_gv=25),
+        Field("unit_drops", "int_list", min_gv=26),
+    ]
+)
+
+EVENT_DATA_SCHEMA = Schema(
+    [
+        Field("get_event_data", "bool"),
+        Field("achievements", "bool_list", length=7),
+        Field("os_value", "int"),
+    ]
+)
+
+PLAYER_ID_SCHEMA = Schema(
+    [
+        Field("player_id", "string", jp=False),
+        Field("order_ids", "string_list"),
+        Field("g_timestamp", "double", jp=False),
+        Field("g_servertimestamp", "double", jp=False),
+        Field("m_gettimesave", "double", jp=False),
+        Field("usl1", "string_list", jp=False),
+        Field("energy_notification", "bool", jp=False),
+        Field("full_gameversion", "int", jp=False),
+    ]
+)
+
+TIMESTAMPS_SCHEMA = Schema(
+    [
+        Field("uil2", "int_list", length=7, max_gv=37),
+        Field("uil3", "int_list", length=7, max_gv=37),
+        Field("uil4", "int_list", length=7, max_gv=37),
+        Field("g_timestamp_2", "double"),
+        Field("g_servertimestamp_2", "double"),
+        Field("m_gettimesave_2", "double"),
+        Field("unknown_timestamp", "double"),
+    ]
+)
+
+SAVE_TIME_2_SCHEMA = Schema(
+    [
+        Field("usl2", "string_list", max_gv=37),
+        Field("m_dGetTimeSave2", "double", jp=False),
+        Field("ui11", "int", jp=True),
+        Field("ubl1", "bool_list", length=12, min_gv=20, max_gv=25),
+        Field("ubl1", "bool_list", min_gv=26, max_gv=38),
+    ]
+)
+
+TRANSFER_SCHEMA = Schema(
+    [
+        Field("transfer_code", "string"),
+        Field("confirmation_code", "string"),
+        Field("transfer_flag", "bool"),
+    ]
+)
+
+BACKUP_SCHEMA = Schema(
+    [
+        Field("has_account", "byte"),
+        Field("backup_state", "int"),
+        Field("ub2", "bool", jp=False),
+        Marker(44),
+        Field("itf1_complete", "int"),
+    ]
+)
+
+COMBO_SCHEMA = Schema(
+    [
+        Field("title_chapter_bg", "int"),
+        Field("combo_unlocks", "int_list", min_gv=27),
+        Field("combo_unlocked_10k_ur", "bool"),
+        Marker(45),
+    ]
+)
+
+EVENT_CAPSULES_SCHEMA = Schema(
+    [
+        Field("event_capsules", "int_list", length=100, max_gv=33),
+        Field("event_capsules_counter", "int_list", length=100, max_gv=33),
+        Field("event_capsules", "int_list", min_gv=34),
+        Field("event_capsules_counter", "int_list", min_gv=34),
+        Marker(47),
+    ]
+)
+
+GV_23_SCHEMA = Schema(
+    [
+        Field("energy_notification", "bool", jp=True),
+        Field("m_dGetTimeSave3", "double"),
+        Field("gatya_seen_lucky_drops", "int_list", length=44, max_gv=25),
+        Field("gatya_seen_lucky_drops", "int_list", min_gv=26),
+        Field("show_ban_message", "bool", key="banned"),
+        Field("catfood_beginner_purchased", "bool_list", length=3),
+        Field("next_week_timestamp", "double"),
+        Field("catfood_beginner_expired", "bool_list", length=3),
+        Field("rank_up_sale_value", "int"),
+        Marker(49),
+    ],
+    min_gv=23,
+)
+
+ENERGY_SCHEMA = Schema(
+    [
+        Field("time_since_time_check_cumulative", "double"),
+        Field("server_timestamp", "double"),
+        Field("last_checked_energy_recovery_time", "double"),
+        Field("time_since_check", "double"),
+        Field("last_checked_expedition_time", "double"),
+        Field("catfruit", "int_list"),
+    ]
+)
+
+CATSEYES_SCHEMA = Schema(
+    [
+        Field("catseyes", "int_list"),
+        Field("catamins", "int_list"),
+    ]
+)
+
+REWARDS_SCHEMA = Schema(
+    [
+        Field("reset_item_reward_flags", "bool_list", max_gv=100999),
+        Field("reward_remaining_time", "double"),
+        Field("last_checked_reward_time", "double"),
+        Field("announcements", "int_tuple_list", length=16),
+        Field("backup_counter", "int"),
+        Field("ui12", "int"),
+        Field("ui13", "int"),
+        Field("ui14", "int"),
+        Marker(55),
+    ]
+)
+
+LOCKS_SCHEMA = Schema(
+    [
+        Field("first_locks", "int_bool_dict"),
+        Field("energy_penalty_timestamp", "double"),
+        Marker(60),
+    ]
+)
+
+LUCKY_TICKETS_SCHEMA = Schema(
+    [
+        Field("lucky_tickets", "int_list"),
+        Field("ub5", "bool"),
+        Marker(77),
+    ]
+)
+
+NP_SCHEMA = Schema(
+    [
+        Field("np", "int"),
+        Field("ub6", "bool"),
+        Marker(80000),
+    ]
+)
+
+LEADERSHIP_SCHEMA = Schema(
+    [
+        Field("ub7", "bool"),
+        Field("leadership", "short"),
+    ]
+)
+
+GV_80300_SCHEMA = Schema(
+    [
+        Field("filibuster_stage_id", "byte"),
+        Field("filibuster_stage_enabled", "bool"),
+        Marker(80300),
+    ],
+    min_gv=80300,
+)
+
+GV_80500_SCHEMA = Schema(
+    [
+        Field("stage_ids_10s", "int_list"),
+        Marker(80500),
+    ],
+    min_gv=80500,
+)
+
+GV_80600_SCHEMA = Schema(
+    [
+        Field("ush1", "short"),
+        Field("uby1", "byte"),
+        Marker(80600),
+    ]
+)
+
+GV_81000_SCHEMA = Schema(
+    [
+        Field("restart_pack", "byte"),
+        Marker(81000),
+    ],
+    min_gv=81000,
+)
+
+GV_90100_SCHEMA = Schema(
+    [
+        Field("ush2", "short"),
+        Field("ush3", "short"),
+        Field("ui15", "int"),
+        Field("ud1", "double"),
+        Marker(90100),
+    ],
+    min_gv=90100,
+)
+
+GV_90500_SCHEMA = Schema(
+    [
+        Field("ub8", "bool"),
+        Field("ud2", "double"),
+        Field("ud3", "double"),
+        Field("ui16", "int"),
+        Field("uby3", "byte", min_gv=100300),
+        Field("ub9", "bool", min_gv=100300),
+        Field("ud4", "double", min_gv=100300),
+        Field("ud5", "double", min_gv=100300),
+    ]
+)
+
+GV_90800_SCHEMA = Schema(
+    [
+        Field("uil7", "int_list", length_type="short"),
+        Field("ubl2", "bool_list", length=10),
+        Marker(90800),
+    ],
+    min_gv=90800,
+)
+
+GV_90900_SCHEMA = Schema(
+    [
+        Field("ud6", "double"),
+        Field("ud7", "double"),
+        Marker(90900),
+    ]
+)
+
+GV_100000_SCHEMA = Schema(
+    [
+        Field("ub11", "bool"),
+        Field("ub12", "bool"),
+        Field("password_refresh_token", "string"),
+        Field("ub13", "bool"),
+        Field("uby4", "byte"),
+        Field("uby5", "byte"),
+        Field("ud8", "double"),
+        Field("ud9", "double"),
+        Marker(100000),
+    ]
+)
+
+GV_100100_SCHEMA = Schema(
+    [
+        Field("date_int", "int"),
+        Marker(100100),
+    ],
+    min_gv=100100,
+)
+
+GV_100400_SCHEMA = Schema(
+    [
+        Field("event_capsules_2", "int_list", length_type="byte"),
+        Field("two_battle_lines", "bool"),
+        Marker(100400),
+    ],
+    min_gv=100400,
+)
+
+GV_100600_SCHEMA = Schema(
+    [
+        Field("ud10", "double"),
+        Field("platinum_shards", "int"),
+        Field("ub15", "bool"),
+        Marker(100600),
+    ],
+    min_gv=100600,
+)
+
+GV_100900_SCHEMA = Schema(
+    [
+        Field("ub16", "bool"),
+        Field("ub17", "bool"),
+    ]
+)
+
+GV_101000_SCHEMA = Schema(
+    [
+        Field("uby6", "byte"),
+        Marker(101000),
+    ],
+    min_gv=101000,
+)
+
+GV_110600_SCHEMA = Schema(
+    [
+        Field("ub20", "bool"),
+        Marker(110600),
+    ],
+    min_gv=110600,
+)
+
+GV_110800_SCHEMA = Schema(
+    [
+        Field("ub21", "bool"),
+        Field("dojo_3x_speed", "bool"),
+        Field("ub22", "bool"),
+        Field("ub23", "bool"),
+        Marker(110800),
+    ]
+)
+
+GV_111000_SCHEMA = Schema(
+    [
+        Field("ui17", "int"),
+        Field("ush4", "short"),
+        Field("uby7", "byte"),
+        Field("uby8", "byte"),
+        Field("ub24", "bool"),
+        Field("uby9", "byte"),
+        Field("ushl1", "short_list", length_type="byte"),
+        Field("ushl2", "short_list", length_type="short"),
+        Field("ushl3", "short_list", length_type="short"),
+        Field("ui18", "int"),
+        Field("ui19", "int"),
+        Field("ui20", "int"),
+        Field("ush5", "short"),
+        Field("ush6", "short"),
+        Field("ush7", "short"),
+        Field("ush8", "short"),
+        Field("uby10", "byte"),
+        Field("ub25", "bool"),
+        Field("ub26", "bool"),
+        Field("ub27", "bool"),
+        Field("ub28", "bool"),
+        Field("ub29", "bool"),
+        Field("ub30", "bool"),
+        Field("uby11", "byte"),
+        Field("ushl4", "short_list", length_type="short"),
+        Field("ubl3", "bool_list", length=14),
+        Field("labyrinth_medals", "short_list", length_type="byte"),
+        Marker(111000),
+    ],
+    min_gv=111000,
+)
+
+GV_120100_SCHEMA = Schema(
+    [
+        Field("ushl6", "short_list", length_type="short"),
+        Marker(120100),
+    ],
+    min_gv=120100,
+)
+
+GV_120200_SCHEMA = Schema(
+    [
+        Field("ub31", "bool"),
+        Field("ush9", "short"),
+    ]
+)
+
+GV_120400_SCHEMA = Schema(
+    [
+        Field("ud11", "double"),
+        Field("ud12", "double"),
+        Marker(120400),
+    ],
+    min_gv=120400,
+)
+
+GV_120500_SCHEMA = Schema(
+    [
+        Field("ub32", "bool"),
+        Field("ub33", "bool"),
+        Field("ub34", "bool"),
+        Field("ui21", "int"),
+        Field("golden_cpu_count", "byte"),
+        Marker(120500),
+    ],
+    min_gv=120500,
+)
+
+GV_120600_SCHEMA = Schema(
+    [
+        Field("sound_effects_volume", "byte"),
+        Field("background_music_volume", "byte"),
+        Marker(120600),
+    ],
+    min_gv=120600,
+)
+
+GV_130400_SCHEMA = Schema(
+    [
+        Field("ud13", "double"),
+        Field("ud14", "double"),
+        Marker(130400),
+    ],
+    min_gv=130400,
+)
+
+GV_130600_SCHEMA = Schema(
+    [
+        Field("uby14", "byte"),
+        Field("ush12", "short", jp=False),
+        Marker(130600),
+    ],
+    min_gv=130600,
+)
+
+GV_130700_SCHEMA = Schema(
+    [
+        Field("ush12", "short", jp=True),
+        Field("ud15", "double"),
+        Field("uby15", "byte"),
+        Field("uby16", "byte"),
+        Field("ush11", "short"),
+        Field("uby17", "byte"),
+        Field("uby18", "byte"),
+        Field("uby19", "byte"),
+        Field("ud16", "double"),
+    ]
+)
+
+GV_140000_SCHEMA = Schema(
+    [
+        Field("ui22", "int"),
+        Field("ud17", "double"),
+        Field("uby20", "byte"),
+    ]
+)
+
+GV_140000_2_SCHEMA = Schema(
+    [
+        Field("uil9", "int_list", length_type="short"),
+        Field("ub35", "bool"),
+        Field("ud18", "double"),
+    ]
+)
+
+GV_140100_SCHEMA = Schema(
+    [
+        Field("uby21", "byte"),
+        Marker(140100),
+    ],
+    min_gv=140100,
+    max_gv=140499,
+)
+
+GV_140300_SCHEMA = Schema(
+    [
+        Field("uil11", "byte_list", length_type="byte"),
+        Field("ui24", "int", min_gv=150300),
+        Field("ub38", "bool", min_gv=150300),
+        Field("ub39", "bool", min_gv=150500),
+        Field("ub36", "bool"),
+        Field("treasure_chests", "int_list", length_type="byte"),
+        Field("ui23", "int"),
+        Field("uil13", "int_list", length_type="short"),
+        Field("ub37", "bool"),
+        Marker(140300),
+    ],
+    min_gv=140300,
+)
+
+SAVE_SECTIONS = [
+    "aku",
+    "battle_items",
+    "beacon_base",
+    "behemoth_culling",
+    "cat_scratcher",
+    "cat_shrine",
+    "catamin_stages",
+    "cats",
+    "challenge",
+    "cleared_slots",
+    "collab_gauntlets",
+    "dojo",
+    "dojo_chapters",
+    "enigma",
+    "enigma_clears",
+    "event_stages",
+    "ex_stages",
+    "gamatoto",
+    "gatya",
+    "gauntlets",
+    "item_pack",
+    "item_reward_stages",
+    "legend_quest",
+    "lineups",
+    "logins",
+    "map_resets",
+    "medals",
+    "missions",
+    "mysale",
+    "officer_pass",
+    "ototo",
+    "outbreaks",
+    "scheme_items",
+    "special_skills",
+    "stamp_data",
+    "story",
+    "talent_orbs",
+    "timed_score_stages",
+    "tower",
+    "uncanny",
+    "unlock_popups",
+    "user_rank_rewards",
+    "wildcat_slots",
+    "zero_legends",
+]
+
+for section_name in SAVE_SECTIONS:
+    setattr(SaveFile, section_name, SaveSection(section_name))
@@ -0,0 +1,88 @@
+from __future__ import annotations
+import datetime
+from typing import Any, Generator
+from bcsfe import core
+from bcsfe.core.game_version import GameVersion
+from bcsfe.core.io.save import SaveFile
+
+
+class TrackedSaveFile(SaveFile):
+    """A save file that records the names of the attributes set on it, so that
+    `SaveReader` can tell when the loader has reached a value."""
+
+    set_names: set[str]
+
+    def __setattr__(self, name: str, value: Any):
+        self.__dict__.setdefault("set_names", set()).add(name)
+        super().__setattr__(name, value)
+
+
+class SaveReader:
+    # values that can't be added to by later sections once they are set
+    PLAIN_TYPES = (
+        type(None),
+        bool,
+        int,
+        float,
+        str,
+        bytes,
+        datetime.datetime,
+        GameVersion,
+    )
+
+    def __init__(self, data: core.Data, cc: core.CountryCode | None = None):
+        """Reads values from save data without loading all of it.
+
+        The save format has no section lengths, so the save is parsed in order
+        as far as the section that sets a value. Plain values near the start of
+        the save, such as `catfood`, are quick to read. Objects such as `cats`
+        can be added to by later sections, so reading one parses the rest of
+        the save. Use `core.SaveFile` to edit or save the data.
+
+        Args:
+            data (core.Data): The save data
+            cc (core.CountryCode | None, optional): Country code to use if it
+                can't be detected. Defaults to None.
+        """
+        self.save_file = TrackedSaveFile(data, cc, load=False)
+        # forget the defaults set by init_save
+        self.save_file.set_names = set()
+        self.loader: Generator[None, None, None] | None = self.save_file.iter_load()
+
+    def read_section(self) -> bool:
+        """Parse the next top-level section of the save.
+
+        Returns:
+            bool: False if the whole save has been parsed
+        """
+        if self.loader is None:
+            return False
+        try:
+            next(self.loader)
+        except StopIteration:
+            self.loader = None
+            return False
+        except Exception as e:
+            self.loader = None
+            self.save_file.handle_load_error(e)
+            return False
+        return True
+
+    def get(self, name: str) -> Any:
+        """Get a value from the save, parsing the save as far as needed.
+
+        Args:
+            name (str): The name of the `core.SaveFile` attribute
+
+        Raises:
+            AttributeError: If the save file has no such attribute
+
+        Returns:
+            Any: The value
+        """
+        while name not in self.save_file.set_names and self.read_section():
+            pass
+        if not isinstance(self.save_file.__dict__.get(name), SaveReader.PLAIN_TYPES):
+            while self.read_section():
+                pass
+        return getattr(self.save_file, name)
@@ -0,0 +1,293 @@
+from __future__ import annotations
+import struct
+from typing import Any
+from bcsfe import core
+
+
+class Field:
+    # struct format character of each fixed-width type
+    FORMATS = {"int": "i", "bool": "b", "byte": "b", "short": "h", "double": "d"}
+    DEFAULTS: dict[str, Any] = {
+        "int": 0,
+        "bool": False,
+        "byte": 0,
+        "short": 0,
+        "double": 0.0,
+        "string": "",
+    }
+
+    def __init__(
+        self,
+        name: str,
+        type: str,
+        length: int | None = None,
+        min_gv: int | None = None,
+        max_gv: int | None = None,
+        jp: bool | None = None,
+        length_type: str | None = None,
+        key: str | None = None,
+    ):
+        """A single field of the save format.
+
+        Args:
+            name (str): Name of the save file attribute
+            type (str): Type of the field, e.g `int`, `bool`, `double`, `string`,
+                a list of one of those, e.g `int_list`, or a `Data` dict type,
+                e.g `int_bool_dict`
+            length (int | None, optional): Fixed length of a list field. If None
+                the length is read from the data. Defaults to None.
+            min_gv (int | None, optional): First game version with the field.
+                Defaults to None.
+            max_gv (int | None, optional): Last game version with the field.
+                Defaults to None.
+            jp (bool | None, optional): If True the field only exists in jp saves,
+                if False it only exists in non-jp saves. Defaults to None.
+            length_type (str | None, optional): Type of the length stored before
+                a list or dict field if it isn't an int, e.g `short` or `byte`.
+                Defaults to None.
+            key (str | None, optional): Key of the field in `to_dict` if it isn't
+                the name. Defaults to None.
+        """
+        self.name = name
+        self.type = type
+        self.length = length
+        self.min_gv = min_gv
+        self.max_gv = max_gv
+        self.jp = jp
+        self.length_type = length_type
+        self.key = key or name
+
+        self.is_list = type.endswith("_list")
+        self.is_dict = type.endswith("_dict")
+        self.item_type = type[: -len("_list")] if self.is_list else type
+
+    def applies(self, gv: int, is_jp: bool) -> bool:
+        if self.min_gv is not None and gv < self.min_gv:
+            return False
+        if self.max_gv is not None and gv > self.max_gv:
+            return False
+        if self.jp is not None and self.jp != is_jp:
+            return False
+        return True
+
+    def get_format(self) -> str | None:
+        """Get the struct format of the field, or None if the field is not fixed
+        width."""
+        fmt = Field.FORMATS.get(self.item_type)
+        if fmt is None:
+            return None
+        if self.is_list:
+            if self.length is None:
+                return None
+            return f"{self.length}{fmt}"
+        return fmt
+
+    def get_default(self) -> Any:
+        if self.is_list:
+            return []
+        if self.is_dict:
+            return {}
+        return Field.DEFAULTS[self.item_type]
+
+
+class Marker(Field):
+    def __init__(
+        self,
+        value: int,
+        min_gv: int | None = None,
+        max_gv: int | None = None,
+        jp: bool | None = None,
+    ):
+        """A constant int that ends a block of the save format. It is checked
+        when reading and written as is. It has no attribute and is not part of
+        the dict.
+
+        Args:
+            value (int): The value of the marker
+            min_gv (int | None, optional): First game version with the marker.
+                Defaults to None.
+            max_gv (int | None, optional): Last game version with the marker.
+                Defaults to None.
+            jp (bool | None, optional): If True the marker only exists in jp
+                saves, if False it only exists in non-jp saves. Defaults to None.
+        """
+        super().__init__(f"marker_{value}", "int", min_gv=min_gv, max_gv=max_gv, jp=jp)
+        self.value = value
+
+
+class PackedStep:
+    def __init__(self, fields: list[Field], endiness: str):
+        """A run of adjacent fixed-width fields read and written with a single
+        struct call."""
+        self.fields = fields
+        self.struct = struct.Struct(
+            endiness + "".join(field.get_format() or "" for field in fields)
+        )
+
+    def read(self, obj: Any, data: core.Data):
+        values = self.struct.unpack_from(data.data, data.pos)
+        data.pos += self.struct.size
+        i = 0
+        for field in self.fields:
+            if field.is_list:
+                length = field.length or 0
+                value: Any = list(values[i : i + length])
+                if field.item_type == "bool":
+                    value = [item != 0 for item in value]
+                i += length
+            else:
+                value = values[i]
+                i += 1
+                if isinstance(field, Marker):
+                    assert value == field.value
+                    continue
+                if field.type == "bool":
+                    value = value != 0
+            setattr(obj, field.name, value)
+
+    def write(self, obj: Any, data: core.Data):
+        values: list[Any] = []
+        for field in self.fields:
+            if isinstance(field, Marker):
+                values.append(field.value)
+                continue
+            value = getattr(obj, field.name)
+            if field.is_list:
+                length = field.length or 0
+                if length > len(value):
+                    value += [Field.DEFAULTS[field.item_type]] * (length - len(value))
+                values.extend(map(int, value[:length]))
+            elif field.type == "double":
+                values.append(value)
+            else:
+                values.append(int(value))
+        data.write_bytes(self.struct.pack(*values))
+
+
+class FieldStep:
+    def __init__(self, field: Field):
+        """A variable width field read and written with the `Data` methods."""
+        self.field = field
+        self.name = field.name
+        self.read_func = f"read_{field.type}"
+        self.write_func = f"write_{field.type}"
+        self.length_type = field.length_type
+
+    def read(self, obj: Any, data: core.Data):
+        if self.length_type is not None:
+            length = getattr(data, f"read_{self.length_type}")()
+            value = getattr(data, self.read_func)(length)
+        elif self.field.is_list:
+            value = getattr(data, self.read_func)(self.field.length)
+        else:
+            value = getattr(data, self.read_func)()
+        setattr(obj, self.name, value)
+
+    def write(self, obj: Any, data: core.Data):
+        value = getattr(obj, self.name)
+        if self.length_type is not None:
+            getattr(data, f"write_{self.length_type}")(len(value))
+            getattr(data, self.write_func)(value, write_length=False)
+        elif self.field.is_list:
+            getattr(data, self.write_func)(
+                value,
+                write_length=self.field.length is None,
+                length=self.field.length,
+            )
+        else:
+            getattr(data, self.write_func)(value)
+
+
+class Schema:
+    def __init__(
+        self,
+        fields: list[Field],
+        min_gv: int | None = None,
+        max_gv: int | None = None,
+    ):
+        """A declarative description of a run of save file fields. The reader
+        and writer for a game version are compiled once and cached. Adjacent
+        fixed-width fields are merged into a single struct call.
+
+        Args:
+            fields (list[Field]): The fields in the order they are stored
+            min_gv (int | None, optional): First game version with any of the
+                fields. Defaults to None.
+            max_gv (int | None, optional): Last game version with any of the
+                fields. Defaults to None.
+        """
+        self.fields = fields
+        self.data_fields = [field for field in fields if not isinstance(field, Marker)]
+        self.min_gv = min_gv
+        self.max_gv = max_gv
+        self.plans: dict[tuple[int, bool, str], list[PackedStep | FieldStep]] = {}
+
+    def applies(self, gv: int) -> bool:
+        if self.min_gv is not None and gv < self.min_gv:
+            return False
+        if self.max_gv is not None and gv > self.max_gv:
+            return False
+        return True
+
+    def compile(
+        self, gv: int, is_jp: bool, endiness: str = "<"
+    ) -> list[PackedStep | FieldStep]:
+        """Get the steps to read or write the fields for a game version.
+
+        Args:
+            gv (int): The game version
+            is_jp (bool): Whether the save is a jp save
+            endiness (str, optional): Struct byte order. Defaults to "<".
+
+        Returns:
+            list[PackedStep | FieldStep]: The steps
+        """
+        key = (gv, is_jp, endiness)
+        cached = self.plans.get(key)
+        if cached is not None:
+            return cached
+
+        plan: list[PackedStep | FieldStep] = []
+        packed: list[Field] = []
+        fields = self.fields if self.applies(gv) else []
+        for field in fields:
+            if not field.applies(gv, is_jp):
+                continue
+            if field.get_format() is not None:
+                packed.append(field)
+                continue
+            if packed:
+                plan.append(PackedStep(packed, endiness))
+                packed = []
+            plan.append(FieldStep(field))
+        if packed:
+            plan.append(PackedStep(packed, endiness))
+
+        self.plans[key] = plan
+        return plan
+
+    def get_plan(self, save_file: core.SaveFile) -> list[PackedStep | FieldStep]:
+        return self.compile(
+            save_file.game_version.game_version,
+            save_file.is_jp(),
+            save_file.data.endiness,
+        )
+
+    def read(self, save_file: core.SaveFile):
+        for step in self.get_plan(save_file):
+            step.read(save_file, save_file.data)
+
+    def write(self, save_file: core.SaveFile):
+        for step in self.get_plan(save_file):
+            step.write(save_file, save_file.data)
+
+    def serialize(self, obj: Any) -> dict[str, Any]:
+        return {field.key: getattr(obj, field.name) for field in self.data_fields}
+
+    def deserialize(self, obj: Any, data: dict[str, Any]):
+        for field in self.data_fields:
+            setattr(obj, field.name, data.get(field.key, field.get_default()))
+
+    def init(self, obj: Any):
+        for field in self.data_fields:
+            setattr(obj, field.name, field.get_default())
@@ -1,6 +1,11 @@
 from __future__ import annotations
-from typing import Callable, Any, Iterable
+from typing import Callable, Any, Iterable, TypeVar
+import concurrent.futures
 import threading
+import traceback
+from bcsfe import core
+
+T = TypeVar("T")
 
 
 class Thread:
@@ -37,40 +42,186 @@ class Thread:
         return thread
 
 
-def thread_run_many_helper(funcs: list[Callable[..., Any]], *args: list[Any]):
-    for i in range(len(funcs)):
-        args_ = args[i]
-        funcs[i](*args_)
-    return
+class ThreadPool:
+    def __init__(self, max_workers: int = 32, name: str = "bcsfe_pool"):
+        """A bounded pool of reusable worker threads.
+
+        Args:
+            max_workers (int, optional): Maximum number of worker threads.
+                Defaults to 32.
+            name (str, optional): Prefix of the worker thread names. Defaults to
+                "bcsfe_pool".
+        """
+        self.max_workers = max_workers
+        self.local = threading.local()
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix=name, initializer=self.init_worker
+        )
 
+    def init_worker(self):
+        self.local.is_worker = True
 
-def thread_run_many(
-    funcs: list[Callable[..., Any]], args: Any = None, max_threads: int = 16
-) -> list[Thread]:
-    chunk_size = len(funcs) // max_threads
-    if chunk_size == 0:
-        chunk_size = 1
-    callable_chunks: list[list[Callable[..., Any]]] = []
-    args_chunks: list[list[Any]] = []
-    for i in range(0, len(funcs), chunk_size):
-        callable_chunks.append(funcs[i : i + chunk_size])
-        args_chunks.append(args[i : i + chunk_size])
-
-    threads: list[Thread] = []
-    for i in range(len(callable_chunks)):
-        args_ = args_chunks[i]
+    def is_worker(self) -> bool:
+        return getattr(self.local, "is_worker", False)
+
+    def submit(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future[T]:
+        """Run a function on the pool.
+
+        Args:
+            func (Callable[..., T]): The function to run
+            *args (Any): Positional arguments for the function
+            **kwargs (Any): Keyword arguments for the function
+
+        Returns:
+            concurrent.futures.Future[T]: The future of the result
+        """
+        if self.is_worker():
+            # a task waiting on tasks queued behind it could deadlock the pool,
+            # so run nested work straight away
+            future: concurrent.futures.Future[T] = concurrent.futures.Future()
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+        return self.executor.submit(func, *args, **kwargs)
+
+    def submit_background(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future[T]:
+        """Run a function on the pool without waiting for its result. An
+        exception raised by the function is printed and logged, like one raised
+        in a thread would be, instead of being kept in the future unseen.
+
+        Args:
+            func (Callable[..., T]): The function to run
+            *args (Any): Positional arguments for the function
+            **kwargs (Any): Keyword arguments for the function
+
+        Returns:
+            concurrent.futures.Future[T]: The future of the result
+        """
+        future = self.submit(func, *args, **kwargs)
+        future.add_done_callback(ThreadPool.report_exception)
+        return future
+
+    @staticmethod
+    def report_exception(future: concurrent.futures.Future[Any]):
+        if future.cancelled():
+            return
+        exception = future.exception()
+        if exception is None:
+            return
+        traceback.print_exception(type(exception), exception, exception.__traceback__)
+        if isinstance(exception, Exception):
+            core.core_data.logger.log_exception(exception, "Background task failed")
+
+    def run_many(
+        self,
+        funcs: list[Callable[..., Any]],
+        args: list[Iterable[Any]] | None = None,
+        max_threads: int | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> list[Any]:
+        """Run many functions on the pool. A new function is started as soon as
+        one finishes, so a slow function doesn't hold up the others.
+
+        Args:
+            funcs (list[Callable[..., Any]]): The functions to run
+            args (list[Iterable[Any]] | None, optional): Arguments for each
+                function. Defaults to None.
+            max_threads (int | None, optional): Maximum number of functions to
+                run at once. Defaults to the pool size.
+            progress (Callable[[int, int], None] | None, optional): Called with
+                the number of finished functions and the total after each one
+                finishes. Defaults to None.
+            cancel_event (threading.Event | None, optional): If set, functions
+                that haven't started yet are cancelled. Defaults to None.
+
+        Raises:
+            concurrent.futures.CancelledError: If the run was cancelled
+
+        Returns:
+            list[Any]: The result of each function, in the same order as funcs.
+                The first exception raised by a function is re-raised after
+                cancelling the functions that haven't started.
+        """
+        total = len(funcs)
         if args is None:
-            args_ = []
-
-        threads.append(
-            Thread.run(
-                "run_many_helper",
-                thread_run_many_helper,
-                (callable_chunks[i], *args_),
-            )
-        )
+            args = [[] for _ in range(total)]
+        if max_threads is None or max_threads <= 0:
+            max_threads = self.max_workers
+
+        results: list[Any] = [None] * total
+        pending: dict[concurrent.futures.Future[Any], int] = {}
+        next_index = 0
+        done_count = 0
+        try:
+            while next_index < total or pending:
+                while (
+                    next_index < total
+                    and len(pending) < max_threads
+                    and not (cancel_event is not None and cancel_event.is_set())
+                ):
+                    future = self.submit(funcs[next_index], *args[next_index])
+                    pending[future] = next_index
+                    next_index += 1
+                if not pending:
+                    break
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+                    done_count += 1
+                    if progress is not None:
+                        progress(done_count, total)
+        finally:
+            for future in pending:
+                future.cancel()
+
+        if done_count < total:
+            raise concurrent.futures.CancelledError()
+        return results
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        self.executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+pool: ThreadPool | None = None
+pool_lock = threading.Lock()
+
+
+def get_thread_pool() -> ThreadPool:
+    """Get the thread pool shared by the whole program."""
+    global pool
+    with pool_lock:
+        if pool is None:
+            pool = ThreadPool()
+        return pool
+
+
+def thread_run_many(
+    funcs: list[Callable[..., Any]],
+    args: Any = None,
+    max_threads: int = 16,
+    progress: Callable[[int, int], None] | None = None,
+) -> list[Any]:
+    """Run many functions on the shared thread pool.
 
-    for thread in threads:
-        thread.join()
+    Args:
+        funcs (list[Callable[..., Any]]): The functions to run
+        args (Any, optional): Arguments for each function. Defaults to None.
+        max_threads (int, optional): Maximum number of functions to run at once.
+            Defaults to 16.
+        progress (Callable[[int, int], None] | None, optional): Called with the
+            number of finished functions and the total after each one finishes.
+            Defaults to None.
 
-    return threads
+    Returns:
+        list[Any]: The result of each function, in the same order as funcs
+    """
+    return get_thread_pool().run_many(funcs, args, max_threads, progress)
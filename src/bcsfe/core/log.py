@@ -1,30 +1,75 @@
 from __future__ import annotations
 
 """Module for handling logging"""
+import atexit
+import enum
+import os
+import threading
 import traceback
+from typing import IO
 from bcsfe import core
 import time
 
 
+class LogLevel(enum.IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+
 class Logger:
-    def __init__(self, path: core.Path | None):
+    def __init__(
+        self,
+        path: core.Path | None,
+        max_size: int = 5 * 1024 * 1024,
+        backup_count: int = 1,
+        buffer_lines: int = 32,
+    ):
         """
-        Initializes a Logger object
+        Initializes a Logger object. Messages are appended to the log file in
+        batches instead of rewriting the whole file.
+
+        Args:
+            path (core.Path | None): Path of the log file. Defaults to the state
+                folder.
+            max_size (int, optional): Size in bytes after which the log file is
+                rotated. Defaults to 5 MiB.
+            backup_count (int, optional): Number of rotated log files to keep.
+                Defaults to 1.
+            buffer_lines (int, optional): Number of messages below warning level
+                to buffer before writing them. Warnings and errors are always
+                written straight away. Defaults to 32.
         """
         if path is None:
             path = Logger.get_log_path()
         self.log_file = path
+        self.max_size = max_size
+        self.backup_count = backup_count
+        self.buffer_lines = buffer_lines
+
+        self.buffer: list[str] = []
+        self.lock = threading.RLock()
+        self.file: IO[bytes] | None = None
+        self.size = 0
         try:
-            self.log_data = self.log_file.read(True).split(b"\n")
+            self.open()
         except Exception as _:
-            self.log_data = None
+            self.file = None
+
+        atexit.register(self.close)
 
     @staticmethod
     def get_log_path() -> core.Path:
         return core.Path.get_state_folder().add("bcsfe.log")
 
     def is_log_enabled(self) -> bool:
-        return self.log_data is not None
+        return self.file is not None
+
+    def open(self):
+        self.log_file.parent().generate_dirs()
+        self.file = open(self.log_file.path, "ab")
+        self.size = self.file.tell()
 
     def get_time(self) -> str:
         """
@@ -35,6 +80,21 @@ class Logger:
         """
         return time.strftime("%d/%m/%Y %H:%M:%S", time.localtime())
 
+    def log(self, level: LogLevel, message: str):
+        """
+        Logs a message
+
+        Args:
+            level (LogLevel): The level of the message
+            message (str): The message to log
+        """
+        if self.file is None:
+            return
+        with self.lock:
+            self.buffer.append(f"[{level.name}]::{self.get_time()} - {message}\n")
+            if level >= LogLevel.WARNING or len(self.buffer) >= self.buffer_lines:
+                self.flush()
+
     def log_debug(self, message: str):
         """
         Logs a debug message
@@ -42,10 +102,7 @@ class Logger:
         Args:
             message (str): The message to log
         """
-        if self.log_data is None:
-            return
-        self.log_data.append(core.Data(f"[DEBUG]::{self.get_time()} - {message}"))
-        self.write()
+        self.log(LogLevel.DEBUG, message)
 
     def log_info(self, message: str):
         """
@@ -54,10 +111,7 @@ class Logger:
         Args:
             message (str): The message to log
         """
-        if self.log_data is None:
-            return
-        self.log_data.append(core.Data(f"[INFO]::{self.get_time()} - {message}"))
-        self.write()
+        self.log(LogLevel.INFO, message)
 
     def log_warning(self, message: str):
         """
@@ -66,10 +120,7 @@ class Logger:
         Args:
             message (str): The message to log
         """
-        if self.log_data is None:
-            return
-        self.log_data.append(core.Data(f"[WARNING]::{self.get_time()} - {message}"))
-        self.write()
+        self.log(LogLevel.WARNING, message)
 
     def log_error(self, message: str):
         """
@@ -78,10 +129,7 @@ class Logger:
         Args:
             message (str): The message to log
         """
-        if self.log_data is None:
-            return
-        self.log_data.append(core.Data(f"[ERROR]::{self.get_time()} - {message}"))
-        self.write()
+        self.log(LogLevel.ERROR, message)
 
     def log_exception(self, exception: Exception, extra_msg: str = ""):
         tb = traceback.format_exc()
@@ -95,13 +143,68 @@ class Logger:
             f"{extra_msg}: {exception.__class__.__name__}: {exception}\n{tb}"
         )
 
+    def flush(self):
+        """
+        Appends the buffered messages to the log file
+        """
+        with self.lock:
+            if self.file is None or not self.buffer:
+                return
+            data = "".join(self.buffer).encode("utf-8")
+            if self.size and self.size + len(data) > self.max_size:
+                try:
+                    self.rotate()
+                except OSError:
+                    # keep appending to the current file, the rotate is tried
+                    # again on the next flush
+                    pass
+            if not self.is_log_enabled():
+                return
+            try:
+                self.file.write(data)
+                self.file.flush()
+            except OSError:
+                # keep the messages buffered so the next flush tries again
+                return
+            self.buffer.clear()
+            self.size += len(data)
+
     def write(self):
         """
         Writes the log data to the log file
         """
-        if self.log_data is None:
-            return
-        self.log_file.write(core.Data.from_many(self.log_data, core.Data("\n")).strip())
+        self.flush()
+
+    def rotate(self):
+        """
+        Moves the log file to `<name>.1`, shifting older log files up, and starts
+        a new log file. The log file is reopened even if moving it fails.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        path = self.log_file.path
+        try:
+            if self.backup_count > 0:
+                for i in range(self.backup_count - 1, 0, -1):
+                    if os.path.exists(f"{path}.{i}"):
+                        os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+                os.replace(path, f"{path}.1")
+            else:
+                os.remove(path)
+        finally:
+            self.open()
+
+    def close(self):
+        """
+        Writes any buffered messages and closes the log file
+        """
+        atexit.unregister(self.close)
+        with self.lock:
+            self.flush()
+            if self.file is not None:
+                self.file.close()
+                self.file = None
 
     def log_no_file_found(self, file_name: str):
         """
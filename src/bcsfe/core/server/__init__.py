@@ -3,6 +3,7 @@ from bcsfe.core.server import (
     headers,
     client_info,
     server_handler,
+    async_server_handler,
     game_data_getter,
     request,
     updater,
@@ -12,6 +13,7 @@ from bcsfe.core.server import (
 __all__ = [
     "managed_item",
     "server_handler",
+    "async_server_handler",
     "headers",
     "client_info",
     "game_data_getter",
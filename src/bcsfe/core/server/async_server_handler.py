@@ -0,0 +1,261 @@
+"""Asyncio driver for the server flows of many save files at once.
+
+Each step of a flow (auth token, save key, upload, transfer codes, backup,
+managed items) runs the blocking `ServerHandler` method for it on the shared
+thread pool. Steps are retried on their own instead of restarting the whole
+chain, and the number of requests in flight to each host is limited.
+"""
+
+from __future__ import annotations
+import asyncio
+import contextlib
+import time
+import urllib.parse
+from typing import Any, AsyncGenerator, Awaitable, Callable, Iterable, TypeVar
+from bcsfe import core
+
+T = TypeVar("T")
+
+
+class HostLimiter:
+    def __init__(self, max_concurrent: int = 4, min_interval: float = 0.0):
+        """Limits the requests made to each host.
+
+        Args:
+            max_concurrent (int, optional): Maximum number of requests in flight
+                to a single host. Defaults to 4.
+            min_interval (float, optional): Minimum number of seconds between the
+                start of two requests to a single host. Defaults to 0.0.
+        """
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self.semaphores: dict[str, asyncio.Semaphore] = {}
+        self.locks: dict[str, asyncio.Lock] = {}
+        self.last_start: dict[str, float] = {}
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        return urllib.parse.urlsplit(url).netloc
+
+    @contextlib.asynccontextmanager
+    async def limit(self, url: str) -> AsyncGenerator[None, None]:
+        host = HostLimiter.get_host(url)
+        semaphore = self.semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent)
+            self.semaphores[host] = semaphore
+            self.locks[host] = asyncio.Lock()
+        async with semaphore:
+            if self.min_interval > 0:
+                async with self.locks[host]:
+                    wait = self.last_start.get(host, 0.0) + self.min_interval
+                    wait -= time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    self.last_start[host] = time.monotonic()
+            yield
+
+
+class AsyncServerHandler:
+    def __init__(
+        self,
+        handler: core.ServerHandler,
+        limiter: HostLimiter | None = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+    ):
+        """Runs the server flows of a `ServerHandler` as asyncio coroutines.
+
+        Auth tokens and passwords are cached in the save file by the
+        `ServerHandler` so a retried step only makes the requests that failed.
+
+        Args:
+            handler (core.ServerHandler): The handler of the save file
+            limiter (HostLimiter | None, optional): Limiter shared by all of the
+                handlers that run at the same time. Defaults to None.
+            retries (int, optional): Number of times to retry a failed step.
+                Defaults to 3.
+            backoff (float, optional): Seconds to wait before the first retry of
+                a step, doubled for each later retry. Defaults to 0.5.
+        """
+        self.handler = handler
+        self.limiter = limiter if limiter is not None else HostLimiter()
+        self.retries = retries
+        self.backoff = backoff
+        self.save_key: dict[str, Any] | None = None
+
+    @staticmethod
+    def from_save_file(
+        save_file: core.SaveFile, limiter: HostLimiter | None = None
+    ) -> AsyncServerHandler:
+        return AsyncServerHandler(core.ServerHandler(save_file, print=False), limiter)
+
+    async def run_step(self, url: str, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking step, retrying it while it returns None or False.
+
+        Args:
+            url (str): URL of the host the step talks to, used for rate limiting
+            func (Callable[..., T]): The step
+            *args (Any): Arguments for the step
+
+        Returns:
+            T: The result of the last attempt
+        """
+        delay = self.backoff
+        result = await self.attempt_step(url, func, *args)
+        for _ in range(self.retries):
+            if result is not None and result is not False:
+                break
+            await asyncio.sleep(delay)
+            delay *= 2
+            result = await self.attempt_step(url, func, *args)
+        return result
+
+    async def attempt_step(self, url: str, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        executor = core.get_thread_pool().executor
+        async with self.limiter.limit(url):
+            return await loop.run_in_executor(executor, func, *args)
+
+    async def get_auth_token(self) -> str | None:
+        return await self.run_step(self.handler.auth_url, self.handler.get_auth_token)
+
+    async def get_save_key(self) -> dict[str, Any] | None:
+        auth_token = await self.get_auth_token()
+        if auth_token is None:
+            return None
+        self.save_key = await self.run_step(
+            self.handler.save_url, self.handler.get_save_key_new, auth_token
+        )
+        return self.save_key
+
+    async def upload_save_data(self) -> bool:
+        """Upload the save data, getting a save key first if needed.
+
+        The auth token and save key are fetched as their own steps, so each
+        request is only limited by the host it is sent to.
+
+        Returns:
+            bool: Whether the upload succeeded
+        """
+        delay = self.backoff
+        for attempt in range(self.retries + 1):
+            if attempt > 0:
+                await asyncio.sleep(delay)
+                delay *= 2
+            save_key = self.save_key
+            if save_key is None:
+                save_key = await self.get_save_key()
+                if save_key is None:
+                    return False
+            url = save_key.get("url")
+            if url is None:
+                url = self.handler.aws_url
+            if await self.attempt_step(url, self.handler.upload_save_data, save_key):
+                return True
+            # the save key may have expired, so get a new one on the next try
+            self.save_key = None
+        return False
+
+    async def get_codes(
+        self, upload_managed_items: bool = True
+    ) -> tuple[str, str] | None:
+        """Upload the save data and get its transfer and confirmation codes.
+
+        Args:
+            upload_managed_items (bool, optional): Whether to send the managed
+                items with the transfer. Defaults to True.
+
+        Returns:
+            tuple[str, str] | None: The transfer code and confirmation code
+        """
+        self.handler.save_file.show_ban_message = False
+        if not await self.upload_save_data() or self.save_key is None:
+            return None
+        auth_token = await self.get_auth_token()
+        if auth_token is None:
+            return None
+        return await self.run_step(
+            self.handler.save_url,
+            self.handler.get_transfer_codes,
+            self.save_key,
+            auth_token,
+            upload_managed_items,
+        )
+
+    async def upload_meta_data(self) -> bool:
+        """Upload the save data as a backup along with the managed items.
+
+        Returns:
+            bool: Whether the backup succeeded
+        """
+        if not await self.upload_save_data() or self.save_key is None:
+            return False
+        auth_token = await self.get_auth_token()
+        if auth_token is None:
+            return False
+        return await self.run_step(
+            self.handler.save_url,
+            self.handler.upload_backup,
+            self.save_key,
+            auth_token,
+        )
+
+    async def update_managed_items(self) -> bool:
+        if await self.get_auth_token() is None:
+            return False
+        return await self.run_step(
+            self.handler.managed_item_url, self.handler.update_managed_items
+        )
+
+    @staticmethod
+    async def run_many(
+        handlers: Iterable[AsyncServerHandler],
+        flow: Callable[[AsyncServerHandler], Awaitable[T]],
+    ) -> list[T | BaseException]:
+        """Run a flow for many handlers at the same time.
+
+        Args:
+            handlers (Iterable[AsyncServerHandler]): The handlers
+            flow (Callable[[AsyncServerHandler], Awaitable[T]]): The flow to
+                run, e.g `AsyncServerHandler.get_codes`
+
+        Returns:
+            list[T | BaseException]: The result of each handler, in order. An
+                exception raised by one handler doesn't stop the others.
+        """
+        return await asyncio.gather(
+            *(flow(handler) for handler in handlers), return_exceptions=True
+        )
+
+    @staticmethod
+    def get_codes_many(
+        save_files: Iterable[core.SaveFile],
+        upload_managed_items: bool = True,
+        max_concurrent: int = 4,
+    ) -> list[tuple[str, str] | None | BaseException]:
+        """Get the transfer codes of many save files at the same time.
+
+        Args:
+            save_files (Iterable[core.SaveFile]): The save files
+            upload_managed_items (bool, optional): Whether to send the managed
+                items with each transfer. Defaults to True.
+            max_concurrent (int, optional): Maximum number of requests in flight
+                to a single host. Defaults to 4.
+
+        Returns:
+            list[tuple[str, str] | None | BaseException]: The codes of each save
+                file, in order
+        """
+
+        async def run() -> list[tuple[str, str] | None | BaseException]:
+            limiter = HostLimiter(max_concurrent)
+            handlers = [
+                AsyncServerHandler.from_save_file(save_file, limiter)
+                for save_file in save_files
+            ]
+            return await AsyncServerHandler.run_many(
+                handlers, lambda handler: handler.get_codes(upload_managed_items)
+            )
+
+        return asyncio.run(run())
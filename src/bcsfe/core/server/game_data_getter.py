@@ -1,16 +1,83 @@
 from __future__ import annotations
-from io import BytesIO
-from typing import Any, Callable
+import io
+import lzma
+import os
+import pickle
+import threading
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
 from bcsfe.cli import color, dialog_creator
 
 import tarfile
 import json
 
-from bcsfe import core
+import requests
+
+from bcsfe import core, __version__
+
+T = TypeVar("T")
+
+
+class DownloadStream(io.RawIOBase):
+    def __init__(
+        self, part_path: core.Path, existing: int, chunks: Iterator[bytes] | None
+    ):
+        """File-like object that first reads the already downloaded part of a
+        file and then the rest of the response, appending each chunk to the
+        part file so that the download can be resumed if it is interrupted.
+
+        Args:
+            part_path (core.Path): Path of the partially downloaded file
+            existing (int): Number of bytes of the part file to read first
+            chunks (Iterator[bytes] | None): Chunks of the rest of the response
+        """
+        super().__init__()
+        self.part_file = open(part_path.path, "rb") if existing else None
+        self.remaining_part = existing
+        self.out_file = open(part_path.path, "ab" if existing else "wb")
+        self.chunks = chunks
+        self.buffer = bytearray()
+        self.finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = 1 << 62
+        if self.part_file is not None and self.remaining_part > 0:
+            data = self.part_file.read(min(size, self.remaining_part))
+            self.remaining_part -= len(data)
+            if data:
+                return data
+        while len(self.buffer) < size and not self.finished:
+            chunk = next(self.chunks, None) if self.chunks is not None else None
+            if chunk is None:
+                self.finished = True
+                break
+            self.out_file.write(chunk)
+            self.buffer += chunk
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    def close(self):
+        if self.part_file is not None:
+            self.part_file.close()
+        self.out_file.close()
+        super().close()
 
 
 class GameDataGetter:
+    # bump when the format of the parsed game data cache changes
+    CACHE_VERSION = 2
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    PARTIAL_DOWNLOAD_SUFFIX = ".tar.xz.part"
+
+    # one lock per part file, so only one thread writes to it at a time
+    download_locks: dict[str, threading.Lock] = {}
+    download_locks_lock = threading.Lock()
+
     @staticmethod
     def repo_url() -> str:
         return core.core_data.config.get_game_data_repo()
@@ -143,34 +210,229 @@ class GameDataGetter:
             return None
         return path.add(pack_name).generate_dirs().add(file_name)
 
-    def download_version_data(self):
+    def get_partial_download_path(self) -> core.Path | None:
+        if self.version is None:
+            return None
+        return GameDataGetter.get_partial_download_path_version(self.cc, self.version)
+
+    @staticmethod
+    def get_partial_download_path_version(
+        cc: core.CountryCode, version: str
+    ) -> core.Path:
+        return (
+            GameDataGetter.get_game_data_dir()
+            .add(cc.get_code())
+            .generate_dirs()
+            .add(f"{version}{GameDataGetter.PARTIAL_DOWNLOAD_SUFFIX}")
+        )
+
+    @staticmethod
+    def get_partial_download_versions(cc: core.CountryCode) -> list[core.GameVersion]:
+        dir = GameDataGetter.get_game_data_dir().add(cc.get_code())
+        if not dir.exists():
+            return []
+        versions: list[core.GameVersion] = []
+        for file in dir.get_files():
+            name = file.basename()
+            if name.endswith(GameDataGetter.PARTIAL_DOWNLOAD_SUFFIX):
+                versions.append(
+                    core.GameVersion.from_string(
+                        name[: -len(GameDataGetter.PARTIAL_DOWNLOAD_SUFFIX)]
+                    )
+                )
+        return versions
+
+    def download_version_data(self, files: set[str] | None = None) -> bool | None:
+        """Download the game data archive and extract it while it is being
+        downloaded. The downloaded bytes are kept in a part file until the
+        archive is complete, so an interrupted download continues where it
+        stopped.
+
+        Args:
+            files (set[str] | None, optional): Only extract these files, given as
+                `pack_name/file_name`. The download stops once they have all been
+                extracted. Defaults to None (extract everything).
+
+        Returns:
+            bool | None: True if the files were extracted, None otherwise,
+                including if some of the requested files aren't in the archive
+        """
         if self.url is None or self.filepath is None or self.version is None:
             return None
         url = self.url + self.filepath
+        part_path = self.get_partial_download_path()
+        if part_path is None:
+            return None
+
+        with GameDataGetter.get_download_lock(part_path):
+            # another thread may have extracted the files while this one waited
+            if self.has_downloaded():
+                return True
+            if files is not None and all(self.is_extracted(name) for name in files):
+                return True
+            return self.stream_version_data(url, part_path, files)
+
+    @staticmethod
+    def get_download_lock(part_path: core.Path) -> threading.Lock:
+        with GameDataGetter.download_locks_lock:
+            lock = GameDataGetter.download_locks.get(part_path.path)
+            if lock is None:
+                lock = threading.Lock()
+                GameDataGetter.download_locks[part_path.path] = lock
+            return lock
+
+    def is_extracted(self, name: str) -> bool:
+        path = self.get_version_path()
+        if path is None:
+            return False
+        return path.add(*name.split("/")).exists()
+
+    def stream_version_data(
+        self, url: str, part_path: core.Path, files: set[str] | None
+    ) -> bool | None:
+        if self.version is None:
+            return None
 
         if self.print:
             color.color_print_key("downloading_compressed_data", url=url)
 
-        downloaded_data = core.RequestHandler(url).get()
-        if downloaded_data is None:
+        existing = part_path.get_file_size() if part_path.exists() else 0
+        headers = {"Range": f"bytes={existing}-"} if existing else None
+        response = core.RequestHandler(url, headers).get(stream=True)
+        if response is None:
             if self.print:
                 color.color_print_key("no_internet")
             return None
 
-        archive = tarfile.open(
-            name=None, mode="r:xz", fileobj=BytesIO(downloaded_data.content)
-        )
+        chunks: Iterator[bytes] | None = None
+        if response.status_code == 416:
+            # the part file is already the whole archive
+            pass
+        elif response.status_code == 206:
+            chunks = response.iter_content(GameDataGetter.DOWNLOAD_CHUNK_SIZE)
+        elif response.ok:
+            existing = 0
+            chunks = response.iter_content(GameDataGetter.DOWNLOAD_CHUNK_SIZE)
+        else:
+            response.close()
+            return None
 
         outdir = (
             GameDataGetter.get_game_data_dir().add(self.cc.get_code()).add(self.version)
         ).generate_dirs()
 
-        archive.extractall(outdir.path)
+        remaining = set(files) if files is not None else None
+        stream = DownloadStream(part_path, existing, chunks)
+        try:
+            with tarfile.open(fileobj=stream, mode="r|xz") as archive:
+                for member in archive:
+                    if remaining is not None:
+                        name = member.name
+                        if name.startswith("./"):
+                            name = name[2:]
+                        if name not in remaining:
+                            continue
+                        remaining.discard(name)
+                    archive.extract(member, outdir.path)
+                    if remaining is not None and not remaining:
+                        return True
+        except requests.exceptions.RequestException:
+            # keep the part file so the download can be resumed
+            return None
+        except (tarfile.TarError, lzma.LZMAError, EOFError):
+            stream.close()
+            part_path.remove()
+            return None
+        finally:
+            stream.close()
+            response.close()
 
+        if files is not None:
+            # keep the complete archive so the rest can be extracted later
+            if remaining:
+                return None
+            return True
+
+        part_path.remove()
         outdir.add("downloaded").write(core.Data())
 
         return True
 
+    def get_cache_path(self, name: str) -> core.Path | None:
+        path = self.get_version_path()
+        if path is None:
+            return None
+        return path.add("cache").generate_dirs().add(f"{name}.pickle")
+
+    def get_source_stamps(
+        self, sources: list[tuple[str, str]]
+    ) -> list[tuple[str, int, int]] | None:
+        """Get the path, modification time and size of each source file of a
+        cached value.
+
+        Args:
+            sources (list[tuple[str, str]]): The pack name and file name of each
+                source file
+
+        Returns:
+            list[tuple[str, int, int]] | None: The stamps, or None if a source
+                file hasn't been downloaded
+        """
+        stamps: list[tuple[str, int, int]] = []
+        for pack_name, file_name in sources:
+            path = self.get_file_path(pack_name, file_name)
+            if path is None or not path.exists():
+                return None
+            stat = os.stat(path.path)
+            stamps.append((path.to_str(), stat.st_mtime_ns, stat.st_size))
+        return stamps
+
+    def load_cached(
+        self,
+        name: str,
+        sources: list[tuple[str, str]],
+        parse: Callable[[], T | None],
+    ) -> T | None:
+        """Load parsed game data from the cache next to the extracted game data,
+        or parse it and cache the result. The cache is invalidated if a source
+        file changes or the editor is updated.
+
+        Args:
+            name (str): Name of the cache file
+            sources (list[tuple[str, str]]): The pack name and file name of each
+                file the value is parsed from
+            parse (Callable[[], T | None]): Function that parses the value. The
+                result must be picklable
+
+        Returns:
+            T | None: The parsed value
+        """
+        cache_path = self.get_cache_path(name)
+        stamps = self.get_source_stamps(sources)
+        if cache_path is not None and stamps is not None and cache_path.exists():
+            key = (GameDataGetter.CACHE_VERSION, __version__, stamps)
+            try:
+                cached_key, value = pickle.loads(cache_path.read().to_bytes())
+                if cached_key == key:
+                    return value
+            except Exception:
+                pass
+
+        value = parse()
+        if value is None or cache_path is None:
+            return value
+
+        # the source files may have only been downloaded by parse
+        stamps = self.get_source_stamps(sources)
+        if stamps is None:
+            return value
+        key = (GameDataGetter.CACHE_VERSION, __version__, stamps)
+        try:
+            cache_path.write(core.Data(pickle.dumps((key, value))))
+        except (OSError, pickle.PicklingError):
+            pass
+        return value
+
     def get_version_path(self) -> core.Path | None:
         if self.version is None:
             return None
@@ -302,25 +564,112 @@ class GameDataGetter:
         file_names: list[str],
         display_text: bool = True,
     ) -> list[tuple[str, core.Data] | None]:
-        pack_name = self.get_packname(pack_name)
-
-        callables: list[Callable[..., Any]] = []
-        args: list[tuple[str, str, int, bool]] = []
-        for file_name in file_names:
-            callables.append(self.download)
-            args.append((pack_name, file_name, 2, display_text))
-        core.thread_run_many(callables, args)
+        files = self.prefetch(
+            [(pack_name, file_name) for file_name in file_names], display_text
+        )
         data_list: list[tuple[str, core.Data] | None] = []
         for file_name in file_names:
-            path = self.get_file_path(pack_name, file_name)
-            if path is None:
-                data_list.append(None)
-            elif not path.exists():
+            data = files.get((pack_name, file_name))
+            if data is None:
                 data_list.append(None)
             else:
-                data_list.append((file_name, path.read()))
+                data_list.append((file_name, data))
         return data_list
 
+    def read_extracted(
+        self, pack_name: str, file_name: str, display_text: bool = True
+    ) -> core.Data | None:
+        path = self.get_file_path(pack_name, file_name)
+        if path is not None and path.exists():
+            try:
+                return path.read()
+            except FileNotFoundError:
+                pass
+        if display_text:
+            self.print_no_file(pack_name, file_name)
+        return None
+
+    def get_existing_files(self, pack_name: str) -> set[str]:
+        path = self.get_version_path()
+        if path is None:
+            return set()
+        path = path.add(self.get_packname(pack_name))
+        if not path.exists():
+            return set()
+        return set(os.listdir(path.path))
+
+    def prefetch(
+        self,
+        files: Iterable[tuple[str, str]],
+        display_text: bool = True,
+        max_workers: int = 8,
+    ) -> dict[tuple[str, str], core.Data | None]:
+        """Get a set of game data files in one go. Each pack directory is only
+        listed once, and the files that are missing are downloaded concurrently.
+
+        Args:
+            files (Iterable[tuple[str, str]]): The pack name and file name of each
+                file a feature needs
+            display_text (bool, optional): Whether to print download messages.
+                Defaults to True.
+            max_workers (int, optional): Maximum number of concurrent downloads.
+                Defaults to 8.
+
+        Returns:
+            dict[tuple[str, str], core.Data | None]: The data of each file, or
+                None if it couldn't be found
+        """
+        result: dict[tuple[str, str], core.Data | None] = {}
+        existing: dict[str, set[str]] = {}
+        missing: list[tuple[str, str]] = []
+        for pack_name, file_name in dict.fromkeys(files):
+            if pack_name not in existing:
+                existing[pack_name] = self.get_existing_files(pack_name)
+            if file_name not in existing[pack_name]:
+                missing.append((pack_name, file_name))
+                continue
+            path = self.get_file_path(pack_name, file_name)
+            if path is None:
+                result[(pack_name, file_name)] = None
+                continue
+            try:
+                result[(pack_name, file_name)] = path.read()
+            except FileNotFoundError:
+                missing.append((pack_name, file_name))
+
+        if not missing:
+            return result
+
+        if self.version is not None and not self.has_downloaded():
+            # the archive has every file, so download it once rather than once
+            # for each missing file, and stop once the needed files are found
+            downloaded_data = self.download_version_data(
+                {
+                    f"{self.get_packname(pack_name)}/{file_name}"
+                    for pack_name, file_name in missing
+                }
+            )
+            if downloaded_data is None:
+                # the download failed or some of the files aren't in the
+                # archive, so trying again for each file wouldn't find them
+                for pack_name, file_name in missing:
+                    result[(pack_name, file_name)] = self.read_extracted(
+                        pack_name, file_name, display_text
+                    )
+                return result
+
+        downloaded = core.thread_run_many(
+            [self.download] * len(missing),
+            [
+                (pack_name, file_name, 2, display_text)
+                for pack_name, file_name in missing
+            ],
+            max_threads=max_workers,
+        )
+        result.update(zip(missing, downloaded))
+
+        return result
+
     @staticmethod
     def get_downloaded_versions_region(cc: core.CountryCode) -> list[core.GameVersion]:
         versions: list[core.GameVersion] = []
@@ -349,21 +698,40 @@ class GameDataGetter:
     def delete(cc: core.CountryCode, gv: core.GameVersion):
         path = GameDataGetter.get_game_data_dir().add(cc.get_code()).add(gv.to_string())
         path.remove()
+        part_path = GameDataGetter.get_partial_download_path_version(cc, gv.to_string())
+        if part_path.exists():
+            part_path.remove()
+        core.core_data.game_data_registry.clear()
 
     @staticmethod
     def delete_region(cc: core.CountryCode):
         path = GameDataGetter.get_game_data_dir().add(cc.get_code())
         path.remove()
+        core.core_data.game_data_registry.clear()
 
     @staticmethod
     def delete_old_versions(to_keep: int) -> None:
         versions = GameDataGetter.get_all_downloaded_versions()
         for cc, cc_versions in versions.items():
             cc_versions.sort(reverse=True)
-            to_keep = min(to_keep, len(cc_versions))
-            for version in cc_versions[to_keep:]:
+            keep = min(to_keep, len(cc_versions))
+            for version in cc_versions[keep:]:
                 GameDataGetter.delete(cc, version)
 
+            kept = cc_versions[:keep]
+            for version in GameDataGetter.get_partial_download_versions(cc):
+                # a partial download of a version newer than the ones kept may
+                # still be resumed
+                if (
+                    to_keep > 0
+                    and version not in cc_versions
+                    and (not kept or version > kept[-1])
+                ):
+                    continue
+                GameDataGetter.get_partial_download_path_version(
+                    cc, version.to_string()
+                ).remove()
+
     def print_no_file(self, packname: str, file_name: str) -> None:
         if self.version is None:
             color.color_print_key("failed_to_get_game_versions")
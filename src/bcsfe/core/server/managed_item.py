@@ -141,9 +141,9 @@ class BackupMetaData:
     def add_managed_item(self, managed_item: ManagedItem):
         if managed_item.amount == 0:
             return
-        managed_items = self.get_managed_items()
-        managed_items.append(managed_item)
-        self.set_managed_items(managed_items)
+        self.save_file.store_string(
+            self.identifier, managed_item.to_short_form(), overwrite=False
+        )
 
     def remove_managed_items(self) -> None:
         self.save_file.remove_strings(self.identifier)
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import http.cookiejar
+import threading
+import urllib.parse
+
 import requests
+import requests.adapters
+import urllib3.util
 
 from bcsfe import core, cli
 
@@ -41,7 +47,16 @@ class MultipartForm:
 
 
 class RequestHandler:
-    """Handles HTTP requests."""
+    """Handles HTTP requests. Requests to the same host share a session so that
+    connections are reused."""
+
+    # should be at least the size of the shared thread pool
+    POOL_SIZE = 32
+    RETRY_BACKOFF = 0.5
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    sessions: dict[tuple[str, str, int], requests.Session] = {}
+    sessions_lock = threading.Lock()
 
     def __init__(
         self,
@@ -72,6 +87,78 @@ class RequestHandler:
             tm = core.core_data.config.get_default(core.ConfigKey.MAX_REQUEST_TIMEOUT)
         return tm
 
+    @staticmethod
+    def retries() -> int:
+        retries = core.core_data.config.get_int(core.ConfigKey.MAX_REQUEST_RETRIES)
+        if retries < 0:
+            retries = core.core_data.config.get_default(
+                core.ConfigKey.MAX_REQUEST_RETRIES
+            )
+        return retries
+
+    @staticmethod
+    def create_session(retries: int) -> requests.Session:
+        """Creates a session that keeps connections alive and retries idempotent
+        requests (e.g GET) that fail to connect or get a temporary error status.
+        POST requests are never retried. Sessions are shared by every request to
+        a host, including requests for different accounts, so cookies set by
+        the server are never stored or sent.
+
+        Args:
+            retries (int): Maximum number of retries.
+
+        Returns:
+            requests.Session: The session.
+        """
+        retry = urllib3.util.Retry(
+            total=retries,
+            backoff_factor=RequestHandler.RETRY_BACKOFF,
+            status_forcelist=RequestHandler.RETRY_STATUSES,
+            allowed_methods=urllib3.util.Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=RequestHandler.POOL_SIZE,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        # allow no domains, so no cookies are stored
+        session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        )
+        return session
+
+    @staticmethod
+    def get_session(url: str) -> requests.Session:
+        """Gets the shared session for the host of a url.
+
+        Args:
+            url (str): URL to request.
+
+        Returns:
+            requests.Session: The session.
+        """
+        parsed = urllib.parse.urlsplit(url)
+        retries = RequestHandler.retries()
+        key = (parsed.scheme, parsed.netloc, retries)
+        with RequestHandler.sessions_lock:
+            session = RequestHandler.sessions.get(key)
+            if session is None:
+                session = RequestHandler.create_session(retries)
+                RequestHandler.sessions[key] = session
+            return session
+
+    @staticmethod
+    def close_sessions():
+        with RequestHandler.sessions_lock:
+            for session in RequestHandler.sessions.values():
+                session.close()
+            RequestHandler.sessions.clear()
+
     def get(
         self,
         stream: bool = False,
@@ -83,7 +170,7 @@ class RequestHandler:
             requests.Response: Response from the server.
         """
         try:
-            return requests.get(
+            return RequestHandler.get_session(self.url).get(
                 self.url,
                 headers=self.headers,
                 timeout=(None if no_timeout else self.timeout()),
@@ -103,7 +190,7 @@ class RequestHandler:
             requests.Response: Response from the server.
         """
         try:
-            return requests.post(
+            return RequestHandler.get_session(self.url).post(
                 self.url,
                 headers=self.headers,
                 data=self.data.data,
@@ -403,6 +403,21 @@ class ServerHandler:
         if not self.upload_save_data(save_key):
             return self.get_codes(upload_managed_items, tries)
 
+        codes = self.get_transfer_codes(save_key, auth_token, upload_managed_items)
+        if codes is None:
+            return self.get_codes(upload_managed_items, tries)
+        if self.print:
+            print()
+        return codes
+
+    def get_transfer_codes(
+        self,
+        save_key: dict[str, Any],
+        auth_token: str,
+        upload_managed_items: bool = True,
+    ) -> tuple[str, str] | None:
+        """Get the transfer and confirmation codes for save data that has
+        already been uploaded with `save_key`."""
         self.print_key("getting_codes")
 
         bmd = core.BackupMetaData(self.save_file)
@@ -424,7 +439,7 @@ class ServerHandler:
                 RequestResult(url, response, headers, meta_data),
             )
             self.remove_stored_auth_token()
-            return self.get_codes(upload_managed_items, tries)
+            return None
         payload = json.get("payload", {})
         transfer_code = payload.get("transferCode", None)
         confirmation_code = payload.get("pin", None)
@@ -434,10 +449,8 @@ class ServerHandler:
                 RequestResult(url, response, headers, ""),
             )
             self.remove_stored_auth_token()
-            return self.get_codes(upload_managed_items, tries)
+            return None
         bmd.remove_managed_items()
-        if self.print:
-            print()
         return (transfer_code, confirmation_code)
 
     def has_managed_items(self) -> bool:
@@ -460,6 +473,11 @@ class ServerHandler:
         if not self.upload_save_data(save_key):
             return False
 
+        return self.upload_backup(save_key, auth_token)
+
+    def upload_backup(self, save_key: dict[str, Any], auth_token: str) -> bool:
+        """Register save data that has already been uploaded with `save_key` as
+        a backup, along with the managed items."""
         bmd = core.BackupMetaData(self.save_file)
         meta_data = bmd.create(save_key["key"])
 
@@ -0,0 +1,160 @@
+"""Benchmark the game data lookups done once per cat.
+
+Synthetic game data is built for an increasing number of cats and every lookup
+is made once per cat, the way the cat editors loop over the selected cats. The
+total time of each loop and the time per lookup are reported. With indexed
+lookups the time per lookup stays flat as the number of cats grows, so the
+loops scale linearly.
+
+Usage:
+    python -m tests.benchmark_lookups [--sizes 250 500 1000] [--repeat N]
+"""
+
+from __future__ import annotations
+import argparse
+import sys
+import time
+from typing import Any, Callable
+from bcsfe import core
+from bcsfe.core.game.catbase import cat, user_rank_rewards
+from bcsfe.core.game.gamoto import gamatoto
+
+
+def make_talent_data(total: int) -> core.TalentData:
+    skills: dict[int, cat.CatSkill] = {}
+    for cat_id in range(total):
+        cat_skills = [
+            cat.Skill(ability_id, 10, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+            for ability_id in range(cat_id % 5, cat_id % 5 + 5)
+        ]
+        skills[cat_id] = cat.CatSkill(cat_id, 0, cat_skills)
+    levels = [cat.SkillLevel(id, [1] * 10) for id in range(total)]
+    return core.TalentData(
+        cat.SkillNames({}), cat.SkillLevelData(levels), cat.CatSkills(skills)
+    )
+
+
+def make_picture_book(total: int) -> core.NyankoPictureBook:
+    cats = [
+        cat.NyankoPictureBookCatData(cat_id, True, False, 3, 0, 0, 0, 0, 0)
+        for cat_id in range(total)
+    ]
+    return core.NyankoPictureBook(None, cats)  # type: ignore
+
+
+def make_rank_gifts(total: int) -> core.RankGifts:
+    gifts = [user_rank_rewards.RankGift(i, i * 100, [(0, 1)]) for i in range(total)]
+    return core.RankGifts(None, gifts)  # type: ignore
+
+
+def make_gamatoto_levels(total: int) -> core.GamatotoLevels:
+    levels = [gamatoto.GamatotoLevel(i + 1, i * 100, 0, 0) for i in range(total)]
+    limit = gamatoto.GamatotoLimit(total, 0, 0)
+    return core.GamatotoLevels(None, levels, limit)  # type: ignore
+
+
+def make_orbs(total: int) -> core.OrbInfoList:
+    orbs = [
+        core.OrbInfo(
+            core.RawOrbInfo(i, i % 5, i // 50, [], i // 5 % 10),
+            f"grade_{i % 5}",
+            f"target_{i // 5 % 10}",
+            f"effect_{i // 50}",
+        )
+        for i in range(total)
+    ]
+    return core.OrbInfoList(orbs)
+
+
+def lookup_talents(total: int) -> Callable[[], Any]:
+    talent_data = make_talent_data(total)
+    return lambda: [
+        talent_data.get_skill_from_cat(cat_id, cat_id % 5 + 4)
+        for cat_id in range(total)
+    ]
+
+
+def lookup_skill_levels(total: int) -> Callable[[], Any]:
+    talent_data = make_talent_data(total)
+    return lambda: [talent_data.get_skill_level(id) for id in range(total)]
+
+
+def lookup_picture_book(total: int) -> Callable[[], Any]:
+    picture_book = make_picture_book(total)
+    return lambda: [picture_book.get_cat(cat_id) for cat_id in range(total)]
+
+
+def lookup_rank_gifts(total: int) -> Callable[[], Any]:
+    rank_gifts = make_rank_gifts(total)
+    return lambda: [rank_gifts.get_rank_gift(i * 100) for i in range(total)]
+
+
+def lookup_gamatoto_levels(total: int) -> Callable[[], Any]:
+    levels = make_gamatoto_levels(total)
+    return lambda: [levels.get_level_from_xp(i * 100 - 1) for i in range(total)]
+
+
+def lookup_orbs(total: int) -> Callable[[], Any]:
+    orbs = make_orbs(total)
+    components = [(orb.rank, orb.target, orb.effect) for orb in orbs.orb_info_list]
+    return lambda: [orbs.get_orb_from_components(*args) for args in components]
+
+
+LOOKUPS: dict[str, Callable[[int], Callable[[], Any]]] = {
+    "talents": lookup_talents,
+    "skill_levels": lookup_skill_levels,
+    "picture_book": lookup_picture_book,
+    "rank_gifts": lookup_rank_gifts,
+    "gamatoto": lookup_gamatoto_levels,
+    "orbs": lookup_orbs,
+}
+
+
+def time_lookup(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes: list[int], repeat: int = 5) -> dict[str, dict[int, float]]:
+    results: dict[str, dict[int, float]] = {}
+    for name, setup in LOOKUPS.items():
+        results[name] = {}
+        for total in sizes:
+            results[name][total] = time_lookup(setup(total), repeat)
+    return results
+
+
+def print_results(results: dict[str, dict[int, float]]):
+    print(f"{'lookup':<14} {'cats':>6} {'ms':>10} {'us/lookup':>10} {'growth':>8}")
+    for name, sizes in results.items():
+        previous: tuple[int, float] | None = None
+        for total, seconds in sizes.items():
+            growth = ""
+            if previous is not None:
+                # 1.00 means the loop grew in proportion to the number of cats
+                growth = f"{(seconds / previous[1]) / (total / previous[0]):.2f}"
+            print(
+                f"{name:<14} {total:>6} {seconds * 1000:>10.3f} "
+                f"{seconds / total * 1_000_000:>10.3f} {growth:>8}"
+            )
+            previous = (total, seconds)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser("benchmark_lookups")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000, 4000]
+    )
+    parser.add_argument("--repeat", "-r", type=int, default=5)
+    args = parser.parse_args()
+
+    print_results(run(args.sizes, args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""Benchmark the save parsing phases across a corpus of save files.
+
+Each save file is loaded, serialised, converted to and from json, and has its
+country code detected and hash verified. The time of each phase is reported as
+MB/s and saves/s, and a separate traced pass reports the peak memory and number
+of allocated blocks of each phase.
+
+Usage:
+    python -m tests.benchmark_parse [saves_dir] [--repeat N] [--save baseline.json]
+    python -m tests.benchmark_parse [saves_dir] --compare baseline.json
+
+When comparing, any phase that is slower than the baseline by more than the
+threshold (10% by default) is reported as a regression and the exit status is
+non-zero.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+from bcsfe import core
+
+
+def phase_load(data: core.Data) -> Callable[[], Any]:
+    save_file = core.SaveFile(data, load=False)
+    return save_file.load_wrapper
+
+
+def phase_to_data(data: core.Data) -> Callable[[], Any]:
+    save_file = core.SaveFile(data)
+    return save_file.to_data
+
+
+def phase_to_dict(data: core.Data) -> Callable[[], Any]:
+    save_file = core.SaveFile(data)
+    return save_file.to_dict
+
+
+def phase_from_dict(data: core.Data) -> Callable[[], Any]:
+    json_data = core.SaveFile(data).to_dict()
+    return lambda: core.SaveFile.from_dict(json_data, warn=False)
+
+
+def phase_detect_cc(data: core.Data) -> Callable[[], Any]:
+    save_file = core.SaveFile(data, load=False)
+    return save_file.detect_cc
+
+
+def phase_verify_hash(data: core.Data) -> Callable[[], Any]:
+    save_file = core.SaveFile(data, load=False)
+    return save_file.verify_hash
+
+
+# each phase builds its own fresh state so that caches from an earlier phase
+# (e.g the encoded section cache) don't make it look faster than it is
+PHASES: dict[str, Callable[[core.Data], Callable[[], Any]]] = {
+    "load": phase_load,
+    "to_data": phase_to_data,
+    "to_dict": phase_to_dict,
+    "from_dict": phase_from_dict,
+    "detect_cc": phase_detect_cc,
+    "verify_hash": phase_verify_hash,
+}
+
+
+def time_phase(
+    setup: Callable[[core.Data], Callable[[], Any]], data: core.Data, repeat: int
+) -> float:
+    """Get the best time of a phase over several runs. Setup is not timed."""
+    best = float("inf")
+    for _ in range(repeat):
+        func = setup(core.Data(data.to_bytes()))
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def trace_phase(
+    setup: Callable[[core.Data], Callable[[], Any]], data: core.Data
+) -> tuple[int, int]:
+    """Get the peak memory and number of allocated blocks that are still alive
+    after a single run of a phase."""
+    func = setup(core.Data(data.to_bytes()))
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return peak, blocks
+
+
+def load_saves(saves_path: core.Path) -> tuple[list[core.Data], dict[str, str]]:
+    """Read the save files in a directory, skipping any file that can't be
+    loaded as a save.
+
+    Args:
+        saves_path (core.Path): The directory
+
+    Returns:
+        tuple[list[core.Data], dict[str, str]]: The save data and the error
+            for each skipped file
+    """
+    saves: list[core.Data] = []
+    skipped: dict[str, str] = {}
+    for file in saves_path.get_files():
+        data = file.read()
+        try:
+            core.SaveFile(core.Data(data.to_bytes()))
+        except Exception as e:
+            skipped[file.basename()] = f"{type(e).__name__}: {e}"
+            continue
+        saves.append(data)
+    return saves, skipped
+
+
+def run(saves_path: core.Path | None = None, repeat: int = 5) -> dict[str, Any]:
+    if saves_path is None:
+        saves_path = core.Path(__file__).parent().add("saves")
+
+    saves, skipped = load_saves(saves_path)
+    if not saves:
+        raise ValueError(f"No save files found in {saves_path}")
+
+    total_bytes = sum(len(data) for data in saves)
+    results: dict[str, Any] = {
+        "saves": len(saves),
+        "bytes": total_bytes,
+        "repeat": repeat,
+        "skipped": skipped,
+        "phases": {},
+    }
+
+    for name, setup in PHASES.items():
+        seconds = 0.0
+        peak = 0
+        blocks = 0
+        for data in saves:
+            seconds += time_phase(setup, data, repeat)
+            save_peak, save_blocks = trace_phase(setup, data)
+            peak = max(peak, save_peak)
+            blocks += save_blocks
+
+        results["phases"][name] = {
+            "seconds": seconds,
+            "mb_per_second": total_bytes / seconds / 1_000_000,
+            "saves_per_second": len(saves) / seconds,
+            "peak_bytes": peak,
+            "blocks": blocks,
+        }
+
+    return results
+
+
+def print_results(results: dict[str, Any]):
+    for name, error in results.get("skipped", {}).items():
+        print(f"Skipped {name}: {error}")
+    print(
+        f"{results['saves']} saves, {results['bytes']} bytes, best of {results['repeat']}"
+    )
+    print(
+        f"{'phase':<12} {'seconds':>10} {'MB/s':>10} {'saves/s':>10} {'peak KiB':>10} {'blocks':>10}"
+    )
+    for name, phase in results["phases"].items():
+        print(
+            f"{name:<12} {phase['seconds']:>10.4f} {phase['mb_per_second']:>10.2f} "
+            f"{phase['saves_per_second']:>10.1f} {phase['peak_bytes'] / 1024:>10.1f} "
+            f"{phase['blocks']:>10}"
+        )
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Compare results against a baseline.
+
+    Args:
+        results (dict[str, Any]): The new results
+        baseline (dict[str, Any]): The baseline results
+        threshold (float): Allowed slowdown as a fraction of the baseline time
+
+    Returns:
+        list[str]: A message for each phase that regressed
+    """
+    regressions: list[str] = []
+    for name, phase in results["phases"].items():
+        base = baseline.get("phases", {}).get(name)
+        if base is None:
+            continue
+        ratio = phase["seconds"] / base["seconds"]
+        print(f"{name:<12} {ratio:>6.2f}x baseline time")
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name} is {(ratio - 1) * 100:.1f}% slower than the baseline"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser("benchmark_parse")
+    parser.add_argument("saves", nargs="?", help="directory of save files")
+    parser.add_argument("--repeat", "-r", type=int, default=5)
+    parser.add_argument("--save", "-s", help="write the results to a json file")
+    parser.add_argument("--compare", "-c", help="baseline json file to compare to")
+    parser.add_argument(
+        "--threshold",
+        "-t",
+        type=float,
+        default=0.1,
+        help="allowed slowdown compared to the baseline, as a fraction",
+    )
+    args = parser.parse_args()
+
+    core.core_data.init_data()
+
+    results = run(core.map_opt(args.saves, core.Path), args.repeat)
+    print_results(results)
+
+    if args.save is not None:
+        core.Path(args.save).write(core.Data(json.dumps(results, indent=4)))
+
+    if args.compare is not None:
+        baseline = json.loads(core.Path(args.compare).read().to_str())
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
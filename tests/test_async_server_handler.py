@@ -0,0 +1,261 @@
+"""Tests for the asyncio server flows, against a local HTTP server that stands in
+for the auth, save and upload servers."""
+
+from __future__ import annotations
+import asyncio
+import contextlib
+import http.server
+import json
+import pathlib
+import threading
+import time
+from typing import Any, AsyncGenerator, Iterator, cast
+import jwt
+import pytest
+from bcsfe import core
+
+
+class FakeServer(http.server.ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeRequestHandler)
+        self.lock = threading.Lock()
+        self.requests: list[str] = []
+        # number of times each path fails before it succeeds
+        self.failures: dict[str, int] = {}
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.upload_url: str | None = None
+        # requests and host slots taken by RecordingLimiter, in order
+        self.events: list[tuple[str, str]] = []
+
+    def get_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start_request(self, path: str, host: str) -> bool:
+        with self.lock:
+            self.requests.append(path)
+            self.events.append((path, host))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            failures = self.failures.get(path, 0)
+            if failures > 0:
+                self.failures[path] = failures - 1
+                return False
+            return True
+
+    def end_request(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def count(self, path: str) -> int:
+        with self.lock:
+            return self.requests.count(path)
+
+
+class FakeRequestHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any):
+        pass
+
+    def send_body(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_payload(self, payload: dict[str, Any] | None):
+        if payload is None:
+            body = {"statusCode": 0}
+        else:
+            body = {"statusCode": 1, "timestamp": int(time.time()), "payload": payload}
+        self.send_body(200, json.dumps(body).encode())
+
+    def handle_request(self):
+        server = cast(FakeServer, self.server)
+        path = self.path.split("?")[0]
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        ok = server.start_request(path, self.headers["host"])
+        try:
+            time.sleep(server.delay)
+            self.respond(path, body, ok)
+        finally:
+            server.end_request()
+
+    def respond(self, path: str, body: bytes, ok: bool):
+        server = cast(FakeServer, self.server)
+        if path == "/upload":
+            self.send_body(204 if ok else 500, b"")
+            return
+        if not ok:
+            self.send_payload(None)
+            return
+        if path in ("/v1/users", "/v1/user/password"):
+            self.send_payload(
+                {"password": "password", "passwordRefreshToken": "refresh_token"}
+            )
+        elif path == "/v1/tokens":
+            account_code = json.loads(body)["accountCode"]
+            token = jwt.encode(  # type: ignore
+                {"accountCode": account_code, "exp": int(time.time()) + 3600},
+                "secret" * 8,
+                algorithm="HS256",
+            )
+            self.send_payload({"token": token})
+        elif path == "/v2/save/key":
+            account_code = jwt.decode(  # type: ignore
+                self.headers["authorization"].removeprefix("Bearer "),
+                options={"verify_signature": False},
+            )["accountCode"]
+            self.send_payload(
+                {
+                    "key": f"backups/0/{account_code}/save",
+                    "url": server.upload_url or server.get_url() + "/upload",
+                }
+            )
+        elif path == "/v2/transfers":
+            self.send_payload({"transferCode": "transfer", "pin": "1234"})
+        else:
+            self.send_payload({})
+
+    def do_GET(self):
+        self.handle_request()
+
+    def do_POST(self):
+        self.handle_request()
+
+
+@pytest.fixture
+def server(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[FakeServer]:
+    core.core_data.init_data()
+    server = FakeServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for name in (
+        "auth_url",
+        "save_url",
+        "backups_url",
+        "aws_url",
+        "managed_item_url",
+    ):
+        monkeypatch.setattr(core.ServerHandler, name, server.get_url())
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        core.RequestHandler.close_sessions()
+
+
+def make_save(i: int = 0) -> core.SaveFile:
+    save_file = core.SaveFile(cc=core.CountryCode("en"), gv=core.GameVersion(130000))
+    save_file.inquiry_code = f"account{i}"
+    save_file.password_refresh_token = "refresh_token"
+    return save_file
+
+
+def make_handler(
+    save_file: core.SaveFile, limiter: core.HostLimiter | None = None
+) -> core.AsyncServerHandler:
+    return core.AsyncServerHandler(
+        core.ServerHandler(save_file, print=False), limiter, retries=3, backoff=0.01
+    )
+
+
+def get_codes(handler: core.AsyncServerHandler) -> tuple[str, str] | None:
+    return asyncio.run(handler.get_codes())
+
+
+def test_get_codes(server: FakeServer):
+    assert get_codes(make_handler(make_save())) == ("transfer", "1234")
+    assert server.count("/upload") == 1
+    assert server.count("/v2/transfers") == 1
+
+
+def test_failed_step_is_retried_alone(server: FakeServer):
+    server.failures["/v2/transfers"] = 2
+
+    assert get_codes(make_handler(make_save())) == ("transfer", "1234")
+    assert server.count("/v2/transfers") == 3
+    # the save data was only uploaded once
+    assert server.count("/upload") == 1
+
+
+def test_failed_upload_is_retried(server: FakeServer):
+    server.failures["/upload"] = 1
+
+    assert get_codes(make_handler(make_save())) == ("transfer", "1234")
+    assert server.count("/upload") == 2
+    # the auth token is kept between tries
+    assert server.count("/v1/tokens") == 1
+
+
+def test_step_gives_up_after_retries(server: FakeServer):
+    server.failures["/v2/transfers"] = 100
+
+    assert get_codes(make_handler(make_save())) is None
+    assert server.count("/v2/transfers") == 4
+    assert server.count("/upload") == 1
+
+
+def test_requests_per_host_are_limited(server: FakeServer):
+    server.delay = 0.05
+    limiter = core.HostLimiter(max_concurrent=2)
+    handlers = [make_handler(make_save(i), limiter) for i in range(6)]
+
+    results = asyncio.run(
+        core.AsyncServerHandler.run_many(handlers, lambda handler: handler.get_codes())
+    )
+
+    assert results == [("transfer", "1234")] * len(handlers)
+    assert server.max_in_flight == 2
+
+
+class RecordingLimiter(core.HostLimiter):
+    def __init__(self, server: FakeServer):
+        super().__init__()
+        self.server = server
+
+    @contextlib.asynccontextmanager
+    async def limit(self, url: str) -> AsyncGenerator[None, None]:
+        host = core.HostLimiter.get_host(url)
+        async with super().limit(url):
+            with self.server.lock:
+                self.server.events.append(("acquire", host))
+            try:
+                yield
+            finally:
+                with self.server.lock:
+                    self.server.events.append(("release", host))
+
+
+def check_held_hosts(server: FakeServer):
+    held: list[str] = []
+    for event, host in server.events:
+        if event == "acquire":
+            held.append(host)
+        elif event == "release":
+            held.remove(host)
+        else:
+            assert held == [host], event
+
+
+def test_requests_hold_their_host(server: FakeServer, monkeypatch: pytest.MonkeyPatch):
+    # the same server, but on a different host to the save server
+    other_url = server.get_url().replace("127.0.0.1", "localhost")
+    monkeypatch.setattr(core.ServerHandler, "auth_url", other_url)
+    server.upload_url = other_url + "/upload"
+    server.failures["/upload"] = 1
+
+    handler = make_handler(make_save(), RecordingLimiter(server))
+    assert get_codes(handler) == ("transfer", "1234")
+    check_held_hosts(server)
+
+    # a save key from an earlier upload, but no auth token yet
+    handler = make_handler(make_save(1), RecordingLimiter(server))
+    handler.save_key = {"key": "backups/0/account1/save", "url": server.upload_url}
+    assert asyncio.run(handler.upload_meta_data())
+    check_held_hosts(server)
+    assert server.count("/v2/backups") == 1
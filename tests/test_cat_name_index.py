@@ -0,0 +1,139 @@
+"""Tests for searching the names of every cat."""
+
+from __future__ import annotations
+import random
+from bcsfe.core.game.catbase.cat import CatNameIndex
+
+NAMES = {
+    0: ["Cat", "Macho Cat", "Macho Legs Cat"],
+    1: ["Tank Cat", "Wall Cat", "Eraser Cat"],
+    2: ["Axe Cat", "Brave Cat", "Crazed Cat"],
+    5: ["Catcatcat", ""],
+    3: [],
+    7: ["Ürün", "İnce"],
+}
+
+
+def naive_search(
+    names: dict[int, list[str]], search_name: str, prefix: bool = False
+) -> dict[int, str]:
+    search_name = search_name.lower()
+    matches: dict[int, str] = {}
+    for id in sorted(names):
+        for name in names[id]:
+            lower_name = name.lower()
+            if prefix:
+                found = lower_name.startswith(search_name)
+            else:
+                found = search_name in lower_name
+            if found:
+                matches.setdefault(id, name)
+    return matches
+
+
+def test_entries_are_in_id_order():
+    index = CatNameIndex(NAMES)
+
+    assert index.entries[:4] == [
+        (0, "Cat"),
+        (0, "Macho Cat"),
+        (0, "Macho Legs Cat"),
+        (1, "Tank Cat"),
+    ]
+    assert [id for id, _ in index.entries] == sorted(id for id, _ in index.entries)
+    for entry, start in enumerate(index.starts):
+        assert index.get_entry(start) == entry
+        name = index.entries[entry][1].lower()
+        assert index.text[start : start + len(name)] == name
+        # any offset inside a name, or the separator after it, maps to it
+        assert index.get_entry(start + len(name)) == entry
+
+
+def test_search_entries():
+    index = CatNameIndex(NAMES)
+
+    # every name of a cat that matches is listed, but each name only once
+    assert index.search_entries("cat") == [
+        entry for entry, (_, name) in enumerate(index.entries) if "cat" in name.lower()
+    ]
+    assert index.search_entries("catcatcat") == [index.entries.index((5, "Catcatcat"))]
+    assert index.search_entries("macho") == [1, 2]
+    assert index.search_entries("zzz") == []
+
+
+def test_search():
+    index = CatNameIndex(NAMES)
+
+    assert index.search("CAT") == {
+        0: "Cat",
+        1: "Tank Cat",
+        2: "Axe Cat",
+        5: "Catcatcat",
+    }
+    assert index.search("legs") == {0: "Macho Legs Cat"}
+    assert index.search("s c") == {0: "Macho Legs Cat"}
+    assert index.search("ürün") == {7: "Ürün"}
+    # the last name in the index
+    assert index.search("nce") == {7: "İnce"}
+
+
+def test_search_prefix():
+    index = CatNameIndex(NAMES)
+
+    assert index.search("cat", prefix=True) == {0: "Cat", 5: "Catcatcat"}
+    assert index.search("macho l", prefix=True) == {0: "Macho Legs Cat"}
+    assert index.search("legs", prefix=True) == {}
+    assert index.search("zzz", prefix=True) == {}
+    assert index.search_prefix_entries("wall") == [index.entries.index((1, "Wall Cat"))]
+
+
+def test_matches_do_not_cross_names():
+    index = CatNameIndex(NAMES)
+
+    # "Cat" followed by "Macho Cat"
+    assert index.search("catmacho") == {}
+    assert index.search("cat" + CatNameIndex.SEPARATOR + "macho") == {}
+    assert index.search(CatNameIndex.SEPARATOR) == {}
+    assert index.search("cat" + CatNameIndex.SEPARATOR, prefix=True) == {}
+
+
+def test_empty_query():
+    index = CatNameIndex(NAMES)
+
+    assert index.search_entries("") == list(range(len(index.entries)))
+    assert index.search("") == {
+        0: "Cat",
+        1: "Tank Cat",
+        2: "Axe Cat",
+        5: "Catcatcat",
+        7: "Ürün",
+    }
+    assert index.search("", prefix=True) == index.search("")
+
+
+def test_empty_index():
+    index = CatNameIndex({})
+
+    assert index.search("") == {}
+    assert index.search("cat") == {}
+    assert index.search("cat", prefix=True) == {}
+
+
+def test_matches_naive_search():
+    rng = random.Random(2)
+    letters = "abc "
+    names = {
+        id: [
+            "".join(rng.choice(letters) for _ in range(rng.randint(0, 8)))
+            for _ in range(rng.randint(0, 3))
+        ]
+        for id in range(200)
+    }
+    index = CatNameIndex(names)
+
+    for _ in range(300):
+        search_name = "".join(rng.choice(letters) for _ in range(rng.randint(0, 4)))
+        for prefix in (False, True):
+            assert index.search(search_name, prefix) == naive_search(
+                names, search_name, prefix
+            )
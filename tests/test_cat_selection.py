@@ -0,0 +1,114 @@
+"""Tests for the bitset of selected cats."""
+
+from __future__ import annotations
+import random
+from bcsfe import core
+
+
+def select(ids: list[int], total_cats: int) -> core.CatSelection:
+    return core.CatSelection.from_ids(ids, total_cats)
+
+
+def test_flags_round_trip():
+    flags = [1, 0, 1, 1, 0]
+    selection = core.CatSelection.from_flags(flags)
+
+    assert selection.total_cats == 5
+    assert selection.get_ids() == [0, 2, 3]
+    assert selection.get_flags() == bytes(flags)
+    assert list(selection) == [0, 2, 3]
+    assert len(selection) == 3
+
+    # unselected cats at either end still count towards the total
+    for flags in ([0, 0, 0, 1], [1, 0, 0, 0], [0, 0, 0, 0]):
+        selection = core.CatSelection.from_flags(flags)
+        assert selection.total_cats == 4
+        assert selection.get_flags() == bytes(flags)
+
+
+def test_large_selection():
+    rng = random.Random(1)
+    flags = [rng.random() < 0.3 for _ in range(1000)]
+    selection = core.CatSelection.from_flags(flags)
+    ids = [i for i, flag in enumerate(flags) if flag]
+
+    assert selection.get_ids() == ids
+    assert selection == select(ids, 1000)
+    assert selection.get_flags() == bytes(flags)
+    assert (~selection).get_ids() == [i for i, flag in enumerate(flags) if not flag]
+
+
+def test_from_column():
+    cats = core.Cats(6)
+    cats.unlocked[1] = 1
+    cats.unlocked[5] = 2
+
+    assert cats.select_unlocked() == select([1, 5], 6)
+    assert [cat.id for cat in cats.get_unlocked_cats()] == [1, 5]
+    assert [cat.id for cat in cats.get_non_unlocked_cats()] == [0, 2, 3, 4]
+    assert cats.select_all() == select(list(range(6)), 6)
+
+
+def test_empty():
+    for selection in (
+        core.CatSelection.from_flags([]),
+        core.CatSelection(0, 0),
+        core.CatSelection(0b101, -1),
+        core.Cats(0).select_all(),
+    ):
+        assert selection == core.CatSelection(0, 0)
+        assert selection.get_flags() == b""
+        assert selection.get_ids() == []
+        assert not selection
+        assert len(selection) == 0
+        assert ~selection == selection
+
+    assert not select([], 4)
+    assert ~select([], 4) == select([0, 1, 2, 3], 4)
+
+
+def test_ids_out_of_range():
+    selection = select([-1, 0, 3, 4, 100], 4)
+
+    assert selection.get_ids() == [0, 3]
+    assert 0 in selection
+    assert -1 not in selection
+    assert 4 not in selection
+    assert 1 not in selection
+
+
+def test_bits_are_masked():
+    selection = core.CatSelection(0b11111, 3)
+
+    assert selection.bits == 0b111
+    assert selection == select([0, 1, 2], 3)
+
+
+def test_invert():
+    selection = select([1], 4)
+
+    assert ~selection == select([0, 2, 3], 4)
+    assert ~~selection == selection
+    assert (~selection).bits >= 0
+
+
+def test_mixed_total_cats():
+    small = select([0, 1, 2], 3)
+    large = select([1, 4], 5)
+
+    assert small - large == select([0, 2], 5)
+    assert large - small == select([4], 5)
+    assert small & large == select([1], 5)
+    assert small | large == select([0, 1, 2, 4], 5)
+    assert large | small == small | large
+
+    # inverting a smaller selection doesn't select the cats it doesn't have
+    assert ~select([0], 3) | large == select([1, 2, 4], 5)
+    assert large - ~select([0], 3) == select([4], 5)
+    assert select([], 0) | large == large
+    assert large - select([], 0) == large
+
+
+def test_equality():
+    assert select([1], 3) != select([1], 4)
+    assert select([1], 3) != [1]
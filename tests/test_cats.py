@@ -0,0 +1,247 @@
+"""Tests for reading and writing the cat columns of a save, and setting the forms
+of many cats at once."""
+
+from __future__ import annotations
+import array
+from typing import Any
+import pytest
+from bcsfe import core
+from bcsfe.core.game.catbase.cat import Talent
+
+
+def make_cats(total_cats: int, gv: int) -> core.Cats:
+    cats = core.Cats.init(core.GameVersion(gv))
+    if len(cats) == 0:
+        cats = core.Cats(total_cats, len(cats.storage_items))
+    for i in range(len(cats)):
+        cats.unlocked[i] = i % 2
+        cats.upgrade_plus[i] = i % 90
+        cats.upgrade_base[i] = 60000 + i
+        cats.current_form[i] = i % 3
+        cats.unlocked_forms[i] = (i * 7) % 4
+        cats.gatya_seen[i] = (i + 1) % 2
+        cats.max_upgrade_plus[i] = 90
+        cats.max_upgrade_base[i] = 50
+        cats.catguide_collected[i] = i % 3 == 0
+        cats.fourth_form[i] = i % 3
+        cats.catseyes_used[i] = i * 11
+    cats.talents[1] = [Talent(3, 10), Talent(4, 1)]
+    cats.talents[len(cats) - 1] = []
+    if not cats.storage_items:
+        cats.storage_items = [core.StorageItem.init() for _ in range(3)]
+    for i, item in enumerate(cats.storage_items):
+        item.item_id = i
+        item.item_type = i % 3
+    cats.favourites = {0: True, 2: False}
+    cats.chara_new_flags = {1: 3, 4: 0}
+    return cats
+
+
+def write_sections(cats: core.Cats, gv: core.GameVersion) -> core.Data:
+    data = core.Data()
+    cats.write_unlocked(data, gv)
+    cats.write_upgrade(data, gv)
+    cats.write_current_form(data, gv)
+    cats.write_unlocked_forms(data, gv)
+    cats.write_gatya_seen(data, gv)
+    cats.write_max_upgrade_levels(data, gv)
+    cats.write_storage(data, gv)
+    cats.write_catguide_collected(data)
+    cats.write_fourth_forms(data)
+    cats.write_catseyes_used(data)
+    cats.write_favorites(data)
+    cats.write_chara_new_flags(data)
+    cats.write_talents(data)
+    return data
+
+
+def read_sections(data: core.Data, gv: core.GameVersion) -> core.Cats:
+    data.reset_pos()
+    cats = core.Cats.read_unlocked(data, gv)
+    cats.read_upgrade(data, gv)
+    cats.read_current_form(data, gv)
+    cats.read_unlocked_forms(data, gv)
+    cats.read_gatya_seen(data, gv)
+    cats.read_max_upgrade_levels(data, gv)
+    cats.read_storage(data, gv)
+    cats.read_catguide_collected(data)
+    cats.read_fourth_forms(data)
+    cats.read_catseyes_used(data)
+    cats.read_favorites(data)
+    cats.read_chara_new_flags(data)
+    cats.read_talents(data)
+    assert data.pos == len(data)
+    return cats
+
+
+@pytest.mark.parametrize("gv", [20, 25, 100000, 130000])
+def test_sections_round_trip(gv: int):
+    game_version = core.GameVersion(gv)
+    cats = make_cats(7, gv)
+
+    loaded = read_sections(write_sections(cats, game_version), game_version)
+
+    assert len(loaded) == len(cats)
+    assert loaded.serialize() == cats.serialize()
+    assert loaded.catguide_collected.typecode == "b"
+    assert loaded.talents[0] is None
+    assert loaded.talents[len(cats) - 1] == []
+
+
+def test_column_layout():
+    gv = core.GameVersion(130000)
+    cats = core.Cats(2)
+    cats.upgrade_plus[:] = array.array("i", [1, 2])
+    cats.upgrade_base[:] = array.array("i", [3, 4])
+    data = core.Data()
+    cats.write_upgrade(data, gv)
+
+    # the number of cats, then a plus and base ushort for each cat
+    assert data.to_bytes() == b"\x02\x00\x00\x00\x01\x00\x03\x00\x02\x00\x04\x00"
+    data.reset_pos()
+    assert cats.read_upgrade_columns(data, gv) == (
+        array.array("i", [1, 2]),
+        array.array("i", [3, 4]),
+    )
+
+    data = core.Data()
+    cats.write_upgrade(data, core.GameVersion(20))
+    assert len(data) == 8
+
+
+def test_counted_columns():
+    cats = core.Cats(4)
+    cats.catseyes_used[:] = array.array("i", [1, 2, 3, 4])
+
+    # a shorter section only sets the first cats
+    data = core.Data()
+    data.write_int(2)
+    data.write_int(7)
+    data.write_int(8)
+    data.reset_pos()
+    cats.read_catseyes_used(data)
+    assert list(cats.catseyes_used) == [7, 8, 3, 4]
+
+    data = core.Data()
+    data.write_int(5)
+    data.reset_pos()
+    with pytest.raises(IndexError):
+        cats.read_fourth_forms(data)
+
+
+def test_serialize_round_trip():
+    cats = make_cats(6, 130000)
+    serialized = cats.serialize()
+
+    loaded = core.Cats.deserialize(serialized)
+
+    assert loaded.serialize() == serialized
+    assert loaded.upgrade_base == cats.upgrade_base
+    assert loaded.catguide_collected == cats.catguide_collected
+
+
+def test_generated_save_has_no_cats():
+    core.core_data.init_data()
+    save_file = core.SaveFile(cc=core.CountryCode("en"), gv=core.GameVersion(130000))
+    assert len(save_file.cats) == 0
+
+    loaded = core.SaveFile(save_file.to_data())
+    assert len(loaded.cats) == 0
+    assert loaded.cats.serialize() == save_file.cats.serialize()
+
+
+class FakePictureBookCat:
+    def __init__(self, total_forms: int):
+        self.total_forms = total_forms
+
+
+class FakePictureBook:
+    def __init__(self, total_forms: dict[int, int]):
+        self.total_forms = total_forms
+
+    def get_cat(self, cat_id: int) -> FakePictureBookCat | None:
+        if cat_id not in self.total_forms:
+            return None
+        return FakePictureBookCat(self.total_forms[cat_id])
+
+
+class FakeCharaDrop:
+    def __init__(self):
+        self.cat_ids: list[int] = []
+
+    def unlock_drops_from_cat_id(self, cat_id: int):
+        self.cat_ids.append(cat_id)
+
+
+@pytest.fixture
+def save_file(monkeypatch: pytest.MonkeyPatch) -> core.SaveFile:
+    core.core_data.init_data()
+    save_file = core.SaveFile(cc=core.CountryCode("en"), gv=core.GameVersion(130000))
+    save_file.cats = core.Cats(6)
+    save_file.menu_unlocks = [0] * 6
+    # cat 5 isn't in the picture book
+    picture_book = FakePictureBook({0: 1, 1: 2, 2: 3, 3: 4, 4: 0})
+    chara_drop = FakeCharaDrop()
+
+    def read_nyanko_picture_book(self: core.Cats, save_file: core.SaveFile) -> Any:
+        return picture_book
+
+    def get_chara_drop(save: core.SaveFile) -> Any:
+        return chara_drop
+
+    monkeypatch.setattr(core.Cats, "read_nyanko_picture_book", read_nyanko_picture_book)
+    monkeypatch.setattr(core.core_data, "get_chara_drop", get_chara_drop)
+    return save_file
+
+
+def get_forms(cats: core.Cats) -> list[tuple[int, int, int, int]]:
+    return [
+        (cat.unlocked, cat.unlocked_forms, cat.current_form, cat.fourth_form)
+        for cat in cats.cats
+    ]
+
+
+def test_true_form_for_each_total_forms(save_file: core.SaveFile):
+    cats = save_file.cats
+    cats.current_form[4] = 1
+    cats.set_forms_true(save_file, cats.cats)
+
+    assert get_forms(cats) == [
+        (0, 0, 0, 0),
+        (0, 0, 1, 0),
+        (1, 3, 2, 0),
+        (1, 3, 2, 0),
+        (0, 0, 0, 0),
+        (0, 0, 0, 0),
+    ]
+    assert save_file.menu_unlocks[2] == 1
+
+
+def test_fourth_form_for_each_total_forms(save_file: core.SaveFile):
+    cats = save_file.cats
+    cats.fourth_form_cats(save_file, cats.cats)
+
+    assert get_forms(cats) == [
+        (0, 0, 0, 0),
+        (0, 0, 1, 0),
+        (1, 3, 2, 0),
+        (1, 3, 3, 2),
+        (0, 0, 0, 0),
+        (0, 0, 0, 0),
+    ]
+
+
+def test_forced_forms(save_file: core.SaveFile):
+    cats = save_file.cats
+    cats.true_form_cats(save_file, cats.cats[:3], force=True, set_current_forms=False)
+    cats.fourth_form_cats(save_file, cats.cats[3:], force=True)
+
+    assert get_forms(cats) == [(1, 3, 0, 0)] * 3 + [(1, 3, 3, 2)] * 3
+
+
+def test_no_cats(save_file: core.SaveFile):
+    cats = save_file.cats
+    cats.set_forms_true(save_file, [])
+
+    assert get_forms(cats) == [(0, 0, 0, 0)] * 6
+    assert save_file.menu_unlocks[2] == 0
@@ -0,0 +1,47 @@
+"""Tests for writing to `core.Data` without the explicit write buffer."""
+
+from __future__ import annotations
+from bcsfe import core
+
+
+def test_writes_are_appended():
+    data = core.Data(b"ab")
+    data.write_int(1)
+    data.write_short(2)
+    data.write_string("cd")
+
+    assert data.to_bytes() == b"ab\x01\x00\x00\x00\x02\x00\x02\x00\x00\x00cd"
+    assert len(data) == 14
+
+
+def test_reads_between_writes():
+    data = core.Data()
+    for i in range(100):
+        data.write_int(i)
+        assert len(data) == (i + 1) * 4
+
+    data.reset_pos()
+    assert data.read_int_list(100) == list(range(100))
+
+
+def test_replaced_data_is_written_to():
+    data = core.Data()
+    data.write_int(1)
+    data.set(b"xy")
+    data.write_byte(3)
+    assert data.to_bytes() == b"xy\x03"
+
+    data.write_byte(4)
+    data.clear()
+    data.write_byte(5)
+    assert data.to_bytes() == b"\x05"
+
+
+def test_copy_has_pending_writes():
+    data = core.Data()
+    data.write_int(7)
+    copy = core.Data(data)
+    data.write_int(8)
+
+    assert copy.to_bytes() == b"\x07\x00\x00\x00"
+    assert data.to_bytes() == b"\x07\x00\x00\x00\x08\x00\x00\x00"
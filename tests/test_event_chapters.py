@@ -0,0 +1,183 @@
+"""Tests for reading and writing the event, sol and collab map progress in each
+of the save layouts."""
+
+from __future__ import annotations
+import struct
+import pytest
+from bcsfe import core
+
+# map types, maps of each type, star difficulties and stages of each map
+TYPES, MAPS, STARS, STAGES = 2, 3, 2, 4
+TOTAL_STARS = TYPES * MAPS * STARS
+TOTAL_STAGES = TOTAL_STARS * STAGES
+
+SELECTED = [i % 5 for i in range(TOTAL_STARS)]
+PROGRESS = [i % 4 for i in range(TOTAL_STARS)]
+CLEARS = [(i * 7) % 300 for i in range(TOTAL_STAGES)]
+UNLOCKS = [i % 3 for i in range(TOTAL_STARS)]
+
+
+def pack(fmt: str, values: list[int]) -> bytes:
+    return struct.pack(f"<{len(values)}{fmt}", *values)
+
+
+def make_int_block() -> bytes:
+    """Save data from game versions 35 to 8.0.0, where each block of values is
+    stored after the lengths of the block."""
+    lengths = pack("i", [TYPES, MAPS, STARS])
+    return (
+        lengths
+        + pack("i", SELECTED)
+        + lengths
+        + pack("i", PROGRESS)
+        + pack("i", [TYPES, MAPS, STAGES, STARS])
+        + pack("i", CLEARS)
+        + lengths
+        + pack("i", UNLOCKS)
+    )
+
+
+def make_small_block() -> bytes:
+    """Save data from after game version 8.0.0, which stores the lengths once and
+    the values as bytes and shorts."""
+    return (
+        struct.pack("<BHBB", TYPES, MAPS, STARS, STAGES)
+        + pack("b", SELECTED)
+        + pack("b", PROGRESS)
+        + pack("h", CLEARS)
+        + pack("b", UNLOCKS)
+    )
+
+
+def read(raw: bytes, gv: int) -> core.EventChapters:
+    data = core.Data(raw)
+    chapters = core.EventChapters.read(data, core.GameVersion(gv))
+    assert data.pos == len(raw)
+    return chapters
+
+
+def write(chapters: core.EventChapters, gv: int) -> bytes:
+    data = core.Data()
+    chapters.write(data, core.GameVersion(gv))
+    return data.to_bytes()
+
+
+def check_values(chapters: core.EventChapters):
+    assert (
+        chapters.total_map_types,
+        chapters.total_subchapters,
+        chapters.stars_per_subchapter,
+        chapters.stages_per_subchapter,
+    ) == (TYPES, MAPS, STARS, STAGES)
+    assert list(chapters.selected_stages) == SELECTED
+    assert list(chapters.clear_progress) == PROGRESS
+    assert list(chapters.clear_amounts) == CLEARS
+    assert list(chapters.chapter_unlock_states) == UNLOCKS
+    for array in (
+        chapters.selected_stages,
+        chapters.clear_progress,
+        chapters.clear_amounts,
+        chapters.chapter_unlock_states,
+    ):
+        assert array.typecode == "i"
+
+
+@pytest.mark.parametrize("gv", [35, 50000, 80099])
+def test_int_layout(gv: int):
+    raw = make_int_block()
+    chapters = read(raw, gv)
+
+    check_values(chapters)
+    assert write(chapters, gv) == raw
+
+
+@pytest.mark.parametrize("gv", [80100, 130000])
+def test_small_layout(gv: int):
+    raw = make_small_block()
+    chapters = read(raw, gv)
+
+    check_values(chapters)
+    assert write(chapters, gv) == raw
+
+
+@pytest.mark.parametrize("gv, total_map_types", [(20, 3), (32, 3), (33, 4), (34, 4)])
+def test_fixed_layout(gv: int, total_map_types: int):
+    # 150 maps with 3 stars and 12 stages, with no lengths stored
+    total_stars = total_map_types * 150 * 3
+    selected = [i % 5 for i in range(total_stars)]
+    clears = [i % 1000 for i in range(total_stars * 12)]
+    raw = (
+        pack("i", selected)
+        + pack("i", selected[::-1])
+        + pack("i", clears)
+        + pack("i", [1] * total_stars)
+    )
+
+    chapters = read(raw, gv)
+    assert chapters.total_map_types == total_map_types
+    assert chapters.stages_per_subchapter == 12
+    assert list(chapters.clear_progress) == selected[::-1]
+    assert list(chapters.clear_amounts) == clears
+    assert write(chapters, gv) == raw
+
+
+def test_view_indexes():
+    chapters = read(make_small_block(), 130000)
+
+    # clear amounts are stored in (type, map, stage, star) order
+    sub_chapter = chapters.get_group(1).get_map(2).chapters[1]
+    map_index = 1 * MAPS + 2
+    assert [stage.clear_amount for stage in sub_chapter.stages] == [
+        CLEARS[(map_index * STAGES + stage) * STARS + 1] for stage in range(STAGES)
+    ]
+    assert sub_chapter.selected_stage == SELECTED[map_index * STARS + 1]
+
+
+def round_trip(chapters: core.EventChapters, gv: int) -> core.EventChapters:
+    loaded = read(write(chapters, gv), gv)
+    assert loaded.serialize() == chapters.serialize()
+
+    deserialized = core.EventChapters.deserialize(chapters.serialize())
+    assert deserialized.serialize() == chapters.serialize()
+    assert write(deserialized, gv) == write(chapters, gv)
+    return loaded
+
+
+@pytest.mark.parametrize("gv", [50000, 130000])
+def test_clear_round_trip(gv: int):
+    chapters = core.EventChapters(TYPES, MAPS, STARS, STAGES)
+    round_trip(chapters, gv)
+
+    chapters.clear_stage(0, 1, 0, STAGES - 1, clear_amount=5)
+    loaded = round_trip(chapters, gv)
+    sub_chapter = loaded.get_group(0).get_map(1).chapters[0]
+    assert sub_chapter.clear_progress == STAGES
+    assert sub_chapter.chapter_unlock_state == 3
+    assert sub_chapter.stages[STAGES - 1].clear_amount == 5
+    # the last stage unlocks the next star and the next map
+    assert loaded.get_group(0).get_map(1).chapters[1].chapter_unlock_state == 1
+    assert loaded.get_group(0).get_map(2).chapters[0].chapter_unlock_state == 1
+
+    chapters.clear_map(1, 0, 1)
+    loaded = round_trip(chapters, gv)
+    stars = loaded.get_group(1).get_map(0).chapters
+    assert [stage.clear_amount for stage in stars[1].stages] == [1] * STAGES
+    assert [stage.clear_amount for stage in stars[0].stages] == [0] * STAGES
+
+    chapters.clear_group(1)
+    chapters.clear_group(1)
+    loaded = round_trip(chapters, gv)
+    for stars in loaded.get_group(1).chapters:
+        for sub_chapter in stars.chapters:
+            assert sub_chapter.clear_progress == STAGES
+    assert loaded.get_group(1).get_map(0).chapters[1].stages[0].clear_amount == 3
+    assert loaded.get_group(1).get_map(2).chapters[0].stages[0].clear_amount == 2
+    # the other map type is unchanged
+    assert loaded.get_group(0).get_map(0).chapters[0].clear_progress == 0
+
+
+def test_deserialize_empty():
+    chapters = core.EventChapters.deserialize({})
+
+    assert chapters.serialize()["chapters"] == []
+    assert write(chapters, 130000) == b"\x00\x00\x00\x00\x00"
@@ -0,0 +1,258 @@
+"""Tests for downloading game data archives, against a local HTTP server that
+serves tests/fixtures/game_data.tar.xz for the en 12.0.0 game data."""
+
+from __future__ import annotations
+import http.server
+import json
+import pathlib
+import threading
+from typing import Any, Iterator, cast
+import pytest
+from bcsfe import core
+
+FIXTURE = pathlib.Path(__file__).parent / "fixtures" / "game_data.tar.xz"
+ARCHIVE_PATH = "en/12.0.0.tar.xz"
+ARCHIVE_FILES = {
+    "DataLocal/unitbuy.csv",
+    "DataLocal/SkillAcquisition.csv",
+    "resLocal/Unit_Explanation1_en.csv",
+}
+
+
+class GameDataServer(http.server.ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), GameDataRequestHandler)
+        self.archive = FIXTURE.read_bytes()
+        self.requests: list[dict[str, str]] = []
+        self.archive_available = True
+
+    def get_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+
+class GameDataRequestHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any):
+        pass
+
+    def send_body(self, status: int, body: bytes, headers: dict[str, str]):
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = cast(GameDataServer, self.server)
+        server.requests.append({"path": self.path, **self.headers})
+        if self.path == "/metadata.json":
+            metadata = {
+                "base_url": server.get_url(),
+                "versions": {"en": {"12.0.0": ARCHIVE_PATH}},
+            }
+            self.send_body(200, json.dumps(metadata).encode(), {})
+            return
+        if self.path != f"/{ARCHIVE_PATH}" or not server.archive_available:
+            self.send_body(404, b"", {})
+            return
+
+        archive = server.archive
+        range_header = self.headers.get("Range")
+        if range_header is None:
+            self.send_body(200, archive, {})
+            return
+        start = int(range_header.removeprefix("bytes=").split("-")[0])
+        if start >= len(archive):
+            self.send_body(416, b"", {"Content-Range": f"bytes */{len(archive)}"})
+            return
+        self.send_body(
+            206,
+            archive[start:],
+            {"Content-Range": f"bytes {start}-{len(archive) - 1}/{len(archive)}"},
+        )
+
+
+@pytest.fixture
+def server(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[GameDataServer]:
+    core.core_data.init_data()
+    server = GameDataServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(core, "game_data_path", core.Path(str(tmp_path)))
+    monkeypatch.setattr(
+        core.GameDataGetter,
+        "repo_url",
+        staticmethod(lambda: server.get_url() + "metadata.json"),
+    )
+    # small chunks so the archive is read in several parts
+    monkeypatch.setattr(core.GameDataGetter, "DOWNLOAD_CHUNK_SIZE", 1024)
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        core.RequestHandler.close_sessions()
+
+
+def make_getter() -> core.GameDataGetter:
+    return core.GameDataGetter(
+        core.CountryCode("en"), core.GameVersion.from_string("12.0.0"), False
+    )
+
+
+def get_version_path(getter: core.GameDataGetter) -> pathlib.Path:
+    path = getter.get_version_path()
+    assert path is not None
+    return pathlib.Path(path.path)
+
+
+def get_part_path(getter: core.GameDataGetter) -> pathlib.Path:
+    path = getter.get_partial_download_path()
+    assert path is not None
+    return pathlib.Path(path.path)
+
+
+def get_extracted(getter: core.GameDataGetter) -> set[str]:
+    version_path = get_version_path(getter)
+    return {
+        path.relative_to(version_path).as_posix()
+        for path in version_path.glob("*/*")
+        if path.is_file()
+    }
+
+
+def test_download_extracts_archive(server: GameDataServer):
+    getter = make_getter()
+    assert getter.download_version_data() is True
+
+    assert get_extracted(getter) == ARCHIVE_FILES
+    assert getter.has_downloaded()
+    assert not get_part_path(getter).exists()
+    data = (get_version_path(getter) / "DataLocal" / "unitbuy.csv").read_bytes()
+    assert data.startswith(b"0,")
+
+
+def test_download_resumes_part_file(server: GameDataServer):
+    getter = make_getter()
+    part_path = get_part_path(getter)
+    part_path.write_bytes(server.archive[:5000])
+
+    assert getter.download_version_data() is True
+
+    assert server.requests[-1]["Range"] == "bytes=5000-"
+    assert get_extracted(getter) == ARCHIVE_FILES
+    assert not part_path.exists()
+
+
+def test_download_complete_part_file(server: GameDataServer):
+    getter = make_getter()
+    get_part_path(getter).write_bytes(server.archive)
+
+    assert getter.download_version_data() is True
+    assert get_extracted(getter) == ARCHIVE_FILES
+
+
+def test_download_subset(server: GameDataServer):
+    getter = make_getter()
+    assert getter.download_version_data({"DataLocal/unitbuy.csv"}) is True
+
+    assert get_extracted(getter) == {"DataLocal/unitbuy.csv"}
+    assert not getter.has_downloaded()
+    # the downloaded part of the archive is kept for the rest of the files
+    assert get_part_path(getter).exists()
+
+    assert getter.download_version_data() is True
+    assert get_extracted(getter) == ARCHIVE_FILES
+
+
+def test_download_subset_missing_file(server: GameDataServer):
+    getter = make_getter()
+    files = {"DataLocal/unitbuy.csv", "DataLocal/not_in_archive.csv"}
+    assert getter.download_version_data(files) is None
+    assert get_extracted(getter) == {"DataLocal/unitbuy.csv"}
+
+
+def test_prefetch_extracts_needed_files(server: GameDataServer):
+    getter = make_getter()
+    files = getter.prefetch(
+        [("DataLocal", "SkillAcquisition.csv"), ("DataLocal", "missing.csv")],
+        display_text=False,
+    )
+
+    data = files[("DataLocal", "SkillAcquisition.csv")]
+    assert data is not None and data.to_bytes().startswith(b"0,")
+    assert files[("DataLocal", "missing.csv")] is None
+
+
+def test_delete_removes_part_file(server: GameDataServer):
+    getter = make_getter()
+    getter.download_version_data({"DataLocal/unitbuy.csv"})
+    part_path = get_part_path(getter)
+    version_path = get_version_path(getter)
+    assert part_path.exists()
+
+    core.GameDataGetter.delete(
+        core.CountryCode("en"), core.GameVersion.from_string("12.0.0")
+    )
+    assert not part_path.exists()
+    assert not version_path.exists()
+
+
+def test_delete_old_versions_removes_stale_part_files(server: GameDataServer):
+    getter = make_getter()
+    getter.download_version_data()
+    cc = core.CountryCode("en")
+    stale = core.GameDataGetter.get_partial_download_path_version(cc, "11.0.0")
+    newer = core.GameDataGetter.get_partial_download_path_version(cc, "13.0.0")
+    stale.write(core.Data(b"stale"))
+    newer.write(core.Data(b"newer"))
+
+    core.GameDataGetter.delete_old_versions(1)
+
+    assert not stale.exists()
+    assert newer.exists()
+    assert getter.has_downloaded()
+
+
+def get_archive_requests(server: GameDataServer) -> list[dict[str, str]]:
+    return [request for request in server.requests if request["path"].endswith("xz")]
+
+
+def test_prefetch_failed_download(server: GameDataServer):
+    getter = make_getter()
+    server.archive_available = False
+    files = getter.prefetch(
+        [("DataLocal", "unitbuy.csv"), ("DataLocal", "SkillAcquisition.csv")],
+        display_text=False,
+    )
+
+    assert files == {
+        ("DataLocal", "unitbuy.csv"): None,
+        ("DataLocal", "SkillAcquisition.csv"): None,
+    }
+    # the files aren't downloaded again one by one
+    assert len(get_archive_requests(server)) == 1
+
+
+def test_concurrent_downloads(server: GameDataServer):
+    getters = [make_getter() for _ in range(8)]
+    results: list[bool | None] = [None] * len(getters)
+    barrier = threading.Barrier(len(getters))
+
+    def download(i: int):
+        barrier.wait()
+        results[i] = getters[i].download_version_data()
+
+    threads = [
+        threading.Thread(target=download, args=(i,)) for i in range(len(getters))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * len(getters)
+    assert get_extracted(getters[0]) == ARCHIVE_FILES
+    assert len(get_archive_requests(server)) == 1
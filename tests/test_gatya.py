@@ -0,0 +1,36 @@
+"""Tests for fetching the gatya info pages."""
+
+from __future__ import annotations
+import pytest
+from bcsfe import core
+from bcsfe.core.game.catbase import gatya
+
+
+def test_failed_page_does_not_stop_others(monkeypatch: pytest.MonkeyPatch):
+    core.core_data.init_data()
+
+    def load_gatya_data_set(
+        self: core.GatyaDataSet, rarity: str, id: int
+    ) -> list[list[int]] | None:
+        return [[1], [2], [3], [4]]
+
+    def get_data(self: gatya.GatyaInfo) -> core.Data | None:
+        if self.gatya_id == 1:
+            raise ConnectionError("page failed")
+        self.data = core.Data(f"<h2>Banner {self.gatya_id}</h2>".encode())
+        return self.data
+
+    monkeypatch.setattr(core.GatyaDataSet, "load_gatya_data_set", load_gatya_data_set)
+    monkeypatch.setattr(gatya.GatyaInfo, "get_data", get_data)
+    save_file = core.SaveFile(cc=core.CountryCode("en"), gv=core.GameVersion(130000))
+
+    for threaded in [True, False]:
+        infos = core.GatyaInfos(save_file)
+        infos.get_all(threaded, print_progress=False)
+
+        assert [info is None for info in infos.infos] == [False, True, False, False]
+        assert infos.get_info(1) is None
+        names = infos.get_all_names()
+        assert names[0] == "Banner 0"
+        assert names[3] == "Banner 3"
+        assert names[1] == core.core_data.local_manager.get_key("unknown_banner")
@@ -0,0 +1,46 @@
+"""Tests for the buffered, rotating log file."""
+
+from __future__ import annotations
+import os
+import pytest
+from bcsfe import core
+
+
+def read_lines(path: core.Path) -> list[str]:
+    with open(path.path, "rb") as f:
+        return f.read().decode("utf-8").splitlines()
+
+
+def test_failed_rotate_keeps_messages(
+    tmp_path: os.PathLike[str], monkeypatch: pytest.MonkeyPatch
+):
+    path = core.Path(os.path.join(tmp_path, "bcsfe.log"))
+    logger = core.Logger(path, max_size=64, buffer_lines=1)
+    logger.log_info("a" * 60)
+
+    def fail_replace(src: str, dst: str):
+        raise OSError("file is locked")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    logger.log_info("second")
+    logger.log_info("third")
+    assert logger.file is not None
+    assert not logger.buffer
+
+    monkeypatch.undo()
+    logger.log_info("fourth")
+    logger.close()
+
+    lines = read_lines(path) + read_lines(core.Path(path.path + ".1"))
+    assert len(lines) == 4
+    for message in ["second", "third", "fourth"]:
+        assert any(line.endswith(message) for line in lines)
+
+
+def test_init_data_closes_old_logger():
+    core.core_data.init_data()
+    old_logger = core.core_data.logger
+
+    core.core_data.init_data()
+    assert core.core_data.logger is not old_logger
+    assert old_logger.file is None
@@ -0,0 +1,41 @@
+"""Tests for reading values from save data without loading all of it."""
+
+from __future__ import annotations
+import pytest
+from bcsfe import core
+
+
+def make_save_data() -> core.Data:
+    core.core_data.init_data()
+    save_file = core.SaveFile(cc=core.CountryCode("en"), gv=core.GameVersion(130000))
+    save_file.catfood = 1234
+    save_file.inquiry_code = "abcdef123"
+    save_file.battle_items.items[0].amount = 5
+    return save_file.to_data()
+
+
+def test_plain_value_stops_early():
+    reader = core.SaveReader(make_save_data())
+
+    assert reader.get("catfood") == 1234
+    assert reader.loader is not None
+
+    assert reader.get("inquiry_code") == "abcdef123"
+    assert reader.get("catfood") == 1234
+
+
+def test_object_parses_rest_of_save():
+    data = make_save_data()
+    reader = core.SaveReader(data.copy())
+
+    battle_items = reader.get("battle_items")
+    assert reader.loader is None
+    assert battle_items.items[0].amount == 5
+    assert reader.get("cats").serialize() == core.SaveFile(data).cats.serialize()
+
+
+def test_missing_attribute():
+    reader = core.SaveReader(make_save_data())
+
+    with pytest.raises(AttributeError):
+        reader.get("not_a_save_attribute")
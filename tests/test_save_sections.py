@@ -0,0 +1,125 @@
+"""Tests for the cached encoded save sections."""
+
+from __future__ import annotations
+import pathlib
+import sys
+import threading
+import pytest
+from bcsfe import core
+
+
+def make_save() -> core.SaveFile:
+    core.core_data.init_data()
+    save_file = core.SaveFile(cc=core.CountryCode("en"), gv=core.GameVersion(130000))
+    save_file.to_data()
+    return save_file
+
+
+def get_item_amount(save_file: core.SaveFile) -> int:
+    return core.SaveFile(save_file.to_data()).battle_items.items[0].amount
+
+
+def test_edit_after_save_is_kept():
+    save_file = make_save()
+    save_file.to_data()
+    save_file.battle_items.items[0].amount = 5
+    assert get_item_amount(save_file) == 5
+
+
+def test_edit_through_reference_held_across_saves():
+    save_file = make_save()
+    items = save_file.battle_items
+    save_file.to_data()
+    items.items[0].amount = 9
+    assert get_item_amount(save_file) == 9
+
+
+def test_untouched_sections_are_reused():
+    save_file = core.SaveFile(make_save().to_data())
+    assert save_file.exposed_sections == set()
+
+    first = save_file.to_data()
+    assert "cats.write_unlocked" in save_file.section_cache
+    save_file.catfood = 10
+    second = core.SaveFile(save_file.to_data())
+    assert second.catfood == 10
+    assert second.cats.serialize() == core.SaveFile(first).cats.serialize()
+
+    save_file.cats
+    assert save_file.exposed_sections == {"cats"}
+    save_file.to_data()
+    assert "cats.write_unlocked" not in save_file.section_cache
+
+
+def test_edit_while_save_is_queued(tmp_path: pathlib.Path):
+    save_file = make_save()
+    path = core.Path(str(tmp_path)).add("save.temp")
+
+    # hold the save back so the section is read after the save was started
+    # but before it runs
+    save_file.save_lock.acquire()
+    future = save_file.to_file_thread(path)
+    items = save_file.battle_items
+    save_file.save_lock.release()
+    future.result()
+
+    items.items[0].amount = 7
+    assert get_item_amount(save_file) == 7
+
+
+def test_edits_during_background_saves(tmp_path: pathlib.Path):
+    save_file = make_save()
+    path = core.Path(str(tmp_path)).add("save.temp")
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        lost = 0
+        for amount in range(1, 101):
+            future = save_file.to_file_thread(path)
+            save_file.battle_items.items[0].amount = amount
+            future.result()
+            if get_item_amount(save_file) != amount:
+                lost += 1
+    finally:
+        sys.setswitchinterval(interval)
+    assert lost == 0
+
+
+def test_dirty_sections_from_many_threads():
+    save_file = make_save()
+
+    def read_sections():
+        for _ in range(200):
+            save_file.battle_items
+            save_file.story
+
+    threads = [threading.Thread(target=read_sections) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for _ in range(20):
+        save_file.to_data()
+    for thread in threads:
+        thread.join()
+
+    save_file.battle_items.items[0].amount = 3
+    assert get_item_amount(save_file) == 3
+
+
+def test_background_save_error_is_reported(
+    tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+):
+    save_file = make_save()
+    # an invalid value makes encoding the save fail
+    save_file.catfood = "not a number"  # type: ignore
+    path = core.Path(str(tmp_path)).add("save.temp")
+
+    future = save_file.to_file_thread(path)
+    # callbacks run in the order they were added, so this one runs after the
+    # error has been reported
+    reported = threading.Event()
+    future.add_done_callback(lambda _: reported.set())
+    assert reported.wait(10)
+
+    assert future.exception() is not None
+    assert "Traceback" in capsys.readouterr().err
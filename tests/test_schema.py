@@ -0,0 +1,93 @@
+"""Tests for the declarative save field schema."""
+
+from __future__ import annotations
+from typing import Any
+import pytest
+from bcsfe import core
+from bcsfe.core.io.schema import Field, Marker, Schema
+
+
+class Obj:
+    def __init__(self, **values: Any):
+        self.__dict__.update(values)
+
+
+def write(schema: Schema, obj: Any, gv: int = 130000, is_jp: bool = False) -> bytes:
+    data = core.Data()
+    for step in schema.compile(gv, is_jp):
+        step.write(obj, data)
+    return data.to_bytes()
+
+
+def read(schema: Schema, raw: bytes, gv: int = 130000, is_jp: bool = False) -> Obj:
+    obj = Obj()
+    data = core.Data(raw)
+    for step in schema.compile(gv, is_jp):
+        step.read(obj, data)
+    assert data.pos == len(raw)
+    return obj
+
+
+def test_markers_are_written_and_checked():
+    schema = Schema([Field("a", "int"), Marker(44), Field("b", "bool")])
+
+    raw = write(schema, Obj(a=1, b=True))
+    assert raw == b"\x01\x00\x00\x00\x2c\x00\x00\x00\x01"
+    assert vars(read(schema, raw)) == {"a": 1, "b": True}
+    assert schema.serialize(Obj(a=1, b=True)) == {"a": 1, "b": True}
+
+    with pytest.raises(AssertionError):
+        read(schema, b"\x01\x00\x00\x00\x2d\x00\x00\x00\x01")
+
+
+def test_length_type():
+    schema = Schema(
+        [
+            Field("a", "short_list", length_type="byte"),
+            Field("b", "int_list", length_type="short"),
+        ]
+    )
+
+    raw = write(schema, Obj(a=[1, 2], b=[3]))
+    assert raw == b"\x02\x01\x00\x02\x00\x01\x00\x03\x00\x00\x00"
+    assert vars(read(schema, raw)) == {"a": [1, 2], "b": [3]}
+
+
+def test_version_and_region_predicates():
+    schema = Schema(
+        [
+            Field("a", "byte", jp=False),
+            Field("b", "byte", min_gv=100),
+            Field("c", "byte", max_gv=99),
+            Marker(7),
+        ],
+        min_gv=50,
+    )
+    obj = Obj(a=1, b=2, c=3)
+
+    assert write(schema, obj, gv=49) == b""
+    assert write(schema, obj, gv=99) == b"\x01\x03\x07\x00\x00\x00"
+    assert write(schema, obj, gv=100, is_jp=True) == b"\x02\x07\x00\x00\x00"
+
+
+def test_dict_key():
+    schema = Schema([Field("show_ban_message", "bool", key="banned")])
+    obj = Obj(show_ban_message=True)
+
+    assert schema.serialize(obj) == {"banned": True}
+    schema.deserialize(obj, {})
+    assert vars(obj) == {"show_ban_message": False}
+
+
+def test_save_fields_round_trip():
+    core.core_data.init_data()
+    save_file = core.SaveFile(cc=core.CountryCode("en"), gv=core.GameVersion(140100))
+    save_file.ui13 = 1
+    save_file.ui14 = 2
+    save_file.uby21 = 3
+
+    loaded = core.SaveFile(save_file.to_data())
+    assert (loaded.ui13, loaded.ui14, loaded.uby21) == (1, 2, 3)
+
+    from_dict = core.SaveFile.from_dict(loaded.to_dict(), warn=False)
+    assert (from_dict.ui13, from_dict.ui14, from_dict.uby21) == (1, 2, 3)